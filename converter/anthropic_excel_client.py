@@ -11,6 +11,8 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import logging
 
+from .compact_row_view import cell_span
+
 # Try to import anthropic, handle if not installed
 try:
     import anthropic
@@ -173,7 +175,7 @@ SHEET INFORMATION:
         # Add data representation explanation
         prompt += """DATA FORMAT EXPLANATION:
 The sheet data uses a compact representation where:
-- Rows contain cells in format: [column_index, value] or [start_col, val1, val2, ..., run_length] for RLE
+- Rows list their cells as ColN:value, or ColA-B:value for a run of identical cells spanning columns A..B
 - Empty cells are omitted to save space
 - Values may be numbers, text, formulas, or null
 
@@ -304,22 +306,12 @@ Begin analysis now:"""
                 cell_representations = []
                 for cell in cells:
                     if len(cell) >= 2:
-                        if len(cell) == 2:
-                            # Simple cell: [col, value]
-                            col, value = cell
-                            cell_representations.append(f"Col{col}:{value}")
+                        # RLE runs are printed as one column range, never expanded
+                        span = cell_span(cell)
+                        if span.col_end == span.col_start:
+                            cell_representations.append(f"Col{span.col_start}:{span.value}")
                         else:
-                            # RLE cell: [start_col, val1, val2, ..., run_length]
-                            start_col = int(cell[0])
-                            run_length = int(cell[-1]) if isinstance(cell[-1], (int, str)) and str(cell[-1]).isdigit() else 1
-                            values = cell[1:-1]
-                            if len(values) == 1:
-                                # Single value repeated
-                                cell_representations.append(f"Col{start_col}-{start_col+run_length-1}:{values[0]}")
-                            else:
-                                # Multiple values
-                                for j, val in enumerate(values):
-                                    cell_representations.append(f"Col{start_col+j}:{val}")
+                            cell_representations.append(f"Col{span.col_start}-{span.col_end}:{span.value}")
                 
                 if cell_representations:
                     data_lines.append(f"Row {row_num}: {', '.join(cell_representations)}")
@@ -0,0 +1,373 @@
+"""
+Columnar binary encoding of compact workbook JSON (Arrow IPC or Parquet).
+
+The compact rows of every sheet become one cell table with a column per
+field instead of nested ``[col, value, style, formula(, run)]`` lists:
+
+- ``sheet``, ``row``: sheet position and row number of each cell
+- ``row_start``: first record of each row; ``row_extra`` carries row-level
+  keys other than ``r``/``cells`` (the shared row ``style``) as JSON
+- ``col``, ``shape`` (cell array length) and ``run`` (RLE run length)
+- typed value vectors: ``value_type`` with ``int_value``, ``float_value``
+  and ``str_value``
+- ``style``: dictionary-encoded style ids; ``formula``: dictionary-encoded
+  formulas, so each distinct formula is stored once
+
+Everything outside the rows (workbook meta, style registry, sheet metadata,
+table_data, complexity metadata) is kept as zstd-compressed JSON in the schema
+metadata. 'arrow' writes an Arrow IPC stream, 'parquet' a Parquet file.
+decode_columnar_workbook rebuilds the dict that json.loads would return for
+the same result. pyarrow is optional and only needed when this output is used.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .storage_service import StorageReference, StorageService
+
+COLUMNAR_FORMATS = ('arrow', 'parquet')
+FORMAT_VERSION = '1'
+
+CONTENT_TYPES = {
+    'arrow': 'application/vnd.apache.arrow.stream',
+    'parquet': 'application/vnd.apache.parquet',
+}
+FILE_EXTENSIONS = {'arrow': 'arrow', 'parquet': 'parquet'}
+
+_METADATA_KEY = b'compact_workbook'
+_SKELETON_KEY = b'compact_workbook_skeleton'
+
+# value_type codes
+_NONE, _BOOL, _INT, _FLOAT, _STR, _JSON, _CELL_JSON = range(7)
+# shape codes for rows without cells
+_EMPTY_ROW, _NO_CELLS_KEY = 0, -1
+
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+_INT32_MAX = 2 ** 31 - 1
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError("Columnar workbook output requires the 'pyarrow' package") from e
+    return pyarrow
+
+
+def get_columnar_output_format() -> Optional[str]:
+    """Format from COLUMNAR_OUTPUT_FORMAT ('arrow' or 'parquet'), or None when unset/'none'."""
+    fmt = (os.getenv('COLUMNAR_OUTPUT_FORMAT') or '').strip().lower()
+    if fmt in ('', 'none', 'off'):
+        return None
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar output format: {fmt} (expected one of {', '.join(COLUMNAR_FORMATS)})")
+    return fmt
+
+
+def columnar_filename(fmt: str, stem: str = 'processed') -> str:
+    return f"{stem}.{FILE_EXTENSIONS[fmt]}"
+
+
+# -- encoding ------------------------------------------------------------
+
+
+def _is_int32(value: Any) -> bool:
+    return type(value) is int and 0 <= value <= _INT32_MAX
+
+
+def _is_label(value: Any) -> bool:
+    return value is None or type(value) is str
+
+
+def _is_regular_cell(cell: Any) -> bool:
+    """A ``[col, value, style?, formula?, run?]`` array whose slots fit the typed columns."""
+    size = len(cell) if type(cell) is list else 0
+    return (2 <= size <= 5 and _is_int32(cell[0])
+            and (size < 3 or _is_label(cell[2])) and (size < 4 or _is_label(cell[3]))
+            and (size < 5 or _is_int32(cell[4])))
+
+
+def _cell_slots(cells: List[Any]):
+    """(cols, values, styles, formulas, runs) of the cells, or None when any cell is not regular.
+
+    Checks whole columns at once; _is_regular_cell then finds the offending cells.
+    """
+    if not set(map(type, cells)) <= {list} or not set(map(len, cells)) <= {2, 3, 4, 5}:
+        return None
+    cols = [cell[0] for cell in cells]
+    styles = [cell[2] if len(cell) > 2 else None for cell in cells]
+    formulas = [cell[3] if len(cell) > 3 else None for cell in cells]
+    runs = [cell[4] if len(cell) > 4 else None for cell in cells]
+    labels = {str, type(None)}
+    present_runs = [run for run in runs if run is not None]
+    if (set(map(type, cols)) <= {int} and (not cols or 0 <= min(cols) and max(cols) <= _INT32_MAX)
+            and set(map(type, styles)) <= labels and set(map(type, formulas)) <= labels
+            and set(map(type, present_runs)) <= {int}
+            and (not present_runs or 0 <= min(present_runs) and max(present_runs) <= _INT32_MAX)):
+        return cols, [cell[1] for cell in cells], styles, formulas, runs
+    return None
+
+
+_VALUE_TYPES = {type(None): _NONE, bool: _BOOL, int: _INT, float: _FLOAT, str: _STR}
+_PLACEHOLDER = [0, None]
+
+
+def _build_cell_table(pa, sheet_rows: List[Tuple[int, List[Dict[str, Any]]]]):
+    """One record per cell (one placeholder record per cell-less row), columns built list-wise."""
+    cells: List[Any] = []
+    starts: List[int] = []
+    row_sheets: List[int] = []
+    row_numbers: List[int] = []
+    empty_shapes: Dict[int, int] = {}
+    extras: Dict[int, str] = {}
+    for sheet_index, rows in sheet_rows:
+        for row_data in rows:
+            start = len(cells)
+            starts.append(start)
+            row_sheets.append(sheet_index)
+            r = row_data.get('r')
+            extra = {key: value for key, value in row_data.items() if key not in ('r', 'cells')}
+            if r is not None and not _is_int32(r):
+                extra['r'] = r
+            row_numbers.append(r if _is_int32(r) else -1)
+            if extra:
+                extras[start] = json.dumps(extra, separators=(',', ':'))
+            row_cells = row_data.get('cells')
+            if row_cells:
+                cells.extend(row_cells)
+            else:
+                cells.append(None)
+                empty_shapes[start] = _EMPTY_ROW if 'cells' in row_data else _NO_CELLS_KEY
+
+    count = len(cells)
+    lengths = np.diff(np.append(np.asarray(starts, dtype=np.int64), count))
+    row_start = np.zeros(count, dtype=bool)
+    row_start[starts] = True
+    row_extra: List[Optional[str]] = [None] * count
+    for position, text in extras.items():
+        row_extra[position] = text
+
+    # Unusual cell arrays are kept verbatim as JSON; everything else goes to typed columns
+    irregular: Dict[int, Any] = {}
+    regular = [_PLACEHOLDER if cell is None else cell for cell in cells] if empty_shapes else cells
+    slots = _cell_slots(regular)
+    if slots is None:
+        irregular = {i: cell for i, cell in enumerate(cells) if cell is not None and not _is_regular_cell(cell)}
+        regular = [_PLACEHOLDER if cell is None or i in irregular else cell for i, cell in enumerate(cells)]
+        slots = _cell_slots(regular)
+    cols, values, styles, formulas, runs = slots
+
+    value_types = [_VALUE_TYPES.get(type(value), _JSON) for value in values]
+    int_values = [value if kind == _INT else int(value) if kind == _BOOL else None
+                  for value, kind in zip(values, value_types)]
+    present_ints = [value for value in int_values if value is not None]
+    if present_ints and (min(present_ints) < _INT64_MIN or max(present_ints) > _INT64_MAX):
+        for i, value in enumerate(int_values):
+            if value is not None and not _INT64_MIN <= value <= _INT64_MAX:
+                int_values[i], value_types[i] = None, _JSON
+    str_values = [value if kind == _STR else None for value, kind in zip(values, value_types)]
+    if _JSON in value_types:
+        for i, kind in enumerate(value_types):
+            if kind == _JSON:
+                str_values[i] = json.dumps(values[i], separators=(',', ':'))
+    for i, cell in irregular.items():
+        value_types[i], str_values[i] = _CELL_JSON, json.dumps(cell, separators=(',', ':'))
+
+    shapes = [len(cell) for cell in regular]
+    for position, shape in empty_shapes.items():
+        shapes[position] = shape
+    for i, cell in irregular.items():
+        shapes[i] = len(cell) if isinstance(cell, list) else 0
+
+    def dictionary(values):
+        return pa.array(values, type=pa.string()).dictionary_encode()
+
+    return pa.table({
+        'sheet': pa.array(np.repeat(np.asarray(row_sheets, dtype=np.int32), lengths)),
+        'row': pa.array(np.repeat(np.asarray(row_numbers, dtype=np.int64), lengths),
+                        mask=np.repeat(np.asarray(row_numbers) < 0, lengths), type=pa.int32()),
+        'row_start': pa.array(row_start),
+        'row_extra': dictionary(row_extra),
+        'col': pa.array(cols, type=pa.int32()),
+        'shape': pa.array(shapes, type=pa.int8()),
+        'run': pa.array(runs, type=pa.int32()),
+        'value_type': pa.array(value_types, type=pa.int8()),
+        'int_value': pa.array(int_values, type=pa.int64()),
+        'float_value': pa.array([value if kind == _FLOAT else None for value, kind in zip(values, value_types)],
+                                type=pa.float64()),
+        'str_value': pa.array(str_values, type=pa.string()),
+        'style': dictionary(styles),
+        'formula': dictionary(formulas),
+    })
+
+
+def _split_rows(data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Tuple[int, List[Dict[str, Any]]]]]:
+    """(data with sheet rows removed, [(sheet index, rows)] for sheets that have a 'rows' list)"""
+    workbook = data.get('workbook')
+    if not isinstance(workbook, dict) or not isinstance(workbook.get('sheets'), list):
+        return data, []
+    sheets, sheet_rows = [], []
+    for index, sheet in enumerate(workbook['sheets']):
+        if isinstance(sheet, dict) and isinstance(sheet.get('rows'), list):
+            sheet_rows.append((index, sheet['rows']))
+            sheet = {key: value for key, value in sheet.items() if key != 'rows'}
+        sheets.append(sheet)
+    return {**data, 'workbook': {**workbook, 'sheets': sheets}}, sheet_rows
+
+
+def encode_columnar_workbook(data: Dict[str, Any], fmt: str = 'arrow') -> bytes:
+    """Encode a compact workbook result as an Arrow IPC stream or a Parquet file."""
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar output format: {fmt}")
+    pa = _import_pyarrow()
+
+    skeleton, sheet_rows = _split_rows(data)
+    table = _build_cell_table(pa, sheet_rows)
+
+    skeleton_json = json.dumps(skeleton, separators=(',', ':')).encode('utf-8')
+    header = json.dumps({
+        'version': FORMAT_VERSION,
+        'sheets_with_rows': [index for index, _ in sheet_rows],
+        'skeleton_bytes': len(skeleton_json),
+    }, separators=(',', ':')).encode('utf-8')
+    metadata = {
+        _METADATA_KEY: header,
+        _SKELETON_KEY: pa.compress(skeleton_json, codec='zstd', asbytes=True),
+    }
+
+    # Write the metadata once: in the schema of an IPC stream (an IPC file repeats
+    # the schema in its footer) and in the Parquet footer, outside the stored
+    # Arrow schema
+    sink = pa.BufferOutputStream()
+    if fmt == 'arrow':
+        table = table.replace_schema_metadata(metadata)
+        options = pa.ipc.IpcWriteOptions(compression='zstd')
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+    else:
+        with pa.parquet.ParquetWriter(sink, table.schema, compression='zstd') as writer:
+            writer.write_table(table)
+            writer.add_key_value_metadata(metadata)
+    return sink.getvalue().to_pybytes()
+
+
+# -- decoding ------------------------------------------------------------
+
+
+def read_cell_table(payload: bytes):
+    """The cell table of an encoded workbook, for columnar consumers (format detected from the bytes)."""
+    pa = _import_pyarrow()
+    if payload[:4] == b'PAR1':
+        return pa.parquet.ParquetFile(pa.BufferReader(payload)).read()
+    return pa.ipc.open_stream(pa.BufferReader(payload)).read_all()
+
+
+def decode_columnar_workbook(payload: bytes) -> Dict[str, Any]:
+    """Rebuild the compact workbook dict from encode_columnar_workbook output."""
+    pa = _import_pyarrow()
+    table = read_cell_table(payload)
+    metadata = table.schema.metadata or {}
+    if _METADATA_KEY not in metadata:
+        raise ValueError("Not a columnar workbook: missing compact_workbook metadata")
+    header = json.loads(metadata[_METADATA_KEY])
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar workbook version: {header.get('version')}")
+
+    data = json.loads(pa.decompress(metadata[_SKELETON_KEY], decompressed_size=header['skeleton_bytes'],
+                                    codec='zstd', asbytes=True))
+    rows_by_sheet: Dict[int, List[Dict[str, Any]]] = {index: [] for index in header['sheets_with_rows']}
+    if table.num_rows:
+        cells = _decode_cells(table)
+        sheets = _int_list(table.column('sheet'))
+        rows = _int_list(table.column('row'), -1)
+        shapes = _int_list(table.column('shape'))
+        extras = _string_list(table.column('row_extra'))
+        starts = np.flatnonzero(table.column('row_start').to_numpy()).tolist()
+        starts.append(table.num_rows)
+        for start, end in zip(starts, starts[1:]):
+            r = rows[start]
+            row_data: Dict[str, Any] = {} if r < 0 else {'r': r}
+            shape = shapes[start]
+            if shape > _EMPTY_ROW:
+                row_data['cells'] = cells[start:end]
+            elif shape == _EMPTY_ROW:
+                row_data['cells'] = []
+            if extras[start] is not None:
+                row_data.update(json.loads(extras[start]))
+            rows_by_sheet[sheets[start]].append(row_data)
+
+    for index, rows in rows_by_sheet.items():
+        data['workbook']['sheets'][index]['rows'] = rows
+    return data
+
+
+def _int_list(column, null: int = 0) -> List[int]:
+    return column.fill_null(null).to_numpy().tolist()
+
+
+def _string_list(column) -> List[Optional[str]]:
+    """Python strings of a (possibly dictionary-encoded) string column, None for nulls."""
+    if hasattr(column.type, 'value_type'):
+        column = column.combine_chunks() if hasattr(column, 'combine_chunks') else column
+        dictionary = column.dictionary.to_pylist() + [None]
+        return [dictionary[i] for i in column.indices.fill_null(-1).to_numpy().tolist()]
+    return column.to_numpy(zero_copy_only=False).tolist()
+
+
+def _decode_cells(table) -> List[Any]:
+    """Cell arrays for every record of the table (placeholders of cell-less rows included)."""
+    value_types = table.column('value_type').to_numpy()
+    values = np.full(table.num_rows, None, dtype=object)
+
+    def fill(code, column_name, convert=None):
+        positions = np.flatnonzero(value_types == code)
+        if positions.size:
+            column = table.column(column_name).take(positions)
+            if convert is None:
+                selected = column.fill_null(0).to_numpy().tolist()
+            else:
+                selected = convert(column)
+            values[positions] = np.array(selected + [None], dtype=object)[:-1]
+
+    fill(_INT, 'int_value')
+    fill(_FLOAT, 'float_value')
+    fill(_BOOL, 'int_value', lambda column: column.to_numpy().astype(bool).tolist())
+    fill(_STR, 'str_value', _string_list)
+    fill(_JSON, 'str_value', lambda column: [json.loads(text) for text in _string_list(column)])
+    fill(_CELL_JSON, 'str_value', lambda column: [json.loads(text) for text in _string_list(column)])
+    values = values.tolist()
+
+    cols = _int_list(table.column('col'))
+    shapes = _int_list(table.column('shape'))
+    runs = _int_list(table.column('run'))
+    styles = _string_list(table.column('style'))
+    formulas = _string_list(table.column('formula'))
+    kinds = value_types.tolist()
+    return [
+        value if kind == _CELL_JSON
+        else [col, value] if shape == 2
+        else [col, value, style] if shape == 3
+        else [col, value, style, formula] if shape == 4
+        else [col, value, style, formula, run]
+        for kind, col, value, shape, run, style, formula in zip(kinds, cols, values, shapes, runs, styles, formulas)
+    ]
+
+
+# -- storage -------------------------------------------------------------
+
+
+def store_columnar_workbook(storage: StorageService, key: str, data: Dict[str, Any], fmt: str = 'arrow',
+                            metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
+    """Encode ``data`` and write it to ``key`` through the storage service."""
+    return storage.put_bytes(key, encode_columnar_workbook(data, fmt), content_type=CONTENT_TYPES[fmt],
+                             metadata=metadata)
+
+
+def load_columnar_workbook(storage: StorageService, key: str) -> Dict[str, Any]:
+    """Read a stored columnar workbook back into the compact dict shape."""
+    return decode_columnar_workbook(storage.get_bytes(key))
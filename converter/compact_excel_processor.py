@@ -1,22 +1,104 @@
 import json
+import multiprocessing
 import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter, column_index_from_string
 from openpyxl.styles import Font, Fill, Border, Alignment, Protection
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.workbook.workbook import Workbook
+from .compact_row_view import RowView, cell_span, is_rle_cell
+from .excel_single_pass_loader import load_workbook_single_pass, get_value_cell
+from .excel_streaming_reader import StreamingWorkbookReader, StreamingSheet
+
+# Style ids of a cell whose openpyxl StyleArray has not been created yet
+_DEFAULT_STYLE_KEY = tuple(StyleArray())
+
+# One spawn pool per process, shared by every 'parallel' conversion
+_sheet_pool: Optional[ProcessPoolExecutor] = None
+_sheet_pool_lock = threading.Lock()
+
+
+def max_sheet_workers() -> int:
+    """
+    Server-wide cap on worker processes for 'parallel' sheet conversion
+    
+    Read from EXCEL_MAX_SHEET_WORKERS; unset or 0 means one per CPU.
+    """
+    value = (os.getenv("EXCEL_MAX_SHEET_WORKERS") or "").strip()
+    try:
+        configured = int(value) if value else 0
+    except ValueError:
+        raise ValueError(f"EXCEL_MAX_SHEET_WORKERS must be an integer, got {value!r}")
+    if configured < 0:
+        raise ValueError(f"EXCEL_MAX_SHEET_WORKERS must be >= 0, got {configured}")
+    return configured or (os.cpu_count() or 1)
+
+
+def _get_sheet_pool() -> ProcessPoolExecutor:
+    """The shared sheet pool, created on first use"""
+    global _sheet_pool
+    with _sheet_pool_lock:
+        if _sheet_pool is None:
+            # Spawned workers do not inherit the parent's threads or open handles
+            _sheet_pool = ProcessPoolExecutor(max_workers=max_sheet_workers(),
+                                              mp_context=multiprocessing.get_context('spawn'))
+        return _sheet_pool
+
+
+def _discard_sheet_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken shared pool so the next conversion starts a new one"""
+    global _sheet_pool
+    with _sheet_pool_lock:
+        if _sheet_pool is pool:
+            _sheet_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _convert_sheet_in_worker(processor: 'CompactExcelProcessor', file_path: str,
+                             sheet_name: str) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, int], Any]:
+    """
+    Process-pool entry point: convert a single worksheet of the file
+    
+    Args:
+        processor: Pickled copy of the parent processor (configuration only)
+        file_path: Path to the Excel file
+        sheet_name: Worksheet to convert; no other sheet part is parsed
+        
+    Returns:
+        Tuple of (sheet_data, style_registry, rle_stats, statistics_summary) where the
+        sheet's style references point into its own worker-local registry
+    """
+    processor._reset_style_registry()
+    processor.rle_stats = dict.fromkeys(processor.rle_stats, 0)
+    
+    reader = StreamingWorkbookReader(file_path, keep_vba=True)
+    try:
+        sheet_data, summary = processor._convert_streaming_worksheet(reader.get_sheet(sheet_name))
+    finally:
+        reader.close()
+    
+    return sheet_data, processor.style_registry, processor.rle_stats, summary
 
 
 class CompactExcelProcessor:
     """Compact Excel to JSON converter with Run-Length Encoding support"""
     
+    # Workbook ingestion engines selectable via ``ingestion_mode``
+    INGESTION_MODES = ('single_pass', 'streaming', 'parallel', 'dual_load')
+    
     def __init__(self, 
                  enable_rle: bool = True,
                  rle_min_run_length: int = 3,
                  rle_max_row_width: int = 20,
-                 rle_aggressive_none: bool = True):
+                 rle_aggressive_none: bool = True,
+                 ingestion_mode: str = 'single_pass',
+                 max_workers: Optional[int] = None):
         """
         Initialize processor with RLE configuration
         
@@ -25,10 +107,26 @@ class CompactExcelProcessor:
             rle_min_run_length: Minimum consecutive cells to apply RLE (default: 3)
             rle_max_row_width: Only apply RLE to rows with more than this many cells
             rle_aggressive_none: Use more aggressive compression for None values (min_run=2)
+            ingestion_mode: 'single_pass' parses each sheet once and captures formulas and
+                cached values together; 'streaming' does the same from a read-only workbook
+                row by row without building the cell graph; 'parallel' streams each
+                worksheet in its own worker process; 'dual_load' is the legacy
+                formula + data_only double load
+            max_workers: Worker processes for 'parallel' mode; never more than
+                max_sheet_workers() (default: that cap)
         """
+        if ingestion_mode not in self.INGESTION_MODES:
+            raise ValueError(f"Unsupported ingestion mode: {ingestion_mode}")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        
         self.supported_extensions = ['.xlsx', '.xlsm', '.xltx', '.xltm']
+        self.ingestion_mode = ingestion_mode
+        self.max_workers = max_workers
         self.style_registry = {}  # Central style dictionary
         self.next_style_id = 1
+        self._style_index = {}  # Canonical style key -> style id
+        self._style_ref_cache = {}  # Shared openpyxl style -> style id (or None)
         
         # RLE Configuration
         self.enable_rle = enable_rle
@@ -71,13 +169,11 @@ class CompactExcelProcessor:
         }
         
         try:
-            # First pass: get all data including formulas (data_only=False)
-            workbook_with_formulas = load_workbook(file_path, data_only=False, keep_vba=True)
-            
-            # Second pass: get calculated values (data_only=True)  
-            workbook_with_values = load_workbook(file_path, data_only=True, keep_vba=True)
-            
-            result = self._process_workbook(workbook_with_formulas, workbook_with_values, file_path)
+            if self.ingestion_mode in ('streaming', 'parallel'):
+                result = self._process_workbook_streaming(file_path)
+            else:
+                workbook_with_formulas, workbook_with_values = self._load_workbooks(file_path)
+                result = self._process_workbook(workbook_with_formulas, workbook_with_values, file_path)
             
             # Apply empty trailing filtering if requested
             if filter_empty_trailing:
@@ -96,13 +192,26 @@ class CompactExcelProcessor:
         except Exception as e:
             raise Exception(f"Error processing Excel file: {str(e)}")
     
+    def _load_workbooks(self, file_path: str) -> Tuple[Workbook, Any]:
+        """Load the formula and calculated-value views of a workbook for the configured mode"""
+        if self.ingestion_mode == 'single_pass':
+            # One parse per sheet part; cached formula values are captured alongside
+            return load_workbook_single_pass(file_path, keep_vba=True)
+        
+        # First pass: get all data including formulas (data_only=False)
+        workbook_with_formulas = load_workbook(file_path, data_only=False, keep_vba=True)
+        
+        # Second pass: get calculated values (data_only=True)  
+        workbook_with_values = load_workbook(file_path, data_only=True, keep_vba=True)
+        
+        return workbook_with_formulas, workbook_with_values
+    
     def _process_workbook(self, workbook_with_formulas: Workbook, workbook_with_values: Workbook, file_path: str) -> Dict[str, Any]:
         """Process the entire workbook with both formula and value data"""
         file_stats = os.stat(file_path)
         
         # Reset style registry for each workbook
-        self.style_registry = {}
-        self.next_style_id = 1
+        self._reset_style_registry()
         
         result = {
             "workbook": {
@@ -130,6 +239,188 @@ class CompactExcelProcessor:
         
         return result
     
+    def _process_workbook_streaming(self, file_path: str) -> Dict[str, Any]:
+        """Process the workbook from a read-only handle, one row at a time"""
+        file_stats = os.stat(file_path)
+        
+        # Reset style registry for each workbook
+        self._reset_style_registry()
+        
+        reader = StreamingWorkbookReader(file_path, keep_vba=True)
+        try:
+            result = {
+                "workbook": {
+                    "meta": self._extract_compact_metadata(reader.workbook, file_path, file_stats),
+                    "styles": {},
+                    "sheets": []
+                }
+            }
+            
+            sheet_names = reader.worksheet_names
+            workers = self._parallel_worker_count(len(sheet_names))
+            if workers <= 1:
+                for sheet in reader.iter_sheets():
+                    result["workbook"]["sheets"].append(self._process_streaming_worksheet(sheet))
+        finally:
+            reader.close()
+        
+        if workers > 1:
+            result["workbook"]["sheets"] = self._process_sheets_in_pool(file_path, sheet_names, workers)
+        
+        result["workbook"]["styles"] = self.style_registry
+        result["table_data"] = self._generate_table_data(result["workbook"])
+        
+        return result
+    
+    def _parallel_worker_count(self, sheet_count: int) -> int:
+        """Number of worker processes to fan the sheets out to (<= 1 means in-process)"""
+        if self.ingestion_mode != 'parallel':
+            return 1
+        cap = max_sheet_workers()
+        return min(self.max_workers or cap, cap, sheet_count)
+    
+    def _process_sheets_in_pool(self, file_path: str, sheet_names: List[str], workers: int) -> List[Dict[str, Any]]:
+        """
+        Convert each worksheet in the shared process pool and reassemble them in workbook order
+        
+        Args:
+            file_path: Path to the Excel file
+            sheet_names: Worksheets to convert, in workbook order
+            workers: Most sheets of this workbook in the shared pool at once
+            
+        Returns:
+            Sheet objects whose style references point into this processor's registry
+        """
+        pool = _get_sheet_pool()
+        outputs = [None] * len(sheet_names)
+        pending = {}
+        next_index = 0
+        try:
+            # Keep at most ``workers`` of this workbook's sheets in the shared pool at once
+            while next_index < len(sheet_names) or pending:
+                while next_index < len(sheet_names) and len(pending) < workers:
+                    future = pool.submit(_convert_sheet_in_worker, self, file_path, sheet_names[next_index])
+                    pending[future] = next_index
+                    next_index += 1
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outputs[pending.pop(future)] = future.result()
+        except BrokenProcessPool:
+            # A crashed worker breaks the pool; the next conversion gets a fresh one
+            _discard_sheet_pool(pool)
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+        
+        sheets = []
+        for sheet_data, style_registry, rle_stats, summary in outputs:
+            # Interning each worker's styles in first-use order, sheet by sheet, assigns
+            # the same ids as converting the sheets sequentially
+            self._merge_sheet_styles(sheet_data, style_registry)
+            for key, count in rle_stats.items():
+                self.rle_stats[key] += count
+            if summary is not None:
+                self._record_sheet_statistics(sheet_data["name"], summary)
+            sheets.append(sheet_data)
+        return sheets
+    
+    def _merge_sheet_styles(self, sheet_data: Dict[str, Any], style_registry: Dict[str, Any]) -> None:
+        """Register a worker's styles and rewrite the sheet's style references to the merged ids"""
+        style_ids = {local_id: self._intern_style(style) for local_id, style in style_registry.items()}
+        
+        for row in sheet_data.get("rows", []):
+            if "style" in row:
+                row["style"] = style_ids[row["style"]]
+            for cell in row["cells"]:
+                # Position 2 holds the style id; a bare int there is an RLE run length
+                if len(cell) > 2 and isinstance(cell[2], str):
+                    cell[2] = style_ids[cell[2]]
+    
+    def _process_streaming_worksheet(self, sheet: StreamingSheet) -> Dict[str, Any]:
+        """Process a single streamed worksheet into the same structure as _process_worksheet"""
+        sheet_data, summary = self._convert_streaming_worksheet(sheet)
+        if summary is not None:
+            self._record_sheet_statistics(sheet.title, summary)
+        return sheet_data
+    
+    def _convert_streaming_worksheet(self, sheet: StreamingSheet) -> Tuple[Dict[str, Any], Any]:
+        """Convert a streamed worksheet, returning its sheet object and statistics summary"""
+        statistics = self._start_sheet_statistics(sheet.title)
+        
+        # Bounds and frozen panes are only complete once every row has been read
+        rows = list(self._iter_compact_rows_streaming(sheet, statistics))
+        
+        dimensions = sheet.dimensions
+        sheet_data = {
+            "name": sheet.title,
+            "dimensions": [
+                dimensions["min_row"],
+                dimensions["min_col"],
+                dimensions["max_row"],
+                dimensions["max_col"]
+            ]
+        }
+        
+        frozen_panes = self._extract_frozen_panes(sheet)
+        if frozen_panes["frozen_rows"] > 0 or frozen_panes["frozen_cols"] > 0:
+            sheet_data["frozen"] = [frozen_panes["frozen_rows"], frozen_panes["frozen_cols"]]
+        
+        merged_cells = self._extract_compact_merged_cells(sheet)
+        if merged_cells:
+            sheet_data["merged"] = merged_cells
+        
+        if rows:
+            sheet_data["rows"] = rows
+        
+        summary = None
+        if statistics is not None:
+            summary = statistics.finish(dimensions, sheet.merged_cells.ranges)
+        
+        return sheet_data, summary
+    
+    def _iter_compact_rows_streaming(self, sheet: StreamingSheet, statistics=None):
+        """Yield finished compact rows as the sheet is streamed"""
+        # Same wide-sheet rule as _extract_compact_cell_data_with_rle
+        process_empty_cells = self.enable_rle and sheet.max_column > 100
+        
+        for row_num, row_cells in sheet.iter_rows():
+            content_cols = []
+            for col_num in sorted(row_cells):
+                cell = row_cells[col_num]
+                formula = cell.value if cell.data_type == 'f' else None
+                value_cell = cell.value_cell()
+                calculated_value = self._extract_cell_value(value_cell) if value_cell.value is not None else None
+                
+                if calculated_value is not None or formula or cell.comment:
+                    content_cols.append((col_num, calculated_value, formula))
+                    if statistics is not None:
+                        statistics.add_cell(row_num, col_num, calculated_value, formula)
+            
+            if not content_cols:
+                continue
+            
+            cells = []
+            if process_empty_cells:
+                # Fill gaps between content cells so RLE can compress them
+                for col_num in range(content_cols[0][0], content_cols[-1][0] + 1):
+                    cell = row_cells.get(col_num) or sheet.empty_cell(row_num, col_num)
+                    formula = cell.value if cell.data_type == 'f' else None
+                    value_cell = cell.value_cell()
+                    calculated_value = self._extract_cell_value(value_cell) if value_cell.value is not None else None
+                    cells.append(self._build_compact_cell(
+                        col_num, calculated_value, self._get_style_reference(cell), formula
+                    ))
+            else:
+                for col_num, calculated_value, formula in content_cols:
+                    cells.append(self._build_compact_cell(
+                        col_num, calculated_value, self._get_style_reference(row_cells[col_num]), formula
+                    ))
+            
+            row_data = {"r": row_num, "cells": cells}
+            self._finalize_compact_row(row_data)
+            yield row_data
+    
     def _extract_compact_metadata(self, workbook: Workbook, file_path: str, file_stats) -> Dict[str, Any]:
         """Extract essential workbook metadata only"""
         props = workbook.properties
@@ -173,13 +464,36 @@ class CompactExcelProcessor:
             sheet_data["merged"] = merged_cells
         
         # Process cells in row-based format with optional RLE compression
-        rows = self._extract_compact_cell_data_with_rle(worksheet_with_formulas, worksheet_with_values)
+        statistics = self._start_sheet_statistics(worksheet_with_formulas.title)
+        rows = self._extract_compact_cell_data_with_rle(worksheet_with_formulas, worksheet_with_values, statistics)
         if rows:
             sheet_data["rows"] = rows
         
+        if statistics is not None:
+            self._record_sheet_statistics(
+                worksheet_with_formulas.title,
+                statistics.finish(dimensions, worksheet_with_formulas.merged_cells.ranges)
+            )
+        
         return sheet_data
     
-    def _extract_compact_cell_data_with_rle(self, worksheet_with_formulas: Worksheet, worksheet_with_values: Worksheet) -> List[Dict[str, Any]]:
+    def _start_sheet_statistics(self, sheet_name: str):
+        """
+        Hook for subclasses that collect per-sheet statistics during the cell pass
+        
+        Returns:
+            An object whose ``add_cell(row, column, value, formula)`` is called for every
+            content cell in row-major order and whose ``finish(dimensions, merged_ranges)``
+            returns a picklable summary once the sheet is done, or None to skip collection
+        """
+        return None
+    
+    def _record_sheet_statistics(self, sheet_name: str, summary: Any) -> None:
+        """Hook receiving each sheet's finished statistics summary, in workbook order"""
+        pass
+    
+    def _extract_compact_cell_data_with_rle(self, worksheet_with_formulas: Worksheet, worksheet_with_values: Worksheet,
+                                            statistics=None) -> List[Dict[str, Any]]:
         """Extract cell data in compact row-based format with optional RLE compression"""
         rows_data = {}  # Dictionary to organize by row number
         
@@ -197,11 +511,13 @@ class CompactExcelProcessor:
             for row in worksheet_with_formulas.iter_rows():
                 for cell in row:
                     formula = cell.value if getattr(cell, 'data_type', None) == 'f' else None
-                    value_cell = worksheet_with_values[cell.coordinate]
+                    value_cell = get_value_cell(worksheet_with_values, cell)
                     calculated_value = self._extract_cell_value(value_cell) if value_cell.value is not None else None
                     
                     if calculated_value is not None or formula or cell.comment:
                         row_num = cell.row
+                        if statistics is not None:
+                            statistics.add_cell(row_num, cell.column, calculated_value, formula)
                         if row_num not in content_rows:
                             content_rows[row_num] = set()
                         content_rows[row_num].add(cell.column)
@@ -225,20 +541,9 @@ class CompactExcelProcessor:
                     calculated_value = self._extract_cell_value(value_cell) if value_cell.value is not None else None
                     
                     # Create cell array (None for empty cells)
-                    cell_array = [col_num, calculated_value]
-                    
-                    # Add style and formula if present
-                    style_ref = self._get_style_reference(cell)
-                    if style_ref:
-                        cell_array.append(style_ref)
-                    elif formula:
-                        cell_array.append(None)
-                    
-                    if formula:
-                        while len(cell_array) < 4:
-                            cell_array.append(None)
-                        cell_array[3] = str(formula)
-                    
+                    cell_array = self._build_compact_cell(
+                        col_num, calculated_value, self._get_style_reference(cell), formula
+                    )
                     rows_data[row_num]["cells"].append(cell_array)
         else:
             # Original logic for normal-sized sheets - only process cells with content
@@ -248,76 +553,77 @@ class CompactExcelProcessor:
                     formula = cell.value if getattr(cell, 'data_type', None) == 'f' else None
                     
                     # Get calculated value from the worksheet with values
-                    value_cell = worksheet_with_values[cell.coordinate]
+                    value_cell = get_value_cell(worksheet_with_values, cell)
                     calculated_value = self._extract_cell_value(value_cell) if value_cell.value is not None else None
                     
                     # Only process cells that have content
                     if calculated_value is not None or formula or cell.comment:
                         row_num = cell.row
-                        col_num = cell.column
+                        if statistics is not None:
+                            statistics.add_cell(row_num, cell.column, calculated_value, formula)
                         
                         if row_num not in rows_data:
                             rows_data[row_num] = {"r": row_num, "cells": []}
                         
-                        # Create compact cell format: [col, value, style_ref?, formula?]
-                        cell_array = [col_num]
-                        
-                        # Add value
-                        cell_array.append(calculated_value)
-                        
-                        # Get style reference
-                        style_ref = self._get_style_reference(cell)
-                        if style_ref:
-                            cell_array.append(style_ref)
-                        elif formula:
-                            cell_array.append(None)  # Placeholder for style if formula follows
-                        
-                        # Add formula if present
-                        if formula:
-                            # Ensure we have a style slot
-                            while len(cell_array) < 3:
-                                cell_array.append(None)
-                            cell_array.append(str(formula))
-                        
+                        cell_array = self._build_compact_cell(
+                            cell.column, calculated_value, self._get_style_reference(cell), formula
+                        )
                         rows_data[row_num]["cells"].append(cell_array)
         
-        # Apply RLE compression to each row
-        for row_num, row_data in rows_data.items():
-            # Apply RLE to all rows if enabled, with more aggressive settings for wide rows
-            if self.enable_rle:
-                original_cell_count = len(row_data["cells"])
-                
-                # For extremely wide rows (>1000 columns), use more aggressive compression
-                if original_cell_count > 1000:
-                    # Temporarily reduce thresholds for very wide sheets
-                    original_min_run = self.rle_min_run_length
-                    self.rle_min_run_length = 2  # More aggressive for wide sheets
-                    
-                    row_data["cells"] = self._apply_rle_to_row(row_data["cells"])
-                    
-                    # Restore original threshold
-                    self.rle_min_run_length = original_min_run
-                elif original_cell_count > self.rle_max_row_width:
-                    row_data["cells"] = self._apply_rle_to_row(row_data["cells"])
-                
-                compressed_cell_count = len(row_data["cells"])
+        for row_data in rows_data.values():
+            self._finalize_compact_row(row_data)
+        
+        # Convert to sorted list
+        return [rows_data[row_num] for row_num in sorted(rows_data.keys())]
+    
+    def _build_compact_cell(self, col_num: int, calculated_value: Any,
+                            style_ref: Optional[str], formula: Any) -> List[Any]:
+        """Create compact cell format: [col, value, style_ref?, formula?]"""
+        cell_array = [col_num, calculated_value]
+        
+        if style_ref:
+            cell_array.append(style_ref)
+        elif formula:
+            cell_array.append(None)  # Placeholder for style if formula follows
+        
+        if formula:
+            cell_array.append(str(formula))
+        
+        return cell_array
+    
+    def _finalize_compact_row(self, row_data: Dict[str, Any]) -> None:
+        """Apply RLE compression and row-level shared styles to a completed row"""
+        # Apply RLE to all rows if enabled, with more aggressive settings for wide rows
+        if self.enable_rle:
+            original_cell_count = len(row_data["cells"])
+            
+            # For extremely wide rows (>1000 columns), use more aggressive compression
+            if original_cell_count > 1000:
+                # Temporarily reduce thresholds for very wide sheets
+                original_min_run = self.rle_min_run_length
+                self.rle_min_run_length = 2  # More aggressive for wide sheets
                 
-                if compressed_cell_count < original_cell_count:
-                    self.rle_stats["rows_compressed"] += 1
+                row_data["cells"] = self._apply_rle_to_row(row_data["cells"])
                 
-                self.rle_stats["cells_before_rle"] += original_cell_count
-                self.rle_stats["cells_after_rle"] += compressed_cell_count
+                # Restore original threshold
+                self.rle_min_run_length = original_min_run
+            elif original_cell_count > self.rle_max_row_width:
+                row_data["cells"] = self._apply_rle_to_row(row_data["cells"])
+            
+            compressed_cell_count = len(row_data["cells"])
+            
+            if compressed_cell_count < original_cell_count:
+                self.rle_stats["rows_compressed"] += 1
+            
+            self.rle_stats["cells_before_rle"] += original_cell_count
+            self.rle_stats["cells_after_rle"] += compressed_cell_count
         
         # Check for row-level shared styles
-        for row_num, row_data in rows_data.items():
-            shared_style = self._detect_shared_row_style(row_data["cells"])
-            if shared_style:
-                row_data["style"] = shared_style
-                # Remove style references from individual cells if they match the row style
-                self._remove_redundant_cell_styles(row_data["cells"], shared_style)
-        
-        # Convert to sorted list
-        return [rows_data[row_num] for row_num in sorted(rows_data.keys())]
+        shared_style = self._detect_shared_row_style(row_data["cells"])
+        if shared_style:
+            row_data["style"] = shared_style
+            # Remove style references from individual cells if they match the row style
+            self._remove_redundant_cell_styles(row_data["cells"], shared_style)
     
     def _apply_rle_to_row(self, cells: List[List[Any]]) -> List[List[Any]]:
         """Apply run-length encoding to a row of cells"""
@@ -478,9 +784,7 @@ class CompactExcelProcessor:
     
     def _is_rle_cell(self, cell: List[Any]) -> bool:
         """Check if a cell is RLE encoded"""
-        return (len(cell) >= 5 and 
-                isinstance(cell[-1], int) and 
-                cell[-1] > 1)  # Run length > 1
+        return is_rle_cell(cell)
     
     # The following methods are inherited from the original CompactExcelProcessor
     # with minimal modifications for compatibility
@@ -558,10 +862,38 @@ class CompactExcelProcessor:
         
         return cell.value
     
+    def _reset_style_registry(self):
+        """Clear the style registry and its lookup indexes"""
+        self.style_registry = {}
+        self.next_style_id = 1
+        self._style_index = {}
+        self._style_ref_cache = {}
+    
     def _get_style_reference(self, cell) -> Optional[str]:
         """Get or create a style reference for the cell"""
-        style_dict = self._extract_cell_style_dict(cell)
+        # Cells sharing an openpyxl style resolve to the same reference, so the
+        # style dict is only built once per distinct style in the workbook
+        cache_key = self._style_cache_key(cell)
+        if cache_key is not None and cache_key in self._style_ref_cache:
+            return self._style_ref_cache[cache_key]
+        
+        style_ref = self._intern_style(self._extract_cell_style_dict(cell))
         
+        if cache_key is not None:
+            self._style_ref_cache[cache_key] = style_ref
+        return style_ref
+    
+    def _style_cache_key(self, cell) -> Optional[Tuple]:
+        """Hashable identity of the cell's shared style, or None if it has none"""
+        if not hasattr(cell, '_style'):
+            return None
+        # openpyxl leaves _style unset on unstyled and merged cells until a style is read
+        style_array = tuple(cell._style) if cell._style is not None else _DEFAULT_STYLE_KEY
+        # Streaming cells may carry a merged-cell border outside the shared style
+        return (style_array, getattr(cell, '_border', None))
+    
+    def _intern_style(self, style_dict: Dict[str, Any]) -> Optional[str]:
+        """Return the style id for a style dict, registering it on first use"""
         # Skip empty styles
         if not style_dict:
             return None
@@ -570,14 +902,15 @@ class CompactExcelProcessor:
         style_key = self._create_style_key(style_dict)
         
         # Check if this style already exists
-        for style_id, existing_style in self.style_registry.items():
-            if self._create_style_key(existing_style) == style_key:
-                return style_id
+        style_id = self._style_index.get(style_key)
+        if style_id is not None:
+            return style_id
         
         # Create new style reference
         style_id = f"s{self.next_style_id}"
         self.next_style_id += 1
         self.style_registry[style_id] = style_dict
+        self._style_index[style_key] = style_id
         
         return style_id
     
@@ -775,19 +1108,16 @@ class CompactExcelProcessor:
             
             # Create a single table from the sheet data
             if "rows" in sheet and sheet["rows"]:
-                # Expand RLE cells for table display
-                expanded_rows = []
-                for row in sheet["rows"]:
-                    expanded_row = self.expand_rle_cells(row)
-                    expanded_rows.append(expanded_row)
+                # Read RLE runs as column spans instead of expanding them
+                row_views = [RowView(row) for row in sheet["rows"]]
                 
                 table = {
                     "table_id": 1,
                     "name": f"{sheet['name']} - Table",
-                    "range": f"A1:{self._get_last_cell_ref_from_expanded_rows(expanded_rows)}",
-                    "headers": self._extract_headers_from_expanded_rows(expanded_rows),
-                    "data": self._convert_expanded_rows_to_table_data(expanded_rows),
-                    "columns": self._create_columns_for_expanded_rows(expanded_rows)
+                    "range": f"A1:{self._get_last_cell_ref_from_row_views(row_views)}",
+                    "headers": self._extract_headers_from_row_views(row_views),
+                    "data": self._convert_row_views_to_table_data(row_views),
+                    "columns": self._create_columns_for_row_views(row_views)
                 }
                 table_sheet["tables"].append(table)
             
@@ -795,15 +1125,14 @@ class CompactExcelProcessor:
         
         return table_data
     
-    def _get_last_cell_ref_from_expanded_rows(self, expanded_rows: List[Dict[str, Any]]) -> str:
-        """Get the last cell reference from expanded rows"""
+    def _get_last_cell_ref_from_row_views(self, row_views: List[RowView]) -> str:
+        """Get the last cell reference covered by the rows"""
         max_row = 0
         max_col = 0
         
-        for row in expanded_rows:
-            max_row = max(max_row, row.get("r", 0))
-            for cell in row.get("cells", []):
-                max_col = max(max_col, cell[0])
+        for view in row_views:
+            max_row = max(max_row, view.row)
+            max_col = max(max_col, view.max_col)
         
         # Convert to Excel reference
         col_str = ""
@@ -815,75 +1144,58 @@ class CompactExcelProcessor:
         
         return f"{col_str}{max_row}"
     
-    def _extract_headers_from_expanded_rows(self, expanded_rows: List[Dict[str, Any]]) -> List[str]:
-        """Extract headers from the first expanded row"""
-        if not expanded_rows:
+    def _header_cells(self, row_views: List[RowView]) -> List[Tuple[int, str]]:
+        """(column, text) for every column the first row covers, in stored order"""
+        if not row_views:
             return []
         
-        first_row = expanded_rows[0]
         headers = []
-        
-        for cell in first_row.get("cells", []):
-            headers.append(str(cell[1]) if cell[1] is not None else "")
-        
+        for span in row_views[0]:
+            text = str(span.value) if span.value is not None else ""
+            headers.extend((col, text) for col in range(span.col_start, span.col_end + 1))
         return headers
     
-    def _convert_expanded_rows_to_table_data(self, expanded_rows: List[Dict[str, Any]]) -> List[List[Any]]:
-        """Convert expanded rows format to table data format"""
-        table_data = []
-        
-        for row in expanded_rows[1:]:  # Skip header row
-            row_data = []
-            cells_dict = {cell[0]: cell[1] for cell in row.get("cells", [])}
-            
-            # Find max column to ensure consistent row length
-            max_col = max(cells_dict.keys()) if cells_dict else 0
-            
-            for col in range(1, max_col + 1):
-                row_data.append(cells_dict.get(col, ""))
-            
-            table_data.append(row_data)
-        
-        return table_data
+    def _extract_headers_from_row_views(self, row_views: List[RowView]) -> List[str]:
+        """Extract headers from the first row"""
+        return [text for _, text in self._header_cells(row_views)]
+    
+    def _convert_row_views_to_table_data(self, row_views: List[RowView]) -> List[List[Any]]:
+        """Convert rows to table data format"""
+        # Each row is padded with "" up to its own last column
+        return [view.dense_values(view.max_col, "") for view in row_views[1:]]  # Skip header row
     
-    def _create_columns_for_expanded_rows(self, expanded_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Create columns structure for expanded rows"""
-        if not expanded_rows:
+    def _create_columns_for_row_views(self, row_views: List[RowView]) -> List[Dict[str, Any]]:
+        """Create columns structure for the rows"""
+        if not row_views:
             return []
         
-        # Get headers from first row
-        headers = []
-        first_row = expanded_rows[0]
-        for cell in first_row.get("cells", []):
-            headers.append({
-                "col": cell[0],
-                "value": str(cell[1]) if cell[1] is not None else ""
-            })
+        data_rows = []
+        for row_idx, view in enumerate(row_views[1:], start=2):  # Skip header row
+            row_header = view.span_at(1)
+            data_rows.append((row_idx, view, str(row_header.value) if row_header is not None else None))
         
         columns = []
         
         # Create a column for each header
-        for header in headers:
+        for header_col, header_value in self._header_cells(row_views):
             column = {
-                "column_id": header["col"],
-                "header": header["value"],
+                "column_id": header_col,
+                "header": header_value,
                 "cells": {}
             }
             
             # Add cells from all rows for this column
-            for row_idx, row in enumerate(expanded_rows[1:], start=2):  # Skip header row
-                cells_dict = {cell[0]: cell for cell in row.get("cells", [])}
-                
-                if header["col"] in cells_dict:
-                    cell_data = cells_dict[header["col"]]
-                    cell_ref = f"{chr(64 + header['col'])}{row_idx}"  # Convert to A1, B2, etc.
+            for row_idx, view, row_header in data_rows:
+                span = view.span_at(header_col)
+                if span is not None:
+                    cell_ref = f"{chr(64 + header_col)}{row_idx}"  # Convert to A1, B2, etc.
                     
                     column["cells"][cell_ref] = {
                         "coordinate": cell_ref,
-                        "value": cell_data[1],
+                        "value": span.value,
                         "headers": {
-                            "column_headers": [{"value": header["value"]}],
-                            "row_headers": [{"value": str(cells_dict.get(1, [None, ""])[1])}] if 1 in cells_dict else []
+                            "column_headers": [{"value": header_value}],
+                            "row_headers": [{"value": row_header}] if row_header is not None else []
                         }
                     }
             
@@ -928,15 +1240,8 @@ class CompactExcelProcessor:
             
             for cell in cells:
                 if len(cell) >= 2 and self._has_meaningful_data(cell[1]):
-                    if self._is_rle_cell(cell):
-                        # RLE cell: calculate end column
-                        start_col = cell[0]
-                        run_length = cell[-1]
-                        end_col = start_col + run_length - 1
-                        col_num = end_col
-                    else:
-                        # Normal cell
-                        col_num = cell[0]
+                    # An RLE cell reaches to the end of its run
+                    col_num = cell_span(cell).col_end
                     
                     if row_num > max_data_row:
                         max_data_row = row_num
@@ -951,22 +1256,14 @@ class CompactExcelProcessor:
                 # Filter columns within this row
                 filtered_cells = []
                 for cell in row.get('cells', []):
-                    if self._is_rle_cell(cell):
-                        # RLE cell: check if any part is within range
-                        start_col = cell[0]
-                        run_length = cell[-1]
-                        end_col = start_col + run_length - 1
-                        if start_col <= max_data_col:
-                            # Trim RLE cell if it extends beyond max_data_col
-                            if end_col > max_data_col:
-                                trimmed_length = max_data_col - start_col + 1
-                                trimmed_cell = cell[:-1] + [trimmed_length]  # Update run length
-                                filtered_cells.append(trimmed_cell)
-                            else:
-                                filtered_cells.append(cell)
-                    else:
-                        # Normal cell
-                        if len(cell) >= 1 and cell[0] <= max_data_col:
+                    if not cell:
+                        continue
+                    span = cell_span(cell)
+                    if span.col_start <= max_data_col:
+                        if span.col_end > max_data_col:
+                            # Trim an RLE cell that extends beyond max_data_col
+                            filtered_cells.append(cell[:-1] + [max_data_col - span.col_start + 1])
+                        else:
                             filtered_cells.append(cell)
                 
                 # Only include row if it has cells after filtering
@@ -0,0 +1,161 @@
+"""
+Run-aware view over one compact row.
+
+Compact rows store ``[col, value, style, formula(, run)]`` cell arrays, where a
+trailing run length > 1 makes the cell cover ``col..col+run-1``. RowView reads
+such a row as (col_start, col_end, value, style, formula) spans without
+expanding runs, so iterating, point lookups and column-range queries cost
+O(cells) / O(log cells) rather than O(logical width) on wide sheets.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+
+def is_rle_cell(cell: Any) -> bool:
+    """True for a compact cell array carrying a run length > 1 as its last element."""
+    return (isinstance(cell, (list, tuple)) and len(cell) >= 5
+            and isinstance(cell[-1], int) and cell[-1] > 1)
+
+
+class CellSpan(NamedTuple):
+    """A compact cell covering columns col_start..col_end (inclusive)."""
+    col_start: int
+    col_end: int
+    value: Any
+    style: Optional[str]
+    formula: Optional[str]
+
+    @property
+    def width(self) -> int:
+        return self.col_end - self.col_start + 1
+
+
+def cell_span(cell: List[Any]) -> CellSpan:
+    """Span of one compact cell array; a plain cell spans a single column."""
+    col = cell[0]
+    return CellSpan(
+        col,
+        col + cell[-1] - 1 if is_rle_cell(cell) else col,
+        cell[1] if len(cell) > 1 else None,
+        cell[2] if len(cell) > 2 else None,
+        cell[3] if len(cell) > 3 else None,
+    )
+
+
+def iter_spans(cells: List[List[Any]]) -> Iterator[CellSpan]:
+    """Spans of a row's cell arrays, in stored order."""
+    for cell in cells:
+        if cell:
+            yield cell_span(cell)
+
+
+class RowView:
+    """Spans of one compact row with binary-search point and range queries.
+
+    ``spans`` keeps the stored cell order. Lookups resolve overlapping cells
+    the way a ``{col: cell}`` mapping built from the row would: the cell
+    stored last wins.
+    """
+
+    __slots__ = ('row', 'spans', '_resolved', '_starts')
+
+    def __init__(self, row_data: Dict[str, Any]) -> None:
+        self.row = row_data.get('r', 0)
+        self.spans: List[CellSpan] = list(iter_spans(row_data.get('cells', [])))
+        self._resolved: Optional[List[CellSpan]] = None
+        self._starts: List[int] = []
+
+    def __iter__(self) -> Iterator[CellSpan]:
+        return iter(self.spans)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    @property
+    def max_col(self) -> int:
+        """Last column covered by the row (0 for an empty row)."""
+        return max((span.col_end for span in self.spans), default=0)
+
+    @property
+    def width(self) -> int:
+        """Column count of the row once expanded (the sum of its span widths)."""
+        return sum(span.width for span in self.spans)
+
+    # -- point and range queries ----------------------------------------
+
+    def span_at(self, col: int) -> Optional[CellSpan]:
+        """Span covering ``col``, or None."""
+        resolved = self._resolve()
+        i = bisect_right(self._starts, col) - 1
+        if i >= 0 and resolved[i].col_end >= col:
+            return resolved[i]
+        return None
+
+    def value(self, col: int, default: Any = None) -> Any:
+        span = self.span_at(col)
+        return default if span is None else span.value
+
+    def has(self, col: int) -> bool:
+        return self.span_at(col) is not None
+
+    def spans_between(self, min_col: int, max_col: int) -> List[CellSpan]:
+        """Resolved spans intersecting min_col..max_col, clipped to that range."""
+        resolved = self._resolve()
+        lo = max(bisect_right(self._starts, min_col) - 1, 0)
+        hi = bisect_right(self._starts, max_col)
+        clipped = []
+        for span in resolved[lo:hi]:
+            if span.col_end < min_col:
+                continue
+            if span.col_start < min_col or span.col_end > max_col:
+                span = span._replace(col_start=max(span.col_start, min_col), col_end=min(span.col_end, max_col))
+            clipped.append(span)
+        return clipped
+
+    def dense_values(self, width: int, blank: Any = None) -> List[Any]:
+        """Values of columns 1..width as a list, ``blank`` where no cell is stored."""
+        values = [blank] * max(width, 0)
+        for span in self._resolve():
+            start, end = max(span.col_start, 1), min(span.col_end, width)
+            if start <= end:
+                values[start - 1:end] = [span.value] * (end - start + 1)
+        return values
+
+    def _resolve(self) -> List[CellSpan]:
+        """Non-overlapping spans sorted by column, later stored cells winning."""
+        if self._resolved is None:
+            spans = self.spans
+            if all(spans[i].col_start > spans[i - 1].col_end for i in range(1, len(spans))):
+                resolved = spans
+            else:
+                resolved = _resolve_overlaps(spans)
+            self._resolved = resolved
+            self._starts = [span.col_start for span in resolved]
+        return self._resolved
+
+
+def _resolve_overlaps(spans: List[CellSpan]) -> List[CellSpan]:
+    """Paint spans last-to-first, keeping only the parts not already covered."""
+    starts: List[int] = []
+    pieces: List[CellSpan] = []
+    for span in reversed(spans):
+        if span.col_end < span.col_start:
+            continue
+        free_from = span.col_start
+        i = max(bisect_right(starts, span.col_start) - 1, 0)
+        gaps = []
+        while i < len(pieces) and pieces[i].col_start <= span.col_end:
+            covered = pieces[i]
+            if covered.col_end >= free_from:
+                if covered.col_start > free_from:
+                    gaps.append((free_from, covered.col_start - 1))
+                free_from = covered.col_end + 1
+            i += 1
+        if free_from <= span.col_end:
+            gaps.append((free_from, span.col_end))
+        for start, end in gaps:
+            at = bisect_left(starts, start)
+            starts.insert(at, start)
+            pieces.insert(at, span._replace(col_start=start, col_end=end))
+    return pieces
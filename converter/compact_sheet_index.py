@@ -0,0 +1,119 @@
+"""
+Per-sheet index over compact (RLE) rows, shared by the compact table pipeline.
+
+Built once per sheet from ``[{'r': row, 'cells': [[col, value, style, formula(, run)], ...]}]``
+rows, it answers the lookups CompactTableProcessor makes for every detected
+table (the detection grid, cell values for titles and labels, cell counts
+per region), so per-sheet cost stays linear in the number of cells instead
+of growing with tables x cells.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from .compact_row_view import cell_span
+from .sheet_grid import SheetGrid
+
+_MISSING = object()
+
+
+def is_number(value: Any) -> bool:
+    """int/float values, excluding bool."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class CompactSheetIndex:
+    """Row/column lookups and region counters for one sheet in compact row format."""
+
+    def __init__(self, rows: List[Dict[str, Any]], grid_class: Type[SheetGrid] = SheetGrid) -> None:
+        self.rows = rows
+        self.grid_class = grid_class
+        self._grid: Optional[SheetGrid] = None
+        # Later entries for a repeated row number win, as with a {r: row} lookup
+        self._by_row: Dict[int, Dict[str, Any]] = {row_data.get('r', 0): row_data for row_data in rows}
+        self._row_numbers = sorted(self._by_row)
+        self._values: Dict[int, Dict[int, Any]] = {}
+        self._counters: Optional[Tuple[List[int], List[Tuple[List[int], List[int], List[int]]]]] = None
+
+    @property
+    def grid(self) -> SheetGrid:
+        """Detection grid of the sheet (see SheetGrid.from_cell_data)."""
+        if self._grid is None:
+            self._grid = self.grid_class.from_cell_data(self.rows)
+        return self._grid
+
+    # -- row and cell lookups -------------------------------------------
+
+    def row(self, row: int) -> Optional[Dict[str, Any]]:
+        return self._by_row.get(row)
+
+    def rows_between(self, min_row: int, max_row: int) -> List[int]:
+        """Row numbers present in min_row..max_row, ascending."""
+        rows = self._row_numbers
+        return rows[bisect_left(rows, min_row):bisect_right(rows, max_row)]
+
+    def value(self, row: int, col: int, default: Any = None) -> Any:
+        """Value of the first cell at (row, col), or ``default`` when the row has no such cell.
+
+        Cells are matched on their first column, so an RLE cell is found at
+        the column where its run starts.
+        """
+        values = self._values.get(row)
+        if values is None:
+            values = {}
+            row_data = self._by_row.get(row)
+            if row_data is not None:
+                for cell_array in row_data.get('cells', []):
+                    if len(cell_array) >= 2:
+                        values.setdefault(cell_array[0], cell_array[1])
+            self._values[row] = values
+        return values.get(col, default)
+
+    def has_cell(self, row: int, col: int) -> bool:
+        return self.value(row, col, _MISSING) is not _MISSING
+
+    # -- region counters ------------------------------------------------
+
+    def count_cells(self, region: Dict[str, int]) -> int:
+        """Non-empty cells in the region, counting an RLE cell by its run length."""
+        return self._count(region, 1)
+
+    def count_numeric_cells(self, region: Dict[str, int]) -> int:
+        """Numeric (int/float, excluding bool) cells in the region, counting RLE runs."""
+        return self._count(region, 2)
+
+    def _count(self, region: Dict[str, int], which: int) -> int:
+        entry_rows, entries = self._build_counters()
+        lo = bisect_left(entry_rows, region['start_row'])
+        hi = bisect_right(entry_rows, region['end_row'])
+        start_col, end_col = region['start_col'], region['end_col']
+        total = 0
+        for cols, *prefixes in entries[lo:hi]:
+            prefix = prefixes[which - 1]
+            total += prefix[bisect_right(cols, end_col)] - prefix[bisect_left(cols, start_col)]
+        return total
+
+    def _build_counters(self):
+        """Per row entry: sorted cell columns with prefix sums of cell and numeric weights.
+
+        Every row entry counts, including repeated row numbers; a cell is
+        placed at its first column and weighted by its run length.
+        """
+        if self._counters is None:
+            indexed = []
+            for position, row_data in enumerate(self.rows):
+                weighted = []
+                for cell_array in row_data.get('cells', []):
+                    if len(cell_array) >= 2 and cell_array[1] is not None:
+                        span = cell_span(cell_array)
+                        weighted.append((span.col_start, span.width, span.width if is_number(span.value) else 0))
+                weighted.sort(key=lambda item: item[0])
+                cols, cell_prefix, numeric_prefix = [], [0], [0]
+                for col, weight, numeric_weight in weighted:
+                    cols.append(col)
+                    cell_prefix.append(cell_prefix[-1] + weight)
+                    numeric_prefix.append(numeric_prefix[-1] + numeric_weight)
+                indexed.append((row_data.get('r', 1), position, (cols, cell_prefix, numeric_prefix)))
+            indexed.sort(key=lambda item: (item[0], item[1]))
+            self._counters = ([row for row, _, _ in indexed], [entry for _, _, entry in indexed])
+        return self._counters
@@ -1,7 +1,9 @@
 import json
 from typing import Dict, Any, List, Optional, Tuple
 from openpyxl.utils import get_column_letter, column_index_from_string
-from .table_detector import TableDetector, HeaderResolver
+from .compact_row_view import is_rle_cell
+from .compact_sheet_index import CompactSheetIndex, is_number
+from .table_detector import HeaderResolver, get_table_detector
 
 
 class CompactTableProcessor:
@@ -13,7 +15,7 @@ class CompactTableProcessor:
     def __init__(self):
         self.table_detection_rules = []
         # Add new simplified detection system
-        self.detector = TableDetector()
+        self.detector = get_table_detector()
         self.header_resolver = HeaderResolver()
     
     def transform_to_compact_table_format(self, compact_excel_json: dict, options: dict = None) -> dict:
@@ -61,55 +63,31 @@ class CompactTableProcessor:
         detection_options = options.copy()
         detection_options['sheet_data'] = sheet_data
         
+        # Index the sheet once; detection and every table below share it
+        index = CompactSheetIndex(rows, grid_class=self.detector.grid_class)
+        
         # Use new simplified detection system with compact data
-        table_regions = self.detector.detect_tables(rows, dimensions, detection_options)
+        table_regions = self.detector.detect_tables(index.grid, dimensions, detection_options)
         
         # Process each detected table region
         for i, region in enumerate(table_regions):
             table = self._process_compact_table_region(
-                sheet_data, region, i, detection_options
+                sheet_data, region, i, detection_options, index
             )
             if table:
                 tables.append(table)
         
         # If no tables detected, create a default table for the entire sheet
         if not tables and rows:
-            default_table = self._create_compact_default_table(sheet_data, options)
+            default_table = self._create_compact_default_table(sheet_data, options, index)
             if default_table:
                 tables.append(default_table)
         
         return tables
     
-    def _build_cell_map_from_compact_rows(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Convert compact row format back to cell map for table detection"""
-        cell_map = {}
-        
-        for row_data in rows:
-            row_num = row_data.get('r', 1)
-            cells = row_data.get('cells', [])
-            
-            for cell_array in cells:
-                if len(cell_array) >= 2:
-                    col_num = cell_array[0]
-                    value = cell_array[1]
-                    
-                    cell_key = f"{get_column_letter(col_num)}{row_num}"
-                    cell_map[cell_key] = {
-                        'value': value,
-                        'row': row_num,
-                        'column': col_num
-                    }
-        
-        return cell_map
-    
-
-    
-
-    
-
-    
     def _process_compact_table_region(self, sheet_data: dict, region: dict, 
-                                    table_index: int, options: dict) -> Optional[Dict[str, Any]]:
+                                    table_index: int, options: dict,
+                                    index: Optional[CompactSheetIndex] = None) -> Optional[Dict[str, Any]]:
         """
         Process a table region into compact table format
         
@@ -118,6 +96,7 @@ class CompactTableProcessor:
             region: Table region coordinates
             table_index: Index of the table
             options: Processing options
+            index: Index of the sheet's rows (built here if not given)
             
         Returns:
             Compact table object
@@ -125,15 +104,14 @@ class CompactTableProcessor:
         rows = sheet_data.get('rows', [])
         if not rows:
             return None
+        if index is None:
+            index = CompactSheetIndex(rows, grid_class=self.detector.grid_class)
         
         # Determine header information using new resolver
-        # Convert compact rows to normalized cells for header resolution
-        cell_map = self._build_cell_map_from_compact_rows(rows)
-        normalized_cells = self.detector._normalize_cell_data(cell_map)
-        header_info = self.header_resolver.resolve_headers(normalized_cells, region, options)
+        header_info = self.header_resolver.resolve_headers(index.grid, region, options)
         
         # Detect table title (row above the detected region)
-        title_info = self._detect_table_title(rows, region, options)
+        title_info = self._detect_table_title(index, region, options)
         
         # Adjust region to exclude title row if found
         adjusted_region = region.copy()
@@ -163,13 +141,13 @@ class CompactTableProcessor:
                 'data_start': [header_info['data_start_row'], header_info['data_start_col']]
             },
             'labels': {
-                'cols': self._create_compact_column_labels(rows, header_info, adjusted_region),
-                'rows': self._create_compact_row_labels(rows, header_info, adjusted_region)
+                'cols': self._create_compact_column_labels(index, header_info, adjusted_region),
+                'rows': self._create_compact_row_labels(index, header_info, adjusted_region)
             },
             'meta': {
                 'method': region.get('detection_method', 'unknown'),
-                'cells': self._count_cells_in_region(rows, adjusted_region),
-                'numeric_cells': self._count_numeric_cells_in_region(rows, adjusted_region),
+                'cells': self._count_cells_in_region(index, adjusted_region),
+                'numeric_cells': self._count_numeric_cells_in_region(index, adjusted_region),
                 'merged': len(sheet_data.get('merged', [])) > 0,
                 'original_region': [region['start_row'], region['start_col'], region['end_row'], region['end_col']]
             }
@@ -177,12 +155,12 @@ class CompactTableProcessor:
         
         return table
     
-    def _detect_table_title(self, rows: List[Dict[str, Any]], region: dict, options: dict) -> Dict[str, Any]:
+    def _detect_table_title(self, index: CompactSheetIndex, region: dict, options: dict) -> Dict[str, Any]:
         """
         Detect table title in the row immediately above the table region.
         
         Args:
-            rows: Sheet rows data
+            index: Index of the sheet's rows
             region: Table region coordinates
             options: Processing options
             
@@ -197,15 +175,9 @@ class CompactTableProcessor:
         # or check the row immediately above the table
         potential_title_rows = [start_row - 1, start_row]
         
-        # Build row lookup for quick access
-        row_lookup = {}
-        for row_data in rows:
-            row_num = row_data.get('r', 0)
-            row_lookup[row_num] = row_data
-        
         for potential_title_row in potential_title_rows:
-            if potential_title_row in row_lookup:
-                row_data = row_lookup[potential_title_row]
+            row_data = index.row(potential_title_row)
+            if row_data is not None:
                 cells = row_data.get('cells', [])
                 
                 # Look for a single cell in the leftmost position that could be a title
@@ -317,7 +289,7 @@ class CompactTableProcessor:
             'data_start_col': start_col + len(header_cols)
         }
     
-    def _create_compact_column_labels(self, rows: List[Dict[str, Any]], 
+    def _create_compact_column_labels(self, index: CompactSheetIndex, 
                                     header_info: dict, region: dict) -> List[str]:
         """Create compact column labels array"""
         labels = []
@@ -325,116 +297,59 @@ class CompactTableProcessor:
         end_col = region['end_col']
         header_rows = header_info['header_rows']
         
-        # Create row lookup for easier access
-        row_lookup = {row_data['r']: row_data for row_data in rows}
-        
         for col in range(start_col, end_col + 1):
             col_labels = []
             
             for header_row in header_rows:
-                if header_row in row_lookup:
-                    row_data = row_lookup[header_row]
-                    # Find cell for this column
-                    for cell_array in row_data.get('cells', []):
-                        if len(cell_array) >= 2 and cell_array[0] == col:
-                            value = cell_array[1]
-                            if value is not None:
-                                col_labels.append(str(value))
-                            break
+                value = index.value(header_row, col)
+                if value is not None:
+                    col_labels.append(str(value))
             
             label = " | ".join(col_labels) if col_labels else f"Column {get_column_letter(col)}"
             labels.append(label)
         
         return labels
     
-    def _create_compact_row_labels(self, rows: List[Dict[str, Any]], 
+    def _create_compact_row_labels(self, index: CompactSheetIndex, 
                                  header_info: dict, region: dict) -> List[str]:
         """Create compact row labels array for data rows only"""
         labels = []
-        start_row = region['start_row']
         end_row = region['end_row']
         header_cols = header_info['header_columns']
         data_start_row = header_info['data_start_row']
         
-        # Create row lookup for easier access
-        row_lookup = {row_data['r']: row_data for row_data in rows}
-        
-        for row in range(data_start_row, end_row + 1):
-            if row in row_lookup:
-                row_data = row_lookup[row]
-                row_labels = []
-                
-                for header_col in header_cols:
-                    # Find cell for this header column
-                    for cell_array in row_data.get('cells', []):
-                        if len(cell_array) >= 2 and cell_array[0] == header_col:
-                            value = cell_array[1]
-                            if value is not None:
-                                row_labels.append(str(value))
-                            break
-                
-                label = " | ".join(row_labels) if row_labels else f"Row {row}"
-                labels.append(label)
+        # Only rows present in the sheet get a label
+        for row in index.rows_between(data_start_row, end_row):
+            row_labels = []
+            
+            for header_col in header_cols:
+                value = index.value(row, header_col)
+                if value is not None:
+                    row_labels.append(str(value))
+            
+            label = " | ".join(row_labels) if row_labels else f"Row {row}"
+            labels.append(label)
         
         return labels
     
-    def _count_cells_in_region(self, rows: List[Dict[str, Any]], region: dict) -> int:
-        """Count non-empty cells in the table region"""
-        count = 0
-        start_row = region['start_row']
-        end_row = region['end_row']
-        start_col = region['start_col']
-        end_col = region['end_col']
-        
-        for row_data in rows:
-            row_num = row_data.get('r', 1)
-            if start_row <= row_num <= end_row:
-                for cell_array in row_data.get('cells', []):
-                    if len(cell_array) >= 2:
-                        col_num = cell_array[0]
-                        value = cell_array[1]
-                        if start_col <= col_num <= end_col and value is not None:
-                            # Account for RLE cells by run length
-                            if self._is_rle_cell(cell_array):
-                                count += max(int(cell_array[-1]), 0)
-                            else:
-                                count += 1
-        
-        return count
+    def _count_cells_in_region(self, index: CompactSheetIndex, region: dict) -> int:
+        """Count non-empty cells in the table region (RLE cells count by run length)"""
+        return index.count_cells(region)
 
-    def _count_numeric_cells_in_region(self, rows: List[Dict[str, Any]], region: dict) -> int:
+    def _count_numeric_cells_in_region(self, index: CompactSheetIndex, region: dict) -> int:
         """Count numeric (int/float, excluding bool) cells in the region (accounts for RLE)."""
-        count = 0
-        start_row = region['start_row']
-        end_row = region['end_row']
-        start_col = region['start_col']
-        end_col = region['end_col']
-        
-        for row_data in rows:
-            row_num = row_data.get('r', 1)
-            if start_row <= row_num <= end_row:
-                for cell_array in row_data.get('cells', []):
-                    if len(cell_array) >= 2:
-                        col_num = cell_array[0]
-                        value = cell_array[1]
-                        if start_col <= col_num <= end_col and self._is_numeric(value):
-                            if self._is_rle_cell(cell_array):
-                                count += max(int(cell_array[-1]), 0)
-                            else:
-                                count += 1
-        return count
+        return index.count_numeric_cells(region)
 
     def _is_rle_cell(self, cell: List[Any]) -> bool:
         """Detect if a compact-format cell array uses RLE encoding."""
-        return isinstance(cell, list) and len(cell) >= 5 and isinstance(cell[-1], int) and cell[-1] > 1
+        return is_rle_cell(cell)
 
     def _is_numeric(self, value: Any) -> bool:
         """Return True if value is a number (int/float) but not a bool."""
-        if isinstance(value, bool):
-            return False
-        return isinstance(value, (int, float))
+        return is_number(value)
     
-    def _create_compact_default_table(self, sheet_data: dict, options: dict) -> Optional[Dict[str, Any]]:
+    def _create_compact_default_table(self, sheet_data: dict, options: dict,
+                                      index: Optional[CompactSheetIndex] = None) -> Optional[Dict[str, Any]]:
         """Create a default compact table for the entire sheet if no tables detected"""
         rows = sheet_data.get('rows', [])
         if not rows:
@@ -449,4 +364,4 @@ class CompactTableProcessor:
             'detection_method': 'default'
         }
         
-        return self._process_compact_table_region(sheet_data, region, 0, options) 
\ No newline at end of file
+        return self._process_compact_table_region(sheet_data, region, 0, options, index)
\ No newline at end of file
@@ -9,8 +9,9 @@ import json
 import os
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
+from openpyxl.utils import get_column_letter
 from .compact_excel_processor import CompactExcelProcessor
-from .excel_processor import ExcelProcessor
+from .compact_row_view import cell_span
 
 
 class ComplexityPreservingCompactProcessor(CompactExcelProcessor):
@@ -24,17 +25,23 @@ class ComplexityPreservingCompactProcessor(CompactExcelProcessor):
                  rle_min_run_length: int = 3,
                  rle_max_row_width: int = 20,
                  rle_aggressive_none: bool = True,
-                 preserve_complexity_data: bool = True):
+                 preserve_complexity_data: bool = True,
+                 ingestion_mode: str = 'single_pass',
+                 max_workers: Optional[int] = None):
         """
         Initialize with complexity preservation options
         
         Args:
             preserve_complexity_data: Whether to preserve data needed for complexity analysis
+            ingestion_mode: Workbook ingestion engine ('single_pass', 'streaming', 'parallel' or 'dual_load')
+            max_workers: Worker processes for 'parallel' mode (capped by EXCEL_MAX_SHEET_WORKERS)
             Other args: Same as parent CompactExcelProcessor
         """
-        super().__init__(enable_rle, rle_min_run_length, rle_max_row_width, rle_aggressive_none)
+        super().__init__(enable_rle, rle_min_run_length, rle_max_row_width, rle_aggressive_none,
+                         ingestion_mode=ingestion_mode, max_workers=max_workers)
         self.preserve_complexity_data = preserve_complexity_data
         self.complexity_metadata = {}
+        self._collect_complexity = False
     
     def process_file(self, file_path: str, 
                     filter_empty_trailing: bool = True,
@@ -50,279 +57,36 @@ class ComplexityPreservingCompactProcessor(CompactExcelProcessor):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        # First, get complexity metadata using full processor if needed
-        if include_complexity_metadata and self.preserve_complexity_data:
-            self.complexity_metadata = self._extract_complexity_metadata(file_path)
+        # Complexity statistics are accumulated during the compact pass itself
+        self._collect_complexity = include_complexity_metadata and self.preserve_complexity_data
+        if self._collect_complexity:
+            self.complexity_metadata = {
+                'extraction_timestamp': datetime.now().isoformat(),
+                'sheets': {}
+            }
         
-        # Process normally with compact processor
-        result = super().process_file(file_path, filter_empty_trailing)
+        try:
+            result = super().process_file(file_path, filter_empty_trailing)
+        finally:
+            collected = self._collect_complexity
+            self._collect_complexity = False
         
         # Enhance result with complexity metadata
-        if include_complexity_metadata and self.preserve_complexity_data:
+        if collected:
+            print(f"✅ Extracted complexity metadata for {len(self.complexity_metadata['sheets'])} sheets")
             result['complexity_metadata'] = self.complexity_metadata
         
         return result
     
-    def _extract_complexity_metadata(self, file_path: str) -> Dict[str, Any]:
-        """
-        Extract metadata needed for complexity analysis using full processor
-        
-        This preserves key complexity indicators without storing all the data.
-        """
-        print("🔍 Extracting complexity metadata...")
-        
-        # Use full processor to get complete data for analysis
-        full_processor = ExcelProcessor()
-        full_data = full_processor.process_file(file_path)
-        
-        complexity_metadata = {
-            'extraction_timestamp': datetime.now().isoformat(),
-            'sheets': {}
-        }
-        
-        for sheet in full_data.get('workbook', {}).get('sheets', []):
-            sheet_name = sheet.get('name', 'Unknown')
-            sheet_metadata = self._extract_sheet_complexity_metadata(sheet)
-            complexity_metadata['sheets'][sheet_name] = sheet_metadata
-        
-        print(f"✅ Extracted complexity metadata for {len(complexity_metadata['sheets'])} sheets")
-        return complexity_metadata
+    def _start_sheet_statistics(self, sheet_name: str) -> Optional['SheetComplexityAccumulator']:
+        """Start a complexity accumulator for the sheet when metadata is requested"""
+        if not self._collect_complexity:
+            return None
+        return SheetComplexityAccumulator(self)
     
-    def _extract_sheet_complexity_metadata(self, sheet: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Extract complexity-relevant metadata from a single sheet
-        
-        This captures the essence of complexity without storing all cell data.
-        """
-        cells = sheet.get('cells', {})
-        dimensions = sheet.get('dimensions', {})
-        merged_cells = sheet.get('merged_cells', [])
-        
-        # 1. Merged Cell Analysis
-        merged_metadata = {
-            'count': len(merged_cells),
-            'complex_merges': 0,
-            'patterns': []
-        }
-        
-        for merge in merged_cells:
-            start_row = merge.get('start_row', 0) or 0
-            end_row = merge.get('end_row', 0) or 0
-            start_col = merge.get('start_column', 0) or 0
-            end_col = merge.get('end_column', 0) or 0
-            
-            rows_spanned = end_row - start_row + 1
-            cols_spanned = end_col - start_col + 1
-            
-            if rows_spanned > 2 or cols_spanned > 2:
-                merged_metadata['complex_merges'] += 1
-            
-            # Store pattern for analysis
-            merged_metadata['patterns'].append({
-                'start_row': start_row,
-                'start_col': start_col,
-                'rows_spanned': rows_spanned,
-                'cols_spanned': cols_spanned
-            })
-        
-        # 2. Header Structure Analysis
-        header_metadata = self._analyze_header_patterns(cells, dimensions)
-        
-        # 3. Data Distribution Analysis
-        distribution_metadata = self._analyze_data_distribution(cells, dimensions)
-        
-        # 4. Formula Analysis
-        formula_metadata = self._analyze_formula_patterns(cells)
-        
-        # 5. Column Structure Analysis
-        column_metadata = self._analyze_column_patterns(cells, dimensions)
-        
-        return {
-            'dimensions': dimensions,
-            'cell_count': len(cells),
-            'merged_cells': merged_metadata,
-            'header_structure': header_metadata,
-            'data_distribution': distribution_metadata,
-            'formulas': formula_metadata,
-            'columns': column_metadata
-        }
-    
-    def _analyze_header_patterns(self, cells: Dict[str, Any], 
-                                dimensions: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze header patterns for complexity assessment"""
-        max_row_check = min(dimensions.get('max_row', 10), 10)
-        min_col = dimensions.get('min_col', 1)
-        max_col = dimensions.get('max_col', 1)
-        
-        header_rows = []
-        inconsistencies = 0
-        
-        # Check first few rows for header patterns
-        for row in range(1, max_row_check + 1):
-            row_cells = []
-            gaps = 0
-            
-            for col in range(min_col, max_col + 1):
-                from openpyxl.utils import get_column_letter
-                coord = f"{get_column_letter(col)}{row}"
-                
-                if coord in cells:
-                    value = cells[coord].get('value')
-                    if value is not None:
-                        row_cells.append({
-                            'col': col,
-                            'value': str(value),
-                            'type': type(value).__name__
-                        })
-                else:
-                    gaps += 1
-            
-            if row_cells:
-                # Analyze if this looks like a header row
-                text_ratio = sum(1 for cell in row_cells 
-                               if isinstance(cell.get('value'), str)) / len(row_cells)
-                
-                header_rows.append({
-                    'row': row,
-                    'cell_count': len(row_cells),
-                    'gaps': gaps,
-                    'text_ratio': text_ratio,
-                    'is_header_like': text_ratio > 0.7
-                })
-                
-                # Count inconsistencies
-                if gaps > 0:
-                    gap_ratio = gaps / (max_col - min_col + 1)
-                    inconsistencies += gap_ratio
-        
-        # Detect header levels
-        header_levels = len([hr for hr in header_rows if hr['is_header_like']])
-        
-        return {
-            'detected_levels': header_levels,
-            'inconsistency_score': min(inconsistencies, 1.0),
-            'header_rows': header_rows[:5]  # Keep first 5 for analysis
-        }
-    
-    def _analyze_data_distribution(self, cells: Dict[str, Any], 
-                                  dimensions: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze data distribution patterns"""
-        if not cells or not dimensions:
-            return {'sparsity': 0.0, 'clusters': []}
-        
-        # Calculate sparsity
-        total_addressable = (
-            (dimensions.get('max_row', 1) - dimensions.get('min_row', 1) + 1) *
-            (dimensions.get('max_col', 1) - dimensions.get('min_col', 1) + 1)
-        )
-        
-        data_cells = len([cell for cell in cells.values() 
-                         if cell.get('value') is not None and 
-                         str(cell.get('value', '')).strip()])
-        
-        sparsity = 1.0 - (data_cells / total_addressable) if total_addressable > 0 else 0.0
-        
-        # Analyze data clustering (simplified)
-        row_distribution = {}
-        col_distribution = {}
-        
-        for coord, cell in cells.items():
-            if cell.get('value') is not None:
-                # Extract row and column
-                import re
-                row_match = re.search(r'\d+', coord)
-                col_match = re.search(r'[A-Z]+', coord)
-                
-                if row_match:
-                    row_num = int(row_match.group())
-                    row_distribution[row_num] = row_distribution.get(row_num, 0) + 1
-                
-                if col_match:
-                    col_str = col_match.group()
-                    col_distribution[col_str] = col_distribution.get(col_str, 0) + 1
-        
-        # Find largest gaps (indicating sparse regions)
-        row_gaps = self._find_gaps(sorted(row_distribution.keys()))
-        col_gaps = self._find_gaps_alpha(sorted(col_distribution.keys()))
-        
-        return {
-            'sparsity': sparsity,
-            'total_addressable': total_addressable,
-            'data_cells': data_cells,
-            'row_gaps': row_gaps[:5],  # Top 5 largest gaps
-            'col_gaps': col_gaps[:5],
-            'clustered': len(row_gaps) > 3 or len(col_gaps) > 3  # Multiple gaps suggest clustering
-        }
-    
-    def _analyze_formula_patterns(self, cells: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze formula complexity patterns"""
-        formula_count = 0
-        complex_formula_count = 0
-        formula_types = {}
-        
-        for cell in cells.values():
-            formula = cell.get('formula')
-            if formula:
-                formula_count += 1
-                
-                # Categorize formula complexity
-                if self._is_complex_formula(formula):
-                    complex_formula_count += 1
-                
-                # Track formula types
-                formula_type = self._categorize_formula(formula)
-                formula_types[formula_type] = formula_types.get(formula_type, 0) + 1
-        
-        total_cells = len(cells)
-        
-        return {
-            'formula_count': formula_count,
-            'complex_formula_count': complex_formula_count,
-            'formula_ratio': formula_count / total_cells if total_cells > 0 else 0,
-            'complex_ratio': complex_formula_count / formula_count if formula_count > 0 else 0,
-            'formula_types': formula_types
-        }
-    
-    def _analyze_column_patterns(self, cells: Dict[str, Any], 
-                                dimensions: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze column consistency patterns"""
-        min_col = dimensions.get('min_col', 1)
-        max_col = dimensions.get('max_col', 1)
-        min_row = dimensions.get('min_row', 1)
-        max_row = dimensions.get('max_row', 1)
-        
-        column_analysis = {}
-        
-        from openpyxl.utils import get_column_letter
-        
-        for col in range(min_col, min(max_col + 1, min_col + 20)):  # Limit to first 20 cols
-            col_letter = get_column_letter(col)
-            col_values = []
-            
-            for row in range(min_row, max_row + 1):
-                coord = f"{col_letter}{row}"
-                if coord in cells:
-                    value = cells[coord].get('value')
-                    if value is not None:
-                        col_values.append(value)
-            
-            if len(col_values) > 1:
-                inconsistency = self._calculate_column_inconsistency(col_values)
-                column_analysis[col_letter] = {
-                    'value_count': len(col_values),
-                    'inconsistency': inconsistency,
-                    'types': self._get_value_types(col_values)
-                }
-        
-        # Calculate overall inconsistency
-        inconsistencies = [col['inconsistency'] for col in column_analysis.values()]
-        avg_inconsistency = sum(inconsistencies) / len(inconsistencies) if inconsistencies else 0
-        
-        return {
-            'column_count': len(column_analysis),
-            'average_inconsistency': avg_inconsistency,
-            'high_inconsistency_columns': len([i for i in inconsistencies if i > 0.3])
-        }
+    def _record_sheet_statistics(self, sheet_name: str, summary: Dict[str, Any]) -> None:
+        """Store the finished complexity metadata for the sheet"""
+        self.complexity_metadata['sheets'][sheet_name] = summary
     
     def _find_gaps(self, sorted_numbers: List[int]) -> List[int]:
         """Find gaps in a sorted list of numbers"""
@@ -333,19 +97,6 @@ class ComplexityPreservingCompactProcessor(CompactExcelProcessor):
                 gaps.append(gap)
         return sorted(gaps, reverse=True)
     
-    def _find_gaps_alpha(self, sorted_cols: List[str]) -> List[int]:
-        """Find gaps in alphabetical column sequence"""
-        # Simplified - just count missing columns
-        if len(sorted_cols) < 2:
-            return []
-        
-        from openpyxl.utils import column_index_from_string
-        try:
-            indices = [column_index_from_string(col) for col in sorted_cols]
-            return self._find_gaps(sorted(indices))
-        except:
-            return []
-    
     def _is_complex_formula(self, formula: str) -> bool:
         """Check if formula is complex (same as in complexity analyzer)"""
         if not formula:
@@ -384,33 +135,19 @@ class ComplexityPreservingCompactProcessor(CompactExcelProcessor):
         else:
             return 'other'
     
-    def _calculate_column_inconsistency(self, col_values: List[Any]) -> float:
-        """Calculate inconsistency score for column values"""
-        if len(col_values) <= 1:
+    def _calculate_column_inconsistency(self, type_counts: Dict[str, int], value_count: int) -> float:
+        """Calculate inconsistency score for a column from its value type counts"""
+        if value_count <= 1:
             return 0.0
         
-        # Analyze data types
-        type_counts = {}
-        for value in col_values:
-            value_type = type(value).__name__
-            type_counts[value_type] = type_counts.get(value_type, 0) + 1
-        
         # Calculate inconsistency based on type diversity
         if len(type_counts) == 1:
             return 0.0  # All same type = consistent
         
         # More types = more inconsistency
-        inconsistency = (len(type_counts) - 1) / len(col_values)
+        inconsistency = (len(type_counts) - 1) / value_count
         return min(inconsistency, 1.0)
     
-    def _get_value_types(self, values: List[Any]) -> Dict[str, int]:
-        """Get count of value types in a list"""
-        type_counts = {}
-        for value in values:
-            value_type = type(value).__name__
-            type_counts[value_type] = type_counts.get(value_type, 0) + 1
-        return type_counts
-    
     def _filter_empty_trailing_areas(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Enhanced filtering that preserves complexity-relevant data
@@ -498,13 +235,7 @@ class ComplexityPreservingCompactProcessor(CompactExcelProcessor):
                 
                 for cell in cells:
                     if len(cell) >= 1:
-                        if self._is_rle_cell(cell):
-                            start_col = cell[0]
-                            run_length = cell[-1]
-                            end_col = start_col + run_length - 1
-                            max_data_col = max(max_data_col, end_col)
-                        else:
-                            max_data_col = max(max_data_col, cell[0])
+                        max_data_col = max(max_data_col, cell_span(cell).col_end)
         
         # Very minimal filtering - only remove completely empty areas
         filtered_rows = []
@@ -532,3 +263,192 @@ class ComplexityPreservingCompactProcessor(CompactExcelProcessor):
         """Moderate filtering - original approach but with some preservation"""
         # Use the original filtering method but with less aggressive trimming
         return super()._filter_sheet_empty_trailing_areas(sheet)
+
+
+class SheetComplexityAccumulator:
+    """
+    Complexity statistics for one sheet, fed cell by cell from the compact pass
+    
+    Only content cells (a value, a formula or a comment) are observed, which is
+    exactly the cell set the verbose ExcelProcessor emits, so the finished
+    metadata matches what analysing its output produced.
+    """
+    
+    HEADER_ROWS_CHECKED = 10
+    
+    def __init__(self, processor: ComplexityPreservingCompactProcessor):
+        self.processor = processor
+        self.cell_count = 0
+        self.data_cells = 0
+        self.value_rows = set()
+        self.value_cols = set()
+        # Header candidates: row -> [content cells, cells with a value]
+        self.header_rows: Dict[int, List[int]] = {}
+        # Column -> (value count, type name counts in first-seen order)
+        self.column_values: Dict[int, List[Any]] = {}
+        self.formula_count = 0
+        self.complex_formula_count = 0
+        self.formula_types: Dict[str, int] = {}
+    
+    def add_cell(self, row: int, column: int, value: Any, formula: Any) -> None:
+        """Record one content cell"""
+        self.cell_count += 1
+        
+        if row <= self.HEADER_ROWS_CHECKED:
+            header_row = self.header_rows.setdefault(row, [0, 0])
+            header_row[0] += 1
+            if value is not None:
+                header_row[1] += 1
+        
+        if value is not None:
+            if str(value).strip():
+                self.data_cells += 1
+            self.value_rows.add(row)
+            self.value_cols.add(column)
+            
+            column_stats = self.column_values.setdefault(column, [0, {}])
+            column_stats[0] += 1
+            value_type = type(value).__name__
+            column_stats[1][value_type] = column_stats[1].get(value_type, 0) + 1
+        
+        if formula:
+            if not isinstance(formula, str):
+                # Array and data-table formulas are reported in their string form
+                formula = str(formula)
+            self.formula_count += 1
+            if self.processor._is_complex_formula(formula):
+                self.complex_formula_count += 1
+            formula_type = self.processor._categorize_formula(formula)
+            self.formula_types[formula_type] = self.formula_types.get(formula_type, 0) + 1
+    
+    def finish(self, dimensions: Dict[str, int], merged_ranges) -> Dict[str, Any]:
+        """Build the sheet's complexity metadata once its bounds are known"""
+        return {
+            'dimensions': dimensions,
+            'cell_count': self.cell_count,
+            'merged_cells': self._merged_metadata(merged_ranges),
+            'header_structure': self._header_metadata(dimensions),
+            'data_distribution': self._distribution_metadata(dimensions),
+            'formulas': self._formula_metadata(),
+            'columns': self._column_metadata(dimensions)
+        }
+    
+    def _merged_metadata(self, merged_ranges) -> Dict[str, Any]:
+        merged_metadata = {
+            'count': 0,
+            'complex_merges': 0,
+            'patterns': []
+        }
+        
+        for merged_range in merged_ranges:
+            merged_metadata['count'] += 1
+            start_row = merged_range.min_row
+            start_col = merged_range.min_col
+            # The verbose merged-cell records never carried an end cell, so spans
+            # have always been measured against 0; kept for comparable scores
+            rows_spanned = 0 - start_row + 1
+            cols_spanned = 0 - start_col + 1
+            
+            if rows_spanned > 2 or cols_spanned > 2:
+                merged_metadata['complex_merges'] += 1
+            
+            merged_metadata['patterns'].append({
+                'start_row': start_row,
+                'start_col': start_col,
+                'rows_spanned': rows_spanned,
+                'cols_spanned': cols_spanned
+            })
+        
+        return merged_metadata
+    
+    def _header_metadata(self, dimensions: Dict[str, int]) -> Dict[str, Any]:
+        max_row_check = min(dimensions.get('max_row', 10), self.HEADER_ROWS_CHECKED)
+        width = dimensions.get('max_col', 1) - dimensions.get('min_col', 1) + 1
+        
+        header_rows = []
+        inconsistencies = 0
+        
+        for row in range(1, max_row_check + 1):
+            if row not in self.header_rows:
+                continue
+            content_cells, value_cells = self.header_rows[row]
+            if not value_cells:
+                continue
+            
+            gaps = width - content_cells
+            # Header values are recorded in string form, so every one counts as text
+            text_ratio = 1.0
+            header_rows.append({
+                'row': row,
+                'cell_count': value_cells,
+                'gaps': gaps,
+                'text_ratio': text_ratio,
+                'is_header_like': text_ratio > 0.7
+            })
+            
+            if gaps > 0:
+                inconsistencies += gaps / width
+        
+        return {
+            'detected_levels': len([hr for hr in header_rows if hr['is_header_like']]),
+            'inconsistency_score': min(inconsistencies, 1.0),
+            'header_rows': header_rows[:5]  # Keep first 5 for analysis
+        }
+    
+    def _distribution_metadata(self, dimensions: Dict[str, int]) -> Dict[str, Any]:
+        if not self.cell_count or not dimensions:
+            return {'sparsity': 0.0, 'clusters': []}
+        
+        total_addressable = (
+            (dimensions.get('max_row', 1) - dimensions.get('min_row', 1) + 1) *
+            (dimensions.get('max_col', 1) - dimensions.get('min_col', 1) + 1)
+        )
+        sparsity = 1.0 - (self.data_cells / total_addressable) if total_addressable > 0 else 0.0
+        
+        # Find largest gaps (indicating sparse regions)
+        row_gaps = self.processor._find_gaps(sorted(self.value_rows))
+        col_gaps = self.processor._find_gaps(sorted(self.value_cols))
+        
+        return {
+            'sparsity': sparsity,
+            'total_addressable': total_addressable,
+            'data_cells': self.data_cells,
+            'row_gaps': row_gaps[:5],  # Top 5 largest gaps
+            'col_gaps': col_gaps[:5],
+            'clustered': len(row_gaps) > 3 or len(col_gaps) > 3  # Multiple gaps suggest clustering
+        }
+    
+    def _formula_metadata(self) -> Dict[str, Any]:
+        return {
+            'formula_count': self.formula_count,
+            'complex_formula_count': self.complex_formula_count,
+            'formula_ratio': self.formula_count / self.cell_count if self.cell_count > 0 else 0,
+            'complex_ratio': self.complex_formula_count / self.formula_count if self.formula_count > 0 else 0,
+            'formula_types': self.formula_types
+        }
+    
+    def _column_metadata(self, dimensions: Dict[str, int]) -> Dict[str, Any]:
+        min_col = dimensions.get('min_col', 1)
+        max_col = dimensions.get('max_col', 1)
+        
+        column_analysis = {}
+        for col in range(min_col, min(max_col + 1, min_col + 20)):  # Limit to first 20 cols
+            if col not in self.column_values:
+                continue
+            value_count, type_counts = self.column_values[col]
+            if value_count > 1:
+                column_analysis[get_column_letter(col)] = {
+                    'value_count': value_count,
+                    'inconsistency': self.processor._calculate_column_inconsistency(type_counts, value_count),
+                    'types': dict(type_counts)
+                }
+        
+        # Calculate overall inconsistency
+        inconsistencies = [col['inconsistency'] for col in column_analysis.values()]
+        avg_inconsistency = sum(inconsistencies) / len(inconsistencies) if inconsistencies else 0
+        
+        return {
+            'column_count': len(column_analysis),
+            'average_inconsistency': avg_inconsistency,
+            'high_inconsistency_columns': len([i for i in inconsistencies if i > 0.3])
+        }
@@ -0,0 +1,112 @@
+"""zstd/gzip content encodings shared by the storage services and HTTP streaming.
+
+zstd needs the optional ``zstandard`` package; gzip uses zlib. Stored objects
+and HTTP bodies use the same encoding names ('zstd', 'gzip') so compressed
+artifacts can be forwarded to clients as-is.
+"""
+
+from __future__ import annotations
+
+import os
+import zlib
+from typing import Iterable, Iterator, Optional, Tuple
+
+
+CONTENT_ENCODINGS = ("zstd", "gzip")
+DEFAULT_LEVELS = {"zstd": 3, "gzip": 6}
+
+
+def zstd_available() -> bool:
+    try:
+        import zstandard  # type: ignore  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def available_encodings() -> Tuple[str, ...]:
+    return CONTENT_ENCODINGS if zstd_available() else ("gzip",)
+
+
+def _import_zstandard():
+    try:
+        import zstandard  # type: ignore
+    except ImportError as e:
+        raise RuntimeError("zstd content encoding requires the 'zstandard' package") from e
+    return zstandard
+
+
+def _check(encoding: str) -> None:
+    if encoding not in CONTENT_ENCODINGS:
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    _check(encoding)
+    level = DEFAULT_LEVELS[encoding] if level is None else level
+    if encoding == "zstd":
+        return _import_zstandard().ZstdCompressor(level=level).compress(data)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    _check(encoding)
+    return b"".join(iter_decompress([data], encoding))
+
+
+def iter_compress(chunks: Iterable[bytes], encoding: str, level: Optional[int] = None) -> Iterator[bytes]:
+    """Compress a stream of chunks into one zstd frame or gzip member."""
+    _check(encoding)
+    level = DEFAULT_LEVELS[encoding] if level is None else level
+    if encoding == "zstd":
+        compressor = _import_zstandard().ZstdCompressor(level=level).compressobj()
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def iter_decompress(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """Decompress a stream of chunks, reading across concatenated frames/members."""
+    _check(encoding)
+    if encoding == "zstd":
+        decompressor = _import_zstandard().ZstdDecompressor()
+        new = decompressor.decompressobj
+    else:
+        new = lambda: zlib.decompressobj(zlib.MAX_WBITS | 16)  # noqa: E731
+    current = new()
+    for chunk in chunks:
+        while chunk:
+            out = current.decompress(chunk)
+            if out:
+                yield out
+            if not current.eof:
+                break
+            chunk = current.unused_data
+            current = new()
+    if encoding == "gzip":
+        tail = current.flush()
+        if tail:
+            yield tail
+
+
+def get_storage_compression() -> Tuple[Optional[str], Optional[int]]:
+    """(encoding, level) for JSON artifacts from STORAGE_COMPRESSION / STORAGE_COMPRESSION_LEVEL.
+
+    Unset, 'none' or 'off' disables compression.
+    """
+    encoding = (os.getenv("STORAGE_COMPRESSION") or "").strip().lower()
+    if encoding in ("", "none", "off"):
+        return None, None
+    _check(encoding)
+    if encoding == "zstd":
+        _import_zstandard()
+    level = (os.getenv("STORAGE_COMPRESSION_LEVEL") or "").strip()
+    try:
+        return encoding, int(level) if level else None
+    except ValueError:
+        raise ValueError(f"STORAGE_COMPRESSION_LEVEL must be an integer, got {level!r}")
@@ -0,0 +1,259 @@
+"""Content-addressed cache of conversion results, kept in the storage service.
+
+Results are keyed on the SHA-256 of the uploaded bytes, a hash of the
+options that shape the output, and a fingerprint of the pipeline code.
+The fingerprint covers the source of every converter module the pipeline
+imports, found by following import statements from its entry modules, and
+the versions of the parsing libraries it relies on. Any change to either
+produces new keys, so stale results are never served and need no explicit
+invalidation.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import time
+from datetime import datetime
+from functools import lru_cache
+from importlib import metadata
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from converter.storage_service import StorageService, get_storage_service
+
+
+# Pipeline name -> (entry modules of the pipeline, libraries whose version shapes the output).
+# Every converter module the entry modules import, directly or not, is part of the fingerprint.
+PIPELINES: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "excel_compact": (
+        (
+            "converter.complexity_preserving_compact_processor",
+            "converter.excel_complexity_analyzer",
+            "converter.compact_table_processor",
+        ),
+        ("openpyxl",),
+    ),
+    "pdf_table_removal": (
+        ("converter.pdf.table_removal",),
+        ("pdfplumber", "pdfminer.six"),
+    ),
+}
+
+# Values that describe one run rather than the file: (artifact, *path), where '*' matches any key.
+# They are left out of cache entries and filled in for the current run on a hit.
+RUN_FIELDS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "excel_compact": (
+        ("processed_json", "workbook", "meta", "filename"),
+        ("processed_json", "complexity_metadata", "extraction_timestamp"),
+        ("table_data", "workbook", "meta", "filename"),
+        ("table_data", "complexity_metadata", "extraction_timestamp"),
+        ("table_data", "complexity_analysis", "*", "processing_metadata", "analysis_timestamp"),
+    ),
+    "pdf_table_removal": (
+        ("processed_json", "pdf_processing_result", "document_metadata", "filename"),
+        ("processed_json", "pdf_processing_result", "document_metadata", "processing_timestamp"),
+        ("processed_json", "pdf_processing_result", "document_metadata", "processing_duration"),
+        ("processed_json", "pdf_processing_result", "tables", "metadata", "filename"),
+        ("processed_json", "pdf_processing_result", "tables", "metadata", "extraction_timestamp"),
+        # text_content's filename names the internal table-free copy, not the upload
+        ("processed_json", "pdf_processing_result", "text_content", "document_metadata", "extraction_timestamp"),
+    ),
+}
+
+# Only modules of this package are followed; third-party code is covered by library versions
+PACKAGE = "converter"
+
+# Bump to invalidate every cached result, e.g. when the stored layout changes
+CACHE_FORMAT_VERSION = "1"
+
+
+def _module_source(module_name: str) -> Tuple[Optional[str], bool]:
+    """Path of a module's source file and whether it is a package, without importing it."""
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None, False
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None, False
+    return spec.origin, spec.submodule_search_locations is not None
+
+
+def _imported_modules(module_name: str, path: str, is_package: bool) -> Set[str]:
+    """Absolute names of every module an import statement in the file may refer to.
+
+    Function-level imports count too, so lazily loaded engines are covered.
+    """
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+    package = module_name if is_package else module_name.rpartition(".")[0]
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = importlib.util.resolve_name("." * node.level + (node.module or ""), package) \
+                if node.level else node.module
+            if not base:
+                continue
+            names.add(base)
+            # ``from pkg import name`` may import the submodule pkg.name
+            names.update(f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
+    return names
+
+
+@lru_cache(maxsize=None)
+def pipeline_modules(pipeline: str) -> Tuple[str, ...]:
+    """Every converter module reachable from the pipeline's entry modules, sorted."""
+    if pipeline not in PIPELINES:
+        raise ValueError(f"Unknown conversion pipeline: {pipeline}")
+    seen: Set[str] = set()
+    stack = list(PIPELINES[pipeline][0])
+    while stack:
+        module_name = stack.pop()
+        if module_name in seen or not (module_name == PACKAGE or module_name.startswith(PACKAGE + ".")):
+            continue
+        path, is_package = _module_source(module_name)
+        if path is None:
+            continue
+        seen.add(module_name)
+        # Importing a module runs its parent packages' __init__ first
+        stack.append(module_name.rpartition(".")[0])
+        stack.extend(_imported_modules(module_name, path, is_package))
+    return tuple(sorted(seen))
+
+
+@lru_cache(maxsize=None)
+def pipeline_fingerprint(pipeline: str) -> str:
+    """Hash of the pipeline's module sources and library versions."""
+    modules = pipeline_modules(pipeline)
+    libraries = PIPELINES[pipeline][1]
+    digest = hashlib.sha256(f"format={CACHE_FORMAT_VERSION}".encode())
+    for module_name in modules:
+        path, _ = _module_source(module_name)
+        digest.update(module_name.encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    for library in libraries:
+        try:
+            version = metadata.version(library)
+        except metadata.PackageNotFoundError:
+            version = "missing"
+        digest.update(f"{library}=={version}".encode())
+    return digest.hexdigest()
+
+
+def _run_field_slots(artifacts: Dict[str, Any], path: Tuple[str, ...],
+                     existing_only: bool = True) -> Iterator[Tuple[Dict[str, Any], str]]:
+    """(container, key) for every field matching ``path``, or every slot for it with ``existing_only=False``."""
+    containers = [artifacts]
+    for part in path[:-1]:
+        containers = [value for container in containers
+                      for key, value in container.items() if part in ("*", key) and isinstance(value, dict)]
+    for container in containers:
+        if path[-1] in container or not existing_only:
+            yield container, path[-1]
+
+
+def _run_field_value(field: str, file_path: str, started: float) -> Any:
+    if field == "filename":
+        return os.path.basename(file_path)
+    if field == "processing_duration":
+        return time.monotonic() - started
+    return datetime.now().isoformat()
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ConversionCache:
+    """Stores pipeline outputs under ``{prefix}/{pipeline}/{fingerprint}/{content}-{options}/``.
+
+    An entry is a set of JSON artifacts (e.g. ``processed_json`` and
+    ``table_data``) plus a ``manifest.json`` written last; an entry without a
+    manifest is incomplete and treated as a miss.
+    """
+
+    def __init__(self, storage: Optional[StorageService] = None, prefix: str = "conversion-cache",
+                 enabled: bool = True) -> None:
+        self._storage = storage
+        self.prefix = prefix.strip("/")
+        self.enabled = enabled
+
+    @property
+    def storage(self) -> StorageService:
+        return self._storage or get_storage_service()
+
+    def entry_key(self, pipeline: str, content_sha256: str, options: Optional[Dict[str, Any]] = None) -> str:
+        options_hash = hashlib.sha256(
+            json.dumps(options or {}, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return (f"{self.prefix}/{pipeline}/{pipeline_fingerprint(pipeline)[:16]}/"
+                f"{content_sha256}-{options_hash[:16]}")
+
+    def get(self, entry_key: str) -> Optional[Dict[str, Any]]:
+        """Artifacts stored under ``entry_key``, or None on a miss."""
+        storage = self.storage
+        try:
+            if not storage.exists(f"{entry_key}/manifest.json"):
+                return None
+            manifest = storage.get_json(f"{entry_key}/manifest.json")
+            return {name: storage.get_json(f"{entry_key}/{name}.json") for name in manifest["artifacts"]}
+        except Exception:
+            # A damaged or half-deleted entry is recomputed rather than failing the upload
+            return None
+
+    def put(self, entry_key: str, artifacts: Dict[str, Any], pipeline: Optional[str] = None) -> None:
+        """Store ``artifacts``; the pipeline's run fields are left out of the entry."""
+        storage = self.storage
+        removed: List[Tuple[Dict[str, Any], str, Any]] = []
+        for path in RUN_FIELDS.get(pipeline, ()):
+            for container, key in list(_run_field_slots(artifacts, path)):
+                removed.append((container, key, container.pop(key)))
+        try:
+            for name, data in artifacts.items():
+                storage.put_json(f"{entry_key}/{name}.json", data)
+            storage.put_json(f"{entry_key}/manifest.json", {"artifacts": sorted(artifacts)})
+        finally:
+            # The caller still returns these artifacts for its own run
+            for container, key, value in reversed(removed):
+                container[key] = value
+
+    def get_or_compute(self, pipeline: str, file_path: str, options: Optional[Dict[str, Any]],
+                       compute: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+        """Return ``(artifacts, cache_hit)``, running ``compute`` only on a miss.
+
+        On a hit the pipeline's RUN_FIELDS describe this run: the upload's
+        file name, the current time and the time spent serving the hit.
+        """
+        if not self.enabled:
+            return compute(), False
+        started = time.monotonic()
+        entry_key = self.entry_key(pipeline, hash_file(file_path), options)
+        cached = self.get(entry_key)
+        if cached is not None:
+            for path in RUN_FIELDS.get(pipeline, ()):
+                for container, key in _run_field_slots(cached, path, existing_only=False):
+                    container[key] = _run_field_value(key, file_path, started)
+            return cached, True
+        artifacts = compute()
+        try:
+            self.put(entry_key, artifacts, pipeline)
+        except Exception as e:
+            print(f"⚠️ Failed to store conversion cache entry {entry_key}: {e}")
+        return artifacts, False
+
+
+def get_conversion_cache() -> ConversionCache:
+    """Cache configured from CONVERSION_CACHE_ENABLED (default true) and CONVERSION_CACHE_PREFIX."""
+    return ConversionCache(
+        prefix=os.getenv("CONVERSION_CACHE_PREFIX", "conversion-cache"),
+        enabled=os.getenv("CONVERSION_CACHE_ENABLED", "true").lower() == "true",
+    )
@@ -0,0 +1,219 @@
+"""
+Single-Pass Excel Workbook Loader
+
+openpyxl drops the cached ``<v>`` value of formula cells unless a workbook is
+opened with ``data_only=True``, which is why the processors historically called
+``load_workbook`` twice and looked up every cell in both copies. This loader
+parses each sheet part once with formulas enabled and captures the cached
+values of formula cells on the side, so callers get both views from a single
+parse of the file.
+
+The dual-value parser builds on openpyxl's private sheet reader classes, so it
+is only used on the openpyxl releases listed in ``SUPPORTED_OPENPYXL``; on any
+other release ``load_workbook_single_pass`` falls back to two loads. openpyxl
+itself is never patched: the loader runs its own ExcelReader subclass.
+"""
+
+import contextvars
+import types
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from openpyxl import __version__ as OPENPYXL_VERSION, load_workbook
+from openpyxl.reader import excel as openpyxl_excel_reader
+from openpyxl.reader.excel import ExcelReader
+from openpyxl.styles.numbers import is_date_format
+from openpyxl.utils.cell import coordinate_to_tuple
+from openpyxl.workbook.workbook import Workbook
+from openpyxl.worksheet._reader import WorkSheetParser, WorksheetReader
+from openpyxl.worksheet.worksheet import Worksheet
+
+
+# Per-load sink for cached formula values: {sheet_title: {(row, col): (value, data_type)}}.
+# A context variable keeps concurrent loads in different threads isolated.
+_cached_value_sink: contextvars.ContextVar = contextvars.ContextVar('cached_value_sink', default=None)
+
+# openpyxl (major, minor) releases whose reader internals the parser below was written against
+SUPPORTED_OPENPYXL = ((3, 1),)
+
+
+def _single_pass_supported() -> bool:
+    """Whether the installed openpyxl matches the internals this module relies on"""
+    try:
+        version = tuple(int(part) for part in OPENPYXL_VERSION.split('.')[:2])
+    except ValueError:
+        return False
+    return (version in SUPPORTED_OPENPYXL
+            and 'WorksheetReader' in ExcelReader.read_worksheets.__code__.co_names
+            and hasattr(WorkSheetParser, 'parse_cell'))
+
+
+SINGLE_PASS_SUPPORTED = _single_pass_supported()
+
+
+class _DualValueWorkSheetParser(WorkSheetParser):
+    """Sheet parser that also records the cached value of every formula cell
+
+    Cached values go into ``cached_values`` keyed by (row, column); when it is
+    None they are attached to the parsed cell dict under ``'cached'`` instead,
+    which keeps memory flat for callers that consume rows as they are parsed.
+    """
+
+    def __init__(self, *args, cached_values: Optional[Dict[Tuple[int, int], Tuple[Any, str]]], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cached_values = cached_values
+
+    def parse_cell(self, element):
+        col_counter = self.col_counter
+        cell = super().parse_cell(element)
+
+        if cell['data_type'] == 'f':
+            # Decode the same element again with data_only semantics to get the
+            # cached value; restore the column counter so implicit refs stay aligned
+            col_counter_after = self.col_counter
+            self.col_counter = col_counter
+            self.data_only = True
+            try:
+                cached = super().parse_cell(element)
+            finally:
+                self.data_only = False
+                self.col_counter = col_counter_after
+            if self.cached_values is None:
+                cell['cached'] = (cached['value'], cached['data_type'])
+            else:
+                self.cached_values[(cell['row'], cell['column'])] = (cached['value'], cached['data_type'])
+
+        return cell
+
+
+class _DualValueWorksheetReader(WorksheetReader):
+    """WorksheetReader that swaps in the dual-value parser while a capture is active"""
+
+    def __init__(self, ws, xml_source, shared_strings, data_only, rich_text):
+        super().__init__(ws, xml_source, shared_strings, data_only, rich_text)
+        sink = _cached_value_sink.get()
+        if sink is not None and not data_only:
+            self.parser = _DualValueWorkSheetParser(
+                xml_source, shared_strings, data_only,
+                ws.parent.epoch, ws.parent._date_formats,
+                ws.parent._timedelta_formats, rich_text,
+                cached_values=sink.setdefault(ws.title, {})
+            )
+
+
+def _with_worksheet_reader(read_worksheets, worksheet_reader):
+    """Copy of ``read_worksheets`` whose ``WorksheetReader`` global is ``worksheet_reader``"""
+    namespace = {**vars(openpyxl_excel_reader), 'WorksheetReader': worksheet_reader}
+    return types.FunctionType(read_worksheets.__code__, namespace, read_worksheets.__name__,
+                              read_worksheets.__defaults__, read_worksheets.__closure__)
+
+
+class _SinglePassExcelReader(ExcelReader):
+    """ExcelReader that reads worksheets through the dual-value worksheet reader
+
+    Only this reader's copy of ``read_worksheets`` resolves ``WorksheetReader``
+    to the dual-value class; ``openpyxl.load_workbook`` is left untouched.
+    """
+
+    if SINGLE_PASS_SUPPORTED:
+        read_worksheets = _with_worksheet_reader(ExcelReader.read_worksheets, _DualValueWorksheetReader)
+
+
+class CachedValueCell:
+    """Minimal stand-in for a ``data_only=True`` cell holding a cached formula result"""
+
+    __slots__ = ('value', 'data_type', 'number_format')
+
+    def __init__(self, value: Any, data_type: str, number_format: str):
+        self.value = value
+        self.data_type = data_type
+        self.number_format = number_format
+
+    @property
+    def is_date(self) -> bool:
+        # Mirrors openpyxl.cell.Cell.is_date
+        return self.data_type == 'd' or (
+            self.data_type == 'n' and is_date_format(self.number_format)
+        )
+
+
+class CachedValueWorksheet:
+    """Value view of a formula worksheet, equivalent to the ``data_only=True`` sheet"""
+
+    def __init__(self, worksheet: Worksheet, cached_values: Dict[Tuple[int, int], Tuple[Any, str]]):
+        self.worksheet = worksheet
+        self.cached_values = cached_values
+
+    @property
+    def title(self) -> str:
+        return self.worksheet.title
+
+    def value_cell(self, cell):
+        """Return the value-side cell for a cell of the formula worksheet"""
+        if cell.data_type != 'f':
+            # Non-formula cells decode identically in both load modes
+            return cell
+        value, data_type = self.cached_values.get((cell.row, cell.column), (None, 'n'))
+        return CachedValueCell(value, data_type, cell.number_format)
+
+    def cell(self, row: int, column: int):
+        return self.value_cell(self.worksheet.cell(row=row, column=column))
+
+    def __getitem__(self, coordinate: str):
+        row, column = coordinate_to_tuple(coordinate)
+        return self.cell(row=row, column=column)
+
+
+class SinglePassWorkbook:
+    """Value view of a formula workbook, equivalent to the ``data_only=True`` workbook"""
+
+    def __init__(self, workbook: Workbook, cached_values: Dict[str, Dict[Tuple[int, int], Tuple[Any, str]]]):
+        self.workbook = workbook
+        self.cached_values = cached_values
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return self.workbook.sheetnames
+
+    def __getitem__(self, sheet_name: str):
+        worksheet = self.workbook[sheet_name]
+        if not isinstance(worksheet, Worksheet):
+            return worksheet
+        return CachedValueWorksheet(worksheet, self.cached_values.get(sheet_name, {}))
+
+
+def load_workbook_single_pass(file_path: str, keep_vba: bool = True) -> Tuple[Workbook, Union[SinglePassWorkbook, Workbook]]:
+    """
+    Load a workbook once and return its formula and cached-value views
+
+    Args:
+        file_path: Path to the Excel file
+        keep_vba: Preserve VBA content (matches the processors' dual-load settings)
+
+    Returns:
+        Tuple of (workbook_with_formulas, workbook_with_values) usable wherever the
+        processors previously received two separately loaded workbooks; on an
+        unsupported openpyxl release the second item is a ``data_only=True`` load
+    """
+    if not SINGLE_PASS_SUPPORTED:
+        return (load_workbook(file_path, data_only=False, keep_vba=keep_vba),
+                load_workbook(file_path, data_only=True, keep_vba=keep_vba))
+
+    cached_values: Dict[str, Dict[Tuple[int, int], Tuple[Any, str]]] = {}
+    token = _cached_value_sink.set(cached_values)
+    try:
+        # Same arguments load_workbook passes to its own ExcelReader
+        reader = _SinglePassExcelReader(file_path, read_only=False, keep_vba=keep_vba,
+                                        data_only=False, keep_links=True, rich_text=False)
+        reader.read()
+        workbook = reader.wb
+    finally:
+        _cached_value_sink.reset(token)
+
+    return workbook, SinglePassWorkbook(workbook, cached_values)
+
+
+def get_value_cell(worksheet_with_values, cell):
+    """Look up the value-side cell matching ``cell`` from either load mode"""
+    if isinstance(worksheet_with_values, CachedValueWorksheet):
+        return worksheet_with_values.value_cell(cell)
+    return worksheet_with_values[cell.coordinate]
@@ -0,0 +1,515 @@
+"""
+Streaming Excel Worksheet Reader
+
+Reads worksheets row by row from a read-only workbook so memory stays bounded
+by row width rather than sheet size. Each ``<row>`` element is decoded once
+with the dual-value sheet parser (formula text and cached value together) and
+released before the next one is read; no openpyxl cell graph is built.
+
+A normal-mode load also applies merged-cell, hyperlink and comment bindings
+that change which cells exist, what they contain and how merged cells are
+styled. Those records live after ``<sheetData>`` in the sheet XML, so a cheap
+byte-level scan of the sheet part collects them before rows are streamed and
+the reader replays the same semantics:
+
+- non-anchor cells of a merged range are empty and carry only the edge
+  borders of the anchor cell
+- the anchor cell picks up the right/bottom borders of the range's end cell
+- hyperlinks fill empty cells with their target, as ``Cell.hyperlink`` does
+- comment-only cells exist even when the sheet XML has no ``<c>`` for them
+- sheet bounds cover merged ranges, hyperlink ranges and comment cells
+"""
+
+import html
+import re
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from openpyxl import load_workbook
+from openpyxl.comments.comment_sheet import CommentSheet
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.styles.borders import Border
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.numbers import BUILTIN_FORMATS, BUILTIN_FORMATS_MAX_SIZE, is_date_format
+from openpyxl.utils.cell import column_index_from_string, coordinate_to_tuple, range_boundaries
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
+from openpyxl.xml.constants import COMMENTS_NS
+from openpyxl.xml.functions import fromstring
+
+from .excel_single_pass_loader import SINGLE_PASS_SUPPORTED, CachedValueCell, _DualValueWorkSheetParser
+
+
+# Decompressed bytes read per chunk by the pre-scan
+_SCAN_CHUNK_SIZE = 1024 * 1024
+# Column letters of every <c r="..."> element (including empty styled cells)
+_CELL_COLUMN_RE = re.compile(rb'<(?:\w+:)?c\b[^>]*?\br="([A-Z]+)\d+"')
+# Records that sit after <sheetData> but affect which cells exist
+_MERGE_CELL_RE = re.compile(rb'<(?:\w+:)?mergeCell\b([^>]*)>')
+_HYPERLINK_RE = re.compile(rb'<(?:\w+:)?hyperlink\b([^>]*)>')
+_ATTRIBUTE_RE = re.compile(rb'(?:(\w+):)?(\w+)="([^"]*)"')
+
+_DEFAULT_STYLE = StyleArray()
+_BORDER_EDGES = ('top', 'left', 'right', 'bottom')
+
+
+def _parse_attributes(raw: bytes) -> Dict[str, str]:
+    """Attributes of a scanned tag keyed by local name, namespaced ones as ``prefix:name``"""
+    attributes = {}
+    for prefix, name, value in _ATTRIBUTE_RE.findall(raw):
+        key = name.decode('utf-8')
+        if prefix:
+            key = f"{prefix.decode('utf-8')}:{key}"
+        attributes[key] = html.unescape(value.decode('utf-8'))
+    return attributes
+
+
+def _bound_value_type(value: str) -> str:
+    """Data type openpyxl infers when a string is assigned to a cell"""
+    return 'f' if len(value) > 1 and value.startswith('=') else 's'
+
+
+class StreamingCell:
+    """Lightweight cell with the attributes the compact processor reads"""
+
+    __slots__ = ('row', 'column', 'value', 'data_type', 'cached', 'comment',
+                 '_style', '_border', '_workbook')
+
+    def __init__(self, workbook, row: int, column: int, value: Any = None,
+                 data_type: str = 'n', style: StyleArray = _DEFAULT_STYLE,
+                 cached: Optional[Tuple[Any, str]] = None, border: Optional[Border] = None):
+        self._workbook = workbook
+        self.row = row
+        self.column = column
+        self.value = value
+        self.data_type = data_type
+        self.cached = cached
+        self.comment = False
+        self._style = style
+        self._border = border
+
+    @property
+    def font(self):
+        return self._workbook._fonts[self._style.fontId]
+
+    @property
+    def fill(self):
+        return self._workbook._fills[self._style.fillId]
+
+    @property
+    def border(self):
+        if self._border is not None:
+            return self._border
+        return self._workbook._borders[self._style.borderId]
+
+    @property
+    def alignment(self):
+        return self._workbook._alignments[self._style.alignmentId]
+
+    @property
+    def number_format(self) -> str:
+        # Mirrors openpyxl's NumberFormatDescriptor
+        num_fmt_id = self._style.numFmtId
+        if num_fmt_id < BUILTIN_FORMATS_MAX_SIZE:
+            return BUILTIN_FORMATS.get(num_fmt_id, "General")
+        return self._workbook._number_formats[num_fmt_id - BUILTIN_FORMATS_MAX_SIZE]
+
+    @property
+    def is_date(self) -> bool:
+        return self.data_type == 'd' or (
+            self.data_type == 'n' and is_date_format(self.number_format)
+        )
+
+    def value_cell(self):
+        """Return the cell as a ``data_only=True`` load would see it"""
+        if self.data_type != 'f':
+            return self
+        value, data_type = self.cached or (None, 'n')
+        return CachedValueCell(value, data_type, self.number_format)
+
+
+class _MergedRange:
+    """Merged range bounds plus the borders resolved for its cells"""
+
+    __slots__ = ('min_row', 'min_col', 'max_row', 'max_col',
+                 'anchor_style', 'end_border', 'anchor_border', 'edge_sides')
+
+    def __init__(self, ref: str):
+        self.min_col, self.min_row, self.max_col, self.max_row = range_boundaries(ref)
+        self.anchor_style = None
+        self.end_border = None
+        self.anchor_border = None
+        self.edge_sides = []
+
+    def contains(self, row: int, column: int) -> bool:
+        return (self.min_row <= row <= self.max_row and
+                self.min_col <= column <= self.max_col)
+
+    def is_anchor(self, row: int, column: int) -> bool:
+        return row == self.min_row and column == self.min_col
+
+    def _on_edge(self, name: str, row: int, column: int) -> bool:
+        if name == 'top':
+            return row == self.min_row
+        if name == 'bottom':
+            return row == self.max_row
+        if name == 'left':
+            return column == self.min_col
+        return column == self.max_col
+
+    def resolve_borders(self, workbook) -> None:
+        """Replay MergedCellRange._get_borders and format() once the end cell is known"""
+        border = workbook._borders[(self.anchor_style or _DEFAULT_STYLE).borderId]
+        if self.end_border is not None:
+            border = border + Border(right=self.end_border.right, bottom=self.end_border.bottom)
+
+        # format() reads each side from the anchor while it is being updated
+        for name in _BORDER_EDGES:
+            side = getattr(border, name)
+            if side and side.style is None:
+                continue
+            self.edge_sides.append((name, side))
+            if self._on_edge(name, self.min_row, self.min_col):
+                border = border + Border(**{name: side})
+        self.anchor_border = border
+
+    def merged_cell_border(self, workbook, row: int, column: int) -> Border:
+        """Border of a non-anchor cell, as produced by MergedCellRange.format"""
+        border = workbook._borders[0]
+        for name, side in self.edge_sides:
+            if self._on_edge(name, row, column):
+                border = border + Border(**{name: side})
+        return border
+
+
+class StreamingSheet:
+    """Row-by-row view of a single worksheet"""
+
+    def __init__(self, workbook, worksheet: ReadOnlyWorksheet):
+        self.workbook = workbook
+        self.worksheet = worksheet
+        self.title = worksheet.title
+        self.freeze_panes = None
+
+        self._rels = None
+        rels_path = get_rels_path(worksheet._worksheet_path)
+        if rels_path in workbook._archive.namelist():
+            self._rels = get_dependents(workbook._archive, rels_path)
+
+        self._max_xml_column, merge_records, hyperlink_records = self._scan_sheet_part()
+        self.merged_ranges = [_MergedRange(attrs['ref']) for attrs in merge_records if 'ref' in attrs]
+        self.hyperlink_values = self._resolve_hyperlink_values(hyperlink_records)
+        self.comment_cells = self._read_comment_cells()
+
+        # Cells that exist in a normal-mode load without a <c> element
+        self._extra_bounds: List[Tuple[int, int, int, int]] = [
+            (m.min_row, m.min_col, m.max_row, m.max_col) for m in self.merged_ranges
+        ]
+        for attrs in hyperlink_records:
+            if 'ref' in attrs:
+                min_col, min_row, max_col, max_row = range_boundaries(attrs['ref'])
+                self._extra_bounds.append((min_row, min_col, max_row, max_col))
+        for row, column in self.comment_cells:
+            self._extra_bounds.append((row, column, row, column))
+
+        # Per-row lookups so building a row touches only its own links and comments
+        self._hyperlinks_by_row: Dict[int, List[Tuple[int, str]]] = {}
+        for (row, column), text in self.hyperlink_values.items():
+            self._hyperlinks_by_row.setdefault(row, []).append((column, text))
+        self._comment_columns_by_row: Dict[int, List[int]] = {}
+        for row, column in self.comment_cells:
+            self._comment_columns_by_row.setdefault(row, []).append(column)
+
+        self._bounds: Optional[List[int]] = None
+
+    @property
+    def max_column(self) -> int:
+        """Widest column of the sheet, known before rows are streamed"""
+        max_col = self._max_xml_column
+        for bounds in self._extra_bounds:
+            max_col = max(max_col, bounds[3])
+        return max_col or 1
+
+    @property
+    def dimensions(self) -> Dict[str, int]:
+        """Bounds of every cell; complete once ``iter_rows`` is exhausted"""
+        if not self._bounds:
+            return {"min_row": 1, "max_row": 1, "min_col": 1, "max_col": 1}
+        min_row, min_col, max_row, max_col = self._bounds
+        return {"min_row": min_row, "max_row": max_row, "min_col": min_col, "max_col": max_col}
+
+    @property
+    def merged_cells(self) -> MultiCellRange:
+        # Same container (and therefore iteration order) as a normal-mode load
+        return MultiCellRange([
+            CellRange(min_col=m.min_col, min_row=m.min_row, max_col=m.max_col, max_row=m.max_row)
+            for m in self.merged_ranges
+        ])
+
+    def _scan_sheet_part(self) -> Tuple[int, List[Dict[str, str]], List[Dict[str, str]]]:
+        """Collect the widest cell column plus merge and hyperlink records without decoding cells"""
+        columns: Set[bytes] = set()
+        merges: List[Dict[str, str]] = []
+        hyperlinks: List[Dict[str, str]] = []
+
+        def scan(buffer: bytes) -> None:
+            columns.update(_CELL_COLUMN_RE.findall(buffer))
+            merges.extend(_parse_attributes(attrs) for attrs in _MERGE_CELL_RE.findall(buffer))
+            hyperlinks.extend(_parse_attributes(attrs) for attrs in _HYPERLINK_RE.findall(buffer))
+
+        tail = b''
+        with self.worksheet._get_source() as src:
+            while True:
+                chunk = src.read(_SCAN_CHUNK_SIZE)
+                if not chunk:
+                    break
+                buffer = tail + chunk
+                # Every record is a single tag, so only the last tag can be cut off
+                split = buffer.rfind(b'<')
+                if split <= 0:
+                    tail = buffer
+                    continue
+                scan(buffer[:split])
+                tail = buffer[split:]
+        scan(tail)
+
+        # Longer column letters are always further right
+        widest = max(columns, key=lambda c: (len(c), c), default=None)
+        max_col = column_index_from_string(widest.decode('ascii')) if widest else 0
+        return max_col, merges, hyperlinks
+
+    def _resolve_hyperlink_values(self, hyperlinks: List[Dict[str, str]]) -> Dict[Tuple[int, int], str]:
+        """Text each hyperlink writes into an empty cell; the first link bound to a cell wins"""
+        values: Dict[Tuple[int, int], str] = {}
+        for attrs in hyperlinks:
+            ref = attrs.get('ref')
+            if not ref:
+                continue
+            target = None
+            rel_id = next((value for key, value in attrs.items() if key.endswith(':id')), None)
+            if rel_id and self._rels is not None:
+                try:
+                    target = self._rels.get(rel_id).Target
+                except KeyError:
+                    target = None
+            text = target or attrs.get('location')
+            if not text:
+                continue
+
+            if ':' in ref:
+                min_col, min_row, max_col, max_row = range_boundaries(ref)
+                for row in range(min_row, max_row + 1):
+                    for column in range(min_col, max_col + 1):
+                        # Merged cells reject hyperlinks
+                        if self._covering_range(row, column) is None:
+                            values.setdefault((row, column), text)
+            else:
+                row, column = coordinate_to_tuple(ref)
+                merged = self._covering_range(row, column)
+                if merged is not None:
+                    # Links on merged cells are moved to the anchor
+                    row, column = merged.min_row, merged.min_col
+                values.setdefault((row, column), text)
+        return values
+
+    def _covering_range(self, row: int, column: int) -> Optional[_MergedRange]:
+        """Merged range for which the coordinate is a non-anchor cell"""
+        for merged in self.merged_ranges:
+            if merged.contains(row, column) and not merged.is_anchor(row, column):
+                return merged
+        return None
+
+    def _read_comment_cells(self) -> Set[Tuple[int, int]]:
+        """Coordinates of commented cells from the sheet's comments part"""
+        if self._rels is None:
+            return set()
+
+        comment_cells = set()
+        for rel in self._rels.find(COMMENTS_NS):
+            comment_sheet = CommentSheet.from_tree(fromstring(self.workbook._archive.read(rel.target)))
+            for ref, _comment in comment_sheet.comments:
+                comment_cells.add(coordinate_to_tuple(ref))
+        return comment_cells
+
+    def _extend_bounds(self, min_row: int, min_col: int, max_row: int, max_col: int) -> None:
+        if self._bounds is None:
+            self._bounds = [min_row, min_col, max_row, max_col]
+            return
+        bounds = self._bounds
+        bounds[0] = min(bounds[0], min_row)
+        bounds[1] = min(bounds[1], min_col)
+        bounds[2] = max(bounds[2], max_row)
+        bounds[3] = max(bounds[3], max_col)
+
+    def _iter_parsed_rows(self) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Parsed XML rows merged with rows that only hold comments or hyperlinks"""
+        injected_rows = sorted(self._comment_columns_by_row.keys() | self._hyperlinks_by_row.keys())
+        next_injected = 0
+
+        with self.worksheet._get_source() as src:
+            parser = _DualValueWorkSheetParser(
+                src, self.worksheet._shared_strings, False,
+                self.workbook.epoch, self.workbook._date_formats,
+                self.workbook._timedelta_formats, False,
+                cached_values=None
+            )
+            for row_num, cells in parser.parse():
+                while next_injected < len(injected_rows) and injected_rows[next_injected] < row_num:
+                    yield injected_rows[next_injected], []
+                    next_injected += 1
+                if next_injected < len(injected_rows) and injected_rows[next_injected] == row_num:
+                    next_injected += 1
+                yield row_num, cells
+
+            views = getattr(parser, 'views', None)
+            if views is not None and views.sheetView:
+                pane = views.sheetView[0].pane
+                if pane is not None:
+                    self.freeze_panes = pane.topLeftCell
+
+        while next_injected < len(injected_rows):
+            yield injected_rows[next_injected], []
+            next_injected += 1
+
+    def _build_row(self, row_num: int, parsed_cells: List[Dict[str, Any]],
+                   active: List[_MergedRange]) -> Dict[int, StreamingCell]:
+        """Turn parsed cells into streaming cells with the load-time bindings applied"""
+        workbook = self.workbook
+        row_cells: Dict[int, StreamingCell] = {}
+        for parsed in parsed_cells:
+            column = parsed['column']
+            row_cells[column] = StreamingCell(
+                workbook, row_num, column, parsed['value'], parsed['data_type'],
+                workbook._cell_styles[parsed['style_id']], parsed.get('cached')
+            )
+
+        for merged in active:
+            for column in range(merged.min_col, merged.max_col + 1):
+                if merged.is_anchor(row_num, column):
+                    anchor = row_cells.get(column)
+                    if anchor is None:
+                        anchor = row_cells[column] = StreamingCell(workbook, row_num, column)
+                    anchor._border = merged.anchor_border
+                else:
+                    row_cells[column] = StreamingCell(
+                        workbook, row_num, column,
+                        border=merged.merged_cell_border(workbook, row_num, column)
+                    )
+
+        for column, text in self._hyperlinks_by_row.get(row_num, ()):
+            cell = row_cells.get(column)
+            if cell is None:
+                cell = row_cells[column] = StreamingCell(workbook, row_num, column)
+            bound = (text, _bound_value_type(text))
+            if cell.value is None:
+                cell.value, cell.data_type = bound
+                cell.cached = bound
+            elif cell.data_type == 'f' and (cell.cached or (None,))[0] is None:
+                # The data_only copy of the cell was empty, so the link text lands there
+                cell.cached = bound
+
+        for column in self._comment_columns_by_row.get(row_num, ()):
+            if any(m.contains(row_num, column) and not m.is_anchor(row_num, column) for m in active):
+                # Merged cells cannot hold comments; openpyxl drops them
+                continue
+            cell = row_cells.get(column)
+            if cell is None:
+                cell = row_cells[column] = StreamingCell(workbook, row_num, column)
+            cell.comment = True
+
+        if row_cells:
+            self._extend_bounds(row_num, min(row_cells), row_num, max(row_cells))
+        return row_cells
+
+    def iter_rows(self) -> Iterator[Tuple[int, Dict[int, StreamingCell]]]:
+        """
+        Yield ``(row_number, {column: cell})`` in ascending row order
+
+        Rows are held back only while a merged range that covers them is still
+        waiting for its end cell, so buffering is bounded by merged-range height.
+        """
+        workbook = self.workbook
+        ranges_by_start = sorted(self.merged_ranges, key=lambda m: (m.min_row, m.min_col))
+        anchors = {(m.min_row, m.min_col): m for m in self.merged_ranges}
+        ends: Dict[Tuple[int, int], List[_MergedRange]] = {}
+        for merged in self.merged_ranges:
+            ends.setdefault((merged.max_row, merged.max_col), []).append(merged)
+
+        buffered: Deque[Tuple[int, List[Dict[str, Any]]]] = deque()
+        active: List[_MergedRange] = []
+        next_range = 0
+        parsed_row = 0
+
+        def ready(row_num: int) -> bool:
+            # A row can be built once every merged range covering it has passed its end row
+            required = row_num
+            for merged in ranges_by_start[next_range:]:
+                if merged.min_row > row_num:
+                    break
+                required = max(required, merged.max_row)
+            for merged in active:
+                required = max(required, merged.max_row)
+            return parsed_row >= required
+
+        def build(row_num: int, parsed_cells: List[Dict[str, Any]]) -> Dict[int, StreamingCell]:
+            nonlocal next_range, active
+            active = [m for m in active if m.max_row >= row_num]
+            while next_range < len(ranges_by_start) and ranges_by_start[next_range].min_row <= row_num:
+                merged = ranges_by_start[next_range]
+                next_range += 1
+                if merged.max_row >= row_num:
+                    merged.resolve_borders(workbook)
+                    active.append(merged)
+            return self._build_row(row_num, parsed_cells, active)
+
+        for row_num, parsed_cells in self._iter_parsed_rows():
+            parsed_row = row_num
+            for parsed in parsed_cells:
+                coord = (row_num, parsed['column'])
+                if coord in anchors:
+                    anchors[coord].anchor_style = workbook._cell_styles[parsed['style_id']]
+                for merged in ends.get(coord, ()):
+                    merged.end_border = workbook._borders[workbook._cell_styles[parsed['style_id']].borderId]
+
+            buffered.append((row_num, parsed_cells))
+            while buffered and ready(buffered[0][0]):
+                buffered_row, buffered_cells = buffered.popleft()
+                yield buffered_row, build(buffered_row, buffered_cells)
+
+        for buffered_row, buffered_cells in buffered:
+            yield buffered_row, build(buffered_row, buffered_cells)
+
+        for bounds in self._extra_bounds:
+            self._extend_bounds(*bounds)
+
+    def empty_cell(self, row: int, column: int) -> StreamingCell:
+        """Cell created on demand for a coordinate absent from the sheet XML"""
+        return StreamingCell(self.workbook, row, column)
+
+
+class StreamingWorkbookReader:
+    """Read-only workbook handle that hands out streaming worksheets"""
+
+    def __init__(self, file_path: str, keep_vba: bool = True):
+        if not SINGLE_PASS_SUPPORTED:
+            raise RuntimeError("Streaming ingestion needs a supported openpyxl release; "
+                               "use ingestion_mode='dual_load' instead")
+        self.workbook = load_workbook(file_path, read_only=True, data_only=False, keep_vba=keep_vba)
+
+    @property
+    def worksheet_names(self) -> List[str]:
+        """Titles of the worksheets in workbook order, excluding chart sheets"""
+        return [name for name in self.workbook.sheetnames
+                if isinstance(self.workbook[name], ReadOnlyWorksheet)]
+
+    def get_sheet(self, sheet_name: str) -> StreamingSheet:
+        """Open a single worksheet; only its own sheet part is parsed"""
+        return StreamingSheet(self.workbook, self.workbook[sheet_name])
+
+    def iter_sheets(self) -> Iterator[StreamingSheet]:
+        """Yield worksheets in workbook order, skipping chart sheets"""
+        for sheet_name in self.worksheet_names:
+            yield self.get_sheet(sheet_name)
+
+    def close(self) -> None:
+        self.workbook.close()
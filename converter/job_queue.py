@@ -0,0 +1,496 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+JOB_STATUSES = ("queued", "processing", "completed", "failed")
+FINISHED_STATUSES = ("completed", "failed")
+
+# Finished jobs are kept this long for status queries; cleanup runs at most every PURGE_INTERVAL_SECONDS
+DEFAULT_RETENTION_SECONDS = 7 * 24 * 3600
+PURGE_INTERVAL_SECONDS = 60.0
+
+
+@dataclass
+class Job:
+    """A unit of work pulled from a JobQueue.
+
+    ``record`` holds the processing-registry record for the job so that any
+    process can answer status queries, even one that never saw the job run.
+    """
+
+    id: str
+    job_type: str
+    payload: Dict[str, Any]
+    status: str = "queued"
+    attempts: int = 0
+    max_attempts: int = 3
+    record: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+
+class JobQueue(ABC):
+    """Durable queue of conversion jobs shared by web processes and workers.
+
+    Claimed jobs are leased: a worker that dies mid-job stops renewing its
+    lease and the job becomes claimable again until ``max_attempts`` is used up.
+    Completed and failed jobs are dropped ``retention_seconds`` after they finish.
+    """
+
+    retention_seconds: Optional[float] = None
+    _last_purge: float = 0.0
+
+    def _maybe_purge(self, now: float) -> None:
+        if self.retention_seconds and now - self._last_purge >= PURGE_INTERVAL_SECONDS:
+            self._last_purge = now
+            self.purge_finished()
+
+    @abstractmethod
+    def enqueue(self, job_id: str, job_type: str, payload: Dict[str, Any],
+                record: Optional[Dict[str, Any]] = None, max_attempts: int = 3) -> Job:
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        """Lease the oldest runnable job to ``worker_id``; None when idle."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def extend_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_record(self, job_id: str, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, job_id: str, record: Optional[Dict[str, Any]] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str, record: Optional[Dict[str, Any]] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def purge_finished(self) -> int:
+        """Drop finished jobs past their retention; returns how many were removed."""
+        raise NotImplementedError
+
+
+class SQLiteJobQueue(JobQueue):
+    """Single-file job queue; safe across processes on one host (WAL mode)."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            job_type TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 3,
+            record TEXT,
+            error TEXT,
+            worker_id TEXT,
+            lease_expires_at REAL,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+    """
+
+    def __init__(self, path: str, retention_seconds: Optional[float] = DEFAULT_RETENTION_SECONDS) -> None:
+        self.path = path
+        self.retention_seconds = retention_seconds or None
+        self._last_purge = 0.0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(self._SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread; autocommit with explicit transactions for claims
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Job:
+        return Job(
+            id=row["id"],
+            job_type=row["job_type"],
+            payload=json.loads(row["payload"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            record=json.loads(row["record"]) if row["record"] else {},
+            error=row["error"],
+            worker_id=row["worker_id"],
+            lease_expires_at=row["lease_expires_at"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+    def enqueue(self, job_id: str, job_type: str, payload: Dict[str, Any],
+                record: Optional[Dict[str, Any]] = None, max_attempts: int = 3) -> Job:
+        now = time.time()
+        self._connect().execute(
+            "INSERT INTO jobs (id, job_type, payload, status, max_attempts, record, created_at, updated_at) "
+            "VALUES (?, ?, ?, 'queued', ?, ?, ?, ?)",
+            (job_id, job_type, json.dumps(payload, default=str), max_attempts,
+             json.dumps(record or {}, default=str), now, now),
+        )
+        return self.get(job_id)
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        conn = self._connect()
+        now = time.time()
+        self._maybe_purge(now)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Jobs whose worker vanished with no attempts left are given up on
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'worker lease expired', updated_at = ? "
+                "WHERE status = 'processing' AND lease_expires_at < ? AND attempts >= max_attempts",
+                (now, now),
+            )
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' "
+                "OR (status = 'processing' AND lease_expires_at < ?) "
+                "ORDER BY created_at LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'processing', attempts = attempts + 1, worker_id = ?, "
+                "lease_expires_at = ?, updated_at = ? WHERE id = ?",
+                (worker_id, now + lease_seconds, now, row["id"]),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return self.get(row["id"])
+
+    def extend_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        cursor = self._connect().execute(
+            "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND worker_id = ? AND status = 'processing'",
+            (time.time() + lease_seconds, job_id, worker_id),
+        )
+        return cursor.rowcount == 1
+
+    def update_record(self, job_id: str, record: Dict[str, Any]) -> None:
+        self._connect().execute(
+            "UPDATE jobs SET record = ?, updated_at = ? WHERE id = ?",
+            (json.dumps(record, default=str), time.time(), job_id),
+        )
+
+    def _finish(self, job_id: str, status: str, error: Optional[str], record: Optional[Dict[str, Any]]) -> None:
+        if record is None:
+            self._connect().execute(
+                "UPDATE jobs SET status = ?, error = ?, lease_expires_at = NULL, updated_at = ? WHERE id = ?",
+                (status, error, time.time(), job_id),
+            )
+        else:
+            self._connect().execute(
+                "UPDATE jobs SET status = ?, error = ?, record = ?, lease_expires_at = NULL, updated_at = ? "
+                "WHERE id = ?",
+                (status, error, json.dumps(record, default=str), time.time(), job_id),
+            )
+
+    def complete(self, job_id: str, record: Optional[Dict[str, Any]] = None) -> None:
+        self._finish(job_id, "completed", None, record)
+
+    def fail(self, job_id: str, error: str, record: Optional[Dict[str, Any]] = None) -> None:
+        self._finish(job_id, "failed", error, record)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row is not None else None
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._connect().execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
+    def purge_finished(self) -> int:
+        if not self.retention_seconds:
+            return 0
+        cursor = self._connect().execute(
+            "DELETE FROM jobs WHERE status IN ('completed', 'failed') AND updated_at < ?",
+            (time.time() - self.retention_seconds,),
+        )
+        return cursor.rowcount
+
+
+class RedisJobQueue(JobQueue):
+    """Job queue on Redis for workers spread across hosts.
+
+    Jobs are hashes under ``{prefix}:job:{id}``; runnable ids sit in the
+    ``{prefix}:pending`` list and leased ids in the ``{prefix}:leases`` sorted
+    set scored by lease expiry. ``{prefix}:status:{status}`` sorted sets
+    (scored by last update) index jobs by status for counts and retention.
+
+    A claim moves the id atomically from ``pending`` to the worker's own
+    ``{prefix}:claiming:{worker_id}`` list, then leases it in one transaction.
+    Workers keep a ``{prefix}:worker:{worker_id}`` heartbeat key alive while
+    claiming; ids left in the list of a worker whose heartbeat expired are
+    pushed back to ``pending``, so a crash between the two steps loses nothing.
+    """
+
+    def __init__(self, url: str, prefix: str = "jobs", block_seconds: int = 1,
+                 retention_seconds: Optional[float] = DEFAULT_RETENTION_SECONDS) -> None:
+        try:
+            import redis  # type: ignore
+        except ImportError as e:
+            raise RuntimeError("JOB_QUEUE_BACKEND=redis requires the 'redis' package") from e
+        self._watch_error = redis.WatchError
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self.block_seconds = block_seconds
+        self.retention_seconds = retention_seconds or None
+        self._last_purge = 0.0
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+    def _status_index(self, status: str) -> str:
+        return f"{self.prefix}:status:{status}"
+
+    def _claiming(self, worker_id: str) -> str:
+        return f"{self.prefix}:claiming:{worker_id}"
+
+    def _heartbeat(self, worker_id: str) -> str:
+        return f"{self.prefix}:worker:{worker_id}"
+
+    @property
+    def _pending(self) -> str:
+        return f"{self.prefix}:pending"
+
+    @property
+    def _leases(self) -> str:
+        return f"{self.prefix}:leases"
+
+    @property
+    def _workers(self) -> str:
+        return f"{self.prefix}:workers"
+
+    def _to_job(self, job_id: str, data: Dict[str, str]) -> Job:
+        return Job(
+            id=job_id,
+            job_type=data["job_type"],
+            payload=json.loads(data["payload"]),
+            status=data["status"],
+            attempts=int(data.get("attempts", 0)),
+            max_attempts=int(data.get("max_attempts", 3)),
+            record=json.loads(data["record"]) if data.get("record") else {},
+            error=data.get("error") or None,
+            worker_id=data.get("worker_id") or None,
+            lease_expires_at=float(data["lease_expires_at"]) if data.get("lease_expires_at") else None,
+            created_at=float(data.get("created_at", 0)),
+            updated_at=float(data.get("updated_at", 0)),
+        )
+
+    def _set_status(self, pipe: Any, job_id: str, status: str, now: float, mapping: Dict[str, Any]) -> None:
+        """Queue the hash update and status-index move for one transition on ``pipe``."""
+        for other in JOB_STATUSES:
+            if other != status:
+                pipe.zrem(self._status_index(other), job_id)
+        pipe.zadd(self._status_index(status), {job_id: now})
+        pipe.hset(self._key(job_id), mapping={**mapping, "status": status, "updated_at": now})
+        if status in FINISHED_STATUSES and self.retention_seconds:
+            pipe.expire(self._key(job_id), int(max(self.retention_seconds, 1)))
+
+    def enqueue(self, job_id: str, job_type: str, payload: Dict[str, Any],
+                record: Optional[Dict[str, Any]] = None, max_attempts: int = 3) -> Job:
+        now = time.time()
+        pipe = self.client.pipeline()
+        self._set_status(pipe, job_id, "queued", now, {
+            "job_type": job_type,
+            "payload": json.dumps(payload, default=str),
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "record": json.dumps(record or {}, default=str),
+            "created_at": now,
+        })
+        pipe.lpush(self._pending, job_id)
+        pipe.execute()
+        return self.get(job_id)
+
+    def _requeue_expired(self, now: float) -> None:
+        for job_id in self.client.zrangebyscore(self._leases, "-inf", now):
+            with self.client.pipeline() as pipe:
+                try:
+                    # Watching the hash makes only one process recover the job
+                    pipe.watch(self._key(job_id))
+                    score = pipe.zscore(self._leases, job_id)
+                    data = pipe.hgetall(self._key(job_id))
+                    pipe.multi()
+                    pipe.zrem(self._leases, job_id)
+                    if score is None or score > now or not data or data.get("status") != "processing":
+                        pipe.execute()
+                        continue
+                    if int(data.get("attempts", 0)) >= int(data.get("max_attempts", 3)):
+                        self._set_status(pipe, job_id, "failed", now, {"error": "worker lease expired"})
+                    else:
+                        self._set_status(pipe, job_id, "queued", now, {})
+                        pipe.rpush(self._pending, job_id)
+                    pipe.execute()
+                except self._watch_error:
+                    continue
+
+    def _recover_abandoned_claims(self) -> None:
+        """Return ids popped by workers that died before leasing them to ``pending``."""
+        for worker_id in self.client.smembers(self._workers):
+            if self.client.exists(self._heartbeat(worker_id)):
+                continue
+            # Each move is atomic, so a concurrent recovery cannot duplicate an id
+            while self.client.lmove(self._claiming(worker_id), self._pending, "RIGHT", "RIGHT") is not None:
+                pass
+            self.client.srem(self._workers, worker_id)
+
+    def _lease(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Lease a claimed id and take it off the worker's claiming list in one transaction."""
+        with self.client.pipeline() as pipe:
+            try:
+                # A recovery of this worker's list in the meantime aborts the lease
+                pipe.watch(self._claiming(worker_id))
+                if pipe.lpos(self._claiming(worker_id), job_id) is None:
+                    return False
+                now = time.time()
+                pipe.multi()
+                pipe.lrem(self._claiming(worker_id), 1, job_id)
+                pipe.zadd(self._leases, {job_id: now + lease_seconds})
+                self._set_status(pipe, job_id, "processing", now, {
+                    "worker_id": worker_id, "lease_expires_at": now + lease_seconds,
+                })
+                pipe.hincrby(self._key(job_id), "attempts", 1)
+                pipe.execute()
+                return True
+            except self._watch_error:
+                return False
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        now = time.time()
+        self._maybe_purge(now)
+        self._requeue_expired(now)
+        self._recover_abandoned_claims()
+        pipe = self.client.pipeline()
+        pipe.sadd(self._workers, worker_id)
+        pipe.set(self._heartbeat(worker_id), now, ex=int(max(lease_seconds, self.block_seconds + 1, 1)))
+        pipe.execute()
+        job_id = self.client.blmove(self._pending, self._claiming(worker_id), self.block_seconds, "RIGHT", "LEFT")
+        if job_id is None or not self._lease(job_id, worker_id, lease_seconds):
+            return None
+        return self.get(job_id)
+
+    def extend_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        if self.client.hget(self._key(job_id), "worker_id") != worker_id:
+            return False
+        expires = time.time() + lease_seconds
+        pipe = self.client.pipeline()
+        pipe.zadd(self._leases, {job_id: expires}, xx=True)
+        pipe.hset(self._key(job_id), "lease_expires_at", expires)
+        pipe.execute()
+        return True
+
+    def update_record(self, job_id: str, record: Dict[str, Any]) -> None:
+        self.client.hset(self._key(job_id), mapping={
+            "record": json.dumps(record, default=str), "updated_at": time.time(),
+        })
+
+    def _finish(self, job_id: str, status: str, error: Optional[str], record: Optional[Dict[str, Any]]) -> None:
+        mapping: Dict[str, Any] = {"error": error or ""}
+        if record is not None:
+            mapping["record"] = json.dumps(record, default=str)
+        pipe = self.client.pipeline()
+        pipe.zrem(self._leases, job_id)
+        self._set_status(pipe, job_id, status, time.time(), mapping)
+        pipe.execute()
+
+    def complete(self, job_id: str, record: Optional[Dict[str, Any]] = None) -> None:
+        self._finish(job_id, "completed", None, record)
+
+    def fail(self, job_id: str, error: str, record: Optional[Dict[str, Any]] = None) -> None:
+        self._finish(job_id, "failed", error, record)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        data = self.client.hgetall(self._key(job_id))
+        return self._to_job(job_id, data) if data else None
+
+    def counts(self) -> Dict[str, int]:
+        pipe = self.client.pipeline()
+        for status in JOB_STATUSES:
+            pipe.zcard(self._status_index(status))
+        return dict(zip(JOB_STATUSES, pipe.execute()))
+
+    def purge_finished(self) -> int:
+        if not self.retention_seconds:
+            return 0
+        # Finished hashes expire on their own; only their index entries need dropping
+        cutoff = time.time() - self.retention_seconds
+        pipe = self.client.pipeline()
+        for status in FINISHED_STATUSES:
+            pipe.zremrangebyscore(self._status_index(status), "-inf", cutoff)
+        return sum(pipe.execute())
+
+
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue, creating it on first use.
+
+    Configuration via environment variables:
+    - JOB_QUEUE_BACKEND: 'sqlite' (default) or 'redis'
+    - JOB_QUEUE_PATH: database file for the sqlite backend; point it at a
+      persistent volume so queued jobs survive deploys (default: under the temp dir)
+    - JOB_RETENTION_SECONDS: how long finished jobs are kept (default 7 days, 0 = forever)
+    - REDIS_URL: connection URL for the redis backend
+    """
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                backend = os.getenv("JOB_QUEUE_BACKEND", "sqlite").strip().lower()
+                retention_seconds = float(os.getenv("JOB_RETENTION_SECONDS", str(DEFAULT_RETENTION_SECONDS)))
+                if backend == "sqlite":
+                    default_path = os.path.join(tempfile.gettempdir(), "excel-json-jobs", "jobs.sqlite3")
+                    path = os.getenv("JOB_QUEUE_PATH") or default_path
+                    _job_queue = SQLiteJobQueue(path, retention_seconds)
+                elif backend == "redis":
+                    _job_queue = RedisJobQueue(os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+                                               retention_seconds=retention_seconds)
+                else:
+                    raise RuntimeError(f"Unsupported JOB_QUEUE_BACKEND: {backend}")
+    return _job_queue
@@ -0,0 +1,75 @@
+"""JSON encoding shared by the routers, the storage services and the result cache.
+
+Results are encoded with orjson when it is installed and with the standard
+library otherwise; both produce compact UTF-8 bytes. Values orjson cannot
+encode (integers wider than 64 bits, for instance) fall back to the standard
+library, so anything ``json.dumps`` accepted is still accepted. orjson writes
+NaN and infinities as ``null`` where the standard library writes ``NaN``.
+
+Large results are encoded once and the bytes are reused for size accounting,
+storage uploads and HTTP responses. ``RawJSON`` marks such bytes so
+``dumps_object`` can splice them into a response envelope without encoding
+the result again.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Mapping, Optional, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def backend() -> str:
+    """Name of the encoder in use: 'orjson' or 'json'."""
+    return "orjson" if orjson is not None else "json"
+
+
+class RawJSON(bytes):
+    """Already-encoded JSON value, written verbatim by ``dumps_object``."""
+
+
+def dumps(obj: Any, *, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes, compact unless ``indent`` is set (2 spaces)."""
+    if isinstance(obj, RawJSON):
+        return bytes(obj)
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(obj, indent=2, default=default).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=default).encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode JSON text or UTF-8 bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def encode(obj: Any) -> RawJSON:
+    """``dumps(obj)`` marked as pre-encoded, for reuse in later envelopes."""
+    return obj if isinstance(obj, RawJSON) else RawJSON(dumps(obj))
+
+
+def dumps_object(fields: Mapping[str, Any]) -> bytes:
+    """Encode a JSON object whose ``RawJSON`` values are inserted as-is.
+
+    Only the top-level mapping is scanned; nested values are encoded normally.
+    """
+    if not any(isinstance(value, RawJSON) for value in fields.values()):
+        return dumps(dict(fields))
+    parts = [dumps(str(key)) + b":" + dumps(value) for key, value in fields.items()]
+    return b"{" + b",".join(parts) + b"}"
@@ -5,7 +5,7 @@ This replaces the prior Django model import and keeps only what the
 routers expect: a module-level cache for processed data results.
 """
 
-from typing import Any, Dict
+from converter.result_cache import ResultCache, create_result_cache
 
-# Shared in-memory cache for processed file data (small, ephemeral)
-processed_data_cache: Dict[str, Any] = {}
+# Shared cache for processed file data; bounded, see converter.result_cache
+processed_data_cache: ResultCache = create_result_cache()
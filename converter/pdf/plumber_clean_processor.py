@@ -22,6 +22,8 @@ from pathlib import Path
 
 # Import our PDFPlumber implementation
 from converter.pdfplumber_processor import PDFPlumberProcessor
+from converter.pdf_number_scanner import get_number_scanner
+from converter.pdf_spatial_index import EXCLUSION_PADDING, pad_bbox
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
@@ -192,13 +194,11 @@ class AreaExcluder:
                 exclusion_zones[page_num] = []
             
             # Add padding around table
-            padding = 10
-            exclusion_zone = {
-                "x0": max(0, table.bbox["x0"] - padding),
-                "y0": max(0, table.bbox["y0"] - padding),
-                "x1": table.bbox["x1"] + padding,
-                "y1": table.bbox["y1"] + padding
-            }
+            padded = pad_bbox(
+                [table.bbox["x0"], table.bbox["y0"], table.bbox["x1"], table.bbox["y1"]],
+                EXCLUSION_PADDING
+            )
+            exclusion_zone = dict(zip(("x0", "y0", "x1", "y1"), padded))
             
             exclusion_zones[page_num].append(exclusion_zone)
             
@@ -352,37 +352,35 @@ class NumberExtractor:
         """Extract numbers from a single text section"""
         numbers = []
         
-        for number_type, pattern in self.patterns.items():
-            matches = re.finditer(pattern, section.content)
-            
-            for match in matches:
-                number_str = match.group(0)
-                
-                # Get context around the number
-                start = max(0, match.start() - 50)
-                end = min(len(section.content), match.end() + 50)
-                context = section.content[start:end]
-                
-                # Skip if this number should be ignored
-                if self._should_skip_number(number_str, context):
-                    continue
-                
-                # Estimate position within section
-                position = {
-                    "x0": section.bbox["x0"],
-                    "y0": section.bbox["y0"],
-                    "x1": section.bbox["x1"],
-                    "y1": section.bbox["y1"]
-                }
-                
-                extracted_number = ExtractedNumber(
-                    value=number_str,
-                    number_type=number_type,
-                    context=context.strip(),
-                    position=position
-                )
-                
-                numbers.append(extracted_number)
+        # One pass over the content; matches come back pattern by pattern
+        for match in get_number_scanner(self.patterns).scan_by_format(section.content):
+            number_str = match.text
+            
+            # Get context around the number
+            start = max(0, match.start - 50)
+            end = min(len(section.content), match.end + 50)
+            context = section.content[start:end]
+            
+            # Skip if this number should be ignored
+            if self._should_skip_number(number_str, context):
+                continue
+            
+            # Estimate position within section
+            position = {
+                "x0": section.bbox["x0"],
+                "y0": section.bbox["y0"],
+                "x1": section.bbox["x1"],
+                "y1": section.bbox["y1"]
+            }
+            
+            extracted_number = ExtractedNumber(
+                value=number_str,
+                number_type=match.format,
+                context=context.strip(),
+                position=position
+            )
+            
+            numbers.append(extracted_number)
         
         return numbers
     
@@ -22,6 +22,7 @@ from typing import Dict, List, Optional, Tuple, Any
 
 # Import our PDFPlumber implementation
 from converter.pdfplumber_processor import PDFPlumberProcessor
+from converter.pdfplumber_document_context import PDFDocumentContext
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -72,12 +73,13 @@ class PDFTableExtractor:
             }
         }
     
-    def extract_tables(self, pdf_path: str) -> Dict[str, Any]:
+    def extract_tables(self, pdf_path: str, document: Optional[PDFDocumentContext] = None) -> Dict[str, Any]:
         """
         Extract tables from PDF file using PDFPlumber
         
         Args:
             pdf_path: Path to the PDF file
+            document: Optional already-open document context
             
         Returns:
             Dictionary containing extracted tables in the expected format
@@ -86,7 +88,7 @@ class PDFTableExtractor:
         
         try:
             # Use PDFPlumber processor to extract tables
-            tables_data = self.processor.extract_tables_only(pdf_path)
+            tables_data = self.processor.extract_tables_only(pdf_path, document)
             
             # Transform to expected format for API compatibility
             result = {
@@ -294,13 +296,15 @@ class PDFTextProcessor:
             }
         }
     
-    def extract_text(self, pdf_path: str, exclude_table_regions: Optional[List[Dict]] = None) -> Dict[str, Any]:
+    def extract_text(self, pdf_path: str, exclude_table_regions: Optional[List[Dict]] = None,
+                     document: Optional[PDFDocumentContext] = None) -> Dict[str, Any]:
         """
         Extract text content from PDF using PDFPlumber
         
         Args:
             pdf_path: Path to the PDF file
             exclude_table_regions: Optional table regions to exclude
+            document: Optional already-open document context
             
         Returns:
             Dictionary containing extracted text in expected format
@@ -309,7 +313,7 @@ class PDFTextProcessor:
         
         try:
             # Use PDFPlumber processor to extract text
-            text_data = self.processor.extract_text_only(pdf_path, exclude_table_regions)
+            text_data = self.processor.extract_text_only(pdf_path, exclude_table_regions, document)
             
             # Transform to expected format for API compatibility
             result = {
@@ -628,7 +632,8 @@ class PDFProcessor:
     
     def process_pdf(self, pdf_path: str) -> Dict[str, Any]:
         """
-        Process PDF file with comprehensive extraction using PDFPlumber
+        Process PDF file with comprehensive extraction using PDFPlumber.
+        The file is opened once and shared by the table and text phases.
         
         Args:
             pdf_path: Path to the PDF file
@@ -660,12 +665,24 @@ class PDFProcessor:
             }
         }
         
+        try:
+            document = PDFDocumentContext(pdf_path)
+        except Exception as e:
+            # Unreadable file: each phase reports its own failure, as when they opened it separately
+            logger.warning(f"Could not open PDF for shared extraction: {e}")
+            return self._process_document(pdf_path, None, result, processing_start)
+        with document:
+            return self._process_document(pdf_path, document, result, processing_start)
+    
+    def _process_document(self, pdf_path: str, document: Optional[PDFDocumentContext],
+                          result: Dict[str, Any], processing_start: datetime) -> Dict[str, Any]:
+        """Run the extraction phases of process_pdf over an open document"""
         try:
             # Phase 1: Extract tables
             if self.config.get('processing_options', {}).get('extract_tables', True):
                 logger.info("Phase 1: Extracting tables")
                 try:
-                    tables_result = self.table_extractor.extract_tables(pdf_path)
+                    tables_result = self.table_extractor.extract_tables(pdf_path, document)
                     result["tables"] = tables_result
                     result["processing_summary"]["tables_extracted"] = \
                         tables_result["extraction_metadata"]["total_tables"]
@@ -694,7 +711,7 @@ class PDFProcessor:
                                     "bbox": bbox  # [x0, y0, x1, y1]
                                 })
                     
-                    text_result = self.text_processor.extract_text(pdf_path, exclude_regions)
+                    text_result = self.text_processor.extract_text(pdf_path, exclude_regions, document)
                     result["text_content"] = text_result
                     result["processing_summary"]["text_sections_extracted"] = \
                         text_result["extraction_metadata"]["total_sections"]
@@ -24,6 +24,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 # Import existing PDFPlumber components
+from converter.pdf_spatial_index import pad_bbox
 from converter.pdfplumber_table_extractor import PDFPlumberTableExtractor
 from converter.pdfplumber_text_extractor import PDFPlumberTextExtractor
 
@@ -433,12 +434,7 @@ class PDFTableRemovalProcessor:
                 # Ensure all coordinates are floats
                 x0, y0, x1, y1 = [float(coord) for coord in bbox[:4]]
                 # Add padding
-                padded_bbox = [
-                    max(0, x0 - padding),      # x0
-                    max(0, y0 - padding),      # y0  
-                    x1 + padding,              # x1
-                    y1 + padding               # y1
-                ]
+                padded_bbox = list(pad_bbox((x0, y0, x1, y1), padding))
                 region_copy['region']['bbox'] = padded_bbox
                 
             padded_regions.append(region_copy)
@@ -10,6 +10,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
+from .pdf_number_scanner import get_number_scanner
+
+
+# Numbers embedded in AI text sections; every match of every pattern is kept
+FAILOVER_NUMBER_PATTERNS = {
+    "currency": r"\$\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?",
+    "percentage": r"\b\d+(?:\.\d+)?%\b",
+    "decimal": r"\b\d+\.\d+\b",
+    "scientific_notation": r"\b\d+(?:\.\d+)?[eE][+-]?\d+\b",
+    "integer": r"\b\d{1,3}(?:,\d{3})*\b",
+}
+
 
 @dataclass
 class AIFailoverConfig:
@@ -110,17 +122,8 @@ class PDFAIFailoverRouter:
         }
 
     def _extract_numbers_from_text(self, text: str) -> List[Dict[str, Any]]:
-        import re
         results: List[Dict[str, Any]] = []
 
-        patterns = {
-            "currency": re.compile(r"\$\s*\d{1,3}(?:,\d{3})*(?:\.\d{2})?"),
-            "percentage": re.compile(r"\b\d+(?:\.\d+)?%\b"),
-            "decimal": re.compile(r"\b\d+\.\d+\b"),
-            "scientific_notation": re.compile(r"\b\d+(?:\.\d+)?[eE][+-]?\d+\b"),
-            "integer": re.compile(r"\b\d{1,3}(?:,\d{3})*\b"),
-        }
-
         def to_number(s: str) -> float:
             s_clean = s.replace("$", "").replace(",", "").replace("%", "")
             try:
@@ -128,23 +131,22 @@ class PDFAIFailoverRouter:
             except Exception:
                 return 0.0
 
-        for fmt, rx in patterns.items():
-            for m in rx.finditer(text):
-                original = m.group(0)
-                value = to_number(original)
-                entry = {
-                    "value": value,
-                    "original_text": original,
-                    "context": text[max(0, m.start()-50): m.end()+50],
-                    "position": {"x": 0, "y": 0, "bbox": [0, 0, 0, 0], "line_number": 0},
-                    "format": fmt,
-                    "unit": None,
-                    "currency": "USD" if fmt == "currency" else None,
-                    "confidence": 0.75,
-                    "extraction_method": "regex_pattern",
-                    "metadata": {}
-                }
-                results.append(entry)
+        for m in get_number_scanner(FAILOVER_NUMBER_PATTERNS).scan_by_format(text):
+            original = m.text
+            value = to_number(original)
+            entry = {
+                "value": value,
+                "original_text": original,
+                "context": text[max(0, m.start-50): m.end+50],
+                "position": {"x": 0, "y": 0, "bbox": [0, 0, 0, 0], "line_number": 0},
+                "format": m.format,
+                "unit": None,
+                "currency": "USD" if m.format == "currency" else None,
+                "confidence": 0.75,
+                "extraction_method": "regex_pattern",
+                "metadata": {}
+            }
+            results.append(entry)
         return results
 
 
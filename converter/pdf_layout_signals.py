@@ -0,0 +1,186 @@
+"""
+PDF Layout Signals
+
+Cheap table-likeness signals for a PyMuPDF page, computed from its words and
+vector drawings without running table detection:
+
+- column_alignment: share of multi-cell rows whose cells start or end on an
+  x position shared by other rows, scaled by how many cells those rows hold
+- ruling_lines: horizontal and vertical rules (lines, thin bars, stroked
+  rectangle edges), saturating at RULES_FOR_FULL_SCORE
+- numeric_grid: share of multi-cell rows holding numeric cells, times how
+  regular the numeric cell count per row is
+
+table_likeness combines them into one 0..1 score.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Weights of the combined table_likeness score; aligned cells alone can reach
+# 0.6, ruling lines and numeric rows confirm it
+ALIGNMENT_WEIGHT = 0.6
+NUMERIC_GRID_WEIGHT = 0.25
+RULING_WEIGHT = 0.25
+
+RULES_FOR_FULL_SCORE = 8
+
+# A whole cell that is a figure: 12, 1,234.5, (1,234), -5%, $1,000, 1.8x
+NUMERIC_CELL = re.compile(r"^[(\-–$€£¥]*\d[\d,.]*[%x)]*$")
+
+
+class LayoutSignalExtractor:
+    def __init__(self,
+                 x_tolerance: float = 6.0,
+                 y_tolerance: float = 3.0,
+                 anchor_bin: float = 3.0,
+                 min_rows: int = 3,
+                 min_rule_length: float = 8.0,
+                 max_rule_thickness: float = 2.0) -> None:
+        self.x_tolerance = x_tolerance
+        self.y_tolerance = y_tolerance
+        self.anchor_bin = anchor_bin
+        self.min_rows = min_rows
+        self.min_rule_length = min_rule_length
+        self.max_rule_thickness = max_rule_thickness
+
+    def page_signals(self, page: Any, textpage: Any = None) -> Optional[Dict[str, float]]:
+        """
+        Layout signals for one page, or None when the page exposes no word
+        positions (e.g. text-only stand-ins), so callers keep their defaults.
+
+        Pass the page's PyMuPDF TextPage when the caller extracts text too, so
+        the page content is parsed once.
+        """
+        try:
+            words = page.get_text("words", textpage=textpage) if textpage is not None else page.get_text("words")
+        except Exception:
+            return None
+        if not words:
+            return None
+
+        rows = self._rows_of_cells(words)
+        multi_cell_rows = [row for row in rows if len(row) >= 2]
+        column_alignment = self._column_alignment(multi_cell_rows)
+        numeric_grid = self._numeric_grid(multi_cell_rows)
+        rules = self._count_rules(page)
+        ruling_lines = min(1.0, rules / RULES_FOR_FULL_SCORE)
+
+        table_likeness = min(1.0, ALIGNMENT_WEIGHT * column_alignment
+                             + NUMERIC_GRID_WEIGHT * numeric_grid
+                             + RULING_WEIGHT * ruling_lines)
+        return {
+            "table_likeness": round(table_likeness, 4),
+            "column_alignment": round(column_alignment, 4),
+            "numeric_grid": round(numeric_grid, 4),
+            "ruling_lines": round(ruling_lines, 4),
+            "multi_cell_rows": float(len(multi_cell_rows)),
+        }
+
+    # --------- internals ---------
+
+    def _rows_of_cells(self, words: List[tuple]) -> List[List[Tuple[float, float, str]]]:
+        """Words clustered into visual rows by vertical center, then into (x0, x1, text) cells by x gaps"""
+        ordered = sorted(words, key=lambda w: (w[1] + w[3]) / 2.0)
+        rows: List[List[tuple]] = []
+        row_mid = None
+        for word in ordered:
+            mid = (word[1] + word[3]) / 2.0
+            if row_mid is None or mid - row_mid > self.y_tolerance:
+                rows.append([])
+                row_mid = mid
+            rows[-1].append(word)
+
+        cell_rows = []
+        for row in rows:
+            row.sort(key=lambda w: w[0])
+            cells: List[Tuple[float, float, str]] = []
+            x0, x1, texts = row[0][0], row[0][2], [row[0][4]]
+            for word in row[1:]:
+                if word[0] - x1 <= self.x_tolerance:
+                    x1 = max(x1, word[2])
+                    texts.append(word[4])
+                else:
+                    cells.append((x0, x1, " ".join(texts)))
+                    x0, x1, texts = word[0], word[2], [word[4]]
+            cells.append((x0, x1, " ".join(texts)))
+            cell_rows.append(cells)
+        return cell_rows
+
+    def _column_alignment(self, rows: List[List[Tuple[float, float, str]]]) -> float:
+        if len(rows) < self.min_rows:
+            return 0.0
+        # An anchor is a left or right cell edge bin shared by at least min_rows rows
+        edge_rows: Counter = Counter()
+        for row in rows:
+            edges = set()
+            for x0, x1, _ in row:
+                edges.add(("l", round(x0 / self.anchor_bin)))
+                edges.add(("r", round(x1 / self.anchor_bin)))
+            edge_rows.update(edges)
+        anchors = {edge for edge, count in edge_rows.items() if count >= self.min_rows}
+        if not anchors:
+            return 0.0
+
+        aligned_rows = 0
+        cells_in_aligned_rows = 0
+        for row in rows:
+            aligned = sum(1 for x0, x1, _ in row
+                          if ("l", round(x0 / self.anchor_bin)) in anchors
+                          or ("r", round(x1 / self.anchor_bin)) in anchors)
+            if aligned >= 2:
+                aligned_rows += 1
+                cells_in_aligned_rows += len(row)
+        if aligned_rows < self.min_rows:
+            return 0.0
+        # Two aligned cells per row is also what two-column prose looks like; full credit takes three
+        columns = min(1.0, (cells_in_aligned_rows / aligned_rows - 1) / 2.0)
+        return (aligned_rows / len(rows)) * columns
+
+    def _numeric_grid(self, rows: List[List[Tuple[float, float, str]]]) -> float:
+        if len(rows) < self.min_rows:
+            return 0.0
+        numeric_counts = [sum(1 for _, _, text in row if NUMERIC_CELL.match(text)) for row in rows]
+        numeric_rows = [count for count in numeric_counts if count]
+        if len(numeric_rows) < self.min_rows:
+            return 0.0
+        _, mode_rows = Counter(numeric_rows).most_common(1)[0]
+        return (len(numeric_rows) / len(rows)) * (mode_rows / len(numeric_rows))
+
+    def _count_rules(self, page: Any) -> int:
+        # get_cdrawings skips building Point/Rect objects; both share the items layout
+        get_drawings = getattr(page, "get_cdrawings", None) or getattr(page, "get_drawings", None)
+        if get_drawings is None:
+            return 0
+        try:
+            drawings = get_drawings()
+        except Exception:
+            return 0
+
+        rules = 0
+        for drawing in drawings:
+            if rules >= RULES_FOR_FULL_SCORE:
+                break  # the signal is saturated; ruled tables can carry thousands of segments
+            stroked = "s" in (drawing.get("type") or "")
+            for item in drawing.get("items", ()):
+                kind = item[0]
+                if kind == "l":
+                    rules += self._is_rule(item[1][0], item[1][1], item[2][0], item[2][1])
+                elif kind == "re":
+                    x0, y0, x1, y1 = item[1][0], item[1][1], item[1][2], item[1][3]
+                    width, height = abs(x1 - x0), abs(y1 - y0)
+                    if min(width, height) <= self.max_rule_thickness:
+                        # A thin filled bar is how many generators draw cell borders
+                        rules += max(width, height) >= self.min_rule_length
+                    elif stroked:
+                        rules += 2 * (width >= self.min_rule_length) + 2 * (height >= self.min_rule_length)
+        return rules
+
+    def _is_rule(self, x0: float, y0: float, x1: float, y1: float) -> bool:
+        dx, dy = abs(x1 - x0), abs(y1 - y0)
+        return (dy <= self.max_rule_thickness and dx >= self.min_rule_length) or \
+            (dx <= self.max_rule_thickness and dy >= self.min_rule_length)
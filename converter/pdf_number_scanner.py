@@ -0,0 +1,80 @@
+"""
+PDF Number Scanner
+
+Matches a set of named number patterns against a text and resolves overlaps
+in one ordered pass. Each pattern is compiled once and scanned with
+re.finditer, so matches are exactly those of a separate finditer per
+pattern. (A single alternation of capturing lookaheads gives the same
+matches, but CPython's engine runs it 2-3x slower than the separate scans.)
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+
+class NumberMatch(NamedTuple):
+    """One pattern match: format name, [start, end) span and matched text"""
+    format: str
+    start: int
+    end: int
+    text: str
+
+
+class NumberScanner:
+    """Compiled matcher for an ordered set of named number patterns"""
+
+    def __init__(self, patterns: Dict[str, str], flags: int = 0):
+        self.formats = list(patterns)
+        self._regexes = [(name, re.compile(pattern, flags)) for name, pattern in patterns.items()]
+
+    def scan_by_format(self, text: str) -> List[NumberMatch]:
+        """All matches grouped by pattern (in pattern order), each group by position"""
+        if not text:
+            return []
+        return [NumberMatch(name, found.start(), found.end(), found.group())
+                for name, regex in self._regexes for found in regex.finditer(text)]
+
+    def scan(self, text: str) -> List[NumberMatch]:
+        """All matches of every pattern, by start position and then pattern order"""
+        # Stable sort: matches at the same position keep pattern order
+        return sorted(self.scan_by_format(text), key=lambda match: match.start)
+
+    def select(self, text: str, priority: Dict[str, int], build: Callable[[NumberMatch], Optional[T]],
+               default_priority: int = 9) -> List[T]:
+        """
+        Non-overlapping matches, built into results
+
+        Candidates are taken by start position, then priority (lower first),
+        then length (longer first). A candidate overlapping an accepted match
+        is skipped; one that ``build`` turns into None is rejected and leaves
+        its span free for the next candidate.
+        """
+        candidates = sorted(self.scan_by_format(text), key=lambda match: (
+            match.start, priority.get(match.format, default_priority), match.start - match.end
+        ))
+        results = []
+        # Accepted spans never start after the current candidate, so it
+        # overlaps one exactly when it starts before the furthest accepted end
+        accepted_end = 0
+        for match in candidates:
+            if match.start < accepted_end:
+                continue
+            result = build(match)
+            if result is not None:
+                results.append(result)
+                accepted_end = max(accepted_end, match.end)
+        return results
+
+
+@lru_cache(maxsize=32)
+def _cached_scanner(patterns: Tuple[Tuple[str, str], ...], flags: int) -> NumberScanner:
+    return NumberScanner(dict(patterns), flags)
+
+
+def get_number_scanner(patterns: Dict[str, str], flags: int = 0) -> NumberScanner:
+    """Shared compiled scanner for a pattern set, so extractors do not recompile per instance"""
+    return _cached_scanner(tuple(patterns.items()), int(flags))
@@ -10,35 +10,47 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
+from .pdf_layout_signals import LayoutSignalExtractor
+
 
 @dataclass
 class AnalyzerThresholds:
     min_numbers_per_page: int = 3
     min_number_density: float = 0.5  # numbers per 1000 chars
     min_table_likeness_score: float = 0.6
+    # Numeric pages whose measured layout scores below this are running prose
+    # ("numeric_prose"): regex extraction handles them, so they are not routed
+    min_routed_table_likeness: float = 0.35
     max_pages_per_group: int = 5
 
 
 class PDFPageComplexityAnalyzer:
     def __init__(self, thresholds: AnalyzerThresholds | None = None) -> None:
         self.thresholds = thresholds or AnalyzerThresholds()
+        self.layout = LayoutSignalExtractor()
 
     def analyze_pages(self, fitz_doc: Any) -> List[Dict[str, Any]]:
         """
         Analyze pages and return metrics with a category for each page.
 
-        NOTE: This is a lightweight placeholder that expects the caller or
-        tests to provide page text via fitz_doc[page_index].get_text().
+        Page text comes from fitz_doc[page_index].get_text(). Layout signals
+        need PyMuPDF word positions (get_text("words")); pages without them
+        get table_likeness 0.0 and are categorized by numbers alone.
         """
         page_metrics: List[Dict[str, Any]] = []
         num_pages = getattr(fitz_doc, "page_count", None) or len(getattr(fitz_doc, "pages", [])) or len(fitz_doc)
 
         for page_index in range(num_pages):
             # Minimal extraction to avoid hard dependency on PyMuPDF in tests
+            page = textpage = None
             try:
                 page = fitz_doc[page_index] if hasattr(fitz_doc, "__getitem__") else fitz_doc.pages[page_index]
                 page_text = ""
-                if hasattr(page, "get_text"):
+                # One PyMuPDF TextPage serves both the page text and the layout words
+                textpage = self._textpage(page)
+                if textpage is not None:
+                    page_text = page.get_text(textpage=textpage) or ""
+                elif hasattr(page, "get_text"):
                     page_text = page.get_text() or ""
                 elif isinstance(page, str):
                     page_text = page
@@ -49,8 +61,10 @@ class PDFPageComplexityAnalyzer:
             char_count = max(len(page_text), 1)
             number_density = (number_count / char_count) * 1000.0
 
-            # Placeholder layout signal (0..1). Real impl would inspect bbox/lines.
-            layout_signals = {"table_likeness": 0.0}
+            # Word alignment, ruling lines and numeric cell grid (0..1 each)
+            layout_signals = self.layout.page_signals(page, textpage) if page is not None else None
+            if layout_signals is None:
+                layout_signals = {"table_likeness": 0.0}
 
             category = self._categorize(number_count, number_density, layout_signals)
             page_metrics.append({
@@ -66,7 +80,8 @@ class PDFPageComplexityAnalyzer:
 
     def group_numeric_pages(self, page_metrics: List[Dict[str, Any]]) -> List[Tuple[int, int]]:
         """
-        Group consecutive pages where category is numeric_text or probable_table.
+        Group consecutive pages where category is numeric_text or probable_table
+        (numeric_prose and none_or_low_numbers pages stay code-only).
         Each group length is capped by thresholds.max_pages_per_group.
         Returns inclusive (start_page, end_page) indices (0-based).
         """
@@ -101,6 +116,16 @@ class PDFPageComplexityAnalyzer:
 
     # --------- internals ---------
 
+    def _textpage(self, page: Any) -> Any:
+        """PyMuPDF TextPage with get_text()'s default flags, or None for other page objects"""
+        if not hasattr(page, "get_textpage"):
+            return None
+        try:
+            import fitz  # PyMuPDF
+            return page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+        except Exception:
+            return None
+
     def _count_numbers(self, text: str) -> int:
         import re
         patterns = [
@@ -116,10 +141,15 @@ class PDFPageComplexityAnalyzer:
         return count
 
     def _categorize(self, number_count: int, number_density: float, layout_signals: Dict[str, float]) -> str:
+        table_likeness = layout_signals.get("table_likeness", 0.0)
+        # Tables are routed even when their cells hold few digits
+        if table_likeness >= self.thresholds.min_table_likeness_score:
+            return "probable_table"
         if number_count < self.thresholds.min_numbers_per_page and number_density < self.thresholds.min_number_density:
             return "none_or_low_numbers"
-        if layout_signals.get("table_likeness", 0.0) >= self.thresholds.min_table_likeness_score:
-            return "probable_table"
+        # Only pages whose layout was measured can be told apart from tabular text
+        if "column_alignment" in layout_signals and table_likeness < self.thresholds.min_routed_table_likeness:
+            return "numeric_prose"
         return "numeric_text"
 
 
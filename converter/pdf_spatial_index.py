@@ -0,0 +1,96 @@
+"""
+PDF Spatial Index
+
+Exclusion zones are table bboxes, padded so that text hugging a table is
+dropped with it. ZoneIndex buckets the zones of one page into a uniform grid,
+so testing a word only checks the zones sharing its grid cells instead of
+every zone on the page. Overlap is inclusive: a word touching a zone's edge
+is inside it.
+"""
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+
+Bbox = Tuple[float, float, float, float]  # (x0, top, x1, bottom)
+
+# Padding (points) added around table regions before excluding their text
+EXCLUSION_PADDING = 10
+
+# Grid cell edge in points; a few text lines high, a fraction of a page wide
+DEFAULT_CELL_SIZE = 64.0
+
+# Pages with this few zones are scanned linearly; the grid only pays off above it
+LINEAR_SCAN_ZONES = 16
+
+# Zones spanning more cells than this (huge or non-finite bboxes) are checked linearly
+MAX_CELLS_PER_ZONE = 4096
+
+
+def pad_bbox(bbox: Sequence[float], padding: float) -> Bbox:
+    """Grow a bbox by padding on every side, clamping x0/top at the page origin"""
+    x0, y0, x1, y1 = bbox[:4]
+    return (max(0, x0 - padding), max(0, y0 - padding), x1 + padding, y1 + padding)
+
+
+def bboxes_overlap(bbox1: Sequence[float], bbox2: Sequence[float]) -> bool:
+    """True if two (x0, y0, x1, y1) bboxes overlap or touch"""
+    return not (bbox1[2] < bbox2[0] or bbox2[2] < bbox1[0] or
+                bbox1[3] < bbox2[1] or bbox2[3] < bbox1[1])
+
+
+class ZoneIndex:
+    """Uniform-grid index over the exclusion zones of one page"""
+
+    def __init__(self, zones: Sequence[Sequence[float]], cell_size: float = DEFAULT_CELL_SIZE):
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = cell_size
+        self.zones: List[Bbox] = [tuple(zone[:4]) for zone in zones]
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._unbucketed: List[int] = []
+
+        for i, zone in enumerate(self.zones):
+            spans = self._spans(zone) if len(self.zones) > LINEAR_SCAN_ZONES else None
+            if spans is None or len(spans[0]) * len(spans[1]) > MAX_CELLS_PER_ZONE:
+                self._unbucketed.append(i)
+                continue
+            for cx in spans[0]:
+                for cy in spans[1]:
+                    self._cells.setdefault((cx, cy), []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.zones)
+
+    def _span(self, lo: float, hi: float) -> range:
+        # min/max keep inverted bboxes exact: they still overlap words covering them
+        lo, hi = min(lo, hi), max(lo, hi)
+        return range(math.floor(lo / self.cell_size), math.floor(hi / self.cell_size) + 1)
+
+    def _spans(self, bbox: Sequence[float]):
+        try:
+            return self._span(bbox[0], bbox[2]), self._span(bbox[1], bbox[3])
+        except (OverflowError, ValueError):  # infinite or NaN coordinates
+            return None
+
+    def overlaps(self, bbox: Sequence[float]) -> bool:
+        """True if bbox overlaps or touches any zone"""
+        zones = self.zones
+        for i in self._unbucketed:
+            if bboxes_overlap(bbox, zones[i]):
+                return True
+        if not self._cells:
+            return False
+        spans = self._spans(bbox)
+        if spans is None or len(spans[0]) * len(spans[1]) > len(zones):
+            # Scanning the zones is cheaper than visiting this many cells
+            return any(bboxes_overlap(bbox, zone) for zone in zones)
+        x0, y0, x1, y1 = bbox[:4]
+        cells = self._cells
+        for cx in spans[0]:
+            for cy in spans[1]:
+                for i in cells.get((cx, cy), ()):
+                    zone = zones[i]
+                    if not (x1 < zone[0] or zone[2] < x0 or y1 < zone[1] or zone[3] < y0):
+                        return True
+        return False
@@ -0,0 +1,95 @@
+"""
+PDFPlumber Document Context
+
+Opens a PDF once and shares its pages between the table and text extractors.
+Per-page words are memoized by extraction settings, so a page's content stream
+is parsed and grouped into words once per run instead of once per phase.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import pdfplumber
+
+
+# pdfplumber's extract_words defaults; settings are normalized against these so
+# extract_words() and extract_words(x_tolerance=3, y_tolerance=3) share one entry
+DEFAULT_WORD_SETTINGS = {'x_tolerance': 3, 'y_tolerance': 3}
+
+
+class PDFPageContext:
+    """A pdfplumber page with memoized chars, words, lines and rects"""
+
+    def __init__(self, page: Any, page_number: int):
+        self.page = page
+        self.page_number = page_number  # 1-based
+        self._words: Dict[Tuple, List[Dict]] = {}
+
+    @property
+    def width(self) -> float:
+        return self.page.width
+
+    @property
+    def height(self) -> float:
+        return self.page.height
+
+    @property
+    def chars(self) -> List[Dict]:
+        # pdfplumber caches the parsed layout objects on the page itself
+        return self.page.chars
+
+    @property
+    def lines(self) -> List[Dict]:
+        return self.page.lines
+
+    @property
+    def rects(self) -> List[Dict]:
+        return self.page.rects
+
+    def words(self, **settings: Any) -> List[Dict]:
+        """page.extract_words(**settings), computed once per distinct settings.
+
+        The returned list is shared; callers must not modify it or its words.
+        """
+        merged = {**DEFAULT_WORD_SETTINGS, **settings}
+        key = tuple(sorted((name, repr(value)) for name, value in merged.items()))
+        words = self._words.get(key)
+        if words is None:
+            words = self._words[key] = self.page.extract_words(**merged)
+        return words
+
+
+class PDFDocumentContext:
+    """
+    A PDF opened once for a whole processing run.
+
+    Use as a context manager, or call close(). Extractors given a context read
+    its pages instead of opening the file themselves.
+    """
+
+    def __init__(self, pdf_path: str):
+        if not os.path.exists(pdf_path):
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        self.pdf_path = pdf_path
+        self.pdf = pdfplumber.open(pdf_path)
+        self._pages: Optional[List[PDFPageContext]] = None
+
+    @property
+    def pages(self) -> List[PDFPageContext]:
+        if self._pages is None:
+            self._pages = [PDFPageContext(page, i + 1) for i, page in enumerate(self.pdf.pages)]
+        return self._pages
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    def close(self) -> None:
+        self._pages = None
+        self.pdf.close()
+
+    def __enter__(self) -> 'PDFDocumentContext':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
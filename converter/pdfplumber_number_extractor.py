@@ -11,16 +11,43 @@ Date: 2024
 import re
 import logging
 from typing import Dict, List, Optional, Any, Tuple
+from .pdf_number_scanner import NumberMatch, get_number_scanner
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Units looked up in a number's context, in lookup order, with the words
+# that name them; the first unit with a word in the context wins
+UNIT_WORDS = {
+    'million': ('million', 'mil', 'm'),
+    'billion': ('billion', 'bil', 'b'),
+    'thousand': ('thousand', 'k'),
+    'dollars': ('dollar', 'dollars', 'usd'),
+    'cents': ('cent', 'cents'),
+    'years': ('year', 'years', 'yr', 'yrs'),
+    'months': ('month', 'months', 'mo', 'mos'),
+    'days': ('day', 'days'),
+    'hours': ('hour', 'hours', 'hr', 'hrs'),
+    'minutes': ('minute', 'minutes', 'min', 'mins'),
+    'seconds': ('second', 'seconds', 'sec', 'secs'),
+    'percent': ('percent', 'percentage')
+}
+UNITS = list(UNIT_WORDS)
+UNIT_RANKS = {word: rank for rank, words in enumerate(UNIT_WORDS.values()) for word in words}
+# A unit word must be a whole \w run; a '%' counts as percent between word characters
+WORD_RUN = re.compile(r'\w+')
+ENCLOSED_PERCENT = re.compile(r'(?<=\w)%(?=\w)')
+
 class PDFPlumberNumberExtractor:
     """
     Number extraction from text content with conversion to existing JSON schemas
     """
     
+    # Overlapping matches at one position: more specific formats win, then longer matches
+    PATTERN_PRIORITY = {'percentage': 0, 'currency': 1, 'ratio': 2, 'date_number': 3,
+                        'scientific_notation': 4, 'fraction': 5, 'decimal': 6, 'integer': 7, 'ordinal': 8}
+    
     def __init__(self, config: Optional[Dict] = None):
         """
         Initialize the PDFPlumber number extractor
@@ -34,6 +61,8 @@ class PDFPlumberNumberExtractor:
         self.confidence_threshold = self.config.get('confidence_threshold', 0.7)
         self.extract_metadata = self.config.get('extract_metadata', True)
         self.include_positioning = self.config.get('include_positioning', True)
+        # All patterns run in one compiled pass, shared by extractors with the same patterns
+        self.scanner = get_number_scanner(self.patterns, re.IGNORECASE)
         
         logger.info("PDFPlumberNumberExtractor initialized")
     
@@ -73,58 +102,23 @@ class PDFPlumberNumberExtractor:
         if not text or not text.strip():
             return []
         
-        numbers = []
-        used_positions = set()
-        
-        # Collect all matches from all patterns first
-        all_matches = []
-        for format_type, pattern in self.patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                all_matches.append((match, format_type))
-        
-        # Sort matches by start position, then prioritize longer and more specific patterns
-        # Priority order: percentage > currency > ratio > date_number > others
-        pattern_priority = {'percentage': 0, 'currency': 1, 'ratio': 2, 'date_number': 3, 
-                           'scientific_notation': 4, 'fraction': 5, 'decimal': 6, 'integer': 7, 'ordinal': 8}
-        
-        all_matches.sort(key=lambda x: (
-            x[0].start(), 
-            pattern_priority.get(x[1], 9),  # More specific patterns first
-            -len(x[0].group(0))  # Then longer matches
-        ))
-        
-        # Process matches, avoiding overlaps but prioritizing more specific patterns
-        for match, format_type in all_matches:
-            start_pos = match.start()
-            end_pos = match.end()
-            
-            # Check if this position overlaps with any used position
-            overlaps = False
-            for used_start, used_end in used_positions:
-                if not (end_pos <= used_start or start_pos >= used_end):
-                    overlaps = True
-                    break
-            
-            if not overlaps:
-                number_info = self._process_number_match(
-                    match, format_type, text, position, metadata
-                )
-                
-                if number_info and number_info["confidence"] >= self.confidence_threshold:
-                    numbers.append(number_info)
-                    used_positions.add((start_pos, end_pos))
-        
-        return numbers
+        def build(match: NumberMatch) -> Optional[Dict]:
+            number_info = self._process_number_match(match, text, position, metadata)
+            if number_info and number_info["confidence"] >= self.confidence_threshold:
+                return number_info
+            return None
+        
+        # Matches are taken by position, then priority and length, skipping any
+        # that overlap an accepted number
+        return self.scanner.select(text, self.PATTERN_PRIORITY, build)
     
-    def _process_number_match(self, match: re.Match, format_type: str, text: str, 
+    def _process_number_match(self, match: NumberMatch, text: str, 
                             position: Dict, metadata: Dict) -> Optional[Dict]:
         """
         Process a single number match and convert to schema format
         
         Args:
-            match: Regex match object
-            format_type: Type of number format
+            match: Pattern match (format, span and matched text)
             text: Full text content
             position: Position information
             metadata: Text metadata
@@ -133,14 +127,15 @@ class PDFPlumberNumberExtractor:
             Number dictionary in schema format or None
         """
         try:
-            original_text = match.group(0)
+            original_text = match.text
+            format_type = match.format
             numeric_value = self._extract_numeric_value(original_text, format_type)
             
             if numeric_value is None:
                 return None
             
             # Extract context around the number
-            context = self._extract_context(text, match.start(), match.end())
+            context = self._extract_context(text, match.start, match.end)
             
             # Calculate confidence based on format and context
             confidence = self._calculate_confidence(original_text, format_type, context)
@@ -151,7 +146,7 @@ class PDFPlumberNumberExtractor:
             
             # Calculate position within text
             text_position = self._calculate_text_position(
-                match.start(), match.end(), text, position
+                match.start, match.end, text, position
             )
             
             number_info = {
@@ -319,27 +314,14 @@ class PDFPlumberNumberExtractor:
         if format_type == 'percentage':
             return 'percent'
         
-        # Common units to look for
-        unit_patterns = {
-            r'\b(million|mil|m)\b': 'million',
-            r'\b(billion|bil|b)\b': 'billion',
-            r'\b(thousand|k)\b': 'thousand',
-            r'\b(dollars?|usd)\b': 'dollars',
-            r'\b(cents?)\b': 'cents',
-            r'\b(years?|yrs?)\b': 'years',
-            r'\b(months?|mos?)\b': 'months',
-            r'\b(days?)\b': 'days',
-            r'\b(hours?|hrs?)\b': 'hours',
-            r'\b(minutes?|mins?)\b': 'minutes',
-            r'\b(seconds?|secs?)\b': 'seconds',
-            r'\b(percent|percentage|%)\b': 'percent'
-        }
-        
         context_lower = context.lower()
         
-        for pattern, unit in unit_patterns.items():
-            if re.search(pattern, context_lower):
-                return unit
+        # One tokenizing pass instead of a regex search per unit
+        ranks = [UNIT_RANKS[word] for word in WORD_RUN.findall(context_lower) if word in UNIT_RANKS]
+        if ranks:
+            return UNITS[min(ranks)]
+        if ENCLOSED_PERCENT.search(context_lower):
+            return 'percent'
         
         return None
     
@@ -381,11 +363,10 @@ class PDFPlumberNumberExtractor:
             Position dictionary
         """
         # Calculate line number by counting newlines before start_pos
-        line_number = text[:start_pos].count('\n') + 1
+        line_number = text.count('\n', 0, start_pos) + 1
         
         # Estimate character position within the section
-        lines = text[:start_pos].split('\n')
-        char_in_line = len(lines[-1]) if lines else 0
+        char_in_line = start_pos - (text.rfind('\n', 0, start_pos) + 1)
         
         # Use section position as base and add estimated offsets
         bbox = section_position.get('bbox', [0, 0, 0, 0])
@@ -0,0 +1,138 @@
+"""
+PDFPlumber Page Pool
+
+Page-sharded execution for the PDFPlumber extractors. pdfplumber is pure
+Python and CPU-bound per page, so large documents are split into contiguous
+page ranges that worker processes extract independently; each worker opens
+the document itself. Results come back in page order, and cross-page steps
+(table numbering, spanning-table merges, TOC) stay in the parent.
+
+Every extraction in the process shares one spawn pool capped by
+PDF_MAX_PAGE_WORKERS; a document's worker count only limits how many of its
+ranges are in the pool at once.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Tuple
+
+
+# Ranges per worker: smaller shards even out pages of uneven cost
+CHUNKS_PER_WORKER = 4
+
+# One spawn pool per process, shared by the table and text extractors
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+
+def max_page_workers() -> int:
+    """
+    Server-wide cap on worker processes for page-sharded extraction
+
+    Read from PDF_MAX_PAGE_WORKERS; unset or 0 means one per CPU.
+    """
+    value = (os.getenv("PDF_MAX_PAGE_WORKERS") or "").strip()
+    try:
+        configured = int(value) if value else 0
+    except ValueError:
+        raise ValueError(f"PDF_MAX_PAGE_WORKERS must be an integer, got {value!r}")
+    if configured < 0:
+        raise ValueError(f"PDF_MAX_PAGE_WORKERS must be >= 0, got {configured}")
+    return configured or (os.cpu_count() or 1)
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """The shared page pool, created on first use"""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            # Spawned workers do not inherit the parent's threads or open handles
+            _page_pool = ProcessPoolExecutor(max_workers=max_page_workers(),
+                                             mp_context=multiprocessing.get_context('spawn'))
+        return _page_pool
+
+
+def _discard_page_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken shared pool so the next extraction starts a new one"""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is pool:
+            _page_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def resolve_page_workers(configured: Optional[int] = None) -> int:
+    """
+    Worker processes for page-sharded extraction
+
+    ``configured`` (an extractor's ``page_workers`` setting) wins over the
+    PDF_PAGE_WORKERS env var; both default to 1 (in-process) and 0 means one
+    worker per CPU.
+    """
+    if configured is None:
+        value = (os.getenv("PDF_PAGE_WORKERS") or "").strip()
+        try:
+            configured = int(value) if value else 1
+        except ValueError:
+            raise ValueError(f"PDF_PAGE_WORKERS must be an integer, got {value!r}")
+    if configured < 0:
+        raise ValueError(f"page_workers must be >= 0, got {configured}")
+    return configured or (os.cpu_count() or 1)
+
+
+def page_worker_count(page_workers: int, min_pages_per_worker: int, page_count: int) -> int:
+    """Processes to spread page_count pages over (<= 1 means in-process)"""
+    if page_workers <= 1:
+        return 1
+    return max(1, min(page_workers, max_page_workers(), page_count // max(min_pages_per_worker, 1)))
+
+
+def page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """Contiguous 0-based [start, end) page ranges covering the document"""
+    chunks = min(page_count, workers * CHUNKS_PER_WORKER)
+    if chunks <= 0:
+        return []
+    size, extra = divmod(page_count, chunks)
+    ranges = []
+    start = 0
+    for i in range(chunks):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def map_page_ranges(func: Callable[..., List[Any]], pdf_path: str, page_count: int,
+                    workers: int, *args: Any) -> List[Any]:
+    """
+    Run ``func(pdf_path, start, end, *args)`` per page range in the shared pool
+
+    ``func`` must be a module-level function returning one item per page; the
+    items are returned for the whole document in page order. At most
+    ``workers`` of the document's ranges are in the pool at once.
+    """
+    ranges = page_ranges(page_count, workers)
+    pool = _get_page_pool()
+    outputs: List[Optional[List[Any]]] = [None] * len(ranges)
+    pending = {}
+    next_index = 0
+    try:
+        while next_index < len(ranges) or pending:
+            while next_index < len(ranges) and len(pending) < workers:
+                start, end = ranges[next_index]
+                pending[pool.submit(func, pdf_path, start, end, *args)] = next_index
+                next_index += 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                outputs[pending.pop(future)] = future.result()
+    except BrokenProcessPool:
+        # A crashed worker breaks the pool; the next extraction gets a fresh one
+        _discard_page_pool(pool)
+        raise
+    finally:
+        for future in pending:
+            future.cancel()
+    return [item for output in outputs for item in output]
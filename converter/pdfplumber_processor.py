@@ -17,6 +17,7 @@ from typing import Dict, List, Optional, Any
 from .pdfplumber_table_extractor import PDFPlumberTableExtractor
 from .pdfplumber_text_extractor import PDFPlumberTextExtractor
 from .pdfplumber_number_extractor import PDFPlumberNumberExtractor
+from .pdfplumber_document_context import PDFDocumentContext
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -123,7 +124,8 @@ class PDFPlumberProcessor:
     def process_file(self, pdf_path: str) -> Dict[str, Any]:
         """
         Process PDF file and return comprehensive JSON representation
-        Compatible with existing API
+        Compatible with existing API. The file is opened once and its pages
+        are shared by the table and text phases.
         
         Args:
             pdf_path: Path to the PDF file
@@ -159,13 +161,25 @@ class PDFPlumberProcessor:
             }
         }
         
+        try:
+            document = PDFDocumentContext(pdf_path)
+        except Exception as e:
+            # Unreadable file: each phase reports its own failure, as when they opened it separately
+            logger.warning(f"Could not open PDF for shared extraction: {e}")
+            return self._process_document(pdf_path, None, result, processing_start)
+        with document:
+            return self._process_document(pdf_path, document, result, processing_start)
+    
+    def _process_document(self, pdf_path: str, document: Optional[PDFDocumentContext],
+                          result: Dict[str, Any], processing_start: datetime) -> Dict[str, Any]:
+        """Run the extraction phases of process_file over an open document"""
         try:
             # Phase 1: Extract tables
             tables_data = None
             if self.config.get('processing_options', {}).get('extract_tables', True):
                 logger.info("Phase 1: Extracting tables")
                 try:
-                    tables_data = self.table_extractor.extract_tables(pdf_path)
+                    tables_data = self.table_extractor.extract_tables(pdf_path, document)
                     result["pdf_processing_result"]["tables"] = tables_data
                     result["pdf_processing_result"]["processing_summary"]["tables_extracted"] = \
                         len(tables_data.get("tables", []))
@@ -188,7 +202,7 @@ class PDFPlumberProcessor:
                         and tables_data):
                         table_regions = tables_data.get("tables", [])
                     
-                    text_data = self.text_extractor.extract_text_content(pdf_path, table_regions)
+                    text_data = self.text_extractor.extract_text_content(pdf_path, table_regions, document)
                     result["pdf_processing_result"]["text_content"] = text_data["text_content"]
                     
                     # Update summary with text statistics
@@ -225,32 +239,35 @@ class PDFPlumberProcessor:
             result["pdf_processing_result"]["processing_summary"]["processing_errors"].append(error_msg)
             raise
     
-    def extract_tables_only(self, pdf_path: str) -> Dict:
+    def extract_tables_only(self, pdf_path: str, document: Optional[PDFDocumentContext] = None) -> Dict:
         """
         Extract only tables from PDF (compatibility method)
         
         Args:
             pdf_path: Path to the PDF file
+            document: Optional already-open document context
             
         Returns:
             Dictionary containing extracted tables
         """
         logger.info(f"Extracting tables only from: {pdf_path}")
-        return self.table_extractor.extract_tables(pdf_path)
+        return self.table_extractor.extract_tables(pdf_path, document)
     
-    def extract_text_only(self, pdf_path: str, table_regions: Optional[List[Dict]] = None) -> Dict:
+    def extract_text_only(self, pdf_path: str, table_regions: Optional[List[Dict]] = None,
+                          document: Optional[PDFDocumentContext] = None) -> Dict:
         """
         Extract only text content from PDF (compatibility method)
         
         Args:
             pdf_path: Path to the PDF file
             table_regions: Optional table regions to exclude
+            document: Optional already-open document context
             
         Returns:
             Dictionary containing extracted text content
         """
         logger.info(f"Extracting text only from: {pdf_path}")
-        return self.text_extractor.extract_text_content(pdf_path, table_regions)
+        return self.text_extractor.extract_text_content(pdf_path, table_regions, document)
     
     def extract_numbers_only(self, text: str, position: Dict, metadata: Dict) -> List[Dict]:
         """
@@ -13,9 +13,10 @@ import os
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-import pdfplumber
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from .pdfplumber_document_context import PDFDocumentContext, PDFPageContext
+from .pdfplumber_page_pool import map_page_ranges, page_worker_count, resolve_page_workers
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -28,6 +29,25 @@ class TableRegion:
     bbox: Tuple[float, float, float, float]  # x0, y0, x1, y1
     table_data: List[List[str]]
     confidence: float
+
+
+def _extract_page_range_tables(pdf_path: str, start: int, end: int,
+                               extractor: 'PDFPlumberTableExtractor') -> List[List[TableRegion]]:
+    """
+    Process-pool entry point: valid table regions of pages [start, end)
+    
+    Args:
+        pdf_path: Path to the PDF file, opened by this worker
+        start: First page index (0-based)
+        end: Page index after the last page
+        extractor: Pickled copy of the parent extractor (configuration only)
+        
+    Returns:
+        One list of TableRegion objects per page, in page order
+    """
+    with PDFDocumentContext(pdf_path) as document:
+        return [extractor._extract_valid_tables(page_ctx) for page_ctx in document.pages[start:end]]
+
     
 class PDFPlumberTableExtractor:
     """
@@ -46,6 +66,9 @@ class PDFPlumberTableExtractor:
         self.quality_threshold = self.config.get('quality_threshold', 0.8)
         self.min_table_size = self.config.get('min_table_size', 2)
         self.max_tables_per_page = self.config.get('max_tables_per_page', 10)
+        # Page-sharded extraction over worker processes; 1 keeps it in-process
+        self.page_workers = resolve_page_workers(self.config.get('page_workers'))
+        self.min_pages_per_worker = self.config.get('min_pages_per_worker', 8)
         
         logger.info("PDFPlumberTableExtractor initialized")
     
@@ -81,20 +104,22 @@ class PDFPlumberTableExtractor:
             'enable_spanning_detection': True  # Enable cross-page table merging
         }
     
-    def extract_tables(self, pdf_path: str) -> Dict:
+    def extract_tables(self, pdf_path: str, document: Optional[PDFDocumentContext] = None) -> Dict:
         """
         Extract tables from PDF using PDFPlumber
         
         Args:
             pdf_path: Path to the PDF file
+            document: Already-open document context to read pages from
             
         Returns:
             Dictionary containing extracted tables in table-oriented JSON format
         """
-        logger.info(f"Starting table extraction from: {pdf_path}")
+        if document is None:
+            with PDFDocumentContext(pdf_path) as document:
+                return self.extract_tables(pdf_path, document)
         
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        logger.info(f"Starting table extraction from: {pdf_path}")
         
         tables_data = {
             "tables": [],
@@ -108,52 +133,60 @@ class PDFPlumberTableExtractor:
         }
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                table_counter = 1
-                
-                for page_num, page in enumerate(pdf.pages):
-                    logger.info(f"Processing page {page_num + 1}/{len(pdf.pages)}")
-                    
-                    # Extract tables using multiple strategies
-                    page_tables = self._extract_tables_from_page(page, page_num + 1)
+            table_counter = 1
+            
+            workers = page_worker_count(self.page_workers, self.min_pages_per_worker, document.page_count)
+            if workers > 1:
+                logger.info(f"Extracting tables from {document.page_count} pages with {workers} worker processes")
+                page_tables = map_page_ranges(_extract_page_range_tables, pdf_path, document.page_count, workers, self)
+            else:
+                page_tables = (self._extract_valid_tables(page_ctx) for page_ctx in document.pages)
+            
+            # Tables are numbered in page order, however the pages were extracted
+            for valid_tables in page_tables:
+                for table_region in valid_tables:
+                    table_json = self._convert_to_schema(
+                        table_region, table_counter
+                    )
                     
-                    for table_region in page_tables:
-                        if self._is_valid_table(table_region):
-                            table_json = self._convert_to_schema(
-                                table_region, table_counter
-                            )
-                            
-                            if table_json:
-                                tables_data["tables"].append(table_json)
-                                self._update_quality_distribution(
-                                    tables_data["metadata"]["quality_distribution"],
-                                    table_region.confidence
-                                )
-                                logger.info(f"Added table {table_counter} from page {page_num + 1}")
-                                table_counter += 1
-                
-                # Apply post-processing
-                tables_data["tables"] = self._post_process_tables(tables_data["tables"])
-                tables_data["metadata"]["total_tables_found"] = len(tables_data["tables"])
-                
-                logger.info(f"Table extraction completed. Found {len(tables_data['tables'])} tables")
-                return tables_data
+                    if table_json:
+                        tables_data["tables"].append(table_json)
+                        self._update_quality_distribution(
+                            tables_data["metadata"]["quality_distribution"],
+                            table_region.confidence
+                        )
+                        logger.info(f"Added table {table_counter} from page {table_region.page_number}")
+                        table_counter += 1
+            
+            # Apply post-processing
+            tables_data["tables"] = self._post_process_tables(tables_data["tables"])
+            tables_data["metadata"]["total_tables_found"] = len(tables_data["tables"])
+            
+            logger.info(f"Table extraction completed. Found {len(tables_data['tables'])} tables")
+            return tables_data
                 
         except Exception as e:
             logger.error(f"Error during table extraction: {str(e)}")
             raise
     
-    def _extract_tables_from_page(self, page: Any, page_num: int) -> List[TableRegion]:
+    def _extract_valid_tables(self, page_ctx: PDFPageContext) -> List[TableRegion]:
+        """Tables of one page that pass validation, in detection order"""
+        logger.info(f"Processing page {page_ctx.page_number}")
+        page_tables = self._extract_tables_from_page(page_ctx, page_ctx.page_number)
+        return [table_region for table_region in page_tables if self._is_valid_table(table_region)]
+    
+    def _extract_tables_from_page(self, page_ctx: PDFPageContext, page_num: int) -> List[TableRegion]:
         """
         Extract tables from a single page using multiple strategies
         
         Args:
-            page: PDFPlumber page object
+            page_ctx: Shared page context (PDFPlumber page plus memoized words)
             page_num: Page number (1-based)
             
         Returns:
             List of TableRegion objects
         """
+        page = page_ctx.page
         tables = []
         
         # Strategy 0: Use pdfplumber's native table objects with accurate bboxes
@@ -183,7 +216,7 @@ class PDFPlumberTableExtractor:
                 for i, table_data in enumerate(extracted_tables):
                     if table_data and len(table_data) >= self.min_table_size:
                         # Estimate bounding box for the table using safer heuristic
-                        bbox = self._estimate_table_bbox(page, table_data)
+                        bbox = self._estimate_table_bbox(page_ctx, table_data)
                         table_region = TableRegion(
                             page_number=page_num,
                             bbox=bbox,
@@ -209,7 +242,7 @@ class PDFPlumberTableExtractor:
                 
                 for table_data in extracted_tables:
                     if table_data and len(table_data) >= self.min_table_size:
-                        bbox = self._estimate_table_bbox(page, table_data)
+                        bbox = self._estimate_table_bbox(page_ctx, table_data)
                         
                         table_region = TableRegion(
                             page_number=page_num,
@@ -224,17 +257,17 @@ class PDFPlumberTableExtractor:
         
         # Strategy 3: Manual table detection using text positioning
         if not tables:
-            manual_tables = self._detect_tables_manually(page, page_num)
+            manual_tables = self._detect_tables_manually(page_ctx, page_num)
             tables.extend(manual_tables)
         
         return tables[:self.max_tables_per_page]  # Limit tables per page
     
-    def _estimate_table_bbox(self, page: Any, table_data: List[List[str]]) -> Tuple[float, float, float, float]:
+    def _estimate_table_bbox(self, page_ctx: PDFPageContext, table_data: List[List[str]]) -> Tuple[float, float, float, float]:
         """
         Estimate bounding box for a table based on its content
         
         Args:
-            page: PDFPlumber page object
+            page_ctx: Shared page context
             table_data: Table data as list of lists
             
         Returns:
@@ -242,7 +275,7 @@ class PDFPlumberTableExtractor:
         """
         try:
             # Get all words on the page
-            words = page.extract_words()
+            words = page_ctx.words()
             
             # Build a conservative set of target tokens (avoid overly short tokens)
             targets = set()
@@ -288,16 +321,16 @@ class PDFPlumberTableExtractor:
             logger.debug(f"Could not estimate table bbox: {e}")
         
         # Final fallback: return a small centered box to avoid nuking page text
-        pw, ph = page.width, page.height
+        pw, ph = page_ctx.width, page_ctx.height
         cx0, cy0, cx1, cy1 = pw * 0.25, ph * 0.25, pw * 0.75, ph * 0.75
         return (cx0, cy0, cx1, cy1)
     
-    def _detect_tables_manually(self, page: Any, page_num: int) -> List[TableRegion]:
+    def _detect_tables_manually(self, page_ctx: PDFPageContext, page_num: int) -> List[TableRegion]:
         """
         Manually detect tables using text patterns and positioning
         
         Args:
-            page: PDFPlumber page object
+            page_ctx: Shared page context
             page_num: Page number (1-based)
             
         Returns:
@@ -307,7 +340,7 @@ class PDFPlumberTableExtractor:
         
         try:
             # Get all text with coordinates
-            words = page.extract_words()
+            words = page_ctx.words()
             
             if not words:
                 return tables
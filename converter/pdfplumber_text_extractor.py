@@ -12,13 +12,37 @@ import os
 import re
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-import pdfplumber
+from typing import Dict, List, Optional, Tuple
+from .pdfplumber_document_context import PDFDocumentContext, PDFPageContext
+from .pdf_spatial_index import EXCLUSION_PADDING, ZoneIndex, bboxes_overlap, pad_bbox
+from .pdfplumber_page_pool import map_page_ranges, page_worker_count, resolve_page_workers
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _extract_page_range_text(pdf_path: str, start: int, end: int,
+                             extractor: 'PDFPlumberTextExtractor',
+                             exclusion_zones: Dict[int, List[Tuple]]) -> List[Dict]:
+    """
+    Process-pool entry point: page content of pages [start, end)
+    
+    Args:
+        pdf_path: Path to the PDF file, opened by this worker
+        start: First page index (0-based)
+        end: Page index after the last page
+        extractor: Pickled copy of the parent extractor (configuration only)
+        exclusion_zones: Exclusion zones by 0-based page index
+        
+    Returns:
+        One page content dict per page, in page order
+    """
+    with PDFDocumentContext(pdf_path) as document:
+        return [extractor._extract_page_content(page_ctx, page_ctx.page_number,
+                                                exclusion_zones.get(page_ctx.page_number - 1, []))
+                for page_ctx in document.pages[start:end]]
+
 class PDFPlumberTextExtractor:
     """
     Text extraction using PDFPlumber with layout preservation and 
@@ -37,6 +61,9 @@ class PDFPlumberTextExtractor:
         self.section_config = self.config.get('section_detection', {})
         self.extract_metadata = self.config.get('extract_metadata', True)
         self.preserve_formatting = self.config.get('preserve_formatting', True)
+        # Page-sharded extraction over worker processes; 1 keeps it in-process
+        self.page_workers = resolve_page_workers(self.config.get('page_workers'))
+        self.min_pages_per_worker = self.config.get('min_pages_per_worker', 8)
         
         logger.info("PDFPlumberTextExtractor initialized")
     
@@ -59,21 +86,24 @@ class PDFPlumberTextExtractor:
             'preserve_formatting': True
         }
     
-    def extract_text_content(self, pdf_path: str, table_regions: Optional[List[Dict]] = None) -> Dict:
+    def extract_text_content(self, pdf_path: str, table_regions: Optional[List[Dict]] = None,
+                             document: Optional[PDFDocumentContext] = None) -> Dict:
         """
         Extract text content from PDF using PDFPlumber, excluding table regions
         
         Args:
             pdf_path: Path to the PDF file
             table_regions: List of table regions to exclude from text extraction
+            document: Already-open document context to read pages from
             
         Returns:
             Dictionary containing extracted text in structured format
         """
-        logger.info(f"Starting text extraction from: {pdf_path}")
+        if document is None:
+            with PDFDocumentContext(pdf_path) as document:
+                return self.extract_text_content(pdf_path, table_regions, document)
         
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        logger.info(f"Starting text extraction from: {pdf_path}")
         
         # Initialize result structure
         text_data = {
@@ -110,48 +140,58 @@ class PDFPlumberTextExtractor:
         }
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                text_data["text_content"]["document_metadata"]["total_pages"] = len(pdf.pages)
-                
-                # Convert table regions to exclusion zones
-                exclusion_zones = self._prepare_exclusion_zones(table_regions, len(pdf.pages))
+            total_pages = document.page_count
+            text_data["text_content"]["document_metadata"]["total_pages"] = total_pages
+            
+            # Convert table regions to exclusion zones
+            exclusion_zones = self._prepare_exclusion_zones(table_regions, total_pages)
+            
+            # Extract text content from each page, sharded over processes when enabled
+            workers = page_worker_count(self.page_workers, self.min_pages_per_worker, total_pages)
+            if workers > 1:
+                logger.info(f"Extracting text from {total_pages} pages with {workers} worker processes")
+                pages = map_page_ranges(_extract_page_range_text, pdf_path, total_pages, workers,
+                                        self, exclusion_zones)
+            else:
+                pages = self._iter_page_content(document, exclusion_zones)
+            
+            for page_data in pages:
+                text_data["text_content"]["pages"].append(page_data)
                 
-                # Process each page
-                for page_num, page in enumerate(pdf.pages):
-                    logger.info(f"Processing page {page_num + 1}/{len(pdf.pages)}")
-                    
-                    # Extract text content from page
-                    page_data = self._extract_page_content(
-                        page, page_num + 1, exclusion_zones.get(page_num, [])
-                    )
-                    
-                    text_data["text_content"]["pages"].append(page_data)
+                # Update summary statistics
+                for section in page_data["sections"]:
+                    section_type = section["section_type"]
+                    text_data["text_content"]["document_structure"]["sections_by_type"][section_type] += 1
+                    text_data["text_content"]["summary"]["total_sections"] += 1
+                    text_data["text_content"]["summary"]["total_words"] += section["word_count"]
+                    text_data["text_content"]["summary"]["total_numbers_found"] += len(section.get("numbers", []))
                     
-                    # Update summary statistics
-                    for section in page_data["sections"]:
-                        section_type = section["section_type"]
-                        text_data["text_content"]["document_structure"]["sections_by_type"][section_type] += 1
-                        text_data["text_content"]["summary"]["total_sections"] += 1
-                        text_data["text_content"]["summary"]["total_words"] += section["word_count"]
-                        text_data["text_content"]["summary"]["total_numbers_found"] += len(section.get("numbers", []))
-                        
-                        if section["llm_ready"]:
-                            text_data["text_content"]["summary"]["llm_ready_sections"] += 1
-                
-                # Calculate final statistics
-                self._finalize_statistics(text_data["text_content"])
-                
-                # Generate table of contents
-                text_data["text_content"]["document_structure"]["toc"] = \
-                    self._generate_table_of_contents(text_data["text_content"]["pages"])
-                
-                logger.info(f"Text extraction completed. Found {text_data['text_content']['summary']['total_sections']} sections")
-                return text_data
-                
+                    if section["llm_ready"]:
+                        text_data["text_content"]["summary"]["llm_ready_sections"] += 1
+            
+            # Calculate final statistics
+            self._finalize_statistics(text_data["text_content"])
+            
+            # Generate table of contents
+            text_data["text_content"]["document_structure"]["toc"] = \
+                self._generate_table_of_contents(text_data["text_content"]["pages"])
+            
+            logger.info(f"Text extraction completed. Found {text_data['text_content']['summary']['total_sections']} sections")
+            return text_data
+            
         except Exception as e:
             logger.error(f"Error during text extraction: {str(e)}")
             raise
     
+    def _iter_page_content(self, document: PDFDocumentContext, exclusion_zones: Dict[int, List[Tuple]]):
+        """Page content dicts of the whole document, extracted in-process"""
+        for page_ctx in document.pages:
+            page_num = page_ctx.page_number - 1
+            logger.info(f"Processing page {page_num + 1}/{document.page_count}")
+            yield self._extract_page_content(
+                page_ctx, page_num + 1, exclusion_zones.get(page_num, [])
+            )
+    
     def _prepare_exclusion_zones(self, table_regions: Optional[List[Dict]], total_pages: int) -> Dict[int, List[Tuple]]:
         """
         Prepare exclusion zones from table regions
@@ -200,24 +240,18 @@ class PDFPlumberTextExtractor:
                 if 0 <= page_index < total_pages:
                     if page_index not in exclusion_zones:
                         exclusion_zones[page_index] = []
-                    padding = 10
-                    exclusion_zone = (
-                        max(0, bbox[0] - padding),
-                        max(0, bbox[1] - padding),
-                        bbox[2] + padding,
-                        bbox[3] + padding
-                    )
+                    exclusion_zone = pad_bbox(bbox, EXCLUSION_PADDING)
                     exclusion_zones[page_index].append(exclusion_zone)
                     logger.debug(f"Added exclusion zone on page {page_index + 1}: {exclusion_zone}")
         
         return exclusion_zones
     
-    def _extract_page_content(self, page: Any, page_num: int, exclusion_zones: List[Tuple]) -> Dict:
+    def _extract_page_content(self, page_ctx: PDFPageContext, page_num: int, exclusion_zones: List[Tuple]) -> Dict:
         """
         Extract text content from a single page
         
         Args:
-            page: PDFPlumber page object
+            page_ctx: Shared page context (PDFPlumber page plus memoized words)
             page_num: Page number (1-based)
             exclusion_zones: List of exclusion zone coordinates
             
@@ -226,14 +260,14 @@ class PDFPlumberTextExtractor:
         """
         page_data = {
             "page_number": page_num,
-            "page_width": page.width,
-            "page_height": page.height,
+            "page_width": page_ctx.width,
+            "page_height": page_ctx.height,
             "sections": []
         }
         
         try:
             # Extract words with coordinates and metadata
-            words = page.extract_words(**self.text_settings)
+            words = page_ctx.words(**self.text_settings)
             
             # Filter out words in exclusion zones
             filtered_words = self._filter_excluded_words(words, exclusion_zones)
@@ -269,20 +303,12 @@ class PDFPlumberTextExtractor:
         if not exclusion_zones:
             return words
         
-        filtered_words = []
-        
-        for word in words:
-            word_bbox = (word['x0'], word['top'], word['x1'], word['bottom'])
-            
-            # Check if word overlaps with any exclusion zone
-            excluded = False
-            for zone in exclusion_zones:
-                if self._bbox_overlaps(word_bbox, zone):
-                    excluded = True
-                    break
-            
-            if not excluded:
-                filtered_words.append(word)
+        # Grid index over the page's zones: each word is checked against nearby zones only
+        zone_index = ZoneIndex(exclusion_zones)
+        filtered_words = [
+            word for word in words
+            if not zone_index.overlaps((word['x0'], word['top'], word['x1'], word['bottom']))
+        ]
         
         logger.debug(f"Filtered {len(words) - len(filtered_words)} words from exclusion zones")
         return filtered_words
@@ -298,8 +324,7 @@ class PDFPlumberTextExtractor:
         Returns:
             True if bounding boxes overlap
         """
-        return not (bbox1[2] < bbox2[0] or bbox2[2] < bbox1[0] or 
-                   bbox1[3] < bbox2[1] or bbox2[3] < bbox1[1])
+        return bboxes_overlap(bbox1, bbox2)
     
     def _group_words_into_blocks(self, words: List[Dict]) -> List[Dict]:
         """
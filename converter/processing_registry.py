@@ -1,36 +1,386 @@
 from __future__ import annotations
 
+import json
+import os
+import sqlite3
+import tempfile
 import threading
-from typing import Any, Dict, Optional
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
 
-class ProcessingRegistry:
-    """Thread-safe in-memory registry for processing records.
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+# Expired records are invisible immediately; physical cleanup runs at most this often
+PURGE_INTERVAL_SECONDS = 60.0
+
+
+class RegistryBackend(ABC):
+    """Storage for processing records keyed by processing id.
 
-    Intended as a temporary solution; replace with Redis/DB for production.
+    Records expire ``ttl_seconds`` after their last write (``None`` or 0 keeps
+    them forever). Backends index records by status and creation time so that
+    listings page through the index instead of scanning the whole history.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds or None
+        self._last_purge = 0.0
+
+    def _expires_at(self, now: float) -> Optional[float]:
+        return now + self.ttl_seconds if self.ttl_seconds else None
+
+    def _maybe_purge(self, now: float) -> None:
+        if now - self._last_purge >= PURGE_INTERVAL_SECONDS:
+            self._last_purge = now
+            self.purge_expired()
+
+    @abstractmethod
+    def put(self, processing_id: str, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, processing_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, processing_id: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list(self, status: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """Records newest first, each with its ``processing_id``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def count(self, status: Optional[str] = None) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Drop expired records; returns how many were removed."""
+        raise NotImplementedError
+
+
+class InMemoryRegistryBackend(RegistryBackend):
+    """Per-process dict; records are not visible to other workers."""
+
+    def __init__(self, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS) -> None:
+        super().__init__(ttl_seconds)
         self._lock = threading.RLock()
-        self._store: Dict[str, Dict[str, Any]] = {}
+        # id -> (record, created_at, expires_at), kept in creation order
+        self._store: Dict[str, tuple] = {}
 
-    def register(self, processing_id: str, payload: Dict[str, Any]) -> None:
+    @staticmethod
+    def _live(entry: tuple, now: float) -> bool:
+        return entry[2] is None or entry[2] > now
+
+    def put(self, processing_id: str, record: Dict[str, Any]) -> None:
+        now = time.time()
         with self._lock:
-            record = dict(payload)
-            record.setdefault("created_at", datetime.now(timezone.utc).isoformat())
-            record.setdefault("status", "completed")  # current flows are synchronous
-            self._store[processing_id] = record
+            existing = self._store.get(processing_id)
+            if existing is not None and self._live(existing, now):
+                # Updating in place keeps the entry's position in creation order
+                self._store[processing_id] = (record, existing[1], self._expires_at(now))
+            else:
+                self._store.pop(processing_id, None)
+                self._store[processing_id] = (record, now, self._expires_at(now))
+            self._maybe_purge(now)
 
     def get(self, processing_id: str) -> Optional[Dict[str, Any]]:
         with self._lock:
-            return self._store.get(processing_id)
+            entry = self._store.get(processing_id)
+            if entry is None or not self._live(entry, time.time()):
+                return None
+            return entry[0]
 
     def delete(self, processing_id: str) -> bool:
         with self._lock:
             return self._store.pop(processing_id, None) is not None
 
+    def _matching(self, status: Optional[str]) -> List[tuple]:
+        now = time.time()
+        return [(pid, entry) for pid, entry in self._store.items()
+                if self._live(entry, now) and (status is None or entry[0].get("status") == status)]
+
+    def list(self, status: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        with self._lock:
+            matching = self._matching(status)
+        page = list(reversed(matching))[offset:offset + limit]
+        return [{"processing_id": pid, **entry[0]} for pid, entry in page]
+
+    def count(self, status: Optional[str] = None) -> int:
+        with self._lock:
+            return len(self._matching(status))
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [pid for pid, entry in self._store.items() if not self._live(entry, now)]
+            for pid in expired:
+                del self._store[pid]
+        return len(expired)
+
+
+class SQLiteRegistryBackend(RegistryBackend):
+    """Single-file registry shared by all workers on one host (WAL mode)."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS processing_records (
+            id TEXT PRIMARY KEY,
+            status TEXT,
+            record TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            expires_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS processing_records_created ON processing_records (created_at);
+        CREATE INDEX IF NOT EXISTS processing_records_status_created ON processing_records (status, created_at);
+        CREATE INDEX IF NOT EXISTS processing_records_expires ON processing_records (expires_at);
+    """
+
+    # Rows with a NULL expiry never expire
+    _LIVE = "(expires_at IS NULL OR expires_at > ?)"
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS) -> None:
+        super().__init__(ttl_seconds)
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(self._SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def put(self, processing_id: str, record: Dict[str, Any]) -> None:
+        now = time.time()
+        # An expired row is restarted rather than updated so it is listed as new
+        self._connect().execute(
+            "INSERT INTO processing_records (id, status, record, created_at, updated_at, expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET status = excluded.status, record = excluded.record, "
+            "updated_at = excluded.updated_at, expires_at = excluded.expires_at, "
+            "created_at = CASE WHEN processing_records.expires_at IS NOT NULL "
+            "AND processing_records.expires_at <= excluded.updated_at "
+            "THEN excluded.created_at ELSE processing_records.created_at END",
+            (processing_id, record.get("status"), json.dumps(record, default=str), now, now,
+             self._expires_at(now)),
+        )
+        self._maybe_purge(now)
+
+    def get(self, processing_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            f"SELECT record FROM processing_records WHERE id = ? AND {self._LIVE}",
+            (processing_id, time.time()),
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def delete(self, processing_id: str) -> bool:
+        cursor = self._connect().execute("DELETE FROM processing_records WHERE id = ?", (processing_id,))
+        return cursor.rowcount == 1
+
+    def _where(self, status: Optional[str]) -> tuple:
+        if status is None:
+            return f"WHERE {self._LIVE}", (time.time(),)
+        return f"WHERE status = ? AND {self._LIVE}", (status, time.time())
+
+    def list(self, status: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        where, params = self._where(status)
+        rows = self._connect().execute(
+            f"SELECT id, record FROM processing_records {where} ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        ).fetchall()
+        return [{"processing_id": row[0], **json.loads(row[1])} for row in rows]
+
+    def count(self, status: Optional[str] = None) -> int:
+        where, params = self._where(status)
+        return self._connect().execute(f"SELECT COUNT(*) FROM processing_records {where}", params).fetchone()[0]
+
+    def purge_expired(self) -> int:
+        cursor = self._connect().execute(
+            "DELETE FROM processing_records WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        )
+        return cursor.rowcount
 
-processing_registry = ProcessingRegistry()
 
+class RedisRegistryBackend(RegistryBackend):
+    """Registry on Redis for web processes spread across hosts.
 
+    Records are JSON strings under ``{prefix}:record:{id}`` with a native TTL.
+    ``{prefix}:by_created`` and ``{prefix}:status:{status}`` are sorted sets
+    scored by creation time. ``{prefix}:expiry`` and ``{prefix}:expiry:{status}``
+    are scored by expiry (``+inf`` for records that never expire), so counts
+    skip expired ids at read time; together with the ``{prefix}:status_of``
+    hash they also let expired ids be dropped from the indexes.
+    """
+
+    def __init__(self, url: str, prefix: str = "processing",
+                 ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS) -> None:
+        super().__init__(ttl_seconds)
+        try:
+            import redis  # type: ignore
+        except ImportError as e:
+            raise RuntimeError("PROCESSING_REGISTRY_BACKEND=redis requires the 'redis' package") from e
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    def _key(self, processing_id: str) -> str:
+        return f"{self.prefix}:record:{processing_id}"
+
+    def _status_index(self, status: Optional[str]) -> str:
+        if status is None:
+            return f"{self.prefix}:by_created"
+        return f"{self.prefix}:status:{status}"
+
+    def _expiry_index(self, status: Optional[str]) -> str:
+        if status is None:
+            return f"{self.prefix}:expiry"
+        return f"{self.prefix}:expiry:{status}"
+
+    @property
+    def _status_of(self) -> str:
+        return f"{self.prefix}:status_of"
+
+    def put(self, processing_id: str, record: Dict[str, Any]) -> None:
+        now = time.time()
+        self._maybe_purge(now)
+        status = record.get("status") or ""
+        previous_status = self.client.hget(self._status_of, processing_id)
+        created_at = self.client.zscore(self._status_index(None), processing_id) or now
+
+        pipe = self.client.pipeline()
+        if self.ttl_seconds:
+            pipe.set(self._key(processing_id), json.dumps(record, default=str), ex=int(max(self.ttl_seconds, 1)))
+        else:
+            pipe.set(self._key(processing_id), json.dumps(record, default=str))
+        expires_at = self._expires_at(now) or float("inf")
+        pipe.zadd(self._status_index(None), {processing_id: created_at})
+        pipe.zadd(self._expiry_index(None), {processing_id: expires_at})
+        if previous_status is not None and previous_status != status:
+            pipe.zrem(self._status_index(previous_status), processing_id)
+            pipe.zrem(self._expiry_index(previous_status), processing_id)
+        pipe.zadd(self._status_index(status), {processing_id: created_at})
+        pipe.zadd(self._expiry_index(status), {processing_id: expires_at})
+        pipe.hset(self._status_of, processing_id, status)
+        pipe.execute()
+
+    def get(self, processing_id: str) -> Optional[Dict[str, Any]]:
+        data = self.client.get(self._key(processing_id))
+        return json.loads(data) if data else None
+
+    def _drop(self, processing_ids: List[str]) -> None:
+        if not processing_ids:
+            return
+        statuses = self.client.hmget(self._status_of, processing_ids)
+        pipe = self.client.pipeline()
+        for processing_id, status in zip(processing_ids, statuses):
+            pipe.delete(self._key(processing_id))
+            pipe.zrem(self._status_index(None), processing_id)
+            if status is not None:
+                pipe.zrem(self._status_index(status), processing_id)
+                pipe.zrem(self._expiry_index(status), processing_id)
+            pipe.zrem(self._expiry_index(None), processing_id)
+            pipe.hdel(self._status_of, processing_id)
+        pipe.execute()
+
+    def delete(self, processing_id: str) -> bool:
+        existed = bool(self.client.exists(self._key(processing_id)))
+        self._drop([processing_id])
+        return existed
+
+    def list(self, status: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        self._maybe_purge(time.time())
+        ids = self.client.zrevrange(self._status_index(status), offset, offset + limit - 1)
+        if not ids:
+            return []
+        records = self.client.mget([self._key(processing_id) for processing_id in ids])
+        return [{"processing_id": processing_id, **json.loads(data)}
+                for processing_id, data in zip(ids, records) if data]
+
+    def count(self, status: Optional[str] = None) -> int:
+        now = time.time()
+        self._maybe_purge(now)
+        # Only ids whose expiry is still ahead count, whether or not a purge has run
+        return self.client.zcount(self._expiry_index(status), f"({now}", "+inf")
+
+    def purge_expired(self) -> int:
+        expired = self.client.zrangebyscore(self._expiry_index(None), "-inf", time.time())
+        self._drop(expired)
+        return len(expired)
+
+
+def create_registry_backend() -> RegistryBackend:
+    """Build the backend selected by the environment.
+
+    - PROCESSING_REGISTRY_BACKEND: 'sqlite' (default), 'redis' or 'memory'
+    - PROCESSING_REGISTRY_PATH: database file for the sqlite backend; every
+      web and worker process on the host must use the same file
+    - PROCESSING_REGISTRY_TTL_SECONDS: record lifetime (default 7 days, 0 = forever)
+    - REDIS_URL: connection URL for the redis backend
+    """
+    backend = os.getenv("PROCESSING_REGISTRY_BACKEND", "sqlite").strip().lower()
+    ttl_seconds = float(os.getenv("PROCESSING_REGISTRY_TTL_SECONDS", str(DEFAULT_TTL_SECONDS)))
+    if backend == "sqlite":
+        default_path = os.path.join(tempfile.gettempdir(), "excel-json-jobs", "registry.sqlite3")
+        return SQLiteRegistryBackend(os.getenv("PROCESSING_REGISTRY_PATH") or default_path, ttl_seconds)
+    if backend == "redis":
+        return RedisRegistryBackend(os.getenv("REDIS_URL", "redis://localhost:6379/0"), ttl_seconds=ttl_seconds)
+    if backend == "memory":
+        return InMemoryRegistryBackend(ttl_seconds)
+    raise RuntimeError(f"Unsupported PROCESSING_REGISTRY_BACKEND: {backend}")
+
+
+class ProcessingRegistry:
+    """Thread-safe registry for processing records.
+
+    Storage is delegated to a RegistryBackend, created from the environment on
+    first use so that every uvicorn worker sees the same records.
+    """
+
+    def __init__(self, backend: Optional[RegistryBackend] = None) -> None:
+        self._lock = threading.RLock()
+        self._backend = backend
+
+    @property
+    def backend(self) -> RegistryBackend:
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = create_registry_backend()
+        return self._backend
+
+    def configure(self, backend: RegistryBackend) -> None:
+        """Swap the storage backend (tests, embedding applications)."""
+        with self._lock:
+            self._backend = backend
+
+    def register(self, processing_id: str, payload: Dict[str, Any]) -> None:
+        record = dict(payload)
+        record.setdefault("created_at", datetime.now(timezone.utc).isoformat())
+        record.setdefault("status", "completed")  # current flows are synchronous
+        self.backend.put(processing_id, record)
+
+    def get(self, processing_id: str) -> Optional[Dict[str, Any]]:
+        return self.backend.get(processing_id)
+
+    def delete(self, processing_id: str) -> bool:
+        return self.backend.delete(processing_id)
+
+    def list(self, status: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        if limit < 1 or offset < 0:
+            raise ValueError("limit must be >= 1 and offset >= 0")
+        return self.backend.list(status=status, limit=limit, offset=offset)
+
+    def count(self, status: Optional[str] = None) -> int:
+        return self.backend.count(status=status)
+
+
+processing_registry = ProcessingRegistry()
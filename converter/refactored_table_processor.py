@@ -7,7 +7,7 @@ TableDetector while maintaining all existing functionality with much less code.
 
 import json
 from typing import Dict, Any, List, Optional
-from converter.table_detector import TableDetector, HeaderResolver
+from converter.table_detector import HeaderResolver, get_table_detector
 
 
 class RefactoredTableProcessor:
@@ -20,7 +20,7 @@ class RefactoredTableProcessor:
     
     def __init__(self):
         # Replace complex detection rules with simple detector
-        self.detector = TableDetector()
+        self.detector = get_table_detector()
         self.header_resolver = HeaderResolver()
     
     def transform_to_table_format(self, excel_json: dict, options: dict = None) -> dict:
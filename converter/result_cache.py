@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from converter.json_serializer import dumps as json_dumps, loads as json_loads
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 3600
+
+
+def estimate_size(value: Any) -> int:
+    """Size of ``value`` as compact JSON, the form it is served and spilled in."""
+    return len(json_dumps(value, default=str))
+
+
+class ResultCache:
+    """Bounded LRU cache for conversion results served by the download routes.
+
+    Entries are accounted by their JSON size and evicted least-recently-used
+    first once ``max_bytes`` or ``max_entries`` is exceeded, or when older than
+    ``ttl_seconds``. With ``spill_dir`` set, evicted entries are written there
+    as gzip-compressed JSON and promoted back into memory on their next read.
+
+    Supports the dict operations the routers used on the old plain-dict cache
+    (``cache[key] = value``, ``key in cache``, ``cache.get(key)``).
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, max_entries: Optional[int] = None,
+                 ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS, spill_dir: Optional[str] = None) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds or None
+        self.spill_dir = spill_dir
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+        self._lock = threading.RLock()
+        # key -> (value, size_bytes, stored_at), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._counters = dict.fromkeys(
+            ("hits", "misses", "evictions", "expirations", "spills", "spill_hits", "oversize"), 0
+        )
+
+    # -- dict-style API -------------------------------------------------
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.put(key, value)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __delitem__(self, key: str) -> None:
+        if not self.pop(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._expired(entry[2], now):
+                return True
+        path = self._spill_path(key)
+        return path is not None and os.path.exists(path) and not self._expired(os.path.getmtime(path), now)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    # -- cache API ------------------------------------------------------
+
+    def put(self, key: str, value: Any, size_bytes: Optional[int] = None) -> None:
+        """Cache ``value``; pass ``size_bytes`` when its JSON encoding is already known.
+
+        Without the hint the value is encoded once just to be measured.
+        """
+        size = estimate_size(value) if size_bytes is None else size_bytes
+        now = time.time()
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                # Would evict everything else and still not fit
+                self._counters["oversize"] += 1
+                victims = [(key, value)]
+            else:
+                self._entries[key] = (value, size, now)
+                self._bytes += size
+                victims = self._evict(now)
+        self._spill(victims)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[2], now):
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return entry[0]
+                self._discard(key)
+                self._counters["expirations"] += 1
+
+        value, size = self._load_spilled(key, now)
+        with self._lock:
+            if value is None:
+                self._counters["misses"] += 1
+                return default
+            self._counters["spill_hits"] += 1
+        self.put(key, value, size_bytes=size)
+        return value
+
+    def pop(self, key: str) -> bool:
+        """Remove ``key`` from memory and disk; True if it was cached."""
+        with self._lock:
+            removed = self._discard(key)
+        path = self._spill_path(key)
+        if path is not None and os.path.exists(path):
+            try:
+                os.remove(path)
+                removed = True
+            except OSError:
+                pass
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.spill_dir:
+            for name in os.listdir(self.spill_dir):
+                if name.endswith(".json.gz"):
+                    try:
+                        os.remove(os.path.join(self.spill_dir, name))
+                    except OSError:
+                        pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["spill_hits"] + self._counters["misses"]
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "spill_enabled": bool(self.spill_dir),
+                **self._counters,
+                "hit_ratio": round((self._counters["hits"] + self._counters["spill_hits"]) / lookups, 3)
+                if lookups else 0.0,
+            }
+
+    # -- internals ------------------------------------------------------
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at >= self.ttl_seconds
+
+    def _discard(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
+
+    def _evict(self, now: float) -> List[Tuple[str, Any]]:
+        """Drop expired entries, then LRU entries until within bounds; returns spill candidates."""
+        victims: List[Tuple[str, Any]] = []
+        for key in [k for k, entry in self._entries.items() if self._expired(entry[2], now)]:
+            self._discard(key)
+            self._counters["expirations"] += 1
+        while self._entries and (self._bytes > self.max_bytes or
+                                 (self.max_entries is not None and len(self._entries) > self.max_entries)):
+            key, (value, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._counters["evictions"] += 1
+            victims.append((key, value))
+        return victims
+
+    def _spill_path(self, key: str) -> Optional[str]:
+        if not self.spill_dir:
+            return None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.spill_dir, f"{digest}.json.gz")
+
+    def _spill(self, victims: List[Tuple[str, Any]]) -> None:
+        # Disk writes happen outside the lock so readers are not blocked on I/O
+        for key, value in victims:
+            path = self._spill_path(key)
+            if path is None:
+                return
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                # Level 1: spills run on the request path, speed matters more than ratio
+                with gzip.open(tmp_path, "wb", compresslevel=1) as f:
+                    f.write(json_dumps(value, default=str))
+                os.replace(tmp_path, path)
+                with self._lock:
+                    self._counters["spills"] += 1
+            except Exception:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _load_spilled(self, key: str, now: float) -> Tuple[Any, int]:
+        """The spilled value and its JSON size, or (None, 0)."""
+        path = self._spill_path(key)
+        if path is None or not os.path.exists(path):
+            return None, 0
+        try:
+            if self._expired(os.path.getmtime(path), now):
+                os.remove(path)
+                return None, 0
+            with gzip.open(path, "rb") as f:
+                data = f.read()
+            value = json_loads(data)
+            os.remove(path)
+            return value, len(data)
+        except (OSError, ValueError):
+            return None, 0
+
+
+def create_result_cache() -> ResultCache:
+    """Build the process-wide result cache from the environment.
+
+    - RESULT_CACHE_MAX_BYTES: in-memory budget (default 256 MiB)
+    - RESULT_CACHE_MAX_ENTRIES: optional cap on the number of entries
+    - RESULT_CACHE_TTL_SECONDS: entry lifetime (default 1 hour, 0 = no expiry)
+    - RESULT_CACHE_SPILL_DIR: directory for evicted entries; unset disables spilling
+    """
+    max_entries = os.getenv("RESULT_CACHE_MAX_ENTRIES")
+    return ResultCache(
+        max_bytes=int(os.getenv("RESULT_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES))),
+        max_entries=int(max_entries) if max_entries else None,
+        ttl_seconds=float(os.getenv("RESULT_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))),
+        spill_dir=os.getenv("RESULT_CACHE_SPILL_DIR") or None,
+    )
@@ -0,0 +1,260 @@
+"""
+Sparse, row/column-indexed cell store shared by the table detection heuristics.
+
+Occupancy is kept as integer bitmaps: bit ``c`` of a row bitmap is set when
+column ``c`` of that row holds a non-empty value. Per-type masks (numeric,
+text, date-like, ...) use the same layout and are computed per row on first
+use, so only the rows a heuristic actually inspects are classified. Counting the cells of a row inside a column range is then a mask
+and a popcount, and scanning for data rows only visits occupied rows, so the
+heuristics cost time proportional to the occupied cells rather than to the
+sheet's bounding box.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from openpyxl.utils import column_index_from_string
+
+
+_NUMBER_TYPES = frozenset((int, float))
+_ROW_RE = re.compile(r'\d+')
+_COL_RE = re.compile(r'[A-Z]+')
+
+_DATE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',  # MM/DD/YYYY, MM-DD-YYYY
+    r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',    # YYYY/MM/DD, YYYY-MM-DD
+    r'\w{3}\s+\d{1,2}[,]?\s+\d{4}',    # Jan 1, 2024
+    r'\d{1,2}\s+\w{3}\s+\d{4}',        # 1 Jan 2024
+    r'Q[1-4]\s+\d{4}',                 # Q1 2024
+    r'\d{4}Q[1-4]',                    # 2024Q1
+)]
+_ISO_DATE_RE = re.compile(r'202[0-9]-\d{2}-\d{2}')
+_MONTH_LABEL_RE = re.compile(r'Month \d+', re.IGNORECASE)
+
+
+def is_numeric_string(value: Any) -> bool:
+    """Check if a string represents a numeric value (ignoring , $ % and spaces)."""
+    if not isinstance(value, str):
+        return False
+    cleaned = value.replace(',', '').replace('$', '').replace('%', '').replace(' ', '')
+    try:
+        float(cleaned)
+        return True
+    except ValueError:
+        return False
+
+
+def looks_like_date(value: str) -> bool:
+    """Check if a value looks like a date."""
+    return any(pattern.search(value) for pattern in _DATE_PATTERNS)
+
+
+def _is_digit_like(value: Any) -> bool:
+    return isinstance(value, (int, float)) or (
+        isinstance(value, str) and value.replace('.', '').replace('-', '').isdigit()
+    )
+
+
+# Cell classifiers available as per-row type masks
+CELL_KINDS: Dict[str, Callable[[Any], bool]] = {
+    'string': lambda v: isinstance(v, str),
+    'numeric': lambda v: isinstance(v, (int, float)) or is_numeric_string(v),
+    'text': lambda v: isinstance(v, str) and not is_numeric_string(v),
+    # Looser numeric test used by row content patterns ("1.5", "-3", 42)
+    'digit_like': _is_digit_like,
+    'label': lambda v: isinstance(v, str) and len(v) > 3 and not _is_digit_like(v),
+    'date': lambda v: looks_like_date(str(v).strip()),
+    'iso_date': lambda v: _ISO_DATE_RE.search(str(v)) is not None,
+    'month_label': lambda v: _MONTH_LABEL_RE.search(str(v)) is not None,
+}
+
+
+def _is_present(value: Any) -> bool:
+    """Non-empty cell value (None and whitespace-only strings are empty)."""
+    if isinstance(value, str):
+        return bool(value.strip())
+    if isinstance(value, (int, float)):
+        return True
+    return value is not None and bool(str(value).strip())
+
+
+def _bit_range(bits: int) -> Tuple[int, int]:
+    """Lowest and highest set bit of a non-zero bitmap."""
+    return (bits & -bits).bit_length() - 1, bits.bit_length() - 1
+
+
+class SheetGrid:
+    """Occupied cells of one sheet, indexed by row and column."""
+
+    def __init__(self) -> None:
+        self._values: Dict[int, Dict[int, Any]] = {}
+        self._row_bits: Dict[int, int] = {}
+        self._rows: Optional[List[int]] = None
+        # kind -> row -> bitmap of the row's cells matching that kind
+        self._masks: Dict[str, Dict[int, int]] = {}
+        self._col_masks: Dict[Tuple[int, int], int] = {}
+
+    @classmethod
+    def from_cell_data(cls, cell_data: Any) -> 'SheetGrid':
+        """Build from ``{coord: {'value': ...}}`` cells or compact ``[{'r': n, 'cells': [[col, value, ...]]}]`` rows.
+
+        Cells whose value is None or blank are left out, as in
+        TableDetector._normalize_cell_data. Another SheetGrid is copied.
+        """
+        grid = cls()
+        if isinstance(cell_data, SheetGrid):
+            for row, values in cell_data.row_items():
+                grid._add_row(row, dict(values), cell_data._row_bits[row])
+        elif isinstance(cell_data, dict):
+            for coord, cell_info in cell_data.items():
+                if isinstance(cell_info, dict) and 'value' in cell_info:
+                    value = cell_info['value']
+                    if _is_present(value):
+                        row = cell_info.get('row')
+                        col = cell_info.get('column')
+                        if row is None:
+                            row = int(_ROW_RE.search(coord).group())
+                        if col is None:
+                            col = column_index_from_string(_COL_RE.search(coord).group())
+                        grid.add(row, col, value)
+        elif isinstance(cell_data, list):
+            for row_data in cell_data:
+                values = {}
+                bits = 0
+                for cell_array in row_data.get('cells', []):
+                    if len(cell_array) >= 2:
+                        value = cell_array[1]
+                        # Plain numbers are always present; skip the call on the hot path
+                        if value.__class__ in _NUMBER_TYPES or _is_present(value):
+                            col = cell_array[0]
+                            values[col] = value
+                            bits |= 1 << col
+                if values:
+                    grid._add_row(row_data.get('r', 1), values, bits)
+        return grid
+
+    def add(self, row: int, col: int, value: Any) -> None:
+        self._add_row(row, {col: value}, 1 << col)
+
+    def _add_row(self, row: int, values: Dict[int, Any], bits: int) -> None:
+        row_values = self._values.get(row)
+        if row_values is None:
+            self._values[row] = values
+            self._rows = None
+        else:
+            row_values.update(values)
+        self._row_bits[row] = self._row_bits.get(row, 0) | bits
+        for masks in self._masks.values():
+            masks.pop(row, None)
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._values.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._values)
+
+    def row_items(self) -> Iterable[Tuple[int, Dict[int, Any]]]:
+        """(row, {col: value}) for every occupied row, in row order. Do not mutate the dicts."""
+        for row in self.rows:
+            yield row, self._values[row]
+
+    def column_extent(self) -> Optional[Tuple[int, int]]:
+        """(first, last) occupied column of the whole sheet, or None if empty."""
+        bits = 0
+        for row_bits in self._row_bits.values():
+            bits |= row_bits
+        return _bit_range(bits) if bits else None
+
+    # -- lookups -----------------------------------------------------------
+
+    def has(self, row: int, col: int) -> bool:
+        return (self._row_bits.get(row, 0) >> col) & 1 == 1
+
+    def value(self, row: int, col: int, default: Any = None) -> Any:
+        return self._values.get(row, {}).get(col, default)
+
+    def is_kind(self, row: int, col: int, kind: str) -> bool:
+        return (self.kind_bits(row, kind) >> col) & 1 == 1
+
+    def col_mask(self, min_col: int, max_col: int) -> int:
+        """Bitmap with the bits for columns min_col..max_col set."""
+        key = (min_col, max_col)
+        mask = self._col_masks.get(key)
+        if mask is None:
+            low = max(min_col, 0)
+            mask = ((1 << (max_col - low + 1)) - 1) << low if max_col >= low else 0
+            self._col_masks[key] = mask
+        return mask
+
+    def kind_bits(self, row: int, kind: str) -> int:
+        """Bitmap of the cells in ``row`` matching ``kind`` (see CELL_KINDS)."""
+        masks = self._masks.get(kind)
+        if masks is None:
+            masks = self._masks[kind] = {}
+        bits = masks.get(row)
+        if bits is None:
+            classify = CELL_KINDS[kind]
+            bits = 0
+            for col, value in self._values.get(row, {}).items():
+                if classify(value):
+                    bits |= 1 << col
+            masks[row] = bits
+        return bits
+
+    def row_bits(self, row: int, min_col: int, max_col: int, kind: Optional[str] = None) -> int:
+        bits = self._row_bits.get(row, 0) if kind is None else self.kind_bits(row, kind)
+        return bits & self.col_mask(min_col, max_col)
+
+    def count(self, row: int, min_col: int, max_col: int, kind: Optional[str] = None) -> int:
+        """Number of occupied cells (optionally of ``kind``) in row between the columns."""
+        return self.row_bits(row, min_col, max_col, kind).bit_count()
+
+    def row_has_data(self, row: int, min_col: int, max_col: int) -> bool:
+        return self.row_bits(row, min_col, max_col) != 0
+
+    def col_has_data(self, col: int, min_row: int, max_row: int) -> bool:
+        bit = 1 << col
+        return any(self._row_bits[row] & bit for row in self.rows_between(min_row, max_row))
+
+    # -- row scans ---------------------------------------------------------
+
+    @property
+    def rows(self) -> List[int]:
+        """Sorted row numbers holding at least one cell."""
+        if self._rows is None:
+            self._rows = sorted(self._values)
+        return self._rows
+
+    def rows_between(self, min_row: int, max_row: int) -> List[int]:
+        rows = self.rows
+        return rows[bisect_left(rows, min_row):bisect_right(rows, max_row)]
+
+    def data_rows(self, min_row: int, max_row: int, min_col: int, max_col: int) -> List[int]:
+        """Rows in min_row..max_row with data between min_col and max_col, ascending."""
+        col_mask = self.col_mask(min_col, max_col)
+        row_bits = self._row_bits
+        return [row for row in self.rows_between(min_row, max_row) if row_bits[row] & col_mask]
+
+    def next_data_row(self, start_row: int, max_row: int, min_col: int, max_col: int) -> Optional[int]:
+        col_mask = self.col_mask(min_col, max_col)
+        rows = self.rows
+        for i in range(bisect_left(rows, start_row), len(rows)):
+            row = rows[i]
+            if row > max_row:
+                break
+            if self._row_bits[row] & col_mask:
+                return row
+        return None
+
+    def occupied_columns(self, rows: Iterable[int], min_col: int, max_col: int) -> int:
+        """Union bitmap of the occupied columns of ``rows`` within min_col..max_col."""
+        bits = 0
+        for row in rows:
+            bits |= self._row_bits.get(row, 0)
+        return bits & self.col_mask(min_col, max_col)
+
+    def column_span(self, rows: Iterable[int], min_col: int, max_col: int) -> Optional[Tuple[int, int]]:
+        """(first, last) occupied column across ``rows`` within the range, or None if empty."""
+        bits = self.occupied_columns(rows, min_col, max_col)
+        return _bit_range(bits) if bits else None
@@ -1,28 +1,50 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import io
 import os
+import threading
+import time
 import uuid
 import mimetypes
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from converter.content_encoding import compress, decompress, get_storage_compression
+from converter.json_serializer import dumps as json_dumps, loads as json_loads
 
 # Django-free defaulting: prefer env var LOCAL_STORAGE_PATH; otherwise use ./media/storage
 
 try:
     import boto3  # type: ignore
+    from boto3.s3.transfer import TransferConfig  # type: ignore
     from botocore.client import Config  # type: ignore
     BOTO3_AVAILABLE = True
 except Exception:
     boto3 = None  # type: ignore[assignment]
+    TransferConfig = None  # type: ignore[assignment]
     Config = None  # type: ignore[assignment]
     BOTO3_AVAILABLE = False
 
 
+# Read size for iter_bytes
+STREAM_CHUNK_SIZE = 256 * 1024
+MB = 1024 * 1024
+
+
+def _env_int(name: str, default: int) -> int:
+    value = (os.getenv(name) or "").strip()
+    try:
+        return int(value) if value else default
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}")
+
+
 class StorageType(Enum):
     ORIGINAL_FILE = "original"
     PROCESSED_JSON = "processed"
@@ -47,6 +69,18 @@ class StorageReference:
     size_bytes: int
     created_at: str
     metadata: Dict[str, Any]
+    # 'zstd'/'gzip' when the stored bytes are compressed; size_bytes is the stored size
+    content_encoding: Optional[str] = None
+
+
+@dataclass
+class StorageWrite:
+    """One object of a put_many batch; arguments as for put_bytes."""
+    key: str
+    data: bytes
+    content_type: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+    content_encoding: Optional[str] = None
 
 
 class StorageService(ABC):
@@ -59,12 +93,18 @@ class StorageService(ABC):
     # Key-first write operations
     @abstractmethod
     def put_bytes(self, key: str, data: bytes, content_type: Optional[str] = None,
-                  metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
+                  metadata: Optional[Dict[str, Any]] = None,
+                  content_encoding: Optional[str] = None) -> StorageReference:
+        """Store ``data``; ``content_encoding`` marks it as already compressed with that encoding."""
         raise NotImplementedError
 
     @abstractmethod
     def put_json(self, key: str, data: Dict[str, Any],
-                 metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
+                 metadata: Optional[Dict[str, Any]] = None, encoded: Optional[bytes] = None) -> StorageReference:
+        """Store ``data`` as JSON; ``encoded`` is its already-serialized body.
+
+        The body is compressed when STORAGE_COMPRESSION is set.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -74,7 +114,7 @@ class StorageService(ABC):
 
     @abstractmethod
     def store_json(self, *, data: Dict[str, Any], storage_type: StorageType, key_prefix: str,
-                   metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
+                   metadata: Optional[Dict[str, Any]] = None, encoded: Optional[bytes] = None) -> StorageReference:
         raise NotImplementedError
 
     @abstractmethod
@@ -93,6 +133,21 @@ class StorageService(ABC):
     def get_json(self, key: str) -> Dict[str, Any]:
         raise NotImplementedError
 
+    @abstractmethod
+    def head(self, key: str) -> StorageReference:
+        """Reference for a stored object (stored size and content encoding); raises if missing."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_bytes(self, key: str, start: int = 0, end: Optional[int] = None,
+                   chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield stored bytes [start, end) in chunks, still compressed if the object is.
+
+        get_bytes/get_json decompress; this reads the stored representation so
+        compressed objects can be forwarded untouched.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, key: str) -> bool:
         raise NotImplementedError
@@ -110,6 +165,30 @@ class StorageService(ABC):
     def list_by_prefix(self, prefix: str) -> List[StorageReference]:
         raise NotImplementedError
 
+    # Batches: backends with network round trips override these to run concurrently
+    def put_many(self, writes: List[StorageWrite]) -> List[StorageReference]:
+        """Store several objects; references come back in the order of ``writes``."""
+        return [self.put_bytes(w.key, w.data, content_type=w.content_type, metadata=w.metadata,
+                               content_encoding=w.content_encoding) for w in writes]
+
+    def get_many(self, keys: List[str]) -> List[bytes]:
+        """get_bytes for several keys, in order."""
+        return [self.get_bytes(key) for key in keys]
+
+    def json_write(self, key: str, data: Any, metadata: Optional[Dict[str, Any]] = None,
+                   encoded: Optional[bytes] = None) -> StorageWrite:
+        """put_json as a StorageWrite for put_many."""
+        body, encoding = self._encode_json_body(data, encoded)
+        return StorageWrite(key, body, "application/json", metadata, encoding)
+
+    def _encode_json_body(self, data: Any, encoded: Optional[bytes]) -> Tuple[bytes, Optional[str]]:
+        """(stored body, content encoding) for a JSON artifact"""
+        body = encoded if encoded is not None else json_dumps(data)
+        encoding, level = self.compression
+        if encoding is None:
+            return body, None
+        return compress(body, encoding, level), encoding
+
     # Directory-like helpers
     @abstractmethod
     def ensure_dir(self, prefix: str) -> None:
@@ -133,7 +212,13 @@ class StorageService(ABC):
 
 
 class LocalStorageService(StorageService):
-    """Filesystem-backed storage for local development."""
+    """Filesystem-backed storage for local development.
+
+    Compressed objects are kept next to their key with a .zst/.gz suffix, like
+    the precompressed siblings static file servers keep.
+    """
+
+    _ENCODING_SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
 
     def __init__(self, base_dir: Optional[str] = None) -> None:
         if base_dir is None:
@@ -145,6 +230,7 @@ class LocalStorageService(StorageService):
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.root_prefix = (os.getenv("STORAGE_ROOT_PREFIX") or "").strip("/")
         self.default_ttl = int(os.getenv("STORAGE_PRESIGN_TTL_SECONDS", "3600") or "3600")
+        self.compression = get_storage_compression()
 
     def _full_path_for_key(self, key: str) -> Path:
         full_key = f"{self.root_prefix}/{key}" if self.root_prefix else key
@@ -155,12 +241,27 @@ class LocalStorageService(StorageService):
             raise ValueError("Invalid key path")
         return resolved
 
+    def _stored_path(self, key: str) -> Tuple[Path, Optional[str]]:
+        """File holding the key's bytes and their content encoding"""
+        full_path = self._full_path_for_key(key)
+        if full_path.is_file():
+            return full_path, None
+        for encoding, suffix in self._ENCODING_SUFFIXES.items():
+            candidate = full_path.with_name(full_path.name + suffix)
+            if candidate.is_file():
+                return candidate, encoding
+        return full_path, None
+
+    def _variant_paths(self, full_path: Path) -> List[Path]:
+        return [full_path] + [full_path.with_name(full_path.name + suffix) for suffix in self._ENCODING_SUFFIXES.values()]
+
     def _guess_content_type(self, filename: str) -> str:
         guessed, _ = mimetypes.guess_type(filename)
         return guessed or "application/octet-stream"
 
     def _build_reference(self, key: str, storage_type: StorageType, content_type: str,
-                         size_bytes: int, metadata: Optional[Dict[str, Any]]) -> StorageReference:
+                         size_bytes: int, metadata: Optional[Dict[str, Any]],
+                         content_encoding: Optional[str] = None) -> StorageReference:
         created_at = datetime.now(timezone.utc).isoformat()
         return StorageReference(
             key=(f"{self.root_prefix}/{key}" if self.root_prefix else key),
@@ -169,24 +270,31 @@ class LocalStorageService(StorageService):
             size_bytes=size_bytes,
             created_at=created_at,
             metadata=metadata or {},
+            content_encoding=content_encoding,
         )
 
     # Key-first API
     def put_bytes(self, key: str, data: bytes, content_type: Optional[str] = None,
-                  metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
+                  metadata: Optional[Dict[str, Any]] = None,
+                  content_encoding: Optional[str] = None) -> StorageReference:
         full_path = self._full_path_for_key(key)
         full_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(full_path, "wb") as f:
+        target = full_path.with_name(full_path.name + self._ENCODING_SUFFIXES[content_encoding]) if content_encoding else full_path
+        with open(target, "wb") as f:
             f.write(data)
+        # Drop other representations of the key so reads see the new bytes
+        for variant in self._variant_paths(full_path):
+            if variant != target and variant.is_file():
+                variant.unlink()
         ct = content_type or (mimetypes.guess_type(full_path.name)[0] or "application/octet-stream")
         st = key.split("/", 1)[0] if "/" in key else StorageType.PROCESSED_JSON.value
         st_enum = StorageType.from_string(st) if st in [t.value for t in StorageType] else StorageType.PROCESSED_JSON
-        return self._build_reference(key, st_enum, ct, len(data), metadata)
+        return self._build_reference(key, st_enum, ct, len(data), metadata, content_encoding)
 
     def put_json(self, key: str, data: Dict[str, Any],
-                 metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
-        encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
-        return self.put_bytes(key, encoded, content_type="application/json", metadata=metadata)
+                 metadata: Optional[Dict[str, Any]] = None, encoded: Optional[bytes] = None) -> StorageReference:
+        body, encoding = self._encode_json_body(data, encoded)
+        return self.put_bytes(key, body, content_type="application/json", metadata=metadata, content_encoding=encoding)
 
     def store_file(self, *, data: bytes, storage_type: StorageType, filename: str,
                    metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
@@ -194,10 +302,10 @@ class LocalStorageService(StorageService):
         return self.put_bytes(key, data, content_type=self._guess_content_type(filename), metadata=metadata)
 
     def store_json(self, *, data: Dict[str, Any], storage_type: StorageType, key_prefix: str,
-                   metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
+                   metadata: Optional[Dict[str, Any]] = None, encoded: Optional[bytes] = None) -> StorageReference:
         filename = "data.json"
         key = f"{storage_type.value}/{uuid.uuid4()}/{key_prefix.rstrip('/')}/{filename}" if key_prefix else f"{storage_type.value}/{uuid.uuid4()}/{filename}"
-        return self.put_json(key, data, metadata=metadata)
+        return self.put_json(key, data, metadata=metadata, encoded=encoded)
 
     def get_download_url(self, reference: StorageReference, expires_in: int = 3600) -> str:
         # For local, expose an internal API route that serves the bytes
@@ -208,18 +316,49 @@ class LocalStorageService(StorageService):
         return f"/api/storage/get?key={key}"
 
     def get_bytes(self, key: str) -> bytes:
-        full_path = self._full_path_for_key(key)
+        full_path, encoding = self._stored_path(key)
         with open(full_path, "rb") as f:
-            return f.read()
+            data = f.read()
+        return decompress(data, encoding) if encoding else data
 
     def get_json(self, key: str) -> Dict[str, Any]:
-        raw = self.get_bytes(key)
-        return json.loads(raw.decode("utf-8"))
+        return json_loads(self.get_bytes(key))
+
+    def head(self, key: str) -> StorageReference:
+        full_path, encoding = self._stored_path(key)
+        if not full_path.is_file():
+            raise FileNotFoundError(f"No stored object at {key}")
+        stats = full_path.stat()
+        return StorageReference(
+            key=key,
+            storage_type=key.split("/", 1)[0] if "/" in key else "unknown",
+            content_type=mimetypes.guess_type(key)[0] or "application/octet-stream",
+            size_bytes=stats.st_size,
+            created_at=datetime.fromtimestamp(stats.st_mtime, tz=timezone.utc).isoformat(),
+            metadata={},
+            content_encoding=encoding,
+        )
+
+    def iter_bytes(self, key: str, start: int = 0, end: Optional[int] = None,
+                   chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        full_path, _ = self._stored_path(key)
+        with open(full_path, "rb") as f:
+            f.seek(start)
+            remaining = None if end is None else end - start
+            while remaining is None or remaining > 0:
+                chunk = f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
 
     def delete(self, key: str) -> bool:
         full_path = self._full_path_for_key(key)
-        if full_path.exists():
-            full_path.unlink()
+        stored = [variant for variant in self._variant_paths(full_path) if variant.is_file()]
+        if stored:
+            for variant in stored:
+                variant.unlink()
             # attempt to remove empty parent directories up to base_path
             parent = full_path.parent
             try:
@@ -258,7 +397,7 @@ class LocalStorageService(StorageService):
         return count
 
     def exists(self, key: str) -> bool:
-        return self._full_path_for_key(key).exists()
+        return self._full_path_for_key(key).exists() or self._stored_path(key)[0].is_file()
 
     def list_by_prefix(self, prefix: str) -> List[StorageReference]:
         return self.list(prefix, recursive=True)
@@ -276,15 +415,19 @@ class LocalStorageService(StorageService):
         for file_path in iterator:
             if file_path.is_file():
                 rel_key = str(file_path.resolve().relative_to(base_resolved))
+                encoding = next((enc for enc, suffix in self._ENCODING_SUFFIXES.items() if rel_key.endswith(suffix)), None)
+                if encoding:
+                    rel_key = rel_key[:-len(self._ENCODING_SUFFIXES[encoding])]
                 stats = file_path.stat()
                 references.append(
                     StorageReference(
                         key=rel_key,
                         storage_type=rel_key.split("/", 1)[0] if "/" in rel_key else "unknown",
-                        content_type=mimetypes.guess_type(file_path.name)[0] or "application/octet-stream",
+                        content_type=mimetypes.guess_type(rel_key)[0] or "application/octet-stream",
                         size_bytes=stats.st_size,
                         created_at=datetime.fromtimestamp(stats.st_mtime, tz=timezone.utc).isoformat(),
                         metadata={},
+                        content_encoding=encoding,
                     )
                 )
         return references
@@ -302,37 +445,82 @@ class LocalStorageService(StorageService):
         return dirs
 
     def copy(self, src_key: str, dst_key: str) -> None:
-        src = self._full_path_for_key(src_key)
-        dst = self._full_path_for_key(dst_key)
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        with open(src, "rb") as rf, open(dst, "wb") as wf:
-            wf.write(rf.read())
+        src, encoding = self._stored_path(src_key)
+        with open(src, "rb") as rf:
+            self.put_bytes(dst_key, rf.read(), content_encoding=encoding)
 
     def move(self, src_key: str, dst_key: str) -> None:
         self.copy(src_key, dst_key)
         self.delete(src_key)
 
 
+_s3_clients: Dict[Tuple[str, Optional[str], int], Any] = {}
+_s3_checked_buckets: set = set()
+_s3_lock = threading.Lock()
+
+
+def _shared_s3_client(region_name: str, endpoint_url: Optional[str], max_pool_connections: int):
+    """One pooled client per (region, endpoint, pool size) for the whole process.
+
+    botocore clients are thread-safe, so requests, batch workers and multipart
+    threads all reuse the same keep-alive connections.
+    """
+    cache_key = (region_name, endpoint_url, max_pool_connections)
+    with _s3_lock:
+        client = _s3_clients.get(cache_key)
+        if client is None:
+            config = Config(
+                max_pool_connections=max_pool_connections,
+                retries={"max_attempts": 5, "mode": "adaptive"},
+                s3={"addressing_style": "path"} if endpoint_url else None,
+            )
+            client_kwargs: Dict[str, Any] = {"region_name": region_name, "config": config}
+            if endpoint_url:
+                client_kwargs["endpoint_url"] = endpoint_url
+            client = _s3_clients[cache_key] = boto3.client("s3", **client_kwargs)  # type: ignore[call-arg]
+        return client
+
+
+def clear_s3_clients() -> None:
+    """Drop the shared S3 clients (tests, or after credentials change)."""
+    with _s3_lock:
+        _s3_clients.clear()
+        _s3_checked_buckets.clear()
+
+
 class S3StorageService(StorageService):
-    """S3-backed storage for cloud deployment. Supports LocalStack via AWS_ENDPOINT_URL."""
+    """S3-backed storage for cloud deployment. Supports LocalStack/MinIO via AWS_ENDPOINT_URL.
+
+    Instances are cheap: the boto3 client and its connection pool are shared
+    per process. Objects of at least S3_MULTIPART_THRESHOLD_MB are uploaded as
+    parallel multipart transfers, and put_many/get_many run batches concurrently.
+    """
 
     def __init__(self, bucket_name: str, region: Optional[str] = None, endpoint_url: Optional[str] = None) -> None:
         if not BOTO3_AVAILABLE:
             raise RuntimeError("boto3 is required for S3StorageService but is not installed.")
 
         region_name = region or os.getenv("AWS_REGION", "us-east-1")
-        session_kwargs: Dict[str, Any] = {}
-        client_kwargs: Dict[str, Any] = {"region_name": region_name}
-        if endpoint_url:
-            client_kwargs["endpoint_url"] = endpoint_url
-            client_kwargs["config"] = Config(s3={"addressing_style": "path"}) if Config else None
+        self.max_concurrency = _env_int("S3_MAX_CONCURRENCY", 8)
+        max_pool_connections = _env_int("S3_MAX_POOL_CONNECTIONS", 32)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=_env_int("S3_MULTIPART_THRESHOLD_MB", 16) * MB,
+            multipart_chunksize=_env_int("S3_MULTIPART_CHUNK_MB", 8) * MB,
+            max_concurrency=self.max_concurrency,
+        )
 
         self.bucket_name = bucket_name
-        self.s3 = boto3.client("s3", **client_kwargs)  # type: ignore[call-arg]
+        self.s3 = _shared_s3_client(region_name, endpoint_url, max_pool_connections)
         self.root_prefix = (os.getenv("STORAGE_ROOT_PREFIX") or "").strip("/")
         self.default_ttl = int(os.getenv("STORAGE_PRESIGN_TTL_SECONDS", "3600") or "3600")
-
-        # Ensure bucket exists (idempotent for LocalStack; in AWS this should be provisioned via IaC)
+        self.compression = get_storage_compression()
+        self._ensure_bucket()
+
+    def _ensure_bucket(self) -> None:
+        # Ensure bucket exists once per process (idempotent for LocalStack; in AWS this should be provisioned via IaC)
+        check_key = (id(self.s3), self.bucket_name)
+        if check_key in _s3_checked_buckets:
+            return
         try:
             self.s3.head_bucket(Bucket=self.bucket_name)
         except Exception:
@@ -341,6 +529,7 @@ class S3StorageService(StorageService):
             except Exception:
                 # Ignore if no permissions; assume bucket exists
                 pass
+        _s3_checked_buckets.add(check_key)
 
     def _guess_content_type(self, filename: str) -> str:
         guessed, _ = mimetypes.guess_type(filename)
@@ -351,16 +540,21 @@ class S3StorageService(StorageService):
 
     # Key-first API
     def put_bytes(self, key: str, data: bytes, content_type: Optional[str] = None,
-                  metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
+                  metadata: Optional[Dict[str, Any]] = None,
+                  content_encoding: Optional[str] = None) -> StorageReference:
         ak = self._apply_prefix(key)
         ct = content_type or (mimetypes.guess_type(key)[0] or "application/octet-stream")
-        self.s3.put_object(
-            Bucket=self.bucket_name,
-            Key=ak,
-            Body=data,
-            ContentType=ct,
-            Metadata={k: str(v) for k, v in (metadata or {}).items()},
-        )
+        extra_args: Dict[str, Any] = {
+            "ContentType": ct,
+            "Metadata": {k: str(v) for k, v in (metadata or {}).items()},
+        }
+        if content_encoding:
+            extra_args["ContentEncoding"] = content_encoding
+        if len(data) >= self.transfer_config.multipart_threshold:
+            self.s3.upload_fileobj(io.BytesIO(data), self.bucket_name, ak,
+                                   ExtraArgs=extra_args, Config=self.transfer_config)
+        else:
+            self.s3.put_object(Bucket=self.bucket_name, Key=ak, Body=data, **extra_args)
         st = key.split("/", 1)[0] if "/" in key else StorageType.PROCESSED_JSON.value
         st_enum = StorageType.from_string(st) if st in [t.value for t in StorageType] else StorageType.PROCESSED_JSON
         return StorageReference(
@@ -370,12 +564,13 @@ class S3StorageService(StorageService):
             size_bytes=len(data),
             created_at=datetime.now(timezone.utc).isoformat(),
             metadata=metadata or {},
+            content_encoding=content_encoding,
         )
 
     def put_json(self, key: str, data: Dict[str, Any],
-                 metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
-        body = json.dumps(data, separators=(",", ":")).encode("utf-8")
-        return self.put_bytes(key, body, content_type="application/json", metadata=metadata)
+                 metadata: Optional[Dict[str, Any]] = None, encoded: Optional[bytes] = None) -> StorageReference:
+        body, encoding = self._encode_json_body(data, encoded)
+        return self.put_bytes(key, body, content_type="application/json", metadata=metadata, content_encoding=encoding)
 
     def store_file(self, *, data: bytes, storage_type: StorageType, filename: str,
                    metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
@@ -383,10 +578,10 @@ class S3StorageService(StorageService):
         return self.put_bytes(key, data, content_type=self._guess_content_type(filename), metadata=metadata)
 
     def store_json(self, *, data: Dict[str, Any], storage_type: StorageType, key_prefix: str,
-                   metadata: Optional[Dict[str, Any]] = None) -> StorageReference:
+                   metadata: Optional[Dict[str, Any]] = None, encoded: Optional[bytes] = None) -> StorageReference:
         filename = "data.json"
         key = f"{storage_type.value}/{uuid.uuid4()}/{key_prefix.rstrip('/')}/{filename}" if key_prefix else f"{storage_type.value}/{uuid.uuid4()}/{filename}"
-        return self.put_json(key, data, metadata=metadata)
+        return self.put_json(key, data, metadata=metadata, encoded=encoded)
 
     def get_download_url(self, reference: StorageReference, expires_in: int = 3600) -> str:
         return self.get_url(reference.key, expires_in=expires_in)
@@ -400,10 +595,52 @@ class S3StorageService(StorageService):
 
     def get_bytes(self, key: str) -> bytes:
         obj = self.s3.get_object(Bucket=self.bucket_name, Key=key)
-        return obj["Body"].read()
+        data = obj["Body"].read()
+        encoding = obj.get("ContentEncoding")
+        return decompress(data, encoding) if encoding in ("zstd", "gzip") else data
+
+    def put_many(self, writes: List[StorageWrite]) -> List[StorageReference]:
+        if len(writes) < 2:
+            return super().put_many(writes)
+        with ThreadPoolExecutor(max_workers=min(len(writes), self.max_concurrency)) as pool:
+            return list(pool.map(lambda w: self.put_bytes(w.key, w.data, content_type=w.content_type, metadata=w.metadata,
+                                                          content_encoding=w.content_encoding), writes))
+
+    def get_many(self, keys: List[str]) -> List[bytes]:
+        if len(keys) < 2:
+            return super().get_many(keys)
+        with ThreadPoolExecutor(max_workers=min(len(keys), self.max_concurrency)) as pool:
+            return list(pool.map(self.get_bytes, keys))
 
     def get_json(self, key: str) -> Dict[str, Any]:
-        return json.loads(self.get_bytes(key).decode("utf-8"))
+        return json_loads(self.get_bytes(key))
+
+    def head(self, key: str) -> StorageReference:
+        obj = self.s3.head_object(Bucket=self.bucket_name, Key=key)
+        last_modified = obj.get("LastModified")
+        encoding = obj.get("ContentEncoding")
+        return StorageReference(
+            key=key,
+            storage_type=key.split("/", 1)[0] if "/" in key else "unknown",
+            content_type=obj.get("ContentType") or "application/octet-stream",
+            size_bytes=int(obj["ContentLength"]),
+            created_at=last_modified.isoformat() if last_modified else datetime.now(timezone.utc).isoformat(),
+            metadata=obj.get("Metadata") or {},
+            content_encoding=encoding if encoding in ("zstd", "gzip") else None,
+        )
+
+    def iter_bytes(self, key: str, start: int = 0, end: Optional[int] = None,
+                   chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        if end is not None and end <= start:
+            return
+        params: Dict[str, Any] = {"Bucket": self.bucket_name, "Key": key}
+        if start or end is not None:
+            params["Range"] = f"bytes={start}-{'' if end is None else end - 1}"
+        body = self.s3.get_object(**params)["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
 
     def delete(self, key: str) -> bool:
         self.s3.delete_object(Bucket=self.bucket_name, Key=key)
@@ -485,15 +722,79 @@ class S3StorageService(StorageService):
         self.delete(src_key)
 
 
-def get_storage_service() -> StorageService:
-    """Factory that returns the configured storage service.
+class AsyncStorageService:
+    """Awaitable facade over a StorageService for async routes.
+
+    Calls run in worker threads so storage round trips do not block the event
+    loop; the S3 client they share is thread-safe.
+    """
+
+    def __init__(self, storage: StorageService) -> None:
+        self.storage = storage
+
+    async def _run(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(getattr(self.storage, method), *args, **kwargs)
+
+    async def put_bytes(self, key: str, data: bytes, **kwargs: Any) -> StorageReference:
+        return await self._run("put_bytes", key, data, **kwargs)
+
+    async def put_json(self, key: str, data: Dict[str, Any], **kwargs: Any) -> StorageReference:
+        return await self._run("put_json", key, data, **kwargs)
+
+    async def store_file(self, **kwargs: Any) -> StorageReference:
+        return await self._run("store_file", **kwargs)
+
+    async def store_json(self, **kwargs: Any) -> StorageReference:
+        return await self._run("store_json", **kwargs)
+
+    async def put_many(self, writes: List[StorageWrite]) -> List[StorageReference]:
+        return await self._run("put_many", writes)
+
+    async def get_bytes(self, key: str) -> bytes:
+        return await self._run("get_bytes", key)
+
+    async def get_json(self, key: str) -> Dict[str, Any]:
+        return await self._run("get_json", key)
+
+    async def get_many(self, keys: List[str]) -> List[bytes]:
+        return await self._run("get_many", keys)
+
+    async def head(self, key: str) -> StorageReference:
+        return await self._run("head", key)
+
+    async def exists(self, key: str) -> bool:
+        return await self._run("exists", key)
+
+    async def delete(self, key: str) -> bool:
+        return await self._run("delete", key)
+
+
+# Settings read when a backend is built; a change to any of them builds a new one
+STORAGE_CONFIG_ENV = (
+    "STORAGE_BACKEND", "LOCAL_STORAGE_PATH", "S3_BUCKET_NAME", "AWS_REGION", "AWS_ENDPOINT_URL",
+    "STORAGE_ROOT_PREFIX", "STORAGE_PRESIGN_TTL_SECONDS", "STORAGE_COMPRESSION", "STORAGE_COMPRESSION_LEVEL",
+    "S3_MAX_POOL_CONNECTIONS", "S3_MAX_CONCURRENCY", "S3_MULTIPART_THRESHOLD_MB", "S3_MULTIPART_CHUNK_MB",
+)
+
+# Storage calls timed by MeteredStorageService
+METERED_OPERATIONS = frozenset({
+    "put_bytes", "put_json", "store_file", "store_json", "put_many", "get_bytes", "get_json", "get_many",
+    "head", "iter_bytes", "exists", "delete", "delete_prefix", "list", "list_by_prefix", "list_dirs",
+    "ensure_dir", "copy", "move",
+})
+
+
+def create_storage_service() -> StorageService:
+    """Build a new storage service from the environment.
 
     Configuration via environment variables:
     - STORAGE_BACKEND: 'local' (default) or 's3'
     - LOCAL_STORAGE_PATH: filesystem base path for local storage
     - S3_BUCKET_NAME: required when STORAGE_BACKEND='s3'
     - AWS_REGION: region name (default 'us-east-1')
-    - AWS_ENDPOINT_URL: optional, for LocalStack/testing
+    - AWS_ENDPOINT_URL: optional, for LocalStack/MinIO/testing
+    - S3_MAX_POOL_CONNECTIONS, S3_MAX_CONCURRENCY, S3_MULTIPART_THRESHOLD_MB,
+      S3_MULTIPART_CHUNK_MB: S3 connection pool and transfer tuning
     """
     backend = os.getenv("STORAGE_BACKEND", "local").strip().lower()
     if backend == "local":
@@ -508,3 +809,128 @@ def get_storage_service() -> StorageService:
     raise RuntimeError(f"Unsupported STORAGE_BACKEND: {backend}")
 
 
+class StorageMetrics:
+    """Call, error and latency counters per backend and operation."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ops: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    def record(self, backend: str, operation: str, seconds: float, error: bool) -> None:
+        with self._lock:
+            op = self._ops.setdefault((backend, operation), {"calls": 0, "errors": 0, "total_s": 0.0, "max_s": 0.0})
+            op["calls"] += 1
+            op["errors"] += int(error)
+            op["total_s"] += seconds
+            op["max_s"] = max(op["max_s"], seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """``{backend: {calls, errors, total_ms, operations: {op: {calls, errors, avg_ms, max_ms}}}}``"""
+        backends: Dict[str, Any] = {}
+        with self._lock:
+            for (backend, operation), op in sorted(self._ops.items()):
+                entry = backends.setdefault(backend, {"calls": 0, "errors": 0, "total_ms": 0.0, "operations": {}})
+                entry["calls"] += op["calls"]
+                entry["errors"] += op["errors"]
+                entry["total_ms"] = round(entry["total_ms"] + op["total_s"] * 1000, 3)
+                entry["operations"][operation] = {
+                    "calls": op["calls"],
+                    "errors": op["errors"],
+                    "avg_ms": round(op["total_s"] * 1000 / op["calls"], 3),
+                    "max_ms": round(op["max_s"] * 1000, 3),
+                }
+        return backends
+
+    def reset(self) -> None:
+        with self._lock:
+            self._ops.clear()
+
+
+class MeteredStorageService:
+    """Delegates to a storage service, timing METERED_OPERATIONS into StorageMetrics.
+
+    Registered as a virtual StorageService subclass, so it can stand in for one.
+    """
+
+    def __init__(self, storage: StorageService, backend: str, metrics: StorageMetrics) -> None:
+        self.storage = storage
+        self.backend = backend
+        self.metrics = metrics
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.storage, name)
+        if name not in METERED_OPERATIONS:
+            return attr
+        if name == "iter_bytes":
+            return self._metered_iter(attr)
+        return self._metered(name, attr)
+
+    def _metered(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        def call(*args: Any, **kwargs: Any) -> Any:
+            started, error = time.perf_counter(), True
+            try:
+                result = method(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                self.metrics.record(self.backend, name, time.perf_counter() - started, error)
+        return call
+
+    def _metered_iter(self, method: Callable[..., Iterator[bytes]]) -> Callable[..., Iterator[bytes]]:
+        # A stream counts once, from the first read to the last chunk
+        def call(*args: Any, **kwargs: Any) -> Iterator[bytes]:
+            started, error = time.perf_counter(), True
+            try:
+                yield from method(*args, **kwargs)
+                error = False
+            finally:
+                self.metrics.record(self.backend, "iter_bytes", time.perf_counter() - started, error)
+        return call
+
+
+StorageService.register(MeteredStorageService)
+
+
+class StorageServiceRegistry:
+    """Process-wide storage service, built once per configuration.
+
+    get() returns the same warm instance until one of STORAGE_CONFIG_ENV
+    changes or reload() is called.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        # (config, service), swapped as one value so readers never pair them wrongly
+        self._current: Optional[Tuple[Tuple[Optional[str], ...], StorageService]] = None
+        self.metrics = StorageMetrics()
+
+    def get(self) -> StorageService:
+        config = tuple(os.getenv(name) for name in STORAGE_CONFIG_ENV)
+        current = self._current
+        if current is not None and current[0] == config:
+            return current[1]
+        with self._lock:
+            if self._current is None or self._current[0] != config:
+                backend = os.getenv("STORAGE_BACKEND", "local").strip().lower()
+                service = MeteredStorageService(create_storage_service(), backend, self.metrics)
+                self._current = (config, service)  # type: ignore[assignment]
+            return self._current[1]
+
+    def reload(self) -> None:
+        """Drop the current service and shared S3 clients; the next get() rebuilds them."""
+        with self._lock:
+            self._current = None
+            clear_s3_clients()
+
+
+storage_registry = StorageServiceRegistry()
+
+
+def get_storage_service() -> StorageService:
+    """The process-wide storage service for the current configuration (see create_storage_service)."""
+    return storage_registry.get()
+
+
+def get_async_storage_service() -> AsyncStorageService:
+    """The configured storage service wrapped for use from async routes."""
+    return AsyncStorageService(get_storage_service())
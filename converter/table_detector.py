@@ -5,16 +5,26 @@ This module provides a unified, simplified approach to detecting tables in Excel
 that eliminates the complexity and inconsistencies in the current implementation.
 """
 
+import os
+from bisect import bisect_left
 from typing import Dict, Any, List, Optional, Tuple
 from openpyxl.utils import get_column_letter
 import re
 
+from .sheet_grid import SheetGrid, is_numeric_string, looks_like_date
+
 
 class TableDetector:
     """
     Unified table detector that provides consistent, accurate detection
     across both regular and compact Excel formats.
+
+    The engine can be chosen per call with
+    ``options['table_detection']['engine']`` (see get_table_detector).
     """
+
+    engine = 'python'
+    grid_class = SheetGrid
     
     def __init__(self):
         # Detection methods will be ordered dynamically in detect_tables()
@@ -26,7 +36,8 @@ class TableDetector:
         Main entry point for table detection.
         
         Args:
-            cell_data: Dictionary of cell data (coordinate -> cell_info)
+            cell_data: Dictionary of cell data (coordinate -> cell_info), compact rows,
+                or a SheetGrid already built for the sheet
             dimensions: Sheet dimensions {min_row, max_row, min_col, max_col}
             options: Detection options
             
@@ -34,9 +45,15 @@ class TableDetector:
             List of detected table regions
         """
         options = options or {}
+        engine = options.get('table_detection', {}).get('engine')
+        if engine and engine != self.engine:
+            return get_table_detector(engine).detect_tables(cell_data, dimensions, options)
         
-        # Normalize input data
-        normalized_cells = self._normalize_cell_data(cell_data)
+        # Index the input once; every heuristic below works on the grid
+        if isinstance(cell_data, self.grid_class):
+            grid = cell_data
+        else:
+            grid = self.grid_class.from_cell_data(cell_data)
         bounds = self._extract_bounds(dimensions)
         
         # Build detection methods dynamically based on options
@@ -69,12 +86,12 @@ class TableDetector:
 
         # Try detection methods in priority order
         for method in methods:
-            regions = method(normalized_cells, bounds, options)
+            regions = method(grid, bounds, options)
             if regions:
                 return self._validate_and_clean_regions(regions, bounds)
         
         # Fallback: create single table for entire data area
-        return self._create_default_table(normalized_cells, bounds)
+        return self._create_default_table(grid, bounds)
     
     def _normalize_cell_data(self, cell_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -131,7 +148,7 @@ class TableDetector:
         else:
             return (1, 1, 1, 1)
     
-    def _detect_by_frozen_panes(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int],
+    def _detect_by_frozen_panes(self, grid: SheetGrid, bounds: Tuple[int, int, int, int],
                                options: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Detect tables based on frozen panes - highest priority.
@@ -151,7 +168,7 @@ class TableDetector:
             }]
         return []
     
-    def _detect_financial_statement_layout(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int],
+    def _detect_financial_statement_layout(self, grid: SheetGrid, bounds: Tuple[int, int, int, int],
                                           options: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Detect financial statement layouts where section headers (with labels only) 
@@ -166,19 +183,16 @@ class TableDetector:
         regions = []
         
         # Check if this looks like a financial statement layout
-        if not self._looks_like_financial_statement(cells, bounds):
+        if not self._looks_like_financial_statement(grid, bounds):
             return []
         
         # For financial statements, treat the entire data area as one table
         # but ensure we have meaningful data
-        data_rows = []
-        for row in range(min_row, max_row + 1):
-            if self._row_has_meaningful_data(cells, row, min_col, max_col):
-                data_rows.append(row)
+        data_rows = grid.data_rows(min_row, max_row, min_col, max_col)
         
         if len(data_rows) >= 3:  # Need at least 3 rows for a table
             # Find actual column bounds (exclude empty trailing columns)
-            actual_bounds = self._determine_table_column_bounds(cells, min(data_rows), max(data_rows), min_col, max_col)
+            actual_bounds = self._determine_table_column_bounds(grid, min(data_rows), max(data_rows), min_col, max_col)
             
             regions.append({
                 'start_row': min(data_rows),
@@ -190,7 +204,7 @@ class TableDetector:
         
         return regions
     
-    def _looks_like_financial_statement(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int]) -> bool:
+    def _looks_like_financial_statement(self, grid: SheetGrid, bounds: Tuple[int, int, int, int]) -> bool:
         """
         Check if the data layout looks like a financial statement.
         
@@ -204,20 +218,13 @@ class TableDetector:
         section_headers = []
         data_rows = []
         
-        # Analyze each row
-        for row in range(min_row, max_row + 1):
-            first_col_coord = f"{get_column_letter(min_col)}{row}"
-            if first_col_coord in cells:
-                first_col_value = cells[first_col_coord]['value']
+        # Analyze each occupied row
+        for row in grid.rows_between(min_row, max_row):
+            if grid.has(row, min_col):
+                first_col_value = grid.value(row, min_col)
                 
                 # Count data in other columns
-                other_data_count = 0
-                for col in range(min_col + 1, max_col + 1):
-                    coord = f"{get_column_letter(col)}{row}"
-                    if coord in cells and cells[coord]['value'] is not None:
-                        value = str(cells[coord]['value']).strip()
-                        if value:
-                            other_data_count += 1
+                other_data_count = grid.count(row, min_col + 1, max_col)
                 
                 # Classify the row
                 if isinstance(first_col_value, str) and first_col_value.strip():
@@ -248,17 +255,12 @@ class TableDetector:
         
         return False
     
-    def _row_has_meaningful_data(self, cells: Dict[str, Any], row: int, min_col: int, max_col: int) -> bool:
+    def _row_has_meaningful_data(self, grid: SheetGrid, row: int, min_col: int, max_col: int) -> bool:
         """Check if a row has meaningful data (not just empty cells)."""
-        for col in range(min_col, max_col + 1):
-            coord = f"{get_column_letter(col)}{row}"
-            if coord in cells and cells[coord]['value'] is not None:
-                value = str(cells[coord]['value']).strip()
-                if value:  # Non-empty value
-                    return True
-        return False
+        # The grid only holds non-blank values
+        return grid.row_has_data(row, min_col, max_col)
     
-    def _detect_by_blank_row_separation(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int],
+    def _detect_by_blank_row_separation(self, grid: SheetGrid, bounds: Tuple[int, int, int, int],
                                        options: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Detect tables separated by blank rows. This method looks for 1-3 row gaps 
@@ -268,10 +270,7 @@ class TableDetector:
         regions = []
         
         # Find all rows with data
-        data_rows = []
-        for row in range(min_row, max_row + 1):
-            if self._row_has_data(cells, row, min_col, max_col):
-                data_rows.append(row)
+        data_rows = grid.data_rows(min_row, max_row, min_col, max_col)
         
         if len(data_rows) < 4:  # Need at least 4 rows for multiple tables
             return []
@@ -287,7 +286,7 @@ class TableDetector:
             if gap_size >= 1:
                 # For small gaps (1-3 rows), check if it's a genuine boundary
                 # For larger gaps (4+ rows), assume it's definitely a boundary
-                if gap_size >= 4 or self._is_table_boundary(cells, data_rows[i-1], data_rows[i], min_col, max_col):
+                if gap_size >= 4 or self._is_table_boundary(grid, data_rows[i-1], data_rows[i], min_col, max_col):
                     table_boundaries.append(data_rows[i])
         
         # Create table regions from boundaries
@@ -299,17 +298,14 @@ class TableDetector:
                 if i < len(table_boundaries) - 1:
                     # Find last data row before next boundary
                     next_boundary = table_boundaries[i + 1]
-                    end_row = start_row
-                    for row in data_rows:
-                        if start_row <= row < next_boundary:
-                            end_row = row
+                    end_row = max(start_row, data_rows[bisect_left(data_rows, next_boundary) - 1])
                 else:
                     # Last table - extend to sheet max_row
                     end_row = max_row
                 
                 if end_row >= start_row:  # Valid table
                     # Determine actual column boundaries for this table region
-                    actual_bounds = self._determine_table_column_bounds(cells, start_row, end_row, min_col, max_col)
+                    actual_bounds = self._determine_table_column_bounds(grid, start_row, end_row, min_col, max_col)
                     
                     regions.append({
                         'start_row': start_row,
@@ -321,13 +317,13 @@ class TableDetector:
         
         return regions
     
-    def _determine_table_column_bounds(self, cells: Dict[str, Any], start_row: int, end_row: int, 
+    def _determine_table_column_bounds(self, grid: SheetGrid, start_row: int, end_row: int, 
                                      min_col: int, max_col: int) -> Dict[str, int]:
         """
         Determine the actual column boundaries for a table region by analyzing data distribution.
         
         Args:
-            cells: Normalized cell data
+            grid: Indexed sheet cells
             start_row: Table start row
             end_row: Table end row  
             min_col: Overall minimum column
@@ -337,38 +333,33 @@ class TableDetector:
             Dictionary with actual min_col and max_col for the table
         """
         # Find columns that have data in this row range
-        cols_with_data = set()
+        span = grid.column_span(grid.rows_between(start_row, end_row), min_col, max_col)
         
-        for row in range(start_row, end_row + 1):
-            for col in range(min_col, max_col + 1):
-                coord = f"{get_column_letter(col)}{row}"
-                if coord in cells and cells[coord]['value'] is not None:
-                    cols_with_data.add(col)
-        
-        if not cols_with_data:
+        if span is None:
             return {'min_col': min_col, 'max_col': max_col}
         
         # Return the actual range of columns with data
         return {
-            'min_col': min(cols_with_data),
-            'max_col': max(cols_with_data)
+            'min_col': span[0],
+            'max_col': span[1]
         }
     
-    def _is_table_boundary(self, cells: Dict[str, Any], prev_row: int, next_row: int, 
+    def _is_table_boundary(self, grid: SheetGrid, prev_row: int, next_row: int, 
                           min_col: int, max_col: int) -> bool:
         """
         Check if the gap between prev_row and next_row represents a genuine table boundary.
         """
         gap_size = max(0, next_row - prev_row - 1)
         # Check if there's a potential section header row between prev_row and next_row
-        for gap_row in range(prev_row + 1, next_row):
-            if self._is_section_header_row(cells, gap_row, min_col, max_col, next_row, max_col):
+        # (rows without any cell cannot be section headers)
+        for gap_row in grid.rows_between(prev_row + 1, next_row - 1):
+            if self._is_section_header_row(grid, gap_row, min_col, max_col, next_row, max_col):
                 # This is likely a section header within the same table, not a boundary
                 return False
         
         # Analyze content patterns around the boundary
-        prev_content = self._get_row_content_pattern(cells, prev_row, min_col, max_col)
-        next_content = self._get_row_content_pattern(cells, next_row, min_col, max_col)
+        prev_content = self._get_row_content_pattern(grid, prev_row, min_col, max_col)
+        next_content = self._get_row_content_pattern(grid, next_row, min_col, max_col)
         
         # Different column counts suggest different tables
         if abs(prev_content['col_count'] - next_content['col_count']) > 2:
@@ -384,60 +375,38 @@ class TableDetector:
         
         # Mixed-content heuristic: after a gap, a row that mixes text label(s) and numbers
         # and begins with a textual first column likely starts a new table
-        if gap_size >= 1 and self._row_has_mixed_content(cells, next_row, min_col, max_col) and self._first_col_is_text(cells, next_row, min_col):
+        if gap_size >= 1 and self._row_has_mixed_content(grid, next_row, min_col, max_col) and self._first_col_is_text(grid, next_row, min_col):
             return True
         
         return False
 
-    def _row_has_mixed_content(self, cells: Dict[str, Any], row: int, min_col: int, max_col: int) -> bool:
-        numeric = 0
-        text = 0
-        for col in range(min_col, max_col + 1):
-            coord = f"{get_column_letter(col)}{row}"
-            if coord in cells:
-                val = cells[coord]['value']
-                if isinstance(val, (int, float)) or (isinstance(val, str) and self._is_numeric_string(val)):
-                    numeric += 1
-                elif isinstance(val, str) and val.strip():
-                    text += 1
-        return numeric > 0 and text > 0
+    def _row_has_mixed_content(self, grid: SheetGrid, row: int, min_col: int, max_col: int) -> bool:
+        return (grid.row_bits(row, min_col, max_col, 'numeric') != 0 and
+                grid.row_bits(row, min_col, max_col, 'text') != 0)
 
-    def _first_col_is_text(self, cells: Dict[str, Any], row: int, min_col: int) -> bool:
-        coord = f"{get_column_letter(min_col)}{row}"
-        if coord not in cells:
-            return False
-        val = cells[coord]['value']
-        return isinstance(val, str) and val.strip() and not self._is_numeric_string(val)
+    def _first_col_is_text(self, grid: SheetGrid, row: int, min_col: int) -> bool:
+        return grid.is_kind(row, min_col, 'text')
     
-    def _get_row_content_pattern(self, cells: Dict[str, Any], row: int, 
+    def _get_row_content_pattern(self, grid: SheetGrid, row: int, 
                                 min_col: int, max_col: int) -> Dict[str, Any]:
         """
         Analyze the content pattern of a row.
         """
-        values = []
-        for col in range(min_col, max_col + 1):
-            coord = f"{get_column_letter(col)}{row}"
-            if coord in cells:
-                values.append(cells[coord]['value'])
+        value_count = grid.count(row, min_col, max_col)
         
-        if not values:
+        if not value_count:
             return {'col_count': 0, 'mostly_numeric': False, 'has_text_labels': False}
         
-        numeric_count = sum(1 for val in values 
-                           if isinstance(val, (int, float)) or 
-                           (isinstance(val, str) and val.replace('.', '').replace('-', '').isdigit()))
-        
-        text_labels = [val for val in values 
-                      if isinstance(val, str) and len(str(val)) > 3 and 
-                      not str(val).replace('.', '').replace('-', '').isdigit()]
+        numeric_count = grid.count(row, min_col, max_col, 'digit_like')
+        text_label_count = grid.count(row, min_col, max_col, 'label')
         
         return {
-            'col_count': len(values),
-            'mostly_numeric': numeric_count > len(values) / 2,
-            'has_text_labels': len(text_labels) > 2
+            'col_count': value_count,
+            'mostly_numeric': numeric_count > value_count / 2,
+            'has_text_labels': text_label_count > 2
         }
     
-    def _is_section_header_row(self, cells: Dict[str, Any], row: int, min_col: int, max_col: int, next_data_row: int, max_row: int = None) -> bool:
+    def _is_section_header_row(self, grid: SheetGrid, row: int, min_col: int, max_col: int, next_data_row: int, max_row: int = None) -> bool:
         """
         Check if a row is a section header (label in first column only, no other data).
         
@@ -446,23 +415,12 @@ class TableDetector:
         2. It has no or minimal data in other columns  
         3. The row following it is NOT a row of dates/headers (indicating it's part of the same table)
         """
-        # Check if this row has data in the first column
-        first_col_coord = f"{get_column_letter(min_col)}{row}"
-        if first_col_coord not in cells:
-            return False
-        
-        first_col_value = cells[first_col_coord]['value']
-        if not isinstance(first_col_value, str) or len(str(first_col_value).strip()) == 0:
+        # Check if this row has text in the first column (blank cells are never stored)
+        if not grid.is_kind(row, min_col, 'string'):
             return False
         
         # Count data cells in other columns (excluding first column)
-        other_data_count = 0
-        for col in range(min_col + 1, max_col + 1):
-            coord = f"{get_column_letter(col)}{row}"
-            if coord in cells and cells[coord]['value'] is not None:
-                value = str(cells[coord]['value']).strip()
-                if value:  # Non-empty value
-                    other_data_count += 1
+        other_data_count = grid.count(row, min_col + 1, max_col)
         
         # If this row has significant data in other columns, it's not a section header
         if other_data_count > 2:
@@ -471,10 +429,8 @@ class TableDetector:
         # Check if the next data row contains dates or header-like content
         # If it does, then this might actually be a new table
         if max_row is None or next_data_row <= max_row:
-            next_row_pattern = self._get_row_content_pattern(cells, next_data_row, min_col, max_col)
-            
             # Check for date patterns in the next row (indicating new table with date headers)
-            has_date_headers = self._row_has_date_pattern(cells, next_data_row, min_col, max_col)
+            has_date_headers = self._row_has_date_pattern(grid, next_data_row, min_col, max_col)
             
             # If next row has date headers or significantly different structure, this could be a new table
             if has_date_headers:
@@ -483,22 +439,13 @@ class TableDetector:
         # This appears to be a section header within the same table
         return True
     
-    def _row_has_date_pattern(self, cells: Dict[str, Any], row: int, min_col: int, max_col: int) -> bool:
+    def _row_has_date_pattern(self, grid: SheetGrid, row: int, min_col: int, max_col: int) -> bool:
         """
         Check if a row contains date-like patterns that would indicate column headers.
         """
-        date_like_count = 0
-        total_values = 0
-        
-        for col in range(min_col + 1, max_col + 1):  # Skip first column (labels)
-            coord = f"{get_column_letter(col)}{row}"
-            if coord in cells and cells[coord]['value'] is not None:
-                value = str(cells[coord]['value']).strip()
-                if value:
-                    total_values += 1
-                    # Check for date-like patterns
-                    if self._looks_like_date(value):
-                        date_like_count += 1
+        # Skip first column (labels)
+        total_values = grid.count(row, min_col + 1, max_col)
+        date_like_count = grid.count(row, min_col + 1, max_col, 'date')
         
         # If more than 30% of values look like dates, consider it a date header row
         return total_values > 0 and (date_like_count / total_values) > 0.3
@@ -507,25 +454,9 @@ class TableDetector:
         """
         Check if a value looks like a date.
         """
-        import re
-        
-        # Common date patterns
-        date_patterns = [
-            r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',  # MM/DD/YYYY, MM-DD-YYYY
-            r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',    # YYYY/MM/DD, YYYY-MM-DD  
-            r'\w{3}\s+\d{1,2}[,]?\s+\d{4}',    # Jan 1, 2024
-            r'\d{1,2}\s+\w{3}\s+\d{4}',        # 1 Jan 2024
-            r'Q[1-4]\s+\d{4}',                 # Q1 2024
-            r'\d{4}Q[1-4]',                    # 2024Q1
-        ]
-        
-        for pattern in date_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                return True
-        
-        return False
+        return looks_like_date(value)
     
-    def _detect_by_temporal_headers(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int],
+    def _detect_by_temporal_headers(self, grid: SheetGrid, bounds: Tuple[int, int, int, int],
                                    options: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Detect tables with temporal column labels (sequential dates).
@@ -536,7 +467,7 @@ class TableDetector:
         # Look for rows with date patterns
         temporal_header_rows = []
         for row in range(min_row, min(min_row + 5, max_row + 1)):  # Check first 5 rows
-            if self._has_temporal_headers(cells, row, min_col, max_col):
+            if self._has_temporal_headers(grid, row, min_col, max_col):
                 temporal_header_rows.append(row)
         
         if not temporal_header_rows:
@@ -547,7 +478,7 @@ class TableDetector:
         for header_row in temporal_header_rows:
             # Find the extent of the temporal table
             table_start = header_row
-            table_end = self._find_temporal_table_end(cells, header_row, min_row, max_row, min_col, max_col)
+            table_end = self._find_temporal_table_end(grid, header_row, min_row, max_row, min_col, max_col)
             
             if table_end > table_start:
                 regions.append({
@@ -561,28 +492,15 @@ class TableDetector:
         
         return regions
     
-    def _has_temporal_headers(self, cells: Dict[str, Any], row: int, 
+    def _has_temporal_headers(self, grid: SheetGrid, row: int, 
                              min_col: int, max_col: int) -> bool:
         """
         Check if a row contains temporal headers (dates like 2025-05-31 or Month 1, Month 2).
         """
-        date_count = 0
-        month_count = 0
-        total_cells = 0
-        
-        for col in range(min_col, max_col + 1):
-            coord = f"{get_column_letter(col)}{row}"
-            if coord in cells:
-                value = str(cells[coord]['value'])
-                total_cells += 1
-                
-                # Check for ISO date patterns (2025-05-31)
-                if re.search(r'202[0-9]-\d{2}-\d{2}', value):
-                    date_count += 1
-                
-                # Check for month patterns (Month 1, Month 2, etc.)
-                if re.search(r'Month \d+', value, re.IGNORECASE):
-                    month_count += 1
+        total_cells = grid.count(row, min_col, max_col)
+        # ISO date patterns (2025-05-31) and month patterns (Month 1, Month 2, etc.)
+        date_count = grid.count(row, min_col, max_col, 'iso_date')
+        month_count = grid.count(row, min_col, max_col, 'month_label')
         
         # If more than 25% of cells contain dates or month patterns, it's temporal
         if total_cells > 0:
@@ -591,7 +509,7 @@ class TableDetector:
         
         return False
     
-    def _find_temporal_table_end(self, cells: Dict[str, Any], header_row: int,
+    def _find_temporal_table_end(self, grid: SheetGrid, header_row: int,
                                 min_row: int, max_row: int, min_col: int, max_col: int) -> int:
         """
         Find where a temporal table ends by looking for gaps or next temporal headers.
@@ -599,66 +517,44 @@ class TableDetector:
         last_data_row = header_row
         
         # Look for the next temporal header or significant gap
-        for row in range(header_row + 1, max_row + 1):
-            if self._row_has_data(cells, row, min_col, max_col):
-                # Check if this is another temporal header (new table starts)
-                if self._has_temporal_headers(cells, row, min_col, max_col):
-                    # New temporal table found - stop here
-                    break
-                else:
-                    # Continue with current table
-                    last_data_row = row
-            else:
-                # Empty row - check for gaps
-                gap_start = row
-                next_data_row = self._find_next_data_row(cells, row + 1, max_row, min_col, max_col)
-                if next_data_row:
-                    gap_size = next_data_row - gap_start
-                    if gap_size > 1:  # Gap of 2+ rows indicates table boundary
-                        break
-                else:
-                    # No more data
-                    break
+        for row in grid.data_rows(header_row + 1, max_row, min_col, max_col):
+            # Empty rows since the previous data row form a gap
+            gap_size = row - last_data_row - 1
+            if gap_size > 1:  # Gap of 2+ rows indicates table boundary
+                break
+            # Check if this is another temporal header (new table starts)
+            if self._has_temporal_headers(grid, row, min_col, max_col):
+                # New temporal table found - stop here
+                break
+            # Continue with current table
+            last_data_row = row
         
         return last_data_row
     
-    def _is_part_of_temporal_table(self, cells: Dict[str, Any], row: int, header_row: int,
+    def _is_part_of_temporal_table(self, grid: SheetGrid, row: int, header_row: int,
                                   min_col: int, max_col: int) -> bool:
         """
         Check if a row is part of the same temporal table as the header row.
         """
-        # Get column structure of header row
-        header_cols = []
-        for col in range(min_col, max_col + 1):
-            coord = f"{get_column_letter(col)}{header_row}"
-            if coord in cells:
-                header_cols.append(col)
-        
-        # Get column structure of current row
-        row_cols = []
-        for col in range(min_col, max_col + 1):
-            coord = f"{get_column_letter(col)}{row}"
-            if coord in cells:
-                row_cols.append(col)
+        # Column structure of the header row and the current row
+        header_cols = grid.row_bits(header_row, min_col, max_col)
+        row_cols = grid.row_bits(row, min_col, max_col)
         
         # Similar column structure suggests same table
-        if len(header_cols) > 0 and len(row_cols) > 0:
-            overlap = len(set(header_cols) & set(row_cols))
-            return overlap / max(len(header_cols), len(row_cols)) > 0.5
+        if header_cols and row_cols:
+            overlap = (header_cols & row_cols).bit_count()
+            return overlap / max(header_cols.bit_count(), row_cols.bit_count()) > 0.5
         
         return False
     
-    def _find_next_data_row(self, cells: Dict[str, Any], start_row: int, max_row: int,
+    def _find_next_data_row(self, grid: SheetGrid, start_row: int, max_row: int,
                            min_col: int, max_col: int) -> Optional[int]:
         """
         Find the next row with data starting from start_row.
         """
-        for row in range(start_row, max_row + 1):
-            if self._row_has_data(cells, row, min_col, max_col):
-                return row
-        return None
+        return grid.next_data_row(start_row, max_row, min_col, max_col)
     
-    def _detect_by_column_continuity(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int],
+    def _detect_by_column_continuity(self, grid: SheetGrid, bounds: Tuple[int, int, int, int],
                                    options: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Detect tables based on column continuity and data type patterns.
@@ -667,10 +563,7 @@ class TableDetector:
         min_row, min_col, max_row, max_col = bounds
         
         # Find all rows with data
-        data_rows = []
-        for row in range(min_row, max_row + 1):
-            if self._row_has_data(cells, row, min_col, max_col):
-                data_rows.append(row)
+        data_rows = grid.data_rows(min_row, max_row, min_col, max_col)
         
         if len(data_rows) < 3:
             return []
@@ -678,7 +571,7 @@ class TableDetector:
         # Analyze column patterns for each row
         row_patterns = {}
         for row in data_rows:
-            row_patterns[row] = self._analyze_row_column_pattern(cells, row, min_col, max_col)
+            row_patterns[row] = self._analyze_row_column_pattern(grid, row, min_col, max_col)
         
         # Find boundaries where column patterns change significantly
         table_boundaries = [data_rows[0]]  # Start with first row
@@ -704,10 +597,10 @@ class TableDetector:
                 if i < len(table_boundaries) - 1:
                     # Find last data row before next boundary
                     next_boundary = table_boundaries[i + 1]
-                    end_row = self._find_table_end_by_gap(cells, start_row, next_boundary - 1, min_col, max_col)
+                    end_row = self._find_table_end_by_gap(grid, start_row, next_boundary - 1, min_col, max_col)
                 else:
                     # Last table
-                    end_row = self._find_table_end_by_gap(cells, start_row, max_row, min_col, max_col)
+                    end_row = self._find_table_end_by_gap(grid, start_row, max_row, min_col, max_col)
                 
                 if end_row >= start_row:
                     regions.append({
@@ -720,22 +613,14 @@ class TableDetector:
         
         return regions
     
-    def _analyze_row_column_pattern(self, cells: Dict[str, Any], row: int, 
+    def _analyze_row_column_pattern(self, grid: SheetGrid, row: int, 
                                    min_col: int, max_col: int) -> Dict[str, Any]:
         """
         Analyze the column pattern of a row (data types, column coverage, etc.).
         """
-        values = []
-        occupied_cols = []
-        
-        for col in range(min_col, max_col + 1):
-            coord = f"{get_column_letter(col)}{row}"
-            if coord in cells:
-                value = cells[coord]['value']
-                values.append(value)
-                occupied_cols.append(col)
+        occupied = grid.row_bits(row, min_col, max_col)
         
-        if not values:
+        if not occupied:
             return {
                 'col_count': 0,
                 'numeric_ratio': 0,
@@ -745,39 +630,25 @@ class TableDetector:
             }
         
         # Analyze data types
-        numeric_count = sum(1 for val in values 
-                           if isinstance(val, (int, float)) or 
-                           (isinstance(val, str) and self._is_numeric_string(val)))
-        
-        text_count = sum(1 for val in values 
-                        if isinstance(val, str) and not self._is_numeric_string(val))
+        numeric_count = grid.count(row, min_col, max_col, 'numeric')
+        text_count = grid.count(row, min_col, max_col, 'text')
         
         # Calculate metrics
-        total_values = len(values)
-        column_span = max(occupied_cols) - min(occupied_cols) + 1 if occupied_cols else 0
+        total_values = occupied.bit_count()
+        column_span = occupied.bit_length() - (occupied & -occupied).bit_length() + 1
         total_possible_cols = max_col - min_col + 1
         
         return {
-            'col_count': len(occupied_cols),
+            'col_count': total_values,
             'numeric_ratio': numeric_count / total_values if total_values > 0 else 0,
             'text_ratio': text_count / total_values if total_values > 0 else 0,
             'column_span': column_span,
-            'data_density': len(occupied_cols) / total_possible_cols if total_possible_cols > 0 else 0
+            'data_density': total_values / total_possible_cols if total_possible_cols > 0 else 0
         }
     
     def _is_numeric_string(self, value: str) -> bool:
         """Check if a string represents a numeric value."""
-        if not isinstance(value, str):
-            return False
-        
-        # Remove common formatting characters
-        cleaned = value.replace(',', '').replace('$', '').replace('%', '').replace(' ', '')
-        
-        try:
-            float(cleaned)
-            return True
-        except ValueError:
-            return False
+        return is_numeric_string(value)
     
     def _is_significant_column_pattern_change(self, prev_pattern: Dict[str, Any], 
                                             current_pattern: Dict[str, Any]) -> bool:
@@ -806,7 +677,7 @@ class TableDetector:
         
         return False
     
-    def _detect_by_multirow_headers(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int],
+    def _detect_by_multirow_headers(self, grid: SheetGrid, bounds: Tuple[int, int, int, int],
                                    options: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Detect multi-level headers stacked in the first 2-3 rows.
@@ -816,7 +687,7 @@ class TableDetector:
         min_row, min_col, max_row, max_col = bounds
         
         # Look for multi-row header blocks in the first few rows
-        header_blocks = self._find_multirow_header_blocks(cells, min_row, min(min_row + 10, max_row), min_col, max_col)
+        header_blocks = self._find_multirow_header_blocks(grid, min_row, min(min_row + 10, max_row), min_col, max_col)
         
         if not header_blocks:
             return []
@@ -827,10 +698,10 @@ class TableDetector:
             header_end = header_block['end_row']
             
             # Find the data section after this header block
-            data_start = self._find_next_data_row(cells, header_end + 1, max_row, min_col, max_col)
+            data_start = self._find_next_data_row(grid, header_end + 1, max_row, min_col, max_col)
             if data_start:
                 # Find where this table ends
-                table_end = self._find_multirow_table_end(cells, data_start, max_row, min_col, max_col)
+                table_end = self._find_multirow_table_end(grid, data_start, max_row, min_col, max_col)
                 
                 if table_end and table_end >= data_start:
                     regions.append({
@@ -845,7 +716,7 @@ class TableDetector:
         
         return regions
     
-    def _find_multirow_header_blocks(self, cells: Dict[str, Any], min_row: int, max_row: int,
+    def _find_multirow_header_blocks(self, grid: SheetGrid, min_row: int, max_row: int,
                                    min_col: int, max_col: int) -> List[Dict[str, int]]:
         """
         Find blocks of consecutive rows that look like multi-row headers.
@@ -854,8 +725,8 @@ class TableDetector:
         current_block_start = None
         
         for row in range(min_row, max_row + 1):
-            if self._row_has_data(cells, row, min_col, max_col):
-                row_pattern = self._get_row_content_pattern(cells, row, min_col, max_col)
+            if self._row_has_data(grid, row, min_col, max_col):
+                row_pattern = self._get_row_content_pattern(grid, row, min_col, max_col)
                 
                 # Check if this row looks like a header row
                 is_header_like = (
@@ -899,34 +770,32 @@ class TableDetector:
         
         return header_blocks
     
-    def _find_multirow_table_end(self, cells: Dict[str, Any], data_start: int, max_row: int,
+    def _find_multirow_table_end(self, grid: SheetGrid, data_start: int, max_row: int,
                                 min_col: int, max_col: int) -> Optional[int]:
         """
         Find where a table with multirow headers ends.
         """
         last_data_row = data_start
         
-        for row in range(data_start + 1, max_row + 1):
-            if self._row_has_data(cells, row, min_col, max_col):
-                # Check if this might be the start of a new header block
-                row_pattern = self._get_row_content_pattern(cells, row, min_col, max_col)
-                if (row_pattern['has_text_labels'] and 
-                    not row_pattern['mostly_numeric'] and
-                    row_pattern['col_count'] >= 3):
-                    # Might be new header - check next few rows
-                    if self._looks_like_new_header_block(cells, row, max_row, min_col, max_col):
-                        break
-                
-                last_data_row = row
-            else:
-                # Gap found - check if it's significant
-                next_data_row = self._find_next_data_row(cells, row + 1, max_row, min_col, max_col)
-                if next_data_row and next_data_row - row > 2:
+        for row in grid.data_rows(data_start + 1, max_row, min_col, max_col):
+            # Gap found - check if it's significant (measured from its first empty row)
+            if row - last_data_row > 1 and row - (last_data_row + 1) > 2:
+                break
+            
+            # Check if this might be the start of a new header block
+            row_pattern = self._get_row_content_pattern(grid, row, min_col, max_col)
+            if (row_pattern['has_text_labels'] and 
+                not row_pattern['mostly_numeric'] and
+                row_pattern['col_count'] >= 3):
+                # Might be new header - check next few rows
+                if self._looks_like_new_header_block(grid, row, max_row, min_col, max_col):
                     break
+            
+            last_data_row = row
         
         return last_data_row
 
-    def _find_table_end_by_gap(self, cells: Dict[str, Any], start_row: int, max_row: int,
+    def _find_table_end_by_gap(self, grid: SheetGrid, start_row: int, max_row: int,
                                min_col: int, max_col: int) -> int:
         """
         Walk forward from start_row until a significant gap (2+ empty rows) or end of data.
@@ -934,12 +803,12 @@ class TableDetector:
         last_data_row = start_row
         row = start_row + 1
         while row <= max_row:
-            if self._row_has_data(cells, row, min_col, max_col):
+            if grid.row_has_data(row, min_col, max_col):
                 last_data_row = row
                 row += 1
                 continue
             # row is empty; look ahead for next data row
-            next_data_row = self._find_next_data_row(cells, row + 1, max_row, min_col, max_col)
+            next_data_row = grid.next_data_row(row + 1, max_row, min_col, max_col)
             if next_data_row is None:
                 # no more data; extend to max_row per test expectation
                 return max_row
@@ -952,7 +821,7 @@ class TableDetector:
             row = next_data_row + 1
         return last_data_row
     
-    def _looks_like_new_header_block(self, cells: Dict[str, Any], start_row: int, max_row: int,
+    def _looks_like_new_header_block(self, grid: SheetGrid, start_row: int, max_row: int,
                                     min_col: int, max_col: int) -> bool:
         """
         Check if starting from start_row, it looks like a new header block.
@@ -960,15 +829,15 @@ class TableDetector:
         header_like_rows = 0
         
         for row in range(start_row, min(start_row + 3, max_row + 1)):
-            if self._row_has_data(cells, row, min_col, max_col):
-                row_pattern = self._get_row_content_pattern(cells, row, min_col, max_col)
+            if self._row_has_data(grid, row, min_col, max_col):
+                row_pattern = self._get_row_content_pattern(grid, row, min_col, max_col)
                 if (row_pattern['has_text_labels'] and 
                     not row_pattern['mostly_numeric']):
                     header_like_rows += 1
         
         return header_like_rows >= 2
     
-    def _detect_by_gaps(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int],
+    def _detect_by_gaps(self, grid: SheetGrid, bounds: Tuple[int, int, int, int],
                        options: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Simplified gap-based detection. Only runs if explicitly requested.
@@ -980,10 +849,7 @@ class TableDetector:
         regions = []
         
         # Find rows with data
-        data_rows = []
-        for row in range(min_row, max_row + 1):
-            if self._row_has_data(cells, row, min_col, max_col):
-                data_rows.append(row)
+        data_rows = grid.data_rows(min_row, max_row, min_col, max_col)
         
         if len(data_rows) < 2:
             return []
@@ -1009,7 +875,7 @@ class TableDetector:
         # Add final table
         regions.append({
             'start_row': current_start,
-            'end_row': self._find_table_end_by_gap(cells, current_start, max_row, min_col, max_col),
+            'end_row': self._find_table_end_by_gap(grid, current_start, max_row, min_col, max_col),
             'start_col': min_col,
             'end_col': max_col,
             'detection_method': 'gaps'
@@ -1017,7 +883,7 @@ class TableDetector:
         
         return regions
     
-    def _detect_by_formatting(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int],
+    def _detect_by_formatting(self, grid: SheetGrid, bounds: Tuple[int, int, int, int],
                              options: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Detect tables based on formatting patterns (headers, borders, etc.).
@@ -1026,7 +892,7 @@ class TableDetector:
         # For now, return empty - can be enhanced later
         return []
     
-    def _detect_by_content_structure(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int],
+    def _detect_by_content_structure(self, grid: SheetGrid, bounds: Tuple[int, int, int, int],
                                    options: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Detect tables based on content structure (headers, data patterns).
@@ -1034,7 +900,7 @@ class TableDetector:
         min_row, min_col, max_row, max_col = bounds
         
         # Check if this looks like a structured table
-        if self._has_structured_layout(cells, bounds):
+        if self._has_structured_layout(grid, bounds):
             return [{
                 'start_row': min_row,
                 'end_row': max_row,
@@ -1045,36 +911,26 @@ class TableDetector:
         
         return []
     
-    def _has_structured_layout(self, cells: Dict[str, Any], bounds: Tuple[int, int, int, int]) -> bool:
+    def _has_structured_layout(self, grid: SheetGrid, bounds: Tuple[int, int, int, int]) -> bool:
         """
         Check if the data has a structured table layout.
         """
         min_row, min_col, max_row, max_col = bounds
         
         # Count rows and columns with data
-        data_rows = sum(1 for row in range(min_row, max_row + 1) 
-                       if self._row_has_data(cells, row, min_col, max_col))
-        data_cols = sum(1 for col in range(min_col, max_col + 1)
-                       if self._col_has_data(cells, col, min_row, max_row))
+        data_rows = len(grid.data_rows(min_row, max_row, min_col, max_col))
+        data_cols = grid.occupied_columns(grid.rows_between(min_row, max_row), min_col, max_col).bit_count()
         
         # Must have reasonable table dimensions
         return data_rows >= 3 and data_cols >= 2
     
-    def _row_has_data(self, cells: Dict[str, Any], row: int, min_col: int, max_col: int) -> bool:
+    def _row_has_data(self, grid: SheetGrid, row: int, min_col: int, max_col: int) -> bool:
         """Check if a row has any data."""
-        for col in range(min_col, max_col + 1):
-            coord = f"{get_column_letter(col)}{row}"
-            if coord in cells:
-                return True
-        return False
+        return grid.row_has_data(row, min_col, max_col)
     
-    def _col_has_data(self, cells: Dict[str, Any], col: int, min_row: int, max_row: int) -> bool:
+    def _col_has_data(self, grid: SheetGrid, col: int, min_row: int, max_row: int) -> bool:
         """Check if a column has any data."""
-        for row in range(min_row, max_row + 1):
-            coord = f"{get_column_letter(col)}{row}"
-            if coord in cells:
-                return True
-        return False
+        return grid.col_has_data(col, min_row, max_row)
     
     def _get_frozen_panes_info(self, options: Dict[str, Any]) -> Dict[str, int]:
         """Extract frozen panes information from options."""
@@ -1126,12 +982,12 @@ class TableDetector:
         
         return cleaned
     
-    def _create_default_table(self, cells: Dict[str, Any], 
+    def _create_default_table(self, grid: SheetGrid, 
                              bounds: Tuple[int, int, int, int]) -> List[Dict[str, Any]]:
         """
         Create a default table covering the entire data area.
         """
-        if not cells:
+        if not grid:
             return []
         
         min_row, min_col, max_row, max_col = bounds
@@ -1156,18 +1012,37 @@ class TableDetector:
         return result
 
 
+TABLE_DETECTION_ENGINES = ('python', 'numpy')
+
+
+def get_table_detector(engine: Optional[str] = None) -> TableDetector:
+    """
+    Create a table detector for ``engine`` (default: TABLE_DETECTION_ENGINE env, else 'python').
+
+    'python' walks the sheet grid row by row; 'numpy' computes the same
+    regions from occupancy/type matrices (see vectorized_table_detector).
+    """
+    engine = engine or os.getenv('TABLE_DETECTION_ENGINE', 'python')
+    if engine == 'python':
+        return TableDetector()
+    if engine == 'numpy':
+        from .vectorized_table_detector import VectorizedTableDetector
+        return VectorizedTableDetector()
+    raise ValueError(f"Unknown table detection engine: {engine} (expected one of {', '.join(TABLE_DETECTION_ENGINES)})")
+
+
 class HeaderResolver:
     """
     Simplified header resolution that works with detected table regions.
     """
     
-    def resolve_headers(self, cells: Dict[str, Any], region: Dict[str, Any], 
+    def resolve_headers(self, cells: Any, region: Dict[str, Any], 
                        options: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Resolve header information for a detected table region.
         
         Args:
-            cells: Normalized cell data
+            cells: Normalized cell data or the sheet's SheetGrid
             region: Table region from detector
             options: Resolution options
             
@@ -1,7 +1,7 @@
 import json
 from typing import Dict, Any, List, Optional, Tuple
 from openpyxl.utils import get_column_letter, column_index_from_string
-from .table_detector import TableDetector, HeaderResolver
+from .table_detector import HeaderResolver, get_table_detector
 
 
 class TableProcessor:
@@ -13,7 +13,7 @@ class TableProcessor:
     def __init__(self):
         self.table_detection_rules = []
         # Add new simplified detection system
-        self.detector = TableDetector()
+        self.detector = get_table_detector()
         self.header_resolver = HeaderResolver()
     
     def transform_to_table_format(self, excel_json: dict, options: dict = None) -> dict:
@@ -0,0 +1,398 @@
+"""
+Vectorized Table Detection Engine
+
+Computes the TableDetector heuristics with NumPy instead of row-by-row
+loops. The occupied rows of a sheet are laid out once as a dense
+(occupied rows x column span) boolean matrix, with one matrix per cell type
+(numeric, text, label, ...). Row emptiness, per-row counts and ratios,
+pattern change points and gap runs then become array operations.
+
+Produces exactly the same regions as TableDetector; the parity suite in
+tests/unit/test_table_detection_engines.py enforces that. Sheets whose
+matrices would exceed MAX_DENSE_CELLS fall back to the grid-based methods.
+"""
+
+from functools import wraps
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .sheet_grid import CELL_KINDS, SheetGrid
+from .table_detector import TableDetector
+
+
+# Upper bound on (occupied rows x column span) for the dense matrices
+MAX_DENSE_CELLS = 20_000_000
+
+# Kinds always true (or always false) for plain numbers, whatever their value
+_NUMBER_KINDS = {kind: CELL_KINDS[kind](0) for kind in CELL_KINDS}
+_NUMBER_TYPES = frozenset((int, float, bool))
+
+
+class SheetArrays:
+    """Occupancy and cell-type matrices over the occupied rows of a SheetGrid."""
+
+    def __init__(self, grid: SheetGrid) -> None:
+        self.rows = np.asarray(grid.rows, dtype=np.int64)
+        row_sizes, col_indices, values = [], [], []
+        for _, row_values in grid.row_items():
+            row_sizes.append(len(row_values))
+            col_indices.extend(row_values)
+            values.extend(row_values.values())
+        extent = grid.column_extent()
+        self.col0 = extent[0] if extent else 1
+        self.width = (extent[1] - self.col0 + 1) if extent else 0
+        self._ri = np.repeat(np.arange(len(row_sizes), dtype=np.int64), row_sizes)
+        self._ci = np.asarray(col_indices, dtype=np.int64) - self.col0
+        self._values = values
+        self._is_number = np.fromiter(map(_NUMBER_TYPES.__contains__, map(type, values)),
+                                      dtype=bool, count=len(values))
+        self.occupied = self._matrix(np.ones(len(values), dtype=bool))
+        self._kinds: Dict[str, np.ndarray] = {}
+        self._cache: Dict[Tuple, np.ndarray] = {}
+
+    @staticmethod
+    def dense_size(grid: SheetGrid) -> int:
+        extent = grid.column_extent()
+        return len(grid.rows) * (extent[1] - extent[0] + 1) if extent else 0
+
+    def _matrix(self, flags: np.ndarray) -> np.ndarray:
+        matrix = np.zeros((len(self.rows), self.width), dtype=bool)
+        matrix[self._ri[flags], self._ci[flags]] = True
+        return matrix
+
+    def kind(self, kind: str) -> np.ndarray:
+        """Boolean matrix of the cells matching ``kind`` (see CELL_KINDS)."""
+        matrix = self._kinds.get(kind)
+        if matrix is None:
+            # Only non-numeric cells need the per-value classifier
+            flags = np.full(len(self._values), _NUMBER_KINDS[kind], dtype=bool)
+            others = np.flatnonzero(~self._is_number)
+            if len(others):
+                other_values = map(self._values.__getitem__, others.tolist())
+                flags[others] = np.fromiter(map(CELL_KINDS[kind], other_values), dtype=bool, count=len(others))
+            matrix = self._kinds[kind] = self._matrix(flags)
+        return matrix
+
+    # -- index helpers -----------------------------------------------------
+
+    def row_range(self, min_row: int, max_row: int) -> slice:
+        """Slice of occupied-row indices with min_row <= row <= max_row."""
+        return slice(int(np.searchsorted(self.rows, min_row, 'left')),
+                     int(np.searchsorted(self.rows, max_row, 'right')))
+
+    def index(self, row: int) -> Optional[int]:
+        i = int(np.searchsorted(self.rows, row))
+        return i if i < len(self.rows) and self.rows[i] == row else None
+
+    def col_range(self, min_col: int, max_col: int) -> slice:
+        return slice(min(max(min_col - self.col0, 0), self.width),
+                     min(max(max_col - self.col0 + 1, 0), self.width))
+
+    # -- per-row statistics (one value per occupied row) -------------------
+
+    def counts(self, min_col: int, max_col: int, kind: Optional[str] = None) -> np.ndarray:
+        """Number of occupied cells (optionally of ``kind``) per row within the columns."""
+        key = ('counts', kind, min_col, max_col)
+        counts = self._cache.get(key)
+        if counts is None:
+            matrix = self.occupied if kind is None else self.kind(kind)
+            counts = self._cache[key] = np.count_nonzero(matrix[:, self.col_range(min_col, max_col)], axis=1)
+        return counts
+
+    def spans(self, min_col: int, max_col: int) -> np.ndarray:
+        """last - first + 1 occupied column per row within the columns (0 for empty rows)."""
+        key = ('spans', min_col, max_col)
+        spans = self._cache.get(key)
+        if spans is None:
+            window = self.occupied[:, self.col_range(min_col, max_col)]
+            if window.shape[1] == 0:
+                spans = np.zeros(len(self.rows), dtype=np.int64)
+            else:
+                first = np.argmax(window, axis=1)
+                last = window.shape[1] - 1 - np.argmax(window[:, ::-1], axis=1)
+                spans = np.where(window.any(axis=1), last - first + 1, 0)
+            self._cache[key] = spans
+        return spans
+
+    def data_row_indices(self, min_row: int, max_row: int, min_col: int, max_col: int) -> np.ndarray:
+        rows = self.row_range(min_row, max_row)
+        return np.flatnonzero(self.counts(min_col, max_col)[rows] > 0) + rows.start
+
+    def data_rows(self, min_row: int, max_row: int, min_col: int, max_col: int) -> np.ndarray:
+        return self.rows[self.data_row_indices(min_row, max_row, min_col, max_col)]
+
+    def occupied_columns(self, min_row: int, max_row: int, min_col: int, max_col: int) -> np.ndarray:
+        """Column numbers with data in min_row..max_row within the columns."""
+        cols = self.col_range(min_col, max_col)
+        any_data = self.occupied[self.row_range(min_row, max_row), cols].any(axis=0)
+        return np.flatnonzero(any_data) + cols.start + self.col0
+
+    def content_flags(self, min_col: int, max_col: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-row (has text labels and not mostly numeric, ... and 3+ cells): see _get_row_content_pattern."""
+        key = ('content', min_col, max_col)
+        flags = self._cache.get(key)
+        if flags is None:
+            counts = self.counts(min_col, max_col)
+            texty = ((self.counts(min_col, max_col, 'label') > 2) &
+                     ~(self.counts(min_col, max_col, 'digit_like') > counts / 2) & (counts > 0))
+            flags = self._cache[key] = (texty, texty & (counts >= 3))
+        return flags
+
+
+class ArrayGrid(SheetGrid):
+    """SheetGrid that also exposes its cells as SheetArrays (None when too large)."""
+
+    _arrays = None
+    _arrays_built = False
+
+    @property
+    def arrays(self) -> Optional[SheetArrays]:
+        if not self._arrays_built:
+            self._arrays = SheetArrays(self) if SheetArrays.dense_size(self) <= MAX_DENSE_CELLS else None
+            self._arrays_built = True
+        return self._arrays
+
+    def _add_row(self, row: int, values: Dict[int, Any], bits: int) -> None:
+        super()._add_row(row, values, bits)
+        self._arrays_built = False
+        self._arrays = None
+
+
+def _vectorized(method):
+    """Use the grid-based TableDetector method when the sheet has no dense arrays."""
+    @wraps(method)
+    def wrapper(self, grid, *args):
+        arrays = grid.arrays if isinstance(grid, ArrayGrid) else None
+        if arrays is None:
+            return getattr(TableDetector, method.__name__)(self, grid, *args)
+        return method(self, grid, arrays, *args)
+    return wrapper
+
+
+class VectorizedTableDetector(TableDetector):
+    """TableDetector whose row-scanning heuristics run as NumPy array operations."""
+
+    engine = 'numpy'
+    grid_class = ArrayGrid
+
+    @_vectorized
+    def _looks_like_financial_statement(self, grid: ArrayGrid, arrays: SheetArrays,
+                                        bounds: Tuple[int, int, int, int]) -> bool:
+        min_row, min_col, max_row, max_col = bounds
+        rows = arrays.row_range(min_row, max_row)
+        first_col = arrays.col_range(min_col, min_col)
+        # Stored strings are never blank, so a string in the first column is a label
+        labelled = arrays.kind('string')[rows, first_col].any(axis=1)
+        other_data = arrays.counts(min_col + 1, max_col)[rows]
+
+        section_rows = arrays.rows[rows][labelled & (other_data == 0)]
+        data_row_count = int(np.count_nonzero(labelled & (other_data > 2)))
+        if len(section_rows) < 2 or data_row_count < 3:
+            return False
+
+        financial_terms = [
+            'assets', 'liabilities', 'equity', 'revenue', 'expenses', 'income',
+            'cash', 'receivable', 'payable', 'inventory', 'property', 'debt',
+            'retained', 'earnings', 'capital', 'current', 'non-current', 'total'
+        ]
+        financial_header_count = sum(
+            1 for row in section_rows.tolist()
+            if any(term in grid.value(row, min_col).strip().lower() for term in financial_terms)
+        )
+        return financial_header_count >= len(section_rows) * 0.6
+
+    @_vectorized
+    def _detect_by_blank_row_separation(self, grid: ArrayGrid, arrays: SheetArrays,
+                                        bounds: Tuple[int, int, int, int],
+                                        options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        min_row, min_col, max_row, max_col = bounds
+        data_rows = arrays.data_rows(min_row, max_row, min_col, max_col)
+        if len(data_rows) < 4:
+            return []
+
+        gaps = np.diff(data_rows) - 1
+        # Gaps of 4+ rows always separate tables; 1-3 row gaps need a closer look
+        boundaries = [int(data_rows[0])] + [
+            int(data_rows[i + 1]) for i in np.flatnonzero(gaps >= 1).tolist()
+            if gaps[i] >= 4 or self._is_table_boundary(grid, int(data_rows[i]), int(data_rows[i + 1]), min_col, max_col)
+        ]
+        if len(boundaries) < 2:
+            return []
+
+        # Each table ends on the last data row before the next boundary; the last one at max_row
+        next_starts = np.searchsorted(data_rows, boundaries[1:]) - 1
+        end_rows = np.maximum(boundaries[:-1], data_rows[next_starts]).tolist() + [max_row]
+
+        regions = []
+        for start_row, end_row in zip(boundaries, end_rows):
+            if end_row >= start_row:
+                actual_bounds = self._determine_table_column_bounds(grid, start_row, end_row, min_col, max_col)
+                regions.append({
+                    'start_row': start_row,
+                    'end_row': end_row,
+                    'start_col': actual_bounds['min_col'],
+                    'end_col': actual_bounds['max_col'],
+                    'detection_method': 'blank_row_separation'
+                })
+        return regions
+
+    @_vectorized
+    def _determine_table_column_bounds(self, grid: ArrayGrid, arrays: SheetArrays, start_row: int, end_row: int,
+                                       min_col: int, max_col: int) -> Dict[str, int]:
+        cols = arrays.occupied_columns(start_row, end_row, min_col, max_col)
+        if not len(cols):
+            return {'min_col': min_col, 'max_col': max_col}
+        return {'min_col': int(cols[0]), 'max_col': int(cols[-1])}
+
+    @_vectorized
+    def _get_row_content_pattern(self, grid: ArrayGrid, arrays: SheetArrays, row: int,
+                                 min_col: int, max_col: int) -> Dict[str, Any]:
+        i = arrays.index(row)
+        value_count = int(arrays.counts(min_col, max_col)[i]) if i is not None else 0
+        if not value_count:
+            return {'col_count': 0, 'mostly_numeric': False, 'has_text_labels': False}
+        numeric_count = int(arrays.counts(min_col, max_col, 'digit_like')[i])
+        text_label_count = int(arrays.counts(min_col, max_col, 'label')[i])
+        return {
+            'col_count': value_count,
+            'mostly_numeric': numeric_count > value_count / 2,
+            'has_text_labels': text_label_count > 2
+        }
+
+    @_vectorized
+    def _find_temporal_table_end(self, grid: ArrayGrid, arrays: SheetArrays, header_row: int,
+                                 min_row: int, max_row: int, min_col: int, max_col: int) -> int:
+        indices = arrays.data_row_indices(header_row + 1, max_row, min_col, max_col)
+        rows = np.concatenate(([header_row], arrays.rows[indices]))
+
+        total = arrays.counts(min_col, max_col)[indices]
+        temporal = (arrays.counts(min_col, max_col, 'iso_date')[indices] +
+                    arrays.counts(min_col, max_col, 'month_label')[indices]) / total > 0.25
+        # Stop before a gap of 2+ empty rows or the next temporal header
+        stops = np.flatnonzero((np.diff(rows) - 1 > 1) | temporal)
+        return int(rows[stops[0]] if len(stops) else rows[-1])
+
+    @_vectorized
+    def _detect_by_column_continuity(self, grid: ArrayGrid, arrays: SheetArrays,
+                                     bounds: Tuple[int, int, int, int],
+                                     options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        min_row, min_col, max_row, max_col = bounds
+        indices = arrays.data_row_indices(min_row, max_row, min_col, max_col)
+        if len(indices) < 3:
+            return []
+
+        # Column patterns of every data row at once (see _analyze_row_column_pattern)
+        col_count = arrays.counts(min_col, max_col)[indices]
+        numeric_ratio = arrays.counts(min_col, max_col, 'numeric')[indices] / col_count
+        column_span = arrays.spans(min_col, max_col)[indices]
+        total_possible_cols = max_col - min_col + 1
+        data_density = col_count / total_possible_cols if total_possible_cols > 0 else np.zeros(len(indices))
+
+        # Significant changes between consecutive data rows (see _is_significant_column_pattern_change)
+        changed = ((np.abs(np.diff(col_count)) > 5) |
+                   (np.abs(np.diff(numeric_ratio)) > 0.4) |
+                   (np.abs(np.diff(column_span)) > 10) |
+                   (np.abs(np.diff(data_density)) > 0.3))
+        data_rows = arrays.rows[indices]
+        boundaries = [int(data_rows[0])] + data_rows[1:][changed].tolist()
+        if len(boundaries) < 2:
+            return []
+
+        regions = []
+        for start_row, next_boundary in zip(boundaries, boundaries[1:] + [None]):
+            end_row = self._find_table_end_by_gap(
+                grid, start_row, next_boundary - 1 if next_boundary is not None else max_row, min_col, max_col
+            )
+            if end_row >= start_row:
+                regions.append({
+                    'start_row': start_row,
+                    'end_row': end_row,
+                    'start_col': min_col,
+                    'end_col': max_col,
+                    'detection_method': 'column_continuity'
+                })
+        return regions
+
+    @_vectorized
+    def _find_multirow_header_blocks(self, grid: ArrayGrid, arrays: SheetArrays, min_row: int, max_row: int,
+                                     min_col: int, max_col: int) -> List[Dict[str, int]]:
+        rows = arrays.row_range(min_row, max_row)
+        header_like = arrays.content_flags(min_col, max_col)[1][rows]
+        header_rows = arrays.rows[rows][header_like]
+        if len(header_rows) < 2:
+            return []
+
+        # Runs of consecutive header-like rows; 2+ rows make a block
+        run_starts = np.flatnonzero(np.diff(header_rows, prepend=header_rows[0] - 2) != 1)
+        run_ends = np.append(run_starts[1:], len(header_rows)) - 1
+        return [
+            {'start_row': int(header_rows[start]), 'end_row': int(header_rows[end])}
+            for start, end in zip(run_starts.tolist(), run_ends.tolist()) if end > start
+        ]
+
+    @_vectorized
+    def _find_multirow_table_end(self, grid: ArrayGrid, arrays: SheetArrays, data_start: int, max_row: int,
+                                 min_col: int, max_col: int) -> Optional[int]:
+        indices = arrays.data_row_indices(data_start + 1, max_row, min_col, max_col)
+        rows = np.concatenate(([data_start], arrays.rows[indices]))
+        texty, header_like = arrays.content_flags(min_col, max_col)
+
+        # A new header block: 2+ text-label rows among the next three rows (see _looks_like_new_header_block)
+        texty_before = np.concatenate(([0], np.cumsum(texty)))
+        window_start = indices
+        window_end = np.searchsorted(arrays.rows, np.minimum(arrays.rows[indices] + 2, max_row), 'right')
+        new_header_block = header_like[indices] & (texty_before[window_end] - texty_before[window_start] >= 2)
+
+        # Stop at a gap of 3+ empty rows or at a new header block
+        stops = np.flatnonzero((np.diff(rows) - 1 > 2) | new_header_block)
+        return int(rows[stops[0]] if len(stops) else rows[-1])
+
+    @_vectorized
+    def _find_table_end_by_gap(self, grid: ArrayGrid, arrays: SheetArrays, start_row: int, max_row: int,
+                               min_col: int, max_col: int) -> int:
+        rows = np.concatenate(([start_row], arrays.data_rows(start_row + 1, max_row, min_col, max_col)))
+        gaps = np.diff(rows) - 1
+        # The row walk absorbs a single empty row into the table, then skips the data row after it,
+        # so a table that stops right after such a row ends on the empty row instead
+        stops = np.flatnonzero(gaps >= 2)
+        if len(stops):
+            k = int(stops[0])
+            return int(rows[k] - 1 if k > 0 and gaps[k - 1] == 1 else rows[k])
+        if rows[-1] < max_row:
+            # Only empty rows remain: extend to max_row
+            return max_row
+        return int(rows[-1] - 1 if len(gaps) and gaps[-1] == 1 else rows[-1])
+
+    @_vectorized
+    def _detect_by_gaps(self, grid: ArrayGrid, arrays: SheetArrays, bounds: Tuple[int, int, int, int],
+                        options: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if not options.get('table_detection', {}).get('use_gaps', False):
+            return []
+
+        min_row, min_col, max_row, max_col = bounds
+        data_rows = arrays.data_rows(min_row, max_row, min_col, max_col)
+        if len(data_rows) < 2:
+            return []
+
+        gap_threshold = options.get('table_detection', {}).get('gap_threshold', 3)
+        splits = np.flatnonzero(np.diff(data_rows) - 1 >= gap_threshold)
+        starts = [int(data_rows[0])] + data_rows[splits + 1].tolist()
+        ends = data_rows[splits].tolist()
+        ends.append(self._find_table_end_by_gap(grid, starts[-1], max_row, min_col, max_col))
+
+        return [{
+            'start_row': start_row,
+            'end_row': end_row,
+            'start_col': min_col,
+            'end_col': max_col,
+            'detection_method': 'gaps'
+        } for start_row, end_row in zip(starts, ends)]
+
+    @_vectorized
+    def _has_structured_layout(self, grid: ArrayGrid, arrays: SheetArrays,
+                               bounds: Tuple[int, int, int, int]) -> bool:
+        min_row, min_col, max_row, max_col = bounds
+        data_rows = len(arrays.data_row_indices(min_row, max_row, min_col, max_col))
+        data_cols = len(arrays.occupied_columns(min_row, max_row, min_col, max_col))
+        return data_rows >= 3 and data_cols >= 2
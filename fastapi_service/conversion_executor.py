@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+
+class ExecutorSaturatedError(HTTPException):
+    """Raised when a conversion cannot be accepted; carries a Retry-After header."""
+
+    def __init__(self, status_code: int, detail: str, retry_after: int) -> None:
+        super().__init__(status_code, detail, headers={"Retry-After": str(retry_after)})
+        self.retry_after = retry_after
+
+
+class ConversionExecutor:
+    """Bounded thread pool for CPU-bound conversions, kept off the event loop.
+
+    At most ``max_workers`` conversions run at once and at most ``max_queue``
+    more wait for a worker. Submissions beyond that are rejected with 429 (or
+    503 once the executor is shut down) and a Retry-After estimate, so request
+    handlers fail fast instead of piling up behind a large workbook. Background
+    jobs use ``submit_when_free`` instead, which waits for an idle worker, so the
+    same bound covers them without taking queue slots from requests.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue: Optional[int] = None) -> None:
+        self.max_workers = max_workers or int(os.getenv("CONVERSION_MAX_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+        if max_queue is None:
+            max_queue = int(os.getenv("CONVERSION_MAX_QUEUE", str(self.max_workers * 4)))
+        if self.max_workers < 1 or max_queue < 0:
+            raise ValueError("ConversionExecutor needs at least one worker and a non-negative queue size")
+        self.max_queue = max_queue
+        self._lock = threading.Condition(threading.Lock())
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="conversion")
+        self._shutdown = False
+        self._active = 0
+        self._queued = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._busy_seconds = 0.0
+        self._started_at = time.monotonic()
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Queue ``func`` on the pool, or raise ExecutorSaturatedError when full."""
+        with self._lock:
+            if self._shutdown:
+                self._rejected += 1
+                raise ExecutorSaturatedError(503, "Conversion service is shutting down", self._retry_after())
+            if self._active + self._queued >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturatedError(429, "Conversion queue is full, retry later", self._retry_after())
+            self._queued += 1
+            self._submitted += 1
+        return self._pool.submit(self._run_tracked, func, args, kwargs)
+
+    def submit_when_free(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Block until a worker is idle, then queue ``func`` on it; raises 503 after shutdown."""
+        with self._lock:
+            while not self._shutdown and self._active + self._queued >= self.max_workers:
+                self._lock.wait()
+            if self._shutdown:
+                raise ExecutorSaturatedError(503, "Conversion service is shutting down", self._retry_after())
+            self._queued += 1
+            self._submitted += 1
+        return self._pool.submit(self._run_tracked, func, args, kwargs)
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func`` on the pool and await its result without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    def _run_tracked(self, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        start = time.monotonic()
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = time.monotonic() - start
+            with self._lock:
+                self._active -= 1
+                self._busy_seconds += elapsed
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+                self._lock.notify_all()
+
+    def _retry_after(self) -> int:
+        """Seconds until a slot is likely free, from the mean task duration (lock held)."""
+        finished = self._completed + self._failed
+        mean_seconds = self._busy_seconds / finished if finished else 1.0
+        waves = (self._queued + self._active) / self.max_workers
+        return max(1, math.ceil(mean_seconds * max(waves, 1.0)))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of pool utilisation and throughput counters."""
+        with self._lock:
+            finished = self._completed + self._failed
+            uptime = time.monotonic() - self._started_at
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queued": self._queued,
+                "utilization": self._active / self.max_workers,
+                "busy_ratio": self._busy_seconds / (uptime * self.max_workers) if uptime > 0 else 0.0,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "mean_task_seconds": self._busy_seconds / finished if finished else None,
+                "accepting": not self._shutdown,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            self._shutdown = True
+            self._lock.notify_all()
+        self._pool.shutdown(wait=wait)
+
+
+conversion_executor = ConversionExecutor()
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import os
 from pathlib import Path
@@ -5,6 +6,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
 from fastapi_service.routers import ui, excel, pdf, storage, status, results
+from fastapi_service.responses import EncodedJSONResponse
 
 
 def _load_dotenv_if_present(path: str = ".env") -> None:
@@ -33,7 +35,15 @@ def _load_dotenv_if_present(path: str = ".env") -> None:
 _load_dotenv_if_present()
 
 
-app = FastAPI(title="Excel/PDF Processor")
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Resume jobs left queued by a previous deploy
+    from fastapi_service.worker import start_embedded_workers
+    start_embedded_workers()
+    yield
+
+
+app = FastAPI(title="Excel/PDF Processor", lifespan=_lifespan, default_response_class=EncodedJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
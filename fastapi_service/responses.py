@@ -0,0 +1,22 @@
+from typing import Any
+
+from fastapi.responses import Response
+
+from converter.json_serializer import dumps, dumps_object
+
+
+class EncodedJSONResponse(Response):
+    """JSON response encoded by converter.json_serializer.
+
+    Bytes content is sent as-is, and ``RawJSON`` values at the top level of a
+    dict are spliced in without being decoded or encoded again.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content)
+        if isinstance(content, dict):
+            return dumps_object(content)
+        return dumps(content)
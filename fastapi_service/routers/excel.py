@@ -1,18 +1,23 @@
 import os
-import json
 import uuid
 import tempfile
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse, Response
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks, Request
 from converter.complexity_preserving_compact_processor import ComplexityPreservingCompactProcessor
 from converter.compact_table_processor import CompactTableProcessor
 from converter.excel_complexity_analyzer import ExcelComplexityAnalyzer
-from converter.storage_service import get_storage_service, StorageType
+from converter.storage_service import get_storage_service, StorageReference, StorageType, StorageWrite
+from converter.columnar_workbook import columnar_filename, get_columnar_output_format, store_columnar_workbook
+from converter.json_serializer import dumps as json_dumps, encode as encode_json
 from converter.processing_registry import processing_registry
 from converter.html_generator import HTMLGenerator
+from converter.conversion_cache import get_conversion_cache
 from converter import models as django_like_models
+from fastapi_service.conversion_executor import conversion_executor
+from fastapi_service.responses import EncodedJSONResponse
+from fastapi_service.streaming import streamed_response
+from fastapi_service.worker import enqueue_conversion_job
 
 router = APIRouter()
 
@@ -107,47 +112,46 @@ def _build_run_dir(filename: str) -> str:
 
 
 def _store_run_artifacts(storage, run_dir: str, original_file_data: bytes, original_filename: str, 
-                        json_data: Dict[str, Any], table_data: Dict[str, Any], meta: Dict[str, Any]) -> Dict[str, str]:
-    """Store all artifacts for a run in a single directory"""
+                        json_data: Dict[str, Any], table_data: Dict[str, Any], meta: Dict[str, Any],
+                        json_bytes: Optional[bytes] = None, table_bytes: Optional[bytes] = None) -> Dict[str, str]:
+    """Store all artifacts for a run in a single directory
+
+    json_bytes/table_bytes are the already-encoded JSON of json_data/table_data, when the caller has them.
+    The artifacts are written as one put_many batch, concurrently on S3.
+    """
     artifacts = {}
     
     try:
-        # Store original file
         file_ext = original_filename.split('.')[-1] if '.' in original_filename else 'bin'
         original_key = f"{run_dir}/original.{file_ext}"
-        storage.put_bytes(original_key, original_file_data, content_type=_get_content_type(original_filename))
-        artifacts['original_file'] = original_key
-        print(f"✅ Stored original file: {original_key}")
-        
-        # Store processed JSON
         processed_key = f"{run_dir}/processed.json"
-        storage.put_json(processed_key, json_data)
-        artifacts['processed_json'] = processed_key
-        print(f"✅ Stored processed JSON: {processed_key}")
-        
-        # Store table data
         table_key = f"{run_dir}/table_data.json"
-        storage.put_json(table_key, table_data)
-        artifacts['table_data'] = table_key
-        print(f"✅ Stored table data: {table_key}")
+        html_key = f"{run_dir}/display.html"
+        meta_key = f"{run_dir}/meta.json"
+        artifacts.update({'original_file': original_key, 'processed_json': processed_key})
+        
+        # Columnar copy of the processed JSON, when enabled
+        columnar_ref = _store_processed_columnar(storage, run_dir, json_data)
+        if columnar_ref:
+            artifacts['processed_columnar'] = columnar_ref.key
+            print(f"✅ Stored columnar output: {columnar_ref.key}")
         
-        # Generate and store HTML
         html_generator = HTMLGenerator()
         data_for_html = {'full': json_data, 'tables': table_data}
         html_content = html_generator.generate_complete_html(data_for_html, meta)
-        html_key = f"{run_dir}/display.html"
-        storage.put_bytes(html_key, html_content.encode('utf-8'), content_type='text/html')
-        artifacts['display_html'] = html_key
-        print(f"✅ Generated and stored HTML: {html_key}")
         
-        # Store metadata
-        meta_key = f"{run_dir}/meta.json"
+        artifacts.update({'table_data': table_key, 'display_html': html_key})
         full_meta = {**meta, 'artifacts': artifacts}
-        storage.put_json(meta_key, full_meta)
+        storage.put_many([
+            StorageWrite(original_key, original_file_data, content_type=_get_content_type(original_filename)),
+            storage.json_write(processed_key, json_data, encoded=json_bytes),
+            storage.json_write(table_key, table_data, encoded=table_bytes),
+            StorageWrite(html_key, html_content.encode('utf-8'), content_type='text/html'),
+            storage.json_write(meta_key, full_meta),
+        ])
         artifacts['meta'] = meta_key
-        print(f"✅ Stored metadata: {meta_key}")
         
-        print(f"✅ All artifacts stored for run: {run_dir}")
+        print(f"✅ All artifacts stored for run: {run_dir} ({', '.join(artifacts.values())})")
         return artifacts
         
     except Exception as e:
@@ -170,6 +174,237 @@ def _get_content_type(filename: str) -> str:
     return content_types.get(ext, 'application/octet-stream')
 
 
+def _store_processed_columnar(storage, key_dir: str, json_data: Dict[str, Any]) -> Optional[StorageReference]:
+    """Columnar copy of the processed JSON under key_dir when COLUMNAR_OUTPUT_FORMAT is set.
+
+    The JSON artifact stays authoritative, so a failed encode is logged and skipped.
+    """
+    fmt = get_columnar_output_format()
+    if fmt is None:
+        return None
+    key = f"{key_dir}/{columnar_filename(fmt)}"
+    try:
+        return store_columnar_workbook(storage, key, json_data, fmt)
+    except Exception as e:
+        print(f"❌ Failed to store columnar output {key}: {e}")
+        return None
+
+
+def _build_excel_processor(parallel_sheets: bool) -> ComplexityPreservingCompactProcessor:
+    """Create the upload processor; parallel_sheets fans worksheets out to the shared worker pool"""
+    if parallel_sheets:
+        # Worker count is server config (EXCEL_MAX_SHEET_WORKERS), never per request
+        return ComplexityPreservingCompactProcessor(enable_rle=True, ingestion_mode='parallel')
+    return ComplexityPreservingCompactProcessor(enable_rle=True)
+
+
+def _run_excel_pipeline(file_path: str, enable_comparison: bool, enable_ai_analysis: bool,
+                        parallel_sheets: bool) -> Dict[str, Any]:
+    """Compact conversion, complexity analysis and table extraction for one workbook"""
+    processor = _build_excel_processor(parallel_sheets)
+    json_data = processor.process_file(file_path, filter_empty_trailing=True, include_complexity_metadata=True)
+
+    analyzer = ExcelComplexityAnalyzer()
+    complexity_results: Dict[str, Any] = {}
+    meta_by_sheet = json_data.get("complexity_metadata", {}).get("sheets", {})
+    for sheet in json_data.get("workbook", {}).get("sheets", []):
+        name = sheet.get("name", "Unknown")
+        complexity_results[name] = analyzer.analyze_sheet_complexity(sheet, complexity_metadata=meta_by_sheet.get(name))
+
+    table_processor = CompactTableProcessor()
+    table_data = table_processor.transform_to_compact_table_format(json_data, {
+        "enable_comparison": enable_comparison,
+        "enable_ai_analysis": enable_ai_analysis,
+        "complexity_results": complexity_results,
+    })
+    table_data["complexity_analysis"] = complexity_results
+    return {"processed_json": json_data, "table_data": table_data}
+
+
+def _convert_excel_cached(file_path: str, enable_comparison: bool, enable_ai_analysis: bool,
+                          parallel_sheets: bool):
+    """Run the Excel pipeline unless an identical upload was already converted.
+
+    Returns (json_data, table_data, cache_hit). Parallel sheet conversion yields
+    the same output as sequential, so it is not part of the cache key.
+    """
+    artifacts, cache_hit = get_conversion_cache().get_or_compute(
+        "excel_compact", file_path,
+        {"enable_comparison": enable_comparison, "enable_ai_analysis": enable_ai_analysis},
+        lambda: _run_excel_pipeline(file_path, enable_comparison, enable_ai_analysis, parallel_sheets),
+    )
+    return artifacts["processed_json"], artifacts["table_data"], cache_hit
+
+
+def run_excel_upload_job(processing_id: str, file_path: str, payload: Dict[str, Any]) -> None:
+    """Job handler for async /api/upload/ requests, run by fastapi_service.worker"""
+    filename = payload['filename']
+    enable_comparison = payload.get('enable_comparison', False)
+    enable_ai_analysis = payload.get('enable_ai_analysis', False)
+
+    json_data_local, table_data_local, cache_hit = _convert_excel_cached(
+        file_path, enable_comparison, enable_ai_analysis,
+        payload.get('parallel_sheets', False),
+    )
+
+    total_cells = _estimate_total_cells_from_workbook(json_data_local.get('workbook', {}))
+    total_numeric_cells = _estimate_total_numeric_cells_from_workbook(json_data_local.get('workbook', {}))
+    estimated_size = total_cells * 200
+    # Encoded once; the bytes are stored and measured as-is
+    json_bytes = encode_json(json_data_local)
+    table_bytes = encode_json(table_data_local)
+
+    use_storage_local = os.getenv("USE_STORAGE_SERVICE", "false").lower() == "true"
+    storage_local = get_storage_service()
+    response_storage_local = None
+    file_id_local = None
+    download_urls_local = None
+
+    if estimated_size > 5 * 1024 * 1024:
+        summary_data = {'workbook': {'meta': json_data_local.get('workbook', {}).get('meta', {}), 'sheets': []}}
+        for sheet in json_data_local.get('workbook', {}).get('sheets', []):
+            tables = sheet.get('tables', [])
+            sheet_summary = {
+                'name': sheet.get('name', 'Unknown'),
+                'table_count': len(tables),
+                'total_rows': sum(len(t.get('labels', {}).get('rows', [])) for t in tables),
+                'total_columns': sum(len(t.get('labels', {}).get('cols', [])) for t in tables),
+                'numeric_cells': _estimate_numeric_cells_for_sheet(sheet),
+            }
+            summary_data['workbook']['sheets'].append(sheet_summary)
+
+        # Always persist to storage; only include references when enabled
+        try:
+            full_ref = storage_local.store_json(data=json_data_local, storage_type=StorageType.PROCESSED_JSON, key_prefix=f"{processing_id}", encoded=json_bytes)
+            table_ref = storage_local.store_json(data=table_data_local, storage_type=StorageType.TABLE_DATA, key_prefix=f"{processing_id}", encoded=table_bytes)
+            columnar_ref = _store_processed_columnar(storage_local, f"{StorageType.PROCESSED_JSON.value}/{processing_id}", json_data_local)
+            if use_storage_local:
+                response_storage_local = {
+                    'processing_id': processing_id,
+                    'processed_json': full_ref.__dict__,
+                    'table_data': table_ref.__dict__,
+                    **({'processed_columnar': columnar_ref.__dict__} if columnar_ref else {}),
+                    'download_urls': {
+                        'processed_json': storage_local.get_download_url(full_ref),
+                        'table_data': storage_local.get_download_url(table_ref),
+                        **({'processed_columnar': storage_local.get_download_url(columnar_ref)} if columnar_ref else {}),
+                    }
+                }
+        except Exception:
+            response_storage_local = None
+
+        if not use_storage_local:
+            file_id_local = str(uuid.uuid4())
+            django_like_models.processed_data_cache.put(file_id_local, {
+                'full_data': json_data_local,
+                'table_data': table_data_local,
+                'filename': filename,
+                'format': 'compact',
+            }, size_bytes=len(json_bytes) + len(table_bytes))
+            download_urls_local = {
+                'full_data': f'/api/download/?type=full&file_id={file_id_local}',
+                'table_data': f'/api/download/?type=table&file_id={file_id_local}',
+            }
+
+        processing_registry.register(processing_id, {
+            'filename': filename,
+            'type': 'excel',
+            'storage': response_storage_local,
+            'size_estimated_bytes': estimated_size,
+            'large_file': True,
+            'cache_hit': cache_hit,
+            'summary': {
+                **summary_data,
+                'workbook': { **summary_data['workbook'], 'total_numeric_cells': total_numeric_cells }
+            },
+            **({ 'file_id': file_id_local, 'download_urls': download_urls_local } if not storage_local else {}),
+            'status': 'completed',
+        })
+        # Write UI index for this run
+        try:
+            run_dir = _build_run_dir(filename)
+            storage_local.put_json(f"runs/{run_dir}/meta/index.json", {
+                'run_dir': run_dir,
+                'processing_id': processing_id,
+                'filename': filename,
+                'file_type': 'excel',
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'keys': {
+                    'original_file': payload.get('original_key'),
+                    'processed_json': (full_ref.key if 'full_ref' in locals() else None),
+                    'table_data': (table_ref.key if 'table_ref' in locals() else None),
+                    'processed_columnar': (columnar_ref.key if locals().get('columnar_ref') else None),
+                },
+            })
+        except Exception:
+            pass
+    else:
+        if not use_storage_local:
+            try:
+                file_id_local = str(uuid.uuid4())
+                django_like_models.processed_data_cache.put(file_id_local, {
+                    'full_data': json_data_local,
+                    'table_data': table_data_local,
+                    'filename': filename,
+                    'format': 'compact',
+                }, size_bytes=len(json_bytes) + len(table_bytes))
+                download_urls_local = {
+                    'full_data': f'/api/download/?type=full&file_id={file_id_local}',
+                    'table_data': f'/api/download/?type=table&file_id={file_id_local}',
+                }
+            except Exception:
+                file_id_local = None
+                download_urls_local = None
+
+        try:
+            full_ref = storage_local.store_json(data=json_data_local, storage_type=StorageType.PROCESSED_JSON, key_prefix=f"{processing_id}", encoded=json_bytes)
+            table_ref = storage_local.store_json(data=table_data_local, storage_type=StorageType.TABLE_DATA, key_prefix=f"{processing_id}", encoded=table_bytes)
+            columnar_ref = _store_processed_columnar(storage_local, f"{StorageType.PROCESSED_JSON.value}/{processing_id}", json_data_local)
+            if use_storage_local:
+                response_storage_local = {
+                    'processing_id': processing_id,
+                    'processed_json': full_ref.__dict__,
+                    'table_data': table_ref.__dict__,
+                    **({'processed_columnar': columnar_ref.__dict__} if columnar_ref else {}),
+                    'download_urls': {
+                        'processed_json': storage_local.get_download_url(full_ref),
+                        'table_data': storage_local.get_download_url(table_ref),
+                        **({'processed_columnar': storage_local.get_download_url(columnar_ref)} if columnar_ref else {}),
+                    }
+                }
+        except Exception:
+            response_storage_local = None
+
+        processing_registry.register(processing_id, {
+            'filename': filename,
+            'type': 'excel',
+            'storage': response_storage_local,
+            'size_actual_bytes': len(json_bytes) + len(table_bytes),
+            'large_file': False,
+            'cache_hit': cache_hit,
+            **({ 'file_id': file_id_local, 'download_urls': download_urls_local } if not storage_local and file_id_local else {}),
+            'status': 'completed',
+        })
+        # Write UI index for this run
+        try:
+            run_dir = _build_run_dir(filename)
+            storage_local.put_json(f"runs/{run_dir}/meta/index.json", {
+                'run_dir': run_dir,
+                'processing_id': processing_id,
+                'filename': filename,
+                'file_type': 'excel',
+                'created_at': datetime.now(timezone.utc).isoformat(),
+                'keys': {
+                    'original_file': payload.get('original_key'),
+                    'processed_json': (full_ref.key if 'full_ref' in locals() else None),
+                    'table_data': (table_ref.key if 'table_ref' in locals() else None),
+                    'processed_columnar': (columnar_ref.key if locals().get('columnar_ref') else None),
+                },
+            })
+        except Exception:
+            pass
+
+
 @router.post("/upload/")
 async def upload_and_convert(
     background_tasks: BackgroundTasks,
@@ -180,6 +415,7 @@ async def upload_and_convert(
     callback_url: Optional[str] = Form(None),
     pubsub_provider: Optional[str] = Form(None),
     pubsub_topic: Optional[str] = Form(None),
+    parallel_sheets: bool = Form(False),
 ):
     # Track processing start time
     processing_start_time = datetime.now(timezone.utc)
@@ -238,198 +474,26 @@ async def upload_and_convert(
             except Exception:
                 response_storage = None
 
-            try:
-                processing_registry.register(processing_id, {
-                    'filename': file.filename,
-                    'type': 'excel',
-                    'status': 'processing',
-                    **({'storage': response_storage} if response_storage else {}),
-                })
-            except Exception:
-                pass
-
-            def _bg_task():
-                from fastapi_service.notification_sender import send_notifications
-                # Write bytes to a temp file for processor
-                with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as t2:
-                    t2.write(file_bytes)
-                    path2 = t2.name
-                # Reuse existing sync logic by invoking processor inline
-                try:
-                    processor = ComplexityPreservingCompactProcessor(enable_rle=True)
-                    json_data_local = processor.process_file(path2, filter_empty_trailing=True, include_complexity_metadata=True)
-
-                    analyzer = ExcelComplexityAnalyzer()
-                    complexity_results_local: Dict[str, Any] = {}
-                    meta_by_sheet = json_data_local.get("complexity_metadata", {}).get("sheets", {})
-                    for sheet in json_data_local.get("workbook", {}).get("sheets", []):
-                        name = sheet.get("name", "Unknown")
-                        complexity_results_local[name] = analyzer.analyze_sheet_complexity(sheet, complexity_metadata=meta_by_sheet.get(name))
-
-                    table_processor = CompactTableProcessor()
-                    table_data_local = table_processor.transform_to_compact_table_format(json_data_local, {
-                        "enable_comparison": enable_comparison,
-                        "enable_ai_analysis": enable_ai_analysis,
-                        "complexity_results": complexity_results_local,
-                    })
-                    table_data_local["complexity_analysis"] = complexity_results_local
-
-                    total_cells = _estimate_total_cells_from_workbook(json_data_local.get('workbook', {}))
-                    total_numeric_cells = _estimate_total_numeric_cells_from_workbook(json_data_local.get('workbook', {}))
-                    estimated_size = total_cells * 200
-
-                    use_storage_local = os.getenv("USE_STORAGE_SERVICE", "false").lower() == "true"
-                    storage_local = get_storage_service()
-                    response_storage_local = None
-                    file_id_local = None
-                    download_urls_local = None
-
-                    if estimated_size > 5 * 1024 * 1024:
-                        summary_data = {'workbook': {'meta': json_data_local.get('workbook', {}).get('meta', {}), 'sheets': []}}
-                        for sheet in json_data_local.get('workbook', {}).get('sheets', []):
-                            tables = sheet.get('tables', [])
-                            sheet_summary = {
-                                'name': sheet.get('name', 'Unknown'),
-                                'table_count': len(tables),
-                                'total_rows': sum(len(t.get('labels', {}).get('rows', [])) for t in tables),
-                                'total_columns': sum(len(t.get('labels', {}).get('cols', [])) for t in tables),
-                                'numeric_cells': _estimate_numeric_cells_for_sheet(sheet),
-                            }
-                            summary_data['workbook']['sheets'].append(sheet_summary)
-
-                        # Always persist to storage; only include references when enabled
-                        try:
-                            full_ref = storage_local.store_json(data=json_data_local, storage_type=StorageType.PROCESSED_JSON, key_prefix=f"{processing_id}")
-                            table_ref = storage_local.store_json(data=table_data_local, storage_type=StorageType.TABLE_DATA, key_prefix=f"{processing_id}")
-                            if use_storage_local:
-                                response_storage_local = {
-                                    'processing_id': processing_id,
-                                    'processed_json': full_ref.__dict__,
-                                    'table_data': table_ref.__dict__,
-                                    'download_urls': {
-                                        'processed_json': storage_local.get_download_url(full_ref),
-                                        'table_data': storage_local.get_download_url(table_ref),
-                                    }
-                                }
-                        except Exception:
-                            response_storage_local = None
-
-                        if not use_storage_local:
-                            file_id_local = str(uuid.uuid4())
-                            django_like_models.processed_data_cache[file_id_local] = {
-                                'full_data': json_data_local,
-                                'table_data': table_data_local,
-                                'filename': file.filename,
-                                'format': 'compact',
-                            }
-                            download_urls_local = {
-                                'full_data': f'/api/download/?type=full&file_id={file_id_local}',
-                                'table_data': f'/api/download/?type=table&file_id={file_id_local}',
-                            }
-
-                        processing_registry.register(processing_id, {
-                            'filename': file.filename,
-                            'type': 'excel',
-                            'storage': response_storage_local,
-                            'size_estimated_bytes': estimated_size,
-                            'large_file': True,
-                            'summary': {
-                                **summary_data,
-                                'workbook': { **summary_data['workbook'], 'total_numeric_cells': total_numeric_cells }
-                            },
-                            **({ 'file_id': file_id_local, 'download_urls': download_urls_local } if not storage_local else {}),
-                            'status': 'completed',
-                        })
-                        # Write UI index for this run
-                        try:
-                            run_dir = _build_run_dir(file.filename)
-                            storage_local.put_json(f"runs/{run_dir}/meta/index.json", {
-                                'run_dir': run_dir,
-                                'processing_id': processing_id,
-                                'filename': file.filename,
-                                'file_type': 'excel',
-                                'created_at': datetime.now(timezone.utc).isoformat(),
-                                'keys': {
-                                    'original_file': (original_ref.key if original_ref else None) if 'original_ref' in locals() else None,
-                                    'processed_json': (full_ref.key if 'full_ref' in locals() else None),
-                                    'table_data': (table_ref.key if 'table_ref' in locals() else None),
-                                },
-                            })
-                        except Exception:
-                            pass
-                    else:
-                        if not use_storage_local:
-                            try:
-                                file_id_local = str(uuid.uuid4())
-                                django_like_models.processed_data_cache[file_id_local] = {
-                                    'full_data': json_data_local,
-                                    'table_data': table_data_local,
-                                    'filename': file.filename,
-                                    'format': 'compact',
-                                }
-                                download_urls_local = {
-                                    'full_data': f'/api/download/?type=full&file_id={file_id_local}',
-                                    'table_data': f'/api/download/?type=table&file_id={file_id_local}',
-                                }
-                            except Exception:
-                                file_id_local = None
-                                download_urls_local = None
-
-                        try:
-                            full_ref = storage_local.store_json(data=json_data_local, storage_type=StorageType.PROCESSED_JSON, key_prefix=f"{processing_id}")
-                            table_ref = storage_local.store_json(data=table_data_local, storage_type=StorageType.TABLE_DATA, key_prefix=f"{processing_id}")
-                            if use_storage_local:
-                                response_storage_local = {
-                                    'processing_id': processing_id,
-                                    'processed_json': full_ref.__dict__,
-                                    'table_data': table_ref.__dict__,
-                                    'download_urls': {
-                                        'processed_json': storage_local.get_download_url(full_ref),
-                                        'table_data': storage_local.get_download_url(table_ref),
-                                    }
-                                }
-                        except Exception:
-                            response_storage_local = None
-
-                        processing_registry.register(processing_id, {
-                            'filename': file.filename,
-                            'type': 'excel',
-                            'storage': response_storage_local,
-                            'size_actual_bytes': len(json.dumps(json_data_local, default=str)) + len(json.dumps(table_data_local, default=str)),
-                            'large_file': False,
-                            **({ 'file_id': file_id_local, 'download_urls': download_urls_local } if not storage_local and file_id_local else {}),
-                            'status': 'completed',
-                        })
-                        # Write UI index for this run
-                        try:
-                            run_dir = _build_run_dir(file.filename)
-                            storage_local.put_json(f"runs/{run_dir}/meta/index.json", {
-                                'run_dir': run_dir,
-                                'processing_id': processing_id,
-                                'filename': file.filename,
-                                'file_type': 'excel',
-                                'created_at': datetime.now(timezone.utc).isoformat(),
-                                'keys': {
-                                    'original_file': (original_ref.key if original_ref else None) if 'original_ref' in locals() else None,
-                                    'processed_json': (full_ref.key if 'full_ref' in locals() else None),
-                                    'table_data': (table_ref.key if 'table_ref' in locals() else None),
-                                },
-                            })
-                        except Exception:
-                            pass
-                finally:
-                    try:
-                        os.remove(path2)
-                    except Exception:
-                        pass
-
-                # Send notifications with the final record
-                final_rec = processing_registry.get(processing_id) or {'processing_id': processing_id, 'type': 'excel', 'status': 'completed'}
-                final_rec['processing_id'] = processing_id
-                send_notifications(record=final_rec, callback_url=callback_url, pubsub_provider=pubsub_provider, pubsub_topic=pubsub_topic)
-
-            background_tasks.add_task(_bg_task)
-            return JSONResponse({
+            # Queue the job durably; the input is the stored original or a staged copy
+            input_key = original_ref.key if original_ref else f"jobs/{processing_id}/input{ext}"
+            if original_ref is None:
+                storage.put_bytes(input_key, file_bytes)
+            enqueue_conversion_job(processing_id, 'excel_upload', {
+                'input_key': input_key,
+                'delete_input': original_ref is None,
+                'suffix': ext,
+                'original_key': original_ref.key if original_ref else None,
+                'filename': file.filename,
+                'enable_comparison': enable_comparison,
+                'enable_ai_analysis': enable_ai_analysis,
+                'parallel_sheets': parallel_sheets,
+                'notify': {'callback_url': callback_url, 'pubsub_provider': pubsub_provider, 'pubsub_topic': pubsub_topic},
+            }, record={
+                'filename': file.filename,
+                'type': 'excel',
+                **({'storage': response_storage} if response_storage else {}),
+            })
+            return EncodedJSONResponse({
                 'accepted': True,
                 'processing_id': processing_id,
                 'status_endpoint': f'/api/status/{processing_id}/',
@@ -439,257 +503,263 @@ async def upload_and_convert(
                     'meta': f'/api/results/{processing_id}/meta',
                 }
             }, status_code=202)
-        processor = ComplexityPreservingCompactProcessor(enable_rle=True)
-        json_data = processor.process_file(full_path, filter_empty_trailing=True, include_complexity_metadata=True)
+        def _convert():
+            json_data, table_data, cache_hit = _convert_excel_cached(
+                full_path, enable_comparison, enable_ai_analysis, parallel_sheets,
+            )
 
-        analyzer = ExcelComplexityAnalyzer()
-        complexity_results = {}
-        meta_by_sheet = json_data.get("complexity_metadata", {}).get("sheets", {})
-        for sheet in json_data.get("workbook", {}).get("sheets", []):
-            name = sheet.get("name", "Unknown")
-            complexity_results[name] = analyzer.analyze_sheet_complexity(sheet, complexity_metadata=meta_by_sheet.get(name))
+            # Large-file parity behavior
+            total_cells = _estimate_total_cells_from_workbook(json_data.get('workbook', {}))
+            total_numeric_cells = _estimate_total_numeric_cells_from_workbook(json_data.get('workbook', {}))
+            estimated_size = total_cells * 200  # rough bytes per cell
+            LARGE_FILE_THRESHOLD = 5 * 1024 * 1024
 
-        table_processor = CompactTableProcessor()
-        table_data = table_processor.transform_to_compact_table_format(json_data, {
-            "enable_comparison": enable_comparison,
-            "enable_ai_analysis": enable_ai_analysis,
-            "complexity_results": complexity_results,
-        })
-        table_data["complexity_analysis"] = complexity_results
-
-        # Large-file parity behavior
-        total_cells = _estimate_total_cells_from_workbook(json_data.get('workbook', {}))
-        total_numeric_cells = _estimate_total_numeric_cells_from_workbook(json_data.get('workbook', {}))
-        estimated_size = total_cells * 200  # rough bytes per cell
-        LARGE_FILE_THRESHOLD = 5 * 1024 * 1024
-
-        use_storage = os.getenv("USE_STORAGE_SERVICE", "false").lower() == "true"
-        storage = get_storage_service()
-        processing_id = str(uuid.uuid4())
-        response_storage = None
-        original_ref = None
-        try:
-            with open(full_path, "rb") as f:
-                original_ref = storage.store_file(
-                    data=f.read(),
-                    storage_type=StorageType.ORIGINAL_FILE,
-                    filename=file.filename,
-                    metadata={"processing_id": processing_id},
-                )
-        except Exception:
+            use_storage = os.getenv("USE_STORAGE_SERVICE", "false").lower() == "true"
+            storage = get_storage_service()
+            processing_id = str(uuid.uuid4())
+            response_storage = None
             original_ref = None
-
-        if estimated_size > LARGE_FILE_THRESHOLD:
-            # Build summary only
-            summary_data = {'workbook': {'meta': json_data.get('workbook', {}).get('meta', {}), 'sheets': []}}
-            sheets = json_data.get('workbook', {}).get('sheets', [])
-            for sheet in sheets:
-                tables = sheet.get('tables', [])
-                sheet_summary = {
-                    'name': sheet.get('name', 'Unknown'),
-                    'table_count': len(tables),
-                    'total_rows': sum(len(t.get('labels', {}).get('rows', [])) for t in tables),
-                    'total_columns': sum(len(t.get('labels', {}).get('cols', [])) for t in tables),
-                    'numeric_cells': _estimate_numeric_cells_for_sheet(sheet),
-                }
-                summary_data['workbook']['sheets'].append(sheet_summary)
-
-            # Always persist; include references only when enabled
-            try:
-                full_ref = storage.store_json(data=json_data, storage_type=StorageType.PROCESSED_JSON, key_prefix=f"{processing_id}")
-                table_ref = storage.store_json(data=table_data, storage_type=StorageType.TABLE_DATA, key_prefix=f"{processing_id}")
-                if use_storage:
-                    response_storage = {
-                        'processing_id': processing_id,
-                        'original_file': original_ref.__dict__ if original_ref else None,
-                        'processed_json': full_ref.__dict__,
-                        'table_data': table_ref.__dict__,
-                        'download_urls': {
-                            'original_file': storage.get_download_url(original_ref) if original_ref else None,
-                            'processed_json': storage.get_download_url(full_ref),
-                            'table_data': storage.get_download_url(table_ref),
-                        }
-                    }
-            except Exception:
-                response_storage = None
-            download_urls = { 'full_data': None, 'table_data': None }
-            if not use_storage:
-                # Legacy in-memory cache
-                file_id = str(uuid.uuid4())
-                django_like_models.processed_data_cache[file_id] = {
-                    'full_data': json_data,
-                    'table_data': table_data,
-                    'filename': file.filename,
-                    'format': 'compact',
-                }
-                download_urls = {
-                    'full_data': f'/api/download/?type=full&file_id={file_id}',
-                    'table_data': f'/api/download/?type=table&file_id={file_id}',
-                }
-
-            processing_registry.register(processing_id, {
-                'filename': file.filename,
-                'type': 'excel',
-                'storage': response_storage,
-                'size_estimated_bytes': estimated_size,
-                'large_file': True,
-                'summary': {
-                    **summary_data,
-                    'workbook': { **summary_data['workbook'], 'total_numeric_cells': total_numeric_cells }
-                },
-                **({ 'file_id': file_id, 'download_urls': download_urls } if not storage else {}),
-            })
-
-            estimated_size_mb = estimated_size / 1024 / 1024
-            json_data_size_mb = estimated_size_mb
-            table_data_size_mb = max(estimated_size_mb * 0.6, 0.0)
-            # Write UI index
             try:
-                run_dir = _build_run_dir(file.filename)
-                storage.put_json(f"runs/{run_dir}/meta/index.json", {
-                    'run_dir': run_dir,
-                    'processing_id': processing_id,
-                    'filename': file.filename,
-                    'file_type': 'excel',
-                    'created_at': datetime.now(timezone.utc).isoformat(),
-                    'keys': {
-                        'original_file': original_ref.key if original_ref else None,
-                        'processed_json': (full_ref.key if 'full_ref' in locals() else None),
-                        'table_data': (table_ref.key if 'table_ref' in locals() else None),
-                    },
-                })
-            except Exception:
-                pass
-            return JSONResponse({
-                'success': True,
-                'format': 'compact',
-                'filename': file.filename,
-                'large_file': True,
-                'warning': f'File is very large (estimated {estimated_size_mb:.1f} MB). Use download links below.',
-                'summary': {
-                    **summary_data,
-                    'workbook': { **summary_data['workbook'], 'total_numeric_cells': total_numeric_cells }
-                },
-                'download_urls': download_urls,
-                'storage': response_storage,
-                'processing_id': processing_id,
-                'file_info': {
-                    'estimated_size_mb': estimated_size_mb,
-                    'json_data_size_mb': json_data_size_mb,
-                    'table_data_size_mb': table_data_size_mb,
-                    'total_cells': total_cells,
-                    'total_numeric_cells': total_numeric_cells,
-                    'sheet_count': len(json_data.get('workbook', {}).get('sheets', [])),
-                    'total_tables': sum(len(s.get('tables', [])) for s in json_data.get('workbook', {}).get('sheets', []))
-                },
-                'compression_stats': {
-                    'format_used': 'compact',
-                    'estimated_verbose_size_mb': estimated_size_mb * 3.5,
-                    'estimated_reduction_percent': 70,
-                    'rle_enabled': True
-                }
-            })
-        else:
-            # Small file: return inline
-            try:
-                if 'workbook' in json_data:
-                    json_data['workbook']['numeric_cell_count'] = _estimate_total_numeric_cells_from_workbook(json_data['workbook'])
-                if 'workbook' in table_data:
-                    table_data['workbook']['numeric_cell_count'] = json_data['workbook'].get('numeric_cell_count', 0)
+                with open(full_path, "rb") as f:
+                    original_ref = storage.store_file(
+                        data=f.read(),
+                        storage_type=StorageType.ORIGINAL_FILE,
+                        filename=file.filename,
+                        metadata={"processing_id": processing_id},
+                    )
             except Exception:
-                pass
+                original_ref = None
+
+            if estimated_size > LARGE_FILE_THRESHOLD:
+                # Build summary only
+                summary_data = {'workbook': {'meta': json_data.get('workbook', {}).get('meta', {}), 'sheets': []}}
+                sheets = json_data.get('workbook', {}).get('sheets', [])
+                for sheet in sheets:
+                    tables = sheet.get('tables', [])
+                    sheet_summary = {
+                        'name': sheet.get('name', 'Unknown'),
+                        'table_count': len(tables),
+                        'total_rows': sum(len(t.get('labels', {}).get('rows', [])) for t in tables),
+                        'total_columns': sum(len(t.get('labels', {}).get('cols', [])) for t in tables),
+                        'numeric_cells': _estimate_numeric_cells_for_sheet(sheet),
+                    }
+                    summary_data['workbook']['sheets'].append(sheet_summary)
 
-            # For consistent retrieval later, also cache when storage is not configured
-            download_urls = None
-            file_id = None
-            if not storage:
+                json_bytes = encode_json(json_data)
+                table_bytes = encode_json(table_data)
+                # Always persist; include references only when enabled
                 try:
+                    full_ref = storage.store_json(data=json_data, storage_type=StorageType.PROCESSED_JSON, key_prefix=f"{processing_id}", encoded=json_bytes)
+                    table_ref = storage.store_json(data=table_data, storage_type=StorageType.TABLE_DATA, key_prefix=f"{processing_id}", encoded=table_bytes)
+                    columnar_ref = _store_processed_columnar(storage, f"{StorageType.PROCESSED_JSON.value}/{processing_id}", json_data)
+                    if use_storage:
+                        response_storage = {
+                            'processing_id': processing_id,
+                            'original_file': original_ref.__dict__ if original_ref else None,
+                            'processed_json': full_ref.__dict__,
+                            'table_data': table_ref.__dict__,
+                            **({'processed_columnar': columnar_ref.__dict__} if columnar_ref else {}),
+                            'download_urls': {
+                                'original_file': storage.get_download_url(original_ref) if original_ref else None,
+                                'processed_json': storage.get_download_url(full_ref),
+                                'table_data': storage.get_download_url(table_ref),
+                                **({'processed_columnar': storage.get_download_url(columnar_ref)} if columnar_ref else {}),
+                            }
+                        }
+                except Exception:
+                    response_storage = None
+                download_urls = { 'full_data': None, 'table_data': None }
+                if not use_storage:
+                    # Legacy in-memory cache
                     file_id = str(uuid.uuid4())
-                    django_like_models.processed_data_cache[file_id] = {
+                    django_like_models.processed_data_cache.put(file_id, {
                         'full_data': json_data,
                         'table_data': table_data,
                         'filename': file.filename,
                         'format': 'compact',
-                    }
+                    }, size_bytes=len(json_bytes) + len(table_bytes))
                     download_urls = {
                         'full_data': f'/api/download/?type=full&file_id={file_id}',
                         'table_data': f'/api/download/?type=table&file_id={file_id}',
                     }
-                except Exception:
-                    file_id = None
-                    download_urls = None
 
-            try:
-                full_ref = storage.store_json(data=json_data, storage_type=StorageType.PROCESSED_JSON, key_prefix=f"{processing_id}")
-                table_ref = storage.store_json(data=table_data, storage_type=StorageType.TABLE_DATA, key_prefix=f"{processing_id}")
-                if use_storage:
-                    response_storage = {
+                processing_registry.register(processing_id, {
+                    'filename': file.filename,
+                    'type': 'excel',
+                    'storage': response_storage,
+                    'size_estimated_bytes': estimated_size,
+                    'large_file': True,
+                    'cache_hit': cache_hit,
+                    'summary': {
+                        **summary_data,
+                        'workbook': { **summary_data['workbook'], 'total_numeric_cells': total_numeric_cells }
+                    },
+                    **({ 'file_id': file_id, 'download_urls': download_urls } if not storage else {}),
+                })
+
+                estimated_size_mb = estimated_size / 1024 / 1024
+                json_data_size_mb = estimated_size_mb
+                table_data_size_mb = max(estimated_size_mb * 0.6, 0.0)
+                # Write UI index
+                try:
+                    run_dir = _build_run_dir(file.filename)
+                    storage.put_json(f"runs/{run_dir}/meta/index.json", {
+                        'run_dir': run_dir,
                         'processing_id': processing_id,
-                        'original_file': original_ref.__dict__ if original_ref else None,
-                        'processed_json': full_ref.__dict__,
-                        'table_data': table_ref.__dict__,
-                        'download_urls': {
-                            'original_file': storage.get_download_url(original_ref) if original_ref else None,
-                            'processed_json': storage.get_download_url(full_ref),
-                            'table_data': storage.get_download_url(table_ref),
-                        }
+                        'filename': file.filename,
+                        'file_type': 'excel',
+                        'created_at': datetime.now(timezone.utc).isoformat(),
+                        'keys': {
+                            'original_file': original_ref.key if original_ref else None,
+                            'processed_json': (full_ref.key if 'full_ref' in locals() else None),
+                            'table_data': (table_ref.key if 'table_ref' in locals() else None),
+                            'processed_columnar': (columnar_ref.key if locals().get('columnar_ref') else None),
+                        },
+                    })
+                except Exception:
+                    pass
+                return EncodedJSONResponse({
+                    'success': True,
+                    'format': 'compact',
+                    'filename': file.filename,
+                    'large_file': True,
+                    'cache_hit': cache_hit,
+                    'warning': f'File is very large (estimated {estimated_size_mb:.1f} MB). Use download links below.',
+                    'summary': {
+                        **summary_data,
+                        'workbook': { **summary_data['workbook'], 'total_numeric_cells': total_numeric_cells }
+                    },
+                    'download_urls': download_urls,
+                    'storage': response_storage,
+                    'processing_id': processing_id,
+                    'file_info': {
+                        'estimated_size_mb': estimated_size_mb,
+                        'json_data_size_mb': json_data_size_mb,
+                        'table_data_size_mb': table_data_size_mb,
+                        'total_cells': total_cells,
+                        'total_numeric_cells': total_numeric_cells,
+                        'sheet_count': len(json_data.get('workbook', {}).get('sheets', [])),
+                        'total_tables': sum(len(s.get('tables', [])) for s in json_data.get('workbook', {}).get('sheets', []))
+                    },
+                    'compression_stats': {
+                        'format_used': 'compact',
+                        'estimated_verbose_size_mb': estimated_size_mb * 3.5,
+                        'estimated_reduction_percent': 70,
+                        'rle_enabled': True
                     }
-            except Exception:
-                response_storage = None
+                })
+            else:
+                # Small file: return inline
+                try:
+                    if 'workbook' in json_data:
+                        json_data['workbook']['numeric_cell_count'] = _estimate_total_numeric_cells_from_workbook(json_data['workbook'])
+                    if 'workbook' in table_data:
+                        table_data['workbook']['numeric_cell_count'] = json_data['workbook'].get('numeric_cell_count', 0)
+                except Exception:
+                    pass
+                # Encoded once; the bytes are stored, measured and sent as-is
+                json_bytes = encode_json(json_data)
+                table_bytes = encode_json(table_data)
+
+                # For consistent retrieval later, also cache when storage is not configured
+                download_urls = None
+                file_id = None
+                if not storage:
+                    try:
+                        file_id = str(uuid.uuid4())
+                        django_like_models.processed_data_cache.put(file_id, {
+                            'full_data': json_data,
+                            'table_data': table_data,
+                            'filename': file.filename,
+                            'format': 'compact',
+                        }, size_bytes=len(json_bytes) + len(table_bytes))
+                        download_urls = {
+                            'full_data': f'/api/download/?type=full&file_id={file_id}',
+                            'table_data': f'/api/download/?type=table&file_id={file_id}',
+                        }
+                    except Exception:
+                        file_id = None
+                        download_urls = None
 
-            processing_registry.register(processing_id, {
-                'filename': file.filename,
-                'type': 'excel',
-                'storage': response_storage,
-                'size_actual_bytes': len(json.dumps(json_data, default=str)) + len(json.dumps(table_data, default=str)),
-                'large_file': False,
-                **({ 'file_id': file_id, 'download_urls': download_urls } if not storage and file_id else {}),
-            })
-            # Store all run artifacts in unified structure
-            try:
-                run_dir = _build_run_dir(file.filename)
+                try:
+                    full_ref = storage.store_json(data=json_data, storage_type=StorageType.PROCESSED_JSON, key_prefix=f"{processing_id}", encoded=json_bytes)
+                    table_ref = storage.store_json(data=table_data, storage_type=StorageType.TABLE_DATA, key_prefix=f"{processing_id}", encoded=table_bytes)
+                    columnar_ref = _store_processed_columnar(storage, f"{StorageType.PROCESSED_JSON.value}/{processing_id}", json_data)
+                    if use_storage:
+                        response_storage = {
+                            'processing_id': processing_id,
+                            'original_file': original_ref.__dict__ if original_ref else None,
+                            'processed_json': full_ref.__dict__,
+                            'table_data': table_ref.__dict__,
+                            **({'processed_columnar': columnar_ref.__dict__} if columnar_ref else {}),
+                            'download_urls': {
+                                'original_file': storage.get_download_url(original_ref) if original_ref else None,
+                                'processed_json': storage.get_download_url(full_ref),
+                                'table_data': storage.get_download_url(table_ref),
+                                **({'processed_columnar': storage.get_download_url(columnar_ref)} if columnar_ref else {}),
+                            }
+                        }
+                except Exception:
+                    response_storage = None
+
+                processing_registry.register(processing_id, {
+                    'filename': file.filename,
+                    'type': 'excel',
+                    'storage': response_storage,
+                    'size_actual_bytes': len(json_bytes) + len(table_bytes),
+                    'large_file': False,
+                    'cache_hit': cache_hit,
+                    **({ 'file_id': file_id, 'download_urls': download_urls } if not storage and file_id else {}),
+                })
+                # Store all run artifacts in unified structure
+                try:
+                    run_dir = _build_run_dir(file.filename)
                 
-                # Get the original file data
-                with open(full_path, 'rb') as f:
-                    original_file_data = f.read()
+                    # Get the original file data
+                    with open(full_path, 'rb') as f:
+                        original_file_data = f.read()
                 
-                # Calculate processing duration
-                processing_end_time = datetime.now(timezone.utc)
-                processing_duration = (processing_end_time - processing_start_time).total_seconds()
+                    # Calculate processing duration
+                    processing_end_time = datetime.now(timezone.utc)
+                    processing_duration = (processing_end_time - processing_start_time).total_seconds()
                 
-                # Prepare metadata
-                meta_for_run = {
-                    'run_dir': run_dir,
-                    'processing_id': processing_id,
-                    'filename': file.filename,
-                    'file_type': 'excel',
-                    'created_at': processing_start_time.isoformat(),
-                    'completed_at': processing_end_time.isoformat(),
-                    'processing_duration_seconds': processing_duration,
-                }
+                    # Prepare metadata
+                    meta_for_run = {
+                        'run_dir': run_dir,
+                        'processing_id': processing_id,
+                        'filename': file.filename,
+                        'file_type': 'excel',
+                        'created_at': processing_start_time.isoformat(),
+                        'completed_at': processing_end_time.isoformat(),
+                        'processing_duration_seconds': processing_duration,
+                    }
                 
-                # Store all artifacts in run-centric structure
-                artifacts = _store_run_artifacts(
-                    storage, run_dir, original_file_data, file.filename,
-                    json_data, table_data, meta_for_run
-                )
+                    # Store all artifacts in run-centric structure
+                    artifacts = _store_run_artifacts(
+                        storage, run_dir, original_file_data, file.filename,
+                        json_data, table_data, meta_for_run,
+                        json_bytes=json_bytes, table_bytes=table_bytes,
+                    )
                 
-                print(f"✅ Created unified run storage for: {run_dir}")
-            except Exception as e:
-                print(f"❌ Failed to create unified run storage: {e}")
-                import traceback
-                traceback.print_exc()
+                    print(f"✅ Created unified run storage for: {run_dir}")
+                except Exception as e:
+                    print(f"❌ Failed to create unified run storage: {e}")
+                    import traceback
+                    traceback.print_exc()
 
-            return JSONResponse({
-                "success": True,
-                "format": "compact",
-                "filename": file.filename,
-                "large_file": False,
-                "data": json_data,
-                "table_data": table_data,
-                "storage": response_storage,
-                "processing_id": processing_id,
-            })
+                return EncodedJSONResponse({
+                    "success": True,
+                    "format": "compact",
+                    "filename": file.filename,
+                    "large_file": False,
+                    "cache_hit": cache_hit,
+                    "data": json_bytes,
+                    "table_data": table_bytes,
+                    "storage": response_storage,
+                    "processing_id": processing_id,
+                })
+
+        return await conversion_executor.run(_convert)
     finally:
         try:
             os.remove(full_path)
@@ -726,19 +796,20 @@ def transform_to_tables(payload: Dict[str, Any]):
         tp = TableProcessor()
         table_data = tp.transform_to_table_format(json_data, options)
 
-    original_size = len(json.dumps(json_data))
-    compressed_size = len(json.dumps(table_data))
-    return {
+    table_bytes = encode_json(table_data)
+    original_size = len(json_dumps(json_data))
+    compressed_size = len(table_bytes)
+    return EncodedJSONResponse({
         "success": True,
         "format": "compact",
-        "table_data": table_data,
+        "table_data": table_bytes,
         "compression_stats": {
             "original_size": original_size,
             "compressed_size": compressed_size,
             "reduction_percent": int((1 - compressed_size / original_size) * 100) if original_size > 0 else 0,
             "rle_enabled": True,
         },
-    }
+    })
 
 
 @router.post("/resolve-headers/")
@@ -775,73 +846,76 @@ async def analyze_excel_complexity(file: UploadFile = File(...)):
     try:
         from converter.compact_excel_processor import CompactExcelProcessor
 
-        processor = CompactExcelProcessor()
-        json_data = processor.process_file(full_path)
-
-        analyzer = ExcelComplexityAnalyzer()
-        complexity_results: Dict[str, Any] = {}
-        recommendations = []
-        for sheet in json_data.get("workbook", {}).get("sheets", []):
-            name = sheet.get("name", "Unknown")
-            analysis = analyzer.analyze_sheet_complexity(sheet)
-            complexity_results[name] = analysis
-            recommendations.append(analysis.get("recommendation"))
-
-        if "ai_first" in recommendations:
-            overall_recommendation = "ai_first"
-        elif "dual" in recommendations:
-            overall_recommendation = "dual"
-        else:
-            overall_recommendation = "traditional"
-
-        use_storage = os.getenv("USE_STORAGE_SERVICE", "false").lower() == "true"
-        storage = get_storage_service() if use_storage else None
-        processing_id = str(uuid.uuid4()) if use_storage else None
-        response_storage = None
-        if storage is not None and processing_id is not None:
-            try:
-                with open(full_path, "rb") as f:
-                    original_bytes = f.read()
-                original_ref = storage.store_file(
-                    data=original_bytes,
-                    storage_type=StorageType.ORIGINAL_FILE,
-                    filename=file.filename,
-                    metadata={"processing_id": processing_id, "type": "excel_complexity"},
-                )
-                payload = {
-                    "success": True,
-                    "filename": file.filename,
-                    "overall_recommendation": overall_recommendation,
-                    "sheet_analysis": complexity_results,
-                }
-                results_ref = storage.store_json(data=payload, storage_type=StorageType.COMPLEXITY_METADATA, key_prefix=f"{processing_id}")
-                response_storage = {
-                    "processing_id": processing_id,
-                    "original_file": original_ref.__dict__,
-                    "complexity_results": results_ref.__dict__,
-                    "download_urls": {
-                        "original_file": storage.get_download_url(original_ref),
-                        "complexity_results": storage.get_download_url(results_ref),
-                    },
-                }
+        def _convert():
+            processor = CompactExcelProcessor()
+            json_data = processor.process_file(full_path)
+
+            analyzer = ExcelComplexityAnalyzer()
+            complexity_results: Dict[str, Any] = {}
+            recommendations = []
+            for sheet in json_data.get("workbook", {}).get("sheets", []):
+                name = sheet.get("name", "Unknown")
+                analysis = analyzer.analyze_sheet_complexity(sheet)
+                complexity_results[name] = analysis
+                recommendations.append(analysis.get("recommendation"))
+
+            if "ai_first" in recommendations:
+                overall_recommendation = "ai_first"
+            elif "dual" in recommendations:
+                overall_recommendation = "dual"
+            else:
+                overall_recommendation = "traditional"
+
+            use_storage = os.getenv("USE_STORAGE_SERVICE", "false").lower() == "true"
+            storage = get_storage_service() if use_storage else None
+            processing_id = str(uuid.uuid4()) if use_storage else None
+            response_storage = None
+            if storage is not None and processing_id is not None:
                 try:
-                    processing_registry.register(processing_id, {
+                    with open(full_path, "rb") as f:
+                        original_bytes = f.read()
+                    original_ref = storage.store_file(
+                        data=original_bytes,
+                        storage_type=StorageType.ORIGINAL_FILE,
+                        filename=file.filename,
+                        metadata={"processing_id": processing_id, "type": "excel_complexity"},
+                    )
+                    payload = {
+                        "success": True,
                         "filename": file.filename,
-                        "type": "excel_complexity",
-                        "storage": response_storage,
-                    })
+                        "overall_recommendation": overall_recommendation,
+                        "sheet_analysis": complexity_results,
+                    }
+                    results_ref = storage.store_json(data=payload, storage_type=StorageType.COMPLEXITY_METADATA, key_prefix=f"{processing_id}")
+                    response_storage = {
+                        "processing_id": processing_id,
+                        "original_file": original_ref.__dict__,
+                        "complexity_results": results_ref.__dict__,
+                        "download_urls": {
+                            "original_file": storage.get_download_url(original_ref),
+                            "complexity_results": storage.get_download_url(results_ref),
+                        },
+                    }
+                    try:
+                        processing_registry.register(processing_id, {
+                            "filename": file.filename,
+                            "type": "excel_complexity",
+                            "storage": response_storage,
+                        })
+                    except Exception:
+                        pass
                 except Exception:
-                    pass
-            except Exception:
-                response_storage = None
+                    response_storage = None
 
-        return JSONResponse({
-            "success": True,
-            "filename": file.filename,
-            "overall_recommendation": overall_recommendation,
-            "sheet_analysis": complexity_results,
-            **({"storage": response_storage, "processing_id": processing_id} if response_storage else {}),
-        })
+            return EncodedJSONResponse({
+                "success": True,
+                "filename": file.filename,
+                "overall_recommendation": overall_recommendation,
+                "sheet_analysis": complexity_results,
+                **({"storage": response_storage, "processing_id": processing_id} if response_storage else {}),
+            })
+
+        return await conversion_executor.run(_convert)
     finally:
         try:
             os.remove(full_path)
@@ -866,65 +940,68 @@ async def excel_comparison_analysis(file: UploadFile = File(...)):
         from converter.anthropic_excel_client import AnthropicExcelClient
         from converter.comparison_engine import ComparisonEngine
 
-        processor = CompactExcelProcessor()
-        json_data = processor.process_file(full_path)
-
-        analyzer = ExcelComplexityAnalyzer()
-        table_processor = CompactTableProcessor()
-        comparison_results: Dict[str, Any] = {}
-
-        for sheet in json_data.get("workbook", {}).get("sheets", []):
-            sheet_name = sheet.get("name", "Unknown")
-            complexity_analysis = analyzer.analyze_sheet_complexity(sheet)
-            traditional_result = table_processor.transform_to_compact_table_format({"workbook": {"sheets": [sheet]}}, {"enable_comparison": False, "enable_ai_analysis": False})
-
-            ai_client = AnthropicExcelClient()
-            ai_parser = AIResultParser()
-            if ai_client.is_available():
-                ai_raw_response = ai_client.analyze_excel_sheet(sheet, complexity_metadata=complexity_analysis, analysis_focus="comprehensive")
-                ai_result = ai_parser.parse_excel_analysis(ai_raw_response)
-            else:
-                ai_result = {
-                    'status': 'unavailable',
-                    'ai_analysis': {'tables': [], 'sheet_summary': {'total_tables': 0}, 'confidence': 0.0},
-                    'table_count': 0,
-                }
+        def _convert():
+            processor = CompactExcelProcessor()
+            json_data = processor.process_file(full_path)
+
+            analyzer = ExcelComplexityAnalyzer()
+            table_processor = CompactTableProcessor()
+            comparison_results: Dict[str, Any] = {}
+
+            for sheet in json_data.get("workbook", {}).get("sheets", []):
+                sheet_name = sheet.get("name", "Unknown")
+                complexity_analysis = analyzer.analyze_sheet_complexity(sheet)
+                traditional_result = table_processor.transform_to_compact_table_format({"workbook": {"sheets": [sheet]}}, {"enable_comparison": False, "enable_ai_analysis": False})
+
+                ai_client = AnthropicExcelClient()
+                ai_parser = AIResultParser()
+                if ai_client.is_available():
+                    ai_raw_response = ai_client.analyze_excel_sheet(sheet, complexity_metadata=complexity_analysis, analysis_focus="comprehensive")
+                    ai_result = ai_parser.parse_excel_analysis(ai_raw_response)
+                else:
+                    ai_result = {
+                        'status': 'unavailable',
+                        'ai_analysis': {'tables': [], 'sheet_summary': {'total_tables': 0}, 'confidence': 0.0},
+                        'table_count': 0,
+                    }
 
-            comp = ComparisonEngine().compare_analysis_results(traditional_result=traditional_result, ai_result=ai_result, complexity_metadata=complexity_analysis, sheet_name=sheet_name)
-            comparison_results[sheet_name] = comp
+                comp = ComparisonEngine().compare_analysis_results(traditional_result=traditional_result, ai_result=ai_result, complexity_metadata=complexity_analysis, sheet_name=sheet_name)
+                comparison_results[sheet_name] = comp
 
-        use_storage = os.getenv("USE_STORAGE_SERVICE", "false").lower() == "true"
-        storage = get_storage_service() if use_storage else None
-        processing_id = str(uuid.uuid4()) if use_storage else None
-        response_storage = None
-        if storage is not None and processing_id is not None:
-            try:
-                with open(full_path, "rb") as f:
-                    original_bytes = f.read()
-                original_ref = storage.store_file(data=original_bytes, storage_type=StorageType.ORIGINAL_FILE, filename=file.filename, metadata={"processing_id": processing_id, "type": "excel_comparison"})
-                results_ref = storage.store_json(data={"success": True, "filename": file.filename, "comparison_results": comparison_results}, storage_type=StorageType.PROCESSED_JSON, key_prefix=f"{processing_id}")
-                response_storage = {
-                    "processing_id": processing_id,
-                    "original_file": original_ref.__dict__,
-                    "comparison_results": results_ref.__dict__,
-                    "download_urls": {
-                        "original_file": storage.get_download_url(original_ref),
-                        "comparison_results": storage.get_download_url(results_ref),
-                    },
-                }
+            use_storage = os.getenv("USE_STORAGE_SERVICE", "false").lower() == "true"
+            storage = get_storage_service() if use_storage else None
+            processing_id = str(uuid.uuid4()) if use_storage else None
+            response_storage = None
+            if storage is not None and processing_id is not None:
                 try:
-                    processing_registry.register(processing_id, {"filename": file.filename, "type": "excel_comparison", "storage": response_storage})
+                    with open(full_path, "rb") as f:
+                        original_bytes = f.read()
+                    original_ref = storage.store_file(data=original_bytes, storage_type=StorageType.ORIGINAL_FILE, filename=file.filename, metadata={"processing_id": processing_id, "type": "excel_comparison"})
+                    results_ref = storage.store_json(data={"success": True, "filename": file.filename, "comparison_results": comparison_results}, storage_type=StorageType.PROCESSED_JSON, key_prefix=f"{processing_id}")
+                    response_storage = {
+                        "processing_id": processing_id,
+                        "original_file": original_ref.__dict__,
+                        "comparison_results": results_ref.__dict__,
+                        "download_urls": {
+                            "original_file": storage.get_download_url(original_ref),
+                            "comparison_results": storage.get_download_url(results_ref),
+                        },
+                    }
+                    try:
+                        processing_registry.register(processing_id, {"filename": file.filename, "type": "excel_comparison", "storage": response_storage})
+                    except Exception:
+                        pass
                 except Exception:
-                    pass
-            except Exception:
-                response_storage = None
+                    response_storage = None
 
-        return JSONResponse({
-            "success": True,
-            "filename": file.filename,
-            "comparison_results": comparison_results,
-            **({"storage": response_storage, "processing_id": processing_id} if response_storage else {}),
-        })
+            return EncodedJSONResponse({
+                "success": True,
+                "filename": file.filename,
+                "comparison_results": comparison_results,
+                **({"storage": response_storage, "processing_id": processing_id} if response_storage else {}),
+            })
+
+        return await conversion_executor.run(_convert)
     finally:
         try:
             os.remove(full_path)
@@ -933,20 +1010,19 @@ async def excel_comparison_analysis(file: UploadFile = File(...)):
 
 
 @router.get("/download/")
-def download_json(type: str = "full", file_id: str = ""):
-    cache = getattr(django_like_models, "processed_data_cache", {})
-    if not file_id or file_id not in cache:
-        return JSONResponse({"error": "File not found or expired"}, status_code=404)
-    cached = cache[file_id]
+def download_json(request: Request, type: str = "full", file_id: str = ""):
+    cached = django_like_models.processed_data_cache.get(file_id) if file_id else None
+    if cached is None:
+        return EncodedJSONResponse({"error": "File not found or expired"}, status_code=404)
     filename = cached.get("filename", "data.xlsx")
     fmt = cached.get("format", "verbose")
     if type == "full":
-        content = json.dumps(cached.get("full_data", {}), indent=2)
+        content = json_dumps(cached.get("full_data", {}), indent=True)
         download_filename = f"{os.path.splitext(filename)[0]}_full_data_{fmt}.json"
     else:
-        content = json.dumps(cached.get("table_data", {}), indent=2)
+        content = json_dumps(cached.get("table_data", {}), indent=True)
         download_filename = f"{os.path.splitext(filename)[0]}_table_data_{fmt}.json"
     headers = {"Content-Disposition": f"attachment; filename=\"{download_filename}\""}
-    return Response(content=content, media_type="application/json", headers=headers)
+    return streamed_response(request, [content], "application/json", headers=headers)
 
 
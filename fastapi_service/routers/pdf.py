@@ -1,14 +1,17 @@
 import os
-import json
 import uuid
 import tempfile
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from fastapi import APIRouter, UploadFile, File, HTTPException, Form, BackgroundTasks
-from fastapi.responses import JSONResponse
 from converter.storage_service import get_storage_service, StorageService, StorageType
 from converter.processing_registry import processing_registry
 from converter.html_generator import HTMLGenerator
+from converter.conversion_cache import get_conversion_cache
+from converter.json_serializer import encode as encode_json
+from fastapi_service.conversion_executor import conversion_executor
+from fastapi_service.responses import EncodedJSONResponse
+from fastapi_service.worker import enqueue_conversion_job
 
 # Import processors
 import sys
@@ -20,6 +23,110 @@ from converter.pdf_ai_failover_pipeline import PDFAIFailoverPipeline
 router = APIRouter()
 
 
+def _process_pdf_cached(file_path: str):
+    """Table-removal extraction, reusing the stored result of an identical upload.
+
+    Returns (result, cache_hit).
+    """
+    artifacts, cache_hit = get_conversion_cache().get_or_compute(
+        "pdf_table_removal", file_path, None,
+        lambda: {"processed_json": PDFTableRemovalProcessor().process(file_path)},
+    )
+    return artifacts["processed_json"], cache_hit
+
+
+def run_pdf_upload_job(processing_id: str, file_path: str, payload: Dict[str, Any]) -> None:
+    """Job handler for async /api/pdf/upload/ requests, run by fastapi_service.worker"""
+    filename = payload['filename']
+    with open(file_path, 'rb') as f:
+        file_bytes = f.read()
+
+    result_local, cache_hit = _process_pdf_cached(file_path)
+    result_local_bytes = encode_json(result_local)
+
+    use_storage_service = os.getenv('USE_STORAGE_SERVICE', 'false').lower() == 'true'
+    storage_local: StorageService | None = get_storage_service()
+    response_storage_local = None
+    file_id_local = None
+    download_urls_local = None
+
+    try:
+        original_ref = storage_local.store_file(
+            data=file_bytes,
+            storage_type=StorageType.ORIGINAL_FILE,
+            filename=filename,
+            metadata={'processing_id': processing_id, 'type': 'pdf'}
+        )
+        result_ref = storage_local.store_json(
+            data=result_local,
+            storage_type=StorageType.PROCESSED_JSON,
+            key_prefix=f"{processing_id}",
+            encoded=result_local_bytes,
+        )
+        if use_storage_service:
+            response_storage_local = {
+                'processing_id': processing_id,
+                'original_file': original_ref.__dict__,
+                'processed_json': result_ref.__dict__,
+                'download_urls': {
+                    'original_file': storage_local.get_download_url(original_ref),
+                    'processed_json': storage_local.get_download_url(result_ref),
+                }
+            }
+    except Exception:
+        response_storage_local = None
+
+    if not use_storage_service:
+        try:
+            from converter import models as django_like_models
+            file_id_local = str(uuid.uuid4())
+            django_like_models.processed_data_cache.put(file_id_local, {
+                'full_data': result_local,
+                'table_data': result_local,
+                'filename': filename,
+                'format': 'verbose',
+            }, size_bytes=2 * len(result_local_bytes))
+            download_urls_local = {
+                'full_data': f'/api/download/?type=full&file_id={file_id_local}',
+                'table_data': f'/api/download/?type=table&file_id={file_id_local}',
+            }
+        except Exception:
+            file_id_local = None
+            download_urls_local = None
+    # Write UI index for this run
+    try:
+        from .excel import _build_run_dir  # reuse helper
+        run_dir = _build_run_dir(filename)
+        ui_index_data = {
+            'run_dir': run_dir,
+            'processing_id': processing_id,
+            'filename': filename,
+            'file_type': 'pdf',
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'keys': {
+                'original_file': original_ref.key if 'original_ref' in locals() else None,
+                'processed_json': result_ref.key if 'result_ref' in locals() else None,
+            },
+        }
+        storage_local.put_json(f"runs/{run_dir}/meta/index.json", ui_index_data)
+        print(f"✅ Created UI index for run: {run_dir}")
+    except Exception as e:
+        print(f"❌ Failed to create UI index: {e}")
+        import traceback
+        traceback.print_exc()
+
+    processing_registry.register(processing_id, {
+        'filename': filename,
+        'type': 'pdf',
+        'storage': response_storage_local,
+        'format': 'verbose',
+        'mode': 'table_removal',
+        'cache_hit': cache_hit,
+        **({ 'file_id': file_id_local, 'download_urls': download_urls_local } if file_id_local else {}),
+        'status': 'completed',
+    })
+
+
 @router.post("/pdf/upload/")
 async def upload_and_process_pdf(
     background_tasks: BackgroundTasks,
@@ -45,115 +152,22 @@ async def upload_and_process_pdf(
                 file_bytes = f.read()
 
             processing_id = str(uuid.uuid4())
-            try:
-                processing_registry.register(processing_id, {
-                    'filename': file.filename,
-                    'type': 'pdf',
-                    'status': 'processing',
-                    'mode': 'table_removal',
-                })
-            except Exception:
-                pass
 
-            def _bg_task():
-                from fastapi_service.notification_sender import send_notifications
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as t2:
-                    t2.write(file_bytes)
-                    path2 = t2.name
-                try:
-                    processor_local = PDFTableRemovalProcessor()
-                    result_local = processor_local.process(path2)
-
-                    use_storage_service = os.getenv('USE_STORAGE_SERVICE', 'false').lower() == 'true'
-                    storage_local: StorageService | None = get_storage_service()
-                    response_storage_local = None
-                    file_id_local = None
-                    download_urls_local = None
-
-                    try:
-                        original_ref = storage_local.store_file(
-                            data=file_bytes,
-                            storage_type=StorageType.ORIGINAL_FILE,
-                            filename=file.filename,
-                            metadata={'processing_id': processing_id, 'type': 'pdf'}
-                        )
-                        result_ref = storage_local.store_json(
-                            data=result_local,
-                            storage_type=StorageType.PROCESSED_JSON,
-                            key_prefix=f"{processing_id}"
-                        )
-                        if use_storage_service:
-                            response_storage_local = {
-                                'processing_id': processing_id,
-                                'original_file': original_ref.__dict__,
-                                'processed_json': result_ref.__dict__,
-                                'download_urls': {
-                                    'original_file': storage_local.get_download_url(original_ref),
-                                    'processed_json': storage_local.get_download_url(result_ref),
-                                }
-                            }
-                    except Exception:
-                        response_storage_local = None
-
-                    if not use_storage_service:
-                        try:
-                            from converter import models as django_like_models
-                            file_id_local = str(uuid.uuid4())
-                            django_like_models.processed_data_cache[file_id_local] = {
-                                'full_data': result_local,
-                                'table_data': result_local,
-                                'filename': file.filename,
-                                'format': 'verbose',
-                            }
-                            download_urls_local = {
-                                'full_data': f'/api/download/?type=full&file_id={file_id_local}',
-                                'table_data': f'/api/download/?type=table&file_id={file_id_local}',
-                            }
-                        except Exception:
-                            file_id_local = None
-                            download_urls_local = None
-                    # Write UI index for this run
-                    try:
-                        from .excel import _build_run_dir  # reuse helper
-                        run_dir = _build_run_dir(file.filename)
-                        ui_index_data = {
-                            'run_dir': run_dir,
-                            'processing_id': processing_id,
-                            'filename': file.filename,
-                            'file_type': 'pdf',
-                            'created_at': datetime.now(timezone.utc).isoformat(),
-                            'keys': {
-                                'original_file': original_ref.key if 'original_ref' in locals() else None,
-                                'processed_json': result_ref.key if 'result_ref' in locals() else None,
-                            },
-                        }
-                        storage_local.put_json(f"runs/{run_dir}/meta/index.json", ui_index_data)
-                        print(f"✅ Created UI index for run: {run_dir}")
-                    except Exception as e:
-                        print(f"❌ Failed to create UI index: {e}")
-                        import traceback
-                        traceback.print_exc()
-
-                    processing_registry.register(processing_id, {
-                        'filename': file.filename,
-                        'type': 'pdf',
-                        'storage': response_storage_local,
-                        'format': 'verbose',
-                        'mode': 'table_removal',
-                        **({ 'file_id': file_id_local, 'download_urls': download_urls_local } if file_id_local else {}),
-                        'status': 'completed',
-                    })
-                finally:
-                    try:
-                        os.remove(path2)
-                    except Exception:
-                        pass
-                final_rec = processing_registry.get(processing_id) or {'processing_id': processing_id, 'type': 'pdf', 'status': 'completed'}
-                final_rec['processing_id'] = processing_id
-                send_notifications(record=final_rec, callback_url=callback_url, pubsub_provider=pubsub_provider, pubsub_topic=pubsub_topic)
-
-            background_tasks.add_task(_bg_task)
-            return JSONResponse({
+            # Queue the job durably; the worker stores the original with the results
+            input_key = f"jobs/{processing_id}/input.pdf"
+            get_storage_service().put_bytes(input_key, file_bytes, content_type='application/pdf')
+            enqueue_conversion_job(processing_id, 'pdf_upload', {
+                'input_key': input_key,
+                'delete_input': True,
+                'suffix': '.pdf',
+                'filename': file.filename,
+                'notify': {'callback_url': callback_url, 'pubsub_provider': pubsub_provider, 'pubsub_topic': pubsub_topic},
+            }, record={
+                'filename': file.filename,
+                'type': 'pdf',
+                'mode': 'table_removal',
+            })
+            return EncodedJSONResponse({
                 'accepted': True,
                 'processing_id': processing_id,
                 'status_endpoint': f'/api/status/{processing_id}/',
@@ -163,122 +177,129 @@ async def upload_and_process_pdf(
                 }
             }, status_code=202)
 
-        processor = PDFTableRemovalProcessor()
-        result = processor.process(full_path)
+        def _convert():
+            result, cache_hit = _process_pdf_cached(full_path)
+            result_bytes = encode_json(result)
 
-        use_storage_service = os.getenv('USE_STORAGE_SERVICE', 'false').lower() == 'true'
-        storage: StorageService | None = get_storage_service()
-        processing_id = str(uuid.uuid4())
-        response_storage = None
-        file_id = None
-        download_urls = None
-        try:
-            with open(full_path, 'rb') as f:
-                original_bytes = f.read()
-            original_ref = storage.store_file(
-                data=original_bytes,
-                storage_type=StorageType.ORIGINAL_FILE,
-                filename=file.filename,
-                metadata={'processing_id': processing_id, 'type': 'pdf'}
-            )
-            result_ref = storage.store_json(
-                data=result,
-                storage_type=StorageType.PROCESSED_JSON,
-                key_prefix=f"{processing_id}"
-            )
-            if use_storage_service:
-                response_storage = {
-                    'processing_id': processing_id,
-                    'original_file': original_ref.__dict__,
-                    'processed_json': result_ref.__dict__,
-                    'download_urls': {
-                        'original_file': storage.get_download_url(original_ref),
-                        'processed_json': storage.get_download_url(result_ref),
-                    }
-                }
-        except Exception:
+            use_storage_service = os.getenv('USE_STORAGE_SERVICE', 'false').lower() == 'true'
+            storage: StorageService | None = get_storage_service()
+            processing_id = str(uuid.uuid4())
             response_storage = None
-
-        if not use_storage_service:
-            # Cache result for retrieval via new results endpoints
+            file_id = None
+            download_urls = None
             try:
-                file_id = str(uuid.uuid4())
-                # Reuse the excel cache structure for consistency
-                from converter import models as django_like_models
-                django_like_models.processed_data_cache[file_id] = {
-                    'full_data': result,
-                    'table_data': result,  # PDF result has a single structure; map to both keys for consumers
-                    'filename': file.filename,
-                    'format': 'verbose',
-                }
-                download_urls = {
-                    'full_data': f'/api/download/?type=full&file_id={file_id}',
-                    'table_data': f'/api/download/?type=table&file_id={file_id}',
-                }
+                with open(full_path, 'rb') as f:
+                    original_bytes = f.read()
+                original_ref = storage.store_file(
+                    data=original_bytes,
+                    storage_type=StorageType.ORIGINAL_FILE,
+                    filename=file.filename,
+                    metadata={'processing_id': processing_id, 'type': 'pdf'}
+                )
+                result_ref = storage.store_json(
+                    data=result,
+                    storage_type=StorageType.PROCESSED_JSON,
+                    key_prefix=f"{processing_id}",
+                    encoded=result_bytes,
+                )
+                if use_storage_service:
+                    response_storage = {
+                        'processing_id': processing_id,
+                        'original_file': original_ref.__dict__,
+                        'processed_json': result_ref.__dict__,
+                        'download_urls': {
+                            'original_file': storage.get_download_url(original_ref),
+                            'processed_json': storage.get_download_url(result_ref),
+                        }
+                    }
             except Exception:
-                file_id = None
-                download_urls = None
-        # Store all run artifacts in unified structure
-        try:
-            from .excel import _build_run_dir, _store_run_artifacts, _get_content_type
-            run_dir = _build_run_dir(file.filename)
+                response_storage = None
+
+            if not use_storage_service:
+                # Cache result for retrieval via new results endpoints
+                try:
+                    file_id = str(uuid.uuid4())
+                    # Reuse the excel cache structure for consistency
+                    from converter import models as django_like_models
+                    django_like_models.processed_data_cache.put(file_id, {
+                        'full_data': result,
+                        'table_data': result,  # PDF result has a single structure; map to both keys for consumers
+                        'filename': file.filename,
+                        'format': 'verbose',
+                    }, size_bytes=2 * len(result_bytes))
+                    download_urls = {
+                        'full_data': f'/api/download/?type=full&file_id={file_id}',
+                        'table_data': f'/api/download/?type=table&file_id={file_id}',
+                    }
+                except Exception:
+                    file_id = None
+                    download_urls = None
+            # Store all run artifacts in unified structure
+            try:
+                from .excel import _build_run_dir, _store_run_artifacts, _get_content_type
+                run_dir = _build_run_dir(file.filename)
             
-            # Get the original file data
-            with open(full_path, 'rb') as f:
-                original_file_data = f.read()
+                # Get the original file data
+                with open(full_path, 'rb') as f:
+                    original_file_data = f.read()
             
-            # Calculate processing duration
-            processing_end_time = datetime.now(timezone.utc)
-            processing_duration = (processing_end_time - processing_start_time).total_seconds()
+                # Calculate processing duration
+                processing_end_time = datetime.now(timezone.utc)
+                processing_duration = (processing_end_time - processing_start_time).total_seconds()
             
-            # Prepare metadata
-            meta_for_run = {
-                'run_dir': run_dir,
-                'processing_id': processing_id,
-                'filename': file.filename,
-                'file_type': 'pdf',
-                'created_at': processing_start_time.isoformat(),
-                'completed_at': processing_end_time.isoformat(),
-                'processing_duration_seconds': processing_duration,
-            }
+                # Prepare metadata
+                meta_for_run = {
+                    'run_dir': run_dir,
+                    'processing_id': processing_id,
+                    'filename': file.filename,
+                    'file_type': 'pdf',
+                    'created_at': processing_start_time.isoformat(),
+                    'completed_at': processing_end_time.isoformat(),
+                    'processing_duration_seconds': processing_duration,
+                }
             
-            # For PDF, we don't have separate table_data, so use the main result
-            table_data = result  # PDF result contains tables within the main structure
+                # For PDF, we don't have separate table_data, so use the main result
+                table_data = result  # PDF result contains tables within the main structure
             
-            # Store all artifacts in run-centric structure
-            artifacts = _store_run_artifacts(
-                storage, run_dir, original_file_data, file.filename,
-                result, table_data, meta_for_run
-            )
+                # Store all artifacts in run-centric structure
+                artifacts = _store_run_artifacts(
+                    storage, run_dir, original_file_data, file.filename,
+                    result, table_data, meta_for_run,
+                    json_bytes=result_bytes, table_bytes=result_bytes,
+                )
             
-            print(f"✅ Created unified run storage for: {run_dir}")
-        except Exception as e:
-            print(f"❌ Failed to create unified run storage: {e}")
-            import traceback
-            traceback.print_exc()
+                print(f"✅ Created unified run storage for: {run_dir}")
+            except Exception as e:
+                print(f"❌ Failed to create unified run storage: {e}")
+                import traceback
+                traceback.print_exc()
 
-        if (response_storage is not None) or file_id is not None:
-            try:
-                processing_registry.register(processing_id, {
-                    'filename': file.filename,
-                    'type': 'pdf',
-                    'storage': response_storage,
-                    'format': 'verbose',
-                    'mode': 'table_removal',
-                    **({ 'file_id': file_id, 'download_urls': download_urls } if file_id else {}),
-                })
-            except Exception:
-                pass
+            if (response_storage is not None) or file_id is not None:
+                try:
+                    processing_registry.register(processing_id, {
+                        'filename': file.filename,
+                        'type': 'pdf',
+                        'storage': response_storage,
+                        'format': 'verbose',
+                        'mode': 'table_removal',
+                        'cache_hit': cache_hit,
+                        **({ 'file_id': file_id, 'download_urls': download_urls } if file_id else {}),
+                    })
+                except Exception:
+                    pass
 
-        return JSONResponse({
-            'success': True,
-            'format': 'verbose',
-            'processing_mode': 'table_removal',
-            'result': result,
-            'filename': file.filename,
-            'storage': response_storage,
-            'processing_id': processing_id,
-        })
+            return EncodedJSONResponse({
+                'success': True,
+                'format': 'verbose',
+                'processing_mode': 'table_removal',
+                'cache_hit': cache_hit,
+                'result': result_bytes,
+                'filename': file.filename,
+                'storage': response_storage,
+                'processing_id': processing_id,
+            })
+
+        return await conversion_executor.run(_convert)
     finally:
         try:
             os.remove(full_path)
@@ -315,82 +336,88 @@ async def upload_and_process_pdf_table_removal(
         full_path = tmp.name
 
     try:
-        processor = PDFTableRemovalProcessor()
-        result = processor.process(full_path)
-
-        use_storage_service = os.getenv('USE_STORAGE_SERVICE', 'false').lower() == 'true'
-        storage: StorageService | None = get_storage_service()
-        processing_id = str(uuid.uuid4())
-        response_storage = None
-        file_id = None
-        download_urls = None
-        try:
-            with open(full_path, 'rb') as f:
-                original_bytes = f.read()
-            original_ref = storage.store_file(
-                data=original_bytes,
-                storage_type=StorageType.ORIGINAL_FILE,
-                filename=file.filename,
-                metadata={'processing_id': processing_id, 'type': 'pdf'}
-            )
-            result_ref = storage.store_json(
-                data=result,
-                storage_type=StorageType.PROCESSED_JSON,
-                key_prefix=f"{processing_id}"
-            )
-            if use_storage_service:
-                response_storage = {
-                    'processing_id': processing_id,
-                    'original_file': original_ref.__dict__,
-                    'processed_json': result_ref.__dict__,
-                    'download_urls': {
-                        'original_file': storage.get_download_url(original_ref),
-                        'processed_json': storage.get_download_url(result_ref),
-                    }
-                }
-        except Exception:
+        def _convert():
+            result, cache_hit = _process_pdf_cached(full_path)
+            result_bytes = encode_json(result)
+
+            use_storage_service = os.getenv('USE_STORAGE_SERVICE', 'false').lower() == 'true'
+            storage: StorageService | None = get_storage_service()
+            processing_id = str(uuid.uuid4())
             response_storage = None
+            file_id = None
+            download_urls = None
+            try:
+                with open(full_path, 'rb') as f:
+                    original_bytes = f.read()
+                original_ref = storage.store_file(
+                    data=original_bytes,
+                    storage_type=StorageType.ORIGINAL_FILE,
+                    filename=file.filename,
+                    metadata={'processing_id': processing_id, 'type': 'pdf'}
+                )
+                result_ref = storage.store_json(
+                    data=result,
+                    storage_type=StorageType.PROCESSED_JSON,
+                    key_prefix=f"{processing_id}",
+                    encoded=result_bytes,
+                )
+                if use_storage_service:
+                    response_storage = {
+                        'processing_id': processing_id,
+                        'original_file': original_ref.__dict__,
+                        'processed_json': result_ref.__dict__,
+                        'download_urls': {
+                            'original_file': storage.get_download_url(original_ref),
+                            'processed_json': storage.get_download_url(result_ref),
+                        }
+                    }
+            except Exception:
+                response_storage = None
+
+            if not use_storage_service:
+                try:
+                    from converter import models as django_like_models
+                    file_id = str(uuid.uuid4())
+                    django_like_models.processed_data_cache.put(file_id, {
+                        'full_data': result,
+                        'table_data': result,
+                        'filename': file.filename,
+                        'format': 'verbose',
+                    }, size_bytes=2 * len(result_bytes))
+                    download_urls = {
+                        'full_data': f'/api/download/?type=full&file_id={file_id}',
+                        'table_data': f'/api/download/?type=table&file_id={file_id}',
+                    }
+                except Exception:
+                    file_id = None
+                    download_urls = None
 
-        if not use_storage_service:
             try:
-                from converter import models as django_like_models
-                file_id = str(uuid.uuid4())
-                django_like_models.processed_data_cache[file_id] = {
-                    'full_data': result,
-                    'table_data': result,
+                processing_registry.register(processing_id, {
                     'filename': file.filename,
+                    'type': 'pdf',
+                    'storage': response_storage,
                     'format': 'verbose',
-                }
-                download_urls = {
-                    'full_data': f'/api/download/?type=full&file_id={file_id}',
-                    'table_data': f'/api/download/?type=table&file_id={file_id}',
-                }
+                    'mode': 'table_removal',
+                    'cache_hit': cache_hit,
+                    **({ 'file_id': file_id, 'download_urls': download_urls } if file_id else {}),
+                    'status': 'completed',
+                })
             except Exception:
-                file_id = None
-                download_urls = None
+                pass
 
-        try:
-            processing_registry.register(processing_id, {
+            return EncodedJSONResponse({
+                'success': True,
+                'format': 'verbose',
+                'processing_mode': 'table_removal',
+                'cache_hit': cache_hit,
+                'result': result_bytes,
                 'filename': file.filename,
-                'type': 'pdf',
                 'storage': response_storage,
-                'format': 'verbose',
-                'mode': 'table_removal',
-                **({ 'file_id': file_id, 'download_urls': download_urls } if file_id else {}),
-                'status': 'completed',
+                'processing_id': processing_id,
             })
-        except Exception:
-            pass
 
-        return JSONResponse({
-            'success': True,
-            'format': 'verbose',
-            'processing_mode': 'table_removal',
-            'result': result,
-            'filename': file.filename,
-            'storage': response_storage,
-            'processing_id': processing_id,
-        })
+        return await conversion_executor.run(_convert)
     finally:
         try:
             os.remove(full_path)
@@ -408,58 +435,63 @@ async def upload_and_process_pdf_ai_failover(file: UploadFile = File(...)):
         full_path = tmp.name
 
     try:
-        pipeline = PDFAIFailoverPipeline()
-        result = pipeline.process(full_path)
-
-        use_storage_service = os.getenv('USE_STORAGE_SERVICE', 'false').lower() == 'true'
-        storage: StorageService | None = get_storage_service() if use_storage_service else None
-        processing_id = str(uuid.uuid4()) if use_storage_service else None
-        response_storage = None
-        if storage is not None and processing_id is not None:
-            try:
-                with open(full_path, 'rb') as f:
-                    original_bytes = f.read()
-                original_ref = storage.store_file(
-                    data=original_bytes,
-                    storage_type=StorageType.ORIGINAL_FILE,
-                    filename=file.filename,
-                    metadata={'processing_id': processing_id, 'type': 'pdf'}
-                )
-                result_ref = storage.store_json(
-                    data=result,
-                    storage_type=StorageType.PROCESSED_JSON,
-                    key_prefix=f"{processing_id}"
-                )
-                response_storage = {
-                    'processing_id': processing_id,
-                    'original_file': original_ref.__dict__,
-                    'processed_json': result_ref.__dict__,
-                    'download_urls': {
-                        'original_file': storage.get_download_url(original_ref),
-                        'processed_json': storage.get_download_url(result_ref),
+        def _convert():
+            pipeline = PDFAIFailoverPipeline()
+            result = pipeline.process(full_path)
+            result_bytes = encode_json(result)
+
+            use_storage_service = os.getenv('USE_STORAGE_SERVICE', 'false').lower() == 'true'
+            storage: StorageService | None = get_storage_service() if use_storage_service else None
+            processing_id = str(uuid.uuid4()) if use_storage_service else None
+            response_storage = None
+            if storage is not None and processing_id is not None:
+                try:
+                    with open(full_path, 'rb') as f:
+                        original_bytes = f.read()
+                    original_ref = storage.store_file(
+                        data=original_bytes,
+                        storage_type=StorageType.ORIGINAL_FILE,
+                        filename=file.filename,
+                        metadata={'processing_id': processing_id, 'type': 'pdf'}
+                    )
+                    result_ref = storage.store_json(
+                        data=result,
+                        storage_type=StorageType.PROCESSED_JSON,
+                        key_prefix=f"{processing_id}",
+                        encoded=result_bytes,
+                    )
+                    response_storage = {
+                        'processing_id': processing_id,
+                        'original_file': original_ref.__dict__,
+                        'processed_json': result_ref.__dict__,
+                        'download_urls': {
+                            'original_file': storage.get_download_url(original_ref),
+                            'processed_json': storage.get_download_url(result_ref),
+                        }
                     }
-                }
-            except Exception:
-                response_storage = None
+                except Exception:
+                    response_storage = None
 
-        if response_storage is not None and processing_id is not None:
-            try:
-                processing_registry.register(processing_id, {
-                    'filename': file.filename,
-                    'type': 'pdf',
-                    'storage': response_storage,
-                    'mode': 'ai_failover_routing',
-                })
-            except Exception:
-                pass
+            if response_storage is not None and processing_id is not None:
+                try:
+                    processing_registry.register(processing_id, {
+                        'filename': file.filename,
+                        'type': 'pdf',
+                        'storage': response_storage,
+                        'mode': 'ai_failover_routing',
+                    })
+                except Exception:
+                    pass
 
-        return JSONResponse({
-            'success': True,
-            'processing_mode': 'ai_failover_routing',
-            'result': result,
-            'filename': file.filename,
-            'storage': response_storage
-        })
+            return EncodedJSONResponse({
+                'success': True,
+                'processing_mode': 'ai_failover_routing',
+                'result': result_bytes,
+                'filename': file.filename,
+                'storage': response_storage
+            })
+
+        return await conversion_executor.run(_convert)
     finally:
         try:
             os.remove(full_path)
@@ -511,14 +543,15 @@ def process_pdf_with_options(payload: Dict[str, Any]):
             extract_numbers=extract_numbers
         )
         # No extra compression implemented here; parity with Django is optional
-        result_size = len(json.dumps(result))
+        result_bytes = encode_json(result)
+        result_size = len(result_bytes)
         response_data = {
             'success': True,
             'format': format_type,
-            'result': result,
+            'result': result_bytes,
             'file_info': { 'result_size_mb': result_size / 1024 / 1024 }
         }
-        return JSONResponse(response_data)
+        return EncodedJSONResponse(response_data)
     except Exception as e:
         raise HTTPException(500, f'Processing failed: {str(e)}')
 
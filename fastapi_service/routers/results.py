@@ -1,11 +1,13 @@
-import json
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Request
 
-from converter.processing_registry import processing_registry
+from fastapi_service.responses import EncodedJSONResponse
+from fastapi_service.streaming import StoredObject, json_envelope, stored_object, streamed_response
+from fastapi_service.worker import get_processing_record
 from converter.storage_service import get_storage_service
+from converter.columnar_workbook import load_columnar_workbook
+from converter.json_serializer import dumps
 from converter import models as django_like_models
 
 
@@ -13,49 +15,70 @@ router = APIRouter()
 
 
 def _get_record(processing_id: str) -> Dict[str, Any]:
-    record = processing_registry.get(processing_id)
+    record = get_processing_record(processing_id)
     if record is None:
         raise HTTPException(status_code=404, detail="processing_id not found")
     return record
 
 
-def _get_json_from_storage(key: str) -> Dict[str, Any]:
-    storage = get_storage_service()
+def _stored_object(key: str) -> StoredObject:
+    """Stored artifact to stream; 404 when it is missing"""
     try:
-        return storage.get_json(key)
+        return stored_object(get_storage_service(), key)
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"stored object not found: {str(e)}")
 
 
+def _stream_json(request: Request, payload_field: str, payload, **fields):
+    return streamed_response(request, json_envelope(payload_field, payload, **fields), "application/json")
+
+
 @router.get("/results/{processing_id}/full")
-def get_full_result(processing_id: str):
+def get_full_result(processing_id: str, request: Request):
     record = _get_record(processing_id)
     storage_info: Optional[Dict[str, Any]] = record.get("storage")
 
-    # Prefer storage if available
+    # Prefer storage if available; the stored JSON is streamed without parsing
     if storage_info and storage_info.get("processed_json"):
         key = storage_info["processed_json"].get("key")
         if key:
-            obj = _get_json_from_storage(key)
-            return JSONResponse({"processing_id": processing_id, "data": obj})
+            return _stream_json(request, "data", _stored_object(key), processing_id=processing_id)
+    if storage_info and storage_info.get("processed_columnar"):
+        key = storage_info["processed_columnar"].get("key")
+        if key:
+            try:
+                obj = load_columnar_workbook(get_storage_service(), key)
+            except Exception as e:
+                raise HTTPException(status_code=404, detail=f"stored object not found: {str(e)}")
+            return _stream_json(request, "data", dumps(obj), processing_id=processing_id)
 
     # Fallback to cache if present
     file_id = record.get("file_id")
-    cache = getattr(django_like_models, "processed_data_cache", {})
-    if file_id and file_id in cache:
-        cached = cache[file_id]
-        return JSONResponse({
-            "processing_id": processing_id,
-            "data": cached.get("full_data"),
-            "filename": cached.get("filename"),
-            "format": cached.get("format", "verbose"),
-        })
+    cached = django_like_models.processed_data_cache.get(file_id) if file_id else None
+    if cached is not None:
+        return _stream_json(
+            request, "data", dumps(cached.get("full_data")),
+            processing_id=processing_id,
+            filename=cached.get("filename"),
+            format=cached.get("format", "verbose"),
+        )
 
     raise HTTPException(status_code=404, detail="full result not available")
 
 
+@router.get("/results/{processing_id}/columnar")
+def get_columnar_result(processing_id: str, request: Request):
+    """Stored columnar (Arrow IPC / Parquet) copy of the full result, as raw bytes"""
+    record = _get_record(processing_id)
+    columnar_ref = (record.get("storage") or {}).get("processed_columnar")
+    if not columnar_ref or not columnar_ref.get("key"):
+        raise HTTPException(status_code=404, detail="columnar result not available")
+    return streamed_response(request, [_stored_object(columnar_ref["key"])],
+                             columnar_ref.get("content_type") or "application/octet-stream")
+
+
 @router.get("/results/{processing_id}/table")
-def get_table_result(processing_id: str):
+def get_table_result(processing_id: str, request: Request):
     record = _get_record(processing_id)
     storage_info: Optional[Dict[str, Any]] = record.get("storage")
 
@@ -63,45 +86,40 @@ def get_table_result(processing_id: str):
     if storage_info:
         table_ref = storage_info.get("table_data")
         if table_ref and table_ref.get("key"):
-            obj = _get_json_from_storage(table_ref["key"])
-            return JSONResponse({"processing_id": processing_id, "table_data": obj})
+            return _stream_json(request, "table_data", _stored_object(table_ref["key"]), processing_id=processing_id)
         # Fallback for PDF storage which only stores processed_json
         processed_ref = storage_info.get("processed_json")
         if processed_ref and processed_ref.get("key"):
-            obj = _get_json_from_storage(processed_ref["key"])
-            return JSONResponse({"processing_id": processing_id, "table_data": obj})
+            return _stream_json(request, "table_data", _stored_object(processed_ref["key"]), processing_id=processing_id)
 
     # Fallback to cache
     file_id = record.get("file_id")
-    cache = getattr(django_like_models, "processed_data_cache", {})
-    if file_id and file_id in cache:
-        cached = cache[file_id]
-        if "table_data" in cached:
-            return JSONResponse({
-                "processing_id": processing_id,
-                "table_data": cached.get("table_data"),
-                "filename": cached.get("filename"),
-                "format": cached.get("format", "verbose"),
-            })
+    cached = django_like_models.processed_data_cache.get(file_id) if file_id else None
+    if cached is not None and "table_data" in cached:
+        return _stream_json(
+            request, "table_data", dumps(cached.get("table_data")),
+            processing_id=processing_id,
+            filename=cached.get("filename"),
+            format=cached.get("format", "verbose"),
+        )
 
     raise HTTPException(status_code=404, detail="table result not available")
 
 
 @router.get("/results/{processing_id}/meta")
-def get_meta_result(processing_id: str):
+def get_meta_result(processing_id: str, request: Request):
     record = _get_record(processing_id)
 
     # Prefer summary if present (Excel large file flow populates this now)
     if "summary" in record:
-        return JSONResponse({"processing_id": processing_id, "summary": record["summary"]})
+        return EncodedJSONResponse({"processing_id": processing_id, "summary": record["summary"]})
 
     # Try complexity metadata in storage
     storage_info: Optional[Dict[str, Any]] = record.get("storage")
     if storage_info and storage_info.get("complexity_results"):
         key = storage_info["complexity_results"].get("key")
         if key:
-            obj = _get_json_from_storage(key)
-            return JSONResponse({"processing_id": processing_id, "meta": obj})
+            return _stream_json(request, "meta", _stored_object(key), processing_id=processing_id)
 
     # Nothing else available
     raise HTTPException(status_code=404, detail="metadata not available")
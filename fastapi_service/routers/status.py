@@ -1,6 +1,13 @@
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from typing import Optional
+
+from fastapi import APIRouter, Query
+from converter.job_queue import get_job_queue
+from converter.models import processed_data_cache
 from converter.processing_registry import processing_registry
+from converter.storage_service import storage_registry
+from fastapi_service.conversion_executor import conversion_executor
+from fastapi_service.responses import EncodedJSONResponse
+from fastapi_service.worker import get_processing_record
 
 router = APIRouter()
 
@@ -10,11 +17,45 @@ def health_check():
     return {"status": "healthy", "service": "Excel to JSON Converter", "version": "1.0.0"}
 
 
+@router.get("/metrics/executor/")
+def executor_metrics():
+    return conversion_executor.metrics()
+
+
+@router.get("/metrics/jobs/")
+def job_queue_metrics():
+    return get_job_queue().counts()
+
+
+@router.get("/metrics/result-cache/")
+def result_cache_metrics():
+    return processed_data_cache.stats()
+
+
+@router.get("/metrics/storage/")
+def storage_metrics():
+    """Per-backend storage call counts, errors and latency since startup."""
+    return storage_registry.metrics.snapshot()
+
+
+@router.get("/status/")
+def list_statuses(status: Optional[str] = None,
+                  limit: int = Query(50, ge=1, le=500),
+                  offset: int = Query(0, ge=0)):
+    """Page through processing records, newest first."""
+    return {
+        "items": processing_registry.list(status=status, limit=limit, offset=offset),
+        "total": processing_registry.count(status=status),
+        "limit": limit,
+        "offset": offset,
+    }
+
+
 @router.get("/status/{processing_id}/")
 def get_status(processing_id: str):
-    rec = processing_registry.get(processing_id)
+    rec = get_processing_record(processing_id)
     if rec is None:
-        return JSONResponse({"processing_id": processing_id, "status": "not_found"}, status_code=404)
-    return JSONResponse({"processing_id": processing_id, **rec}, status_code=200)
+        return EncodedJSONResponse({"processing_id": processing_id, "status": "not_found"}, status_code=404)
+    return EncodedJSONResponse({"processing_id": processing_id, **rec}, status_code=200)
 
 
@@ -1,12 +1,14 @@
 import json
 from typing import Any, Dict, Optional
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Response
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 import mimetypes
 from converter.storage_service import (
     StorageType,
+    get_async_storage_service,
     get_storage_service,
 )
+from fastapi_service.streaming import stored_object, streamed_response
 
 router = APIRouter()
 
@@ -27,10 +29,10 @@ async def storage_store_file(file: UploadFile = File(...), storage_type: str = Q
         except Exception:
             raise HTTPException(400, "metadata must be valid JSON")
 
-    storage = get_storage_service()
+    storage = get_async_storage_service()
     data = await file.read()
-    ref = storage.store_file(data=data, storage_type=st, filename=file.filename, metadata=meta)
-    url = storage.get_download_url(ref)
+    ref = await storage.store_file(data=data, storage_type=st, filename=file.filename, metadata=meta)
+    url = storage.storage.get_download_url(ref)
     return JSONResponse({"reference": ref.__dict__, "download_url": url}, status_code=201)
 
 
@@ -50,21 +52,21 @@ async def storage_store_json(payload: Dict[str, Any]):
     key_prefix = payload.get("key_prefix", "")
     metadata = payload.get("metadata", {})
 
-    storage = get_storage_service()
-    ref = storage.store_json(data=data, storage_type=st, key_prefix=key_prefix, metadata=metadata)
-    url = storage.get_download_url(ref)
+    storage = get_async_storage_service()
+    ref = await storage.store_json(data=data, storage_type=st, key_prefix=key_prefix, metadata=metadata)
+    url = storage.storage.get_download_url(ref)
     return JSONResponse({"reference": ref.__dict__, "download_url": url}, status_code=201)
 
 
 @router.get("/get")
-def storage_get(key: str = Query(...)):
+def storage_get(request: Request, key: str = Query(...)):
     storage = get_storage_service()
     try:
-        data = storage.get_bytes(key)
+        obj = stored_object(storage, key)
     except Exception as e:
         raise HTTPException(404, str(e))
     guessed, _ = mimetypes.guess_type(key)
-    return Response(content=data, media_type=guessed or "application/octet-stream")
+    return streamed_response(request, [obj], guessed or "application/octet-stream")
 
 
 @router.get("/get-json/")
@@ -6,6 +6,9 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import HTMLResponse
 
 from converter.storage_service import get_storage_service
+from converter.columnar_workbook import load_columnar_workbook
+from converter.json_serializer import RawJSON
+from fastapi_service.responses import EncodedJSONResponse
 from converter.metadata_analyzer import MetadataAnalyzer
 
 
@@ -122,21 +125,27 @@ def get_run_data(run_dir: str):
     # Load artifacts from the new unified structure
     artifacts = meta.get("artifacts", {})
     
-    # Load processed JSON
+    # Stored artifacts are passed through as raw JSON bytes
+    # Load processed JSON, or rebuild it from the columnar copy
     if artifacts.get("processed_json"):
         try:
-            data["full"] = storage.get_json(artifacts["processed_json"])
+            data["full"] = RawJSON(storage.get_bytes(artifacts["processed_json"]))
+        except Exception:
+            pass
+    if "full" not in data and artifacts.get("processed_columnar"):
+        try:
+            data["full"] = load_columnar_workbook(storage, artifacts["processed_columnar"])
         except Exception:
             pass
     
     # Load table data
     if artifacts.get("table_data"):
         try:
-            data["tables"] = storage.get_json(artifacts["table_data"])
+            data["tables"] = RawJSON(storage.get_bytes(artifacts["table_data"]))
         except Exception:
             pass
     
-    return data
+    return EncodedJSONResponse(data)
 
 
 @router.get("/run/{run_dir}/html", response_class=HTMLResponse)
@@ -0,0 +1,229 @@
+"""Streamed HTTP responses over stored objects and in-memory bytes.
+
+A body is a list of segments: ``bytes`` or a ``StoredObject`` read in chunks
+from the storage service. JSON envelopes are written around a stored payload
+without loading or parsing it. A single ``Range`` is answered with 206 and the
+identity encoding; otherwise JSON and text bodies are compressed with zstd or
+gzip when ``Accept-Encoding`` allows it.
+
+Objects stored compressed (STORAGE_COMPRESSION) are sent as stored when the
+client accepts their encoding; zstd payloads are spliced between separately
+compressed envelope frames. Otherwise they are decoded on the fly.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+from converter.content_encoding import available_encodings, compress, iter_compress, iter_decompress
+from converter.json_serializer import dumps, dumps_object
+from converter.storage_service import StorageService
+
+
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+# Encodings whose stored frames can be concatenated with freshly compressed
+# ones. gzip allows multiple members too, but several HTTP clients only read the first.
+SPLICEABLE_ENCODINGS = ("zstd",)
+
+
+class StoredObject(NamedTuple):
+    storage: StorageService
+    key: str
+    size: int
+    # content encoding of the stored bytes; size is the stored (compressed) size
+    encoding: Optional[str] = None
+
+
+Segment = Union[bytes, StoredObject]
+
+
+class RangeNotSatisfiable(ValueError):
+    pass
+
+
+def stored_object(storage: StorageService, key: str) -> StoredObject:
+    """Segment for a stored object; raises if the key does not exist."""
+    reference = storage.head(key)
+    return StoredObject(storage, key, reference.size_bytes, reference.content_encoding)
+
+
+def json_envelope(payload_field: str, payload: Segment, **fields: Any) -> List[Segment]:
+    """``{**fields, payload_field: payload}`` with the payload segment left unparsed."""
+    head = dumps_object(fields)[:-1]
+    if fields:
+        head += b","
+    return [head + dumps(payload_field) + b":", payload, b"}"]
+
+
+def _segment_size(segment: Segment) -> int:
+    return segment.size if isinstance(segment, StoredObject) else len(segment)
+
+
+def iter_segments(segments: Iterable[Segment], start: int, end: int) -> Iterator[bytes]:
+    """Yield bytes [start, end) of the concatenated segments."""
+    offset = 0
+    for segment in segments:
+        size = _segment_size(segment)
+        lo, hi = max(start - offset, 0), min(end - offset, size)
+        offset += size
+        if lo >= hi:
+            continue
+        if isinstance(segment, StoredObject):
+            yield from segment.storage.iter_bytes(segment.key, lo, hi)
+        else:
+            yield segment[lo:hi]
+
+
+def parse_range(header: Optional[str], total: int) -> Optional[Tuple[int, int]]:
+    """[start, end) of a single ``bytes=`` range, or None to serve the whole body.
+
+    Multiple or malformed ranges are ignored, as RFC 9110 allows.
+    """
+    if not header or not header.strip().lower().startswith("bytes="):
+        return None
+    spec = header.strip()[6:].strip()
+    if "," in spec or "-" not in spec:
+        return None
+    first, last = (part.strip() for part in spec.split("-", 1))
+    if not (first or last) or not all(part.isdigit() for part in (first, last) if part):
+        return None
+    if first:
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        end = int(last) + 1 if last else total
+    else:
+        start, end = max(total - int(last), 0), total
+    if start >= total or end <= start:
+        raise RangeNotSatisfiable(header)
+    return start, min(end, total)
+
+
+def _accept_weights(accept_encoding: Optional[str]) -> Dict[str, float]:
+    weights = {}
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+    return weights
+
+
+def _accepts(weights: Dict[str, float], encoding: str) -> bool:
+    return weights.get(encoding, weights.get("*", 0.0)) > 0
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """'zstd', 'gzip' or None (identity) for an Accept-Encoding header.
+
+    The highest q-value wins; on ties zstd is preferred. zstd is only offered
+    when the zstandard package is installed.
+    """
+    weights = _accept_weights(accept_encoding)
+    best, best_q = None, 0.0
+    for name in available_encodings():
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def _level(encoding: str) -> int:
+    return ZSTD_LEVEL if encoding == "zstd" else GZIP_LEVEL
+
+
+def _forwardable(segments: List[Segment], weights: Dict[str, float]) -> Optional[List[Segment]]:
+    """Segments as sent in the stored encoding, or None if it cannot be forwarded.
+
+    A lone stored object goes out as-is; with an envelope, each in-memory
+    segment becomes its own frame around the stored ones.
+    """
+    encodings = {segment.encoding for segment in segments if isinstance(segment, StoredObject)}
+    if len(encodings) != 1:
+        return None
+    encoding = encodings.pop()
+    if encoding is None or not _accepts(weights, encoding):
+        return None
+    if len(segments) == 1:
+        return segments
+    if encoding not in SPLICEABLE_ENCODINGS:
+        return None
+    return [segment if isinstance(segment, StoredObject) else compress(segment, encoding, _level(encoding))
+            for segment in segments if not isinstance(segment, bytes) or segment]
+
+
+def _iter_decoded(segments: Iterable[Segment]) -> Iterator[bytes]:
+    for segment in segments:
+        if not isinstance(segment, StoredObject):
+            yield segment
+        elif segment.encoding:
+            yield from iter_decompress(segment.storage.iter_bytes(segment.key), segment.encoding)
+        else:
+            yield from segment.storage.iter_bytes(segment.key)
+
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.startswith("text/") or media_type == "application/json" or media_type.endswith("+json")
+
+
+def streamed_response(request: Request, segments: List[Segment], media_type: str,
+                      headers: Optional[dict] = None) -> Response:
+    """Stream segments, honouring Range and negotiating content-encoding."""
+    headers = {"Accept-Ranges": "bytes", **(headers or {})}
+    stored_encoding = next((s.encoding for s in segments if isinstance(s, StoredObject) and s.encoding), None)
+    if stored_encoding:
+        headers["Vary"] = "Accept-Encoding"
+        weights = _accept_weights(request.headers.get("accept-encoding"))
+        forwarded = _forwardable(segments, weights)
+        if forwarded is None:
+            # Decoded size is unknown up front: no Content-Length and no ranges
+            headers["Accept-Ranges"] = "none"
+            body = _iter_decoded(segments)
+            encoding = negotiate_encoding(request.headers.get("accept-encoding")) if _is_compressible(media_type) else None
+            if encoding:
+                headers["Content-Encoding"] = encoding
+                body = iter_compress(body, encoding, _level(encoding))
+            return StreamingResponse(body, media_type=media_type, headers=headers)
+        # Ranges and lengths now refer to the encoded representation
+        headers["Content-Encoding"] = stored_encoding
+        segments = forwarded
+
+    total = sum(_segment_size(segment) for segment in segments)
+    try:
+        byte_range = parse_range(request.headers.get("range"), total)
+    except RangeNotSatisfiable:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{total}"})
+
+    if byte_range is not None:
+        start, end = byte_range
+        headers.update({"Content-Range": f"bytes {start}-{end - 1}/{total}", "Content-Length": str(end - start)})
+        return StreamingResponse(iter_segments(segments, start, end), status_code=206,
+                                 media_type=media_type, headers=headers)
+
+    body: Iterator[bytes] = iter_segments(segments, 0, total)
+    encoding = None
+    if _is_compressible(media_type) and not stored_encoding:
+        headers["Vary"] = "Accept-Encoding"
+        if total >= MIN_COMPRESS_BYTES:
+            encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        body = iter_compress(body, encoding, _level(encoding))
+    else:
+        headers["Content-Length"] = str(total)
+    return StreamingResponse(body, media_type=media_type, headers=headers)
@@ -0,0 +1,225 @@
+"""Standalone conversion worker that pulls jobs from the durable job queue.
+
+Run one or more per host next to the web tier:
+
+    python -m fastapi_service.worker --concurrency 2
+
+``--concurrency`` runs worker threads; conversions are CPU-bound, so start
+several worker processes to use several cores.
+Web processes also start ``JOB_QUEUE_EMBEDDED_WORKERS`` (default 1) worker
+threads of their own; set it to 0 when dedicated workers are deployed.
+Embedded workers run each conversion on the web process's conversion
+executor, so its worker bound and metrics cover queued jobs too.
+Workers and web processes must share the job queue (JOB_QUEUE_PATH or
+REDIS_URL) and the storage backend, since job inputs are staged in storage.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import socket
+import tempfile
+import threading
+import traceback
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from converter.job_queue import Job, JobQueue, get_job_queue
+from converter.processing_registry import processing_registry
+from converter.storage_service import get_storage_service
+
+
+# Job type -> "module:function"; handlers take (processing_id, input_path, payload)
+JOB_HANDLERS: Dict[str, str] = {
+    "excel_upload": "fastapi_service.routers.excel:run_excel_upload_job",
+    "pdf_upload": "fastapi_service.routers.pdf:run_pdf_upload_job",
+}
+
+
+def _resolve_handler(job_type: str) -> Callable[[str, str, Dict[str, Any]], None]:
+    target = JOB_HANDLERS.get(job_type)
+    if target is None:
+        raise ValueError(f"Unknown job type: {job_type}")
+    module_name, func_name = target.split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def enqueue_conversion_job(processing_id: str, job_type: str, payload: Dict[str, Any],
+                           record: Dict[str, Any], queue: Optional[JobQueue] = None) -> None:
+    """Queue a job and mark it 'queued' in the processing registry."""
+    queue = queue or get_job_queue()
+    record = {**record, "status": "queued"}
+    queue.enqueue(processing_id, job_type, payload, record=record,
+                  max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", "3")))
+    processing_registry.register(processing_id, record)
+    start_embedded_workers()
+
+
+def get_processing_record(processing_id: str) -> Optional[Dict[str, Any]]:
+    """Registry record for ``processing_id``, overlaid with the job queue's view.
+
+    The job queue is shared between processes, so it knows the state of jobs
+    run by other workers even when this process's registry does not.
+    """
+    record = processing_registry.get(processing_id)
+    job = get_job_queue().get(processing_id)
+    if job is None:
+        return record
+    merged = {**(record or {}), **job.record, "status": job.status}
+    if job.error:
+        merged["error"] = job.error
+    return merged
+
+
+class JobWorker:
+    """Claims jobs one at a time and drives their registry status transitions."""
+
+    def __init__(self, queue: Optional[JobQueue] = None, worker_id: Optional[str] = None,
+                 lease_seconds: Optional[float] = None, poll_interval: float = 1.0,
+                 executor: Optional[Any] = None) -> None:
+        self.queue = queue or get_job_queue()
+        # A ConversionExecutor to run handlers on; None runs them on this thread
+        self.executor = executor
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = lease_seconds or float(os.getenv("JOB_LEASE_SECONDS", "300"))
+        self.poll_interval = poll_interval
+
+    def run_once(self) -> bool:
+        """Process one job if any is runnable; returns False when the queue was idle."""
+        job = self.queue.claim(self.worker_id, self.lease_seconds)
+        if job is None:
+            return False
+        self._process(job)
+        return True
+
+    def run_forever(self, stop_event: Optional[threading.Event] = None) -> None:
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            try:
+                if not self.run_once():
+                    stop_event.wait(self.poll_interval)
+            except Exception:
+                # Queue backend hiccups must not kill the worker
+                traceback.print_exc()
+                stop_event.wait(self.poll_interval)
+
+    def _set_record(self, job: Job, record: Dict[str, Any]) -> None:
+        processing_registry.register(job.id, record)
+        self.queue.update_record(job.id, record)
+
+    def _process(self, job: Job) -> None:
+        self._set_record(job, {**job.record, "status": "processing", "attempts": job.attempts})
+
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job, stop_heartbeat), daemon=True)
+        heartbeat.start()
+        input_path = None
+        try:
+            input_path = self._stage_input(job.payload)
+            handler = _resolve_handler(job.job_type)
+            if self.executor is None:
+                handler(job.id, input_path, job.payload)
+            else:
+                self.executor.submit_when_free(handler, job.id, input_path, job.payload).result()
+        except Exception as e:
+            traceback.print_exc()
+            record = {**(processing_registry.get(job.id) or job.record), "status": "failed", "error": str(e)}
+            processing_registry.register(job.id, record)
+            self.queue.fail(job.id, str(e), record)
+        else:
+            record = {**(processing_registry.get(job.id) or job.record), "status": "completed"}
+            processing_registry.register(job.id, record)
+            self.queue.complete(job.id, record)
+        finally:
+            stop_heartbeat.set()
+            if input_path:
+                try:
+                    os.remove(input_path)
+                except Exception:
+                    pass
+            if job.payload.get("delete_input"):
+                try:
+                    get_storage_service().delete(job.payload["input_key"])
+                except Exception:
+                    pass
+
+        self._notify(job, record)
+
+    def _heartbeat(self, job: Job, stop_event: threading.Event) -> None:
+        while not stop_event.wait(self.lease_seconds / 3):
+            try:
+                self.queue.extend_lease(job.id, self.worker_id, self.lease_seconds)
+            except Exception:
+                pass
+
+    def _stage_input(self, payload: Dict[str, Any]) -> str:
+        """Copy the job's input from storage to a local temp file."""
+        data = get_storage_service().get_bytes(payload["input_key"])
+        with tempfile.NamedTemporaryFile(delete=False, suffix=payload.get("suffix", "")) as tmp:
+            tmp.write(data)
+            return tmp.name
+
+    def _notify(self, job: Job, record: Dict[str, Any]) -> None:
+        notify = job.payload.get("notify") or {}
+        if not any(notify.values()):
+            return
+        from fastapi_service.notification_sender import send_notifications
+        send_notifications(record={**record, "processing_id": job.id}, **notify)
+
+
+_embedded_lock = threading.Lock()
+_embedded_threads: List[threading.Thread] = []
+
+
+def start_embedded_workers(count: Optional[int] = None) -> None:
+    """Start in-process worker threads once per process (JOB_QUEUE_EMBEDDED_WORKERS).
+
+    Their conversions run on the shared conversion executor, alongside request handlers.
+    """
+    if count is None:
+        count = int(os.getenv("JOB_QUEUE_EMBEDDED_WORKERS", "1"))
+    if count <= 0:
+        return
+    from fastapi_service.conversion_executor import conversion_executor
+    with _embedded_lock:
+        for _ in range(count - len(_embedded_threads)):
+            worker = JobWorker(executor=conversion_executor)
+            thread = threading.Thread(target=worker.run_forever, name="embedded-job-worker", daemon=True)
+            thread.start()
+            _embedded_threads.append(thread)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run conversion workers against the job queue")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("JOB_WORKER_CONCURRENCY", "1")),
+                        help="Worker threads in this process")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to sleep when the queue is idle")
+    parser.add_argument("--once", action="store_true", help="Drain runnable jobs and exit")
+    args = parser.parse_args(argv)
+
+    if args.once:
+        worker = JobWorker(poll_interval=args.poll_interval)
+        while worker.run_once():
+            pass
+        return
+
+    stop_event = threading.Event()
+    threads = [threading.Thread(target=JobWorker(poll_interval=args.poll_interval).run_forever,
+                                args=(stop_event,), name=f"job-worker-{i}")
+               for i in range(max(args.concurrency, 1))]
+    for thread in threads:
+        thread.start()
+    print(f"✅ Started {len(threads)} conversion worker(s) on {type(get_job_queue()).__name__}")
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        stop_event.set()
+        for thread in threads:
+            thread.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Columnar Output Benchmark
+
+Compares the compact workbook JSON (json.dumps / json.loads, as stored by
+StorageService.put_json) against the columnar Arrow IPC and Parquet
+encodings: encoded size, encode time and decode time back to the dict shape.
+Runs on a synthetic workbook of numeric rows with labels, styles, formulas
+and RLE runs, and on any .xlsx files given with --files.
+
+Usage:
+    python scripts/benchmark_columnar_output.py [--rows N] [--cols N] [--repeat N] [--files PATH ...]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from converter.columnar_workbook import COLUMNAR_FORMATS, decode_columnar_workbook, encode_columnar_workbook
+
+
+def synthetic_workbook(rows: int, cols: int, seed: int = 0):
+    """Compact workbook with a label column, numeric/formula cells and a trailing None run per row"""
+    rnd = random.Random(seed)
+    data = []
+    for r in range(1, rows + 1):
+        cells = [[1, f"Line item {r}", "s1"]]
+        for c in range(2, cols + 1):
+            if rnd.random() < 0.2:
+                cells.append([c, round(rnd.random() * 1000, 2), "s2", f"=SUM(A{r}:B{r})"])
+            else:
+                cells.append([c, rnd.randint(0, 100000)])
+        cells.append([cols + 1, None, "s3", None, 50])
+        data.append({'r': r, 'cells': cells})
+    return {
+        'workbook': {
+            'meta': {'filename': 'synthetic.xlsx'},
+            'styles': {'s1': {'font': {'bold': True}}, 's2': {'number_format': '0.00'}, 's3': {}},
+            'sheets': [{'name': 'Sheet1', 'dimensions': [1, 1, rows, cols + 50], 'rows': data}],
+        },
+    }
+
+
+def workbook_from_file(path: str):
+    from converter.complexity_preserving_compact_processor import ComplexityPreservingCompactProcessor
+
+    processor = ComplexityPreservingCompactProcessor(enable_rle=True)
+    return processor.process_file(path, filter_empty_trailing=True, include_complexity_metadata=True)
+
+
+def best_of(repeat: int, fn):
+    best, result = float('inf'), None
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_case(name: str, workbook, repeat: int) -> None:
+    encode_json = lambda: json.dumps(workbook, separators=(",", ":")).encode("utf-8")  # noqa: E731
+    json_encode_s, json_bytes = best_of(repeat, encode_json)
+    json_decode_s, expected = best_of(repeat, lambda: json.loads(json_bytes.decode("utf-8")))
+    print(f"{name:<28} {'json':<8} {len(json_bytes):>12} {json_encode_s:>9.3f} {json_decode_s:>9.3f}")
+
+    for fmt in COLUMNAR_FORMATS:
+        encode_s, payload = best_of(repeat, lambda: encode_columnar_workbook(workbook, fmt))
+        decode_s, decoded = best_of(repeat, lambda: decode_columnar_workbook(payload))
+        status = '' if decoded == expected else '  (round trip differs!)'
+        print(f"{'':<28} {fmt:<8} {len(payload):>12} {encode_s:>9.3f} {decode_s:>9.3f}{status}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark columnar workbook output against JSON')
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--cols', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case; best time is reported')
+    parser.add_argument('--files', nargs='*', default=[], help='Excel files to convert and benchmark')
+    args = parser.parse_args()
+
+    print("=== Columnar Output Benchmark ===\n")
+    header = f"{'case':<28} {'format':<8} {'bytes':>12} {'encode s':>9} {'decode s':>9}"
+    print(header)
+    print('-' * len(header))
+    run_case(f"synthetic {args.rows}x{args.cols}", synthetic_workbook(args.rows, args.cols), args.repeat)
+    for path in args.files:
+        run_case(os.path.basename(path)[:28], workbook_from_file(path), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Excel Ingestion Benchmark
+
+Compares the CompactExcelProcessor ingestion modes on the Excel fixtures.
+Each (file, mode) pair runs in a fresh subprocess so the reported peak RSS
+reflects that conversion alone. In 'parallel' mode the peak RSS is that of
+the coordinating process; sheet workers are separate processes.
+
+Usage:
+    python scripts/benchmark_excel_ingestion.py [--files PATH ...] [--modes MODE ...] [--repeat N] [--workers N]
+"""
+
+import argparse
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from converter.compact_excel_processor import CompactExcelProcessor
+
+DEFAULT_FIXTURES = os.path.join(PROJECT_ROOT, 'tests', 'fixtures', 'excel', '*.xlsx')
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def run_single(file_path: str, mode: str, workers: int = None) -> dict:
+    """Convert one file in this process and report timing and memory"""
+    baseline_rss = _peak_rss_mb()
+    processor = CompactExcelProcessor(ingestion_mode=mode, max_workers=workers)
+    start = time.perf_counter()
+    result = processor.process_file(file_path)
+    elapsed = time.perf_counter() - start
+    return {
+        'file': os.path.basename(file_path),
+        'mode': mode,
+        'seconds': elapsed,
+        'peak_rss_mb': _peak_rss_mb(),
+        'baseline_rss_mb': baseline_rss,
+        'sheets': len(result.get('workbook', {}).get('sheets', [])),
+    }
+
+
+def run_isolated(file_path: str, mode: str, workers: int = None) -> dict:
+    """Run a single conversion in a fresh interpreter"""
+    command = [sys.executable, os.path.abspath(__file__), '--child', file_path, mode]
+    if workers:
+        command += ['--workers', str(workers)]
+    completed = subprocess.run(command, capture_output=True, text=True, check=True)
+    # The processors print progress; the measurement is the last stdout line
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark Excel ingestion modes')
+    parser.add_argument('--files', nargs='*', help='Excel files to benchmark (default: tests/fixtures/excel)')
+    parser.add_argument('--modes', nargs='*', default=list(CompactExcelProcessor.INGESTION_MODES))
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per (file, mode); best time is reported')
+    parser.add_argument('--workers', type=int, help="Worker processes for 'parallel' mode (default: CPU count)")
+    parser.add_argument('--child', nargs=2, metavar=('FILE', 'MODE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_single(*args.child, workers=args.workers)))
+        return
+
+    files = args.files or sorted(glob.glob(DEFAULT_FIXTURES))
+
+    print("=== Excel Ingestion Benchmark ===\n")
+    header = f"{'file':<60} {'mode':<12} {'seconds':>9} {'peak RSS MB':>12}"
+    print(header)
+    print('-' * len(header))
+
+    for file_path in files:
+        results = {}
+        for mode in args.modes:
+            runs = [run_isolated(file_path, mode, args.workers) for _ in range(max(args.repeat, 1))]
+            best = min(runs, key=lambda r: r['seconds'])
+            best['peak_rss_mb'] = min(r['peak_rss_mb'] for r in runs)
+            results[mode] = best
+            print(f"{best['file'][:60]:<60} {mode:<12} {best['seconds']:>9.3f} {best['peak_rss_mb']:>12.1f}")
+
+        if 'dual_load' in results:
+            base = results['dual_load']
+            for mode, res in results.items():
+                if mode == 'dual_load':
+                    continue
+                speedup = base['seconds'] / res['seconds'] if res['seconds'] else float('inf')
+                rss_delta = res['peak_rss_mb'] - base['peak_rss_mb']
+                print(f"{'':<60} {mode:<12} speedup x{speedup:.2f}, RSS {rss_delta:+.1f} MB vs dual_load")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Style Interning Micro-Benchmark
+
+Builds a workbook with thousands of distinct cell styles and times style
+reference lookups in CompactExcelProcessor against the previous linear scan,
+which re-serialised every registered style for each cell. Both strategies
+must produce the same registry.
+
+Usage:
+    python scripts/benchmark_style_interning.py [--styles N] [--repeats N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+from converter.compact_excel_processor import CompactExcelProcessor
+
+
+def build_workbook(path: str, distinct_styles: int, repeats: int) -> None:
+    """Write a sheet whose rows cycle through ``distinct_styles`` styles ``repeats`` times"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sizes = [8, 9, 10, 11, 12, 14]
+    row = 1
+    for _ in range(repeats):
+        for index in range(distinct_styles):
+            cell = sheet.cell(row=row, column=1 + index % 10, value=index)
+            cell.font = Font(bold=index % 2 == 0, size=sizes[index % len(sizes)],
+                             color=f"FF{index * 2654435761 % 0xFFFFFF:06X}")
+            cell.fill = PatternFill("solid", fgColor=f"FF{(index * 40503) % 0xFFFFFF:06X}")
+            cell.border = Border(bottom=Side(style="thin" if index % 3 else "thick"))
+            cell.alignment = Alignment(horizontal="right" if index % 2 else "left")
+            cell.number_format = "#,##0.00" if index % 4 else "0%"
+            if index % 10 == 9:
+                row += 1
+        row += 1
+    workbook.save(path)
+
+
+def legacy_get_style_reference(processor: CompactExcelProcessor, cell):
+    """The original lookup: build the dict, then scan and re-serialise the registry"""
+    style_dict = processor._extract_cell_style_dict(cell)
+    if not style_dict:
+        return None
+    style_key = processor._create_style_key(style_dict)
+    for style_id, existing_style in processor.style_registry.items():
+        if processor._create_style_key(existing_style) == style_key:
+            return style_id
+    style_id = f"s{processor.next_style_id}"
+    processor.next_style_id += 1
+    processor.style_registry[style_id] = style_dict
+    return style_id
+
+
+def time_lookups(cells, lookup) -> float:
+    start = time.perf_counter()
+    for cell in cells:
+        lookup(cell)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark compact style interning')
+    parser.add_argument('--styles', type=int, default=2000, help='Distinct styles in the workbook')
+    parser.add_argument('--repeats', type=int, default=2, help='Times each style is reused')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'styles.xlsx')
+        build_workbook(path, args.styles, args.repeats)
+        workbook = load_workbook(path)
+
+    cells = [cell for row in workbook.active.iter_rows() for cell in row if cell.value is not None]
+    print("=== Style Interning Benchmark ===\n")
+    print(f"cells: {len(cells):,}   distinct styles requested: {args.styles:,}\n")
+
+    legacy = CompactExcelProcessor()
+    legacy._reset_style_registry()
+    legacy_seconds = time_lookups(cells, lambda cell: legacy_get_style_reference(legacy, cell))
+
+    interned = CompactExcelProcessor()
+    interned._reset_style_registry()
+    interned_seconds = time_lookups(cells, interned._get_style_reference)
+
+    assert interned.style_registry == legacy.style_registry, "style registries differ"
+    assert list(interned.style_registry) == list(legacy.style_registry), "style ids differ"
+
+    print(f"{'strategy':<12} {'seconds':>9} {'cells/s':>12}")
+    for name, seconds in (('linear scan', legacy_seconds), ('interned', interned_seconds)):
+        print(f"{name:<12} {seconds:>9.3f} {len(cells) / seconds:>12,.0f}")
+    print(f"\nregistered styles: {len(interned.style_registry):,}")
+    print(f"speedup: x{legacy_seconds / interned_seconds:.1f}")
+
+
+if __name__ == "__main__":
+    main()
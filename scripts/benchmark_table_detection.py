@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Table Detection Benchmark
+
+Times TableDetector.detect_tables on synthetic sheets of the compact row
+format: a dense block of numeric rows with text labels and periodic blank
+rows separating sections, plus a sparse variant with few occupied cells
+spread over the same bounding box. Each case runs on every selected
+detection engine ('python' grid walk, 'numpy' vectorized).
+
+Usage:
+    python scripts/benchmark_table_detection.py [--rows N] [--cols N] [--repeat N] [--engines ENGINE ...]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from converter.table_detector import TABLE_DETECTION_ENGINES, get_table_detector
+
+
+def dense_sheet(rows: int, cols: int, section_every: int = 50, seed: int = 0):
+    """Label column plus numeric columns, with a blank row and a header row every ``section_every`` rows"""
+    rnd = random.Random(seed)
+    data = []
+    for r in range(1, rows + 1):
+        position = (r - 1) % section_every
+        if position == section_every - 1:
+            continue  # blank separator row
+        if position == 0:
+            cells = [[1, f"Section {r // section_every + 1}"]] + [[c, f"Period {c - 1}"] for c in range(2, cols + 1)]
+        else:
+            cells = [[1, f"Line item {r}"]] + [[c, round(rnd.random() * 1000, 2)] for c in range(2, cols + 1)]
+        data.append({'r': r, 'cells': cells})
+    return data
+
+
+def sparse_sheet(rows: int, cols: int, occupied: int, seed: int = 0):
+    """``occupied`` random cells scattered over a rows x cols bounding box"""
+    rnd = random.Random(seed)
+    by_row = {}
+    for _ in range(occupied):
+        by_row.setdefault(rnd.randint(1, rows), {})[rnd.randint(1, cols)] = rnd.randint(0, 1000)
+    return [{'r': r, 'cells': [[c, v] for c, v in sorted(row.items())]} for r, row in sorted(by_row.items())]
+
+
+def time_detection(engine: str, data, dims, options, repeat: int) -> float:
+    detector = get_table_detector(engine)
+    best = float('inf')
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        detector.detect_tables(data, dims, options)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark TableDetector.detect_tables')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--cols', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case; best time is reported')
+    parser.add_argument('--engines', nargs='*', default=list(TABLE_DETECTION_ENGINES), choices=TABLE_DETECTION_ENGINES)
+    args = parser.parse_args()
+
+    dims = [1, 1, args.rows, args.cols]
+    cases = [
+        ('dense', dense_sheet(args.rows, args.cols), {}),
+        ('dense + gaps', dense_sheet(args.rows, args.cols), {'table_detection': {'use_gaps': True}}),
+        ('sparse (1k cells)', sparse_sheet(args.rows, args.cols, 1000), {}),
+    ]
+
+    print(f"=== Table Detection Benchmark ({args.rows} x {args.cols}) ===\n")
+    header = f"{'case':<24} {'engine':<8} {'cells':>10} {'seconds':>9}"
+    print(header)
+    print('-' * len(header))
+    for name, data, options in cases:
+        cell_count = sum(len(row['cells']) for row in data)
+        for engine in args.engines:
+            seconds = time_detection(engine, data, dims, options, args.repeat)
+            print(f"{name:<24} {engine:<8} {cell_count:>10} {seconds:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -84,6 +84,60 @@ class TestFastAPIBasic:
         assert body['filename'] == 'test.xlsx'
         assert 'processing_id' in body
 
+    def test_duplicate_excel_upload_is_served_from_conversion_cache(self):
+        files = {'file': ('dup.xlsx', self._create_minimal_xlsx(), 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
+        first = self.client.post('/api/upload/', files=files).json()
+        second = self.client.post('/api/upload/', files=files).json()
+
+        assert first['cache_hit'] is False
+        assert second['cache_hit'] is True
+        assert second['data'] == first['data']
+        assert second['processing_id'] != first['processing_id']
+
+    def test_excel_upload_parallel_sheets(self):
+        xlsx_bytes = self._create_minimal_xlsx()
+        files = {'file': ('test.xlsx', xlsx_bytes, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
+        resp = self.client.post('/api/upload/', files=files, data={'parallel_sheets': 'true'})
+        assert resp.status_code == 200
+        assert resp.json()['success'] is True
+
+    def test_excel_upload_rejected_when_executor_saturated(self, monkeypatch):
+        import threading
+        from fastapi_service.conversion_executor import ConversionExecutor
+        from fastapi_service.routers import excel
+
+        saturated = ConversionExecutor(max_workers=1, max_queue=0)
+        release = threading.Event()
+        monkeypatch.setattr(excel, 'conversion_executor', saturated)
+        try:
+            saturated.submit(release.wait)
+            files = {'file': ('test.xlsx', self._create_minimal_xlsx(), 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
+            resp = self.client.post('/api/upload/', files=files)
+            assert resp.status_code == 429
+            assert int(resp.headers['retry-after']) >= 1
+        finally:
+            release.set()
+            saturated.shutdown()
+
+    def test_executor_metrics(self):
+        resp = self.client.get('/api/metrics/executor/')
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body['max_workers'] >= 1
+        assert {'active', 'queued', 'utilization', 'rejected'} <= set(body)
+
+    def test_status_listing(self):
+        xlsx_bytes = self._create_minimal_xlsx()
+        files = {'file': ('listed.xlsx', xlsx_bytes, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')}
+        processing_id = self.client.post('/api/upload/', files=files).json()['processing_id']
+
+        resp = self.client.get('/api/status/?status=completed&limit=5')
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body['total'] >= 1 and body['limit'] == 5
+        assert any(item['processing_id'] == processing_id for item in body['items'])
+        assert self.client.get('/api/status/?limit=0').status_code == 422
+
     def test_excel_download_cache_fallback(self):
         # Seed the in-memory cache used by Django impl and our FastAPI wrapper
         from converter import models as django_like_models
@@ -0,0 +1,82 @@
+import json
+import random
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from converter.columnar_workbook import (
+    COLUMNAR_FORMATS,
+    decode_columnar_workbook,
+    encode_columnar_workbook,
+    get_columnar_output_format,
+    load_columnar_workbook,
+    read_cell_table,
+    store_columnar_workbook,
+)
+from converter.storage_service import LocalStorageService
+
+
+def _workbook(rows):
+    return {
+        'workbook': {
+            'meta': {'filename': 'book.xlsx'},
+            'styles': {'s1': {'font': {'bold': True}}},
+            'sheets': [
+                {'name': 'Data', 'dimensions': [1, 1, 9, 9], 'rows': rows},
+                {'name': 'Empty', 'rows': []},
+                {'name': 'Chart'},
+            ],
+        },
+        'table_data': {'workbook': {'sheets': [{'name': 'Data', 'tables': []}]}},
+    }
+
+
+EDGE_ROWS = [
+    {'r': 1, 'cells': [[1, 'Label', 's1'], [2, 3.5], [3, 7, None, '=A1*2'], [4, None, 's1', None, 12]], 'style': 's1'},
+    {'r': 2, 'cells': [[1, True], [2, False], [3, 2 ** 70], [4, ['nested', 1]], [5, '']]},
+    {'r': 3, 'cells': []},
+    {'r': 4},
+    {'cells': [[1, 'no row number']]},
+    {'r': 'x', 'cells': [[-1, 'negative col'], [2, 'x', 5], [3, 1, 's1', '=B1', 2, 'extra'], 'not a list']},
+]
+
+
+@pytest.mark.parametrize('fmt', COLUMNAR_FORMATS)
+def test_round_trip_matches_json(fmt):
+    data = _workbook(EDGE_ROWS)
+    assert decode_columnar_workbook(encode_columnar_workbook(data, fmt)) == json.loads(json.dumps(data))
+
+
+@pytest.mark.parametrize('fmt', COLUMNAR_FORMATS)
+def test_large_workbook_is_smaller_than_json_and_columnar(fmt):
+    rnd = random.Random(0)
+    rows = [{'r': r, 'cells': [[1, f'Item {r}', 's1']] + [[c, rnd.randint(0, 10 ** 6)] for c in range(2, 30)]
+             + [[30, None, None, None, 40]]} for r in range(1, 2001)]
+    data = _workbook(rows)
+
+    payload = encode_columnar_workbook(data, fmt)
+    table = read_cell_table(payload)
+
+    assert len(payload) < len(json.dumps(data, separators=(',', ':'))) / 2
+    assert table.num_rows == 2000 * 30
+    assert set(table.column_names) >= {'sheet', 'row', 'col', 'int_value', 'style', 'formula'}
+    assert decode_columnar_workbook(payload) == data
+
+
+def test_storage_round_trip_and_format_selection(tmp_path, monkeypatch):
+    storage = LocalStorageService(base_dir=str(tmp_path))
+    data = _workbook(EDGE_ROWS[:2])
+
+    ref = store_columnar_workbook(storage, 'run/processed.parquet', data, 'parquet')
+
+    assert ref.content_type == 'application/vnd.apache.parquet'
+    assert load_columnar_workbook(storage, 'run/processed.parquet') == json.loads(json.dumps(data))
+
+    monkeypatch.delenv('COLUMNAR_OUTPUT_FORMAT', raising=False)
+    assert get_columnar_output_format() is None
+    monkeypatch.setenv('COLUMNAR_OUTPUT_FORMAT', 'Arrow')
+    assert get_columnar_output_format() == 'arrow'
+    monkeypatch.setenv('COLUMNAR_OUTPUT_FORMAT', 'feather')
+    with pytest.raises(ValueError):
+        get_columnar_output_format()
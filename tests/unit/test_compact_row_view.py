@@ -0,0 +1,74 @@
+import random
+
+from converter.anthropic_excel_client import AnthropicExcelClient
+from converter.compact_excel_processor import CompactExcelProcessor
+from converter.compact_row_view import CellSpan, RowView, cell_span
+
+
+def _random_row(seed):
+    rnd = random.Random(seed)
+    cells, col = [], rnd.randint(1, 3)
+    for _ in range(rnd.randint(0, 12)):
+        value = rnd.choice([None, 'a', 'b', 1, 2.5, True])
+        if rnd.random() < 0.3:
+            run = rnd.randint(2, 6)
+            cells.append([col, value, rnd.choice([None, 's1']), None, run])
+            col += run
+        else:
+            cells.append([col, value])
+            col += 1
+        if rnd.random() < 0.15:
+            col -= rnd.randint(1, 4)  # overlapping and out-of-order cells
+    return {'r': seed, 'cells': cells}
+
+
+def test_cell_span_reads_plain_and_rle_cells():
+    assert cell_span([3, 'x']) == CellSpan(3, 3, 'x', None, None)
+    assert cell_span([3, 'x', 's1', '=A1']) == CellSpan(3, 3, 'x', 's1', '=A1')
+    assert cell_span([3, None, 's1', None, 4]) == CellSpan(3, 6, None, 's1', None)
+    # A trailing run of 1 is a plain cell
+    assert cell_span([3, 0, None, None, 1]).width == 1
+
+
+def test_wide_runs_are_not_expanded():
+    view = RowView({'r': 1, 'cells': [[1, 'Label'], [2, None, None, None, 16383]]})
+
+    assert len(view) == 2 and view.max_col == 16384 and view.width == 16384
+    assert view.value(10000, 'missing') is None and view.value(16385, 'missing') == 'missing'
+    assert view.spans_between(16000, 20000) == [CellSpan(16000, 16384, None, None, None)]
+
+
+def test_point_queries_match_an_expanded_lookup():
+    processor = CompactExcelProcessor()
+    for seed in range(300):
+        row = _random_row(seed)
+        expanded = {cell[0]: cell[1] for cell in processor.expand_rle_cells(row)['cells']}
+        view = RowView(row)
+
+        for col in range(0, 40):
+            assert view.has(col) == (col in expanded), (seed, col)
+            assert view.value(col, 'missing') == expanded.get(col, 'missing'), (seed, col)
+        assert view.dense_values(view.max_col, '') == [expanded.get(c, '') for c in range(1, view.max_col + 1)]
+        covered = [c for span in view.spans_between(5, 12) for c in range(span.col_start, span.col_end + 1)]
+        assert covered == sorted(c for c in expanded if 5 <= c <= 12), seed
+
+
+def test_table_data_columns_use_run_values():
+    rows = [
+        {'r': 1, 'cells': [[1, 'Item'], [2, 'Q', None, None, 2]]},
+        {'r': 2, 'cells': [[1, 'Cash'], [2, 0, None, None, 3]]},
+    ]
+    table = CompactExcelProcessor()._generate_table_data({'sheets': [{'name': 'S', 'rows': rows}]})['workbook']['sheets'][0]['tables'][0]
+
+    assert table['range'] == 'A1:D2'
+    assert table['headers'] == ['Item', 'Q', 'Q']
+    assert table['data'] == [['Cash', 0, 0, 0]]
+    assert [c['column_id'] for c in table['columns']] == [1, 2, 3]
+    assert table['columns'][2]['cells']['C2']['headers']['row_headers'] == [{'value': 'Cash'}]
+
+
+def test_prompt_prints_runs_as_column_ranges():
+    client = AnthropicExcelClient.__new__(AnthropicExcelClient)
+    sheet = {'rows': [{'r': 4, 'cells': [[1, 'Total', 's1'], [2, 0, 's2', '=A1', 5], [7, 9, None, '=B2']]}]}
+
+    assert client._prepare_data_for_prompt(sheet) == 'Row 4: Col1:Total, Col2-6:0, Col7:9'
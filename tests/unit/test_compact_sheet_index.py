@@ -0,0 +1,55 @@
+from converter.compact_sheet_index import CompactSheetIndex
+from converter.compact_table_processor import CompactTableProcessor
+from converter.sheet_grid import SheetGrid
+
+
+ROWS = [
+    {'r': 1, 'cells': [[1, 'Revenue table']]},
+    {'r': 2, 'cells': [[3, 'Q2'], [1, 'Item'], [2, 'Q1'], [2, 'ignored duplicate']]},
+    {'r': 3, 'cells': [[1, 'Widgets'], [2, 10], [3, 2.5, 's1', None, 4]]},
+    {'r': 5, 'cells': [[1, 'Flag'], [2, True], [3, None]]},
+]
+
+
+def test_value_lookups_use_the_first_cell_at_a_column():
+    index = CompactSheetIndex(ROWS)
+
+    assert index.value(2, 2) == 'Q1'
+    assert index.value(3, 3) == 2.5
+    assert index.value(4, 1) is None
+    assert index.has_cell(5, 3) and not index.has_cell(5, 4)
+    assert index.rows_between(2, 10) == [2, 3, 5]
+
+
+def test_region_counters_weight_rle_runs_and_skip_bools():
+    index = CompactSheetIndex(ROWS)
+    whole = {'start_row': 1, 'end_row': 5, 'start_col': 1, 'end_col': 3}
+
+    # 1 + 4 + (3 cells incl. the RLE run of 4) + 2 (None skipped)
+    assert index.count_cells(whole) == 1 + 4 + 6 + 2
+    assert index.count_numeric_cells(whole) == 1 + 4
+    assert index.count_cells({'start_row': 3, 'end_row': 3, 'start_col': 2, 'end_col': 2}) == 1
+
+
+def test_grid_is_built_once_and_reused_by_the_detector():
+    index = CompactSheetIndex(ROWS)
+    assert index.grid is index.grid
+    assert isinstance(index.grid, SheetGrid)
+    assert index.grid.count(3, 1, 3) == 3
+
+
+def test_processor_output_matches_for_many_tables_on_one_sheet():
+    rows, r = [], 1
+    for t in range(5):
+        rows.append({'r': r, 'cells': [[1, f'Cost table {t}']]})
+        rows.append({'r': r + 1, 'cells': [[c, f'Head {c}'] for c in range(1, 5)]})
+        rows += [{'r': r + 2 + i, 'cells': [[1, f'Item {i}']] + [[c, i * c] for c in range(2, 5)]} for i in range(3)]
+        r += 10
+    workbook = {'workbook': {'sheets': [{'name': 'S', 'rows': rows, 'dimensions': [1, 1, r, 4]}]}}
+
+    tables = CompactTableProcessor().transform_to_compact_table_format(workbook, {})['workbook']['sheets'][0]['tables']
+
+    assert [t['title'] for t in tables] == [f'Cost table {t}' for t in range(5)]
+    assert [t['region'] for t in tables[:2]] == [[2, 1, 5, 4], [12, 1, 15, 4]]
+    assert tables[1]['labels']['rows'][-3:] == ['Item 0', 'Item 1', 'Item 2']
+    assert all(t['meta']['cells'] == 16 and t['meta']['numeric_cells'] == 9 for t in tables)
@@ -0,0 +1,126 @@
+import os
+import re
+
+import pytest
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+from converter.complexity_preserving_compact_processor import ComplexityPreservingCompactProcessor
+from converter.excel_processor import ExcelProcessor
+
+
+FIXTURES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "fixtures", "excel"))
+
+
+def _reference_sheet_metadata(processor, sheet):
+    """Complexity metadata derived from the verbose ExcelProcessor output, as computed before"""
+    cells = sheet["cells"]
+    dims = sheet["dimensions"]
+    min_col, max_col = dims["min_col"], dims["max_col"]
+
+    patterns = []
+    complex_merges = 0
+    for merge in sheet["merged_cells"]:
+        start_row, start_col = merge["start_row"] or 0, merge["start_column"] or 0
+        rows_spanned = (merge["end_row"] or 0) - start_row + 1
+        cols_spanned = (merge["end_column"] or 0) - start_col + 1
+        complex_merges += rows_spanned > 2 or cols_spanned > 2
+        patterns.append({"start_row": start_row, "start_col": start_col,
+                         "rows_spanned": rows_spanned, "cols_spanned": cols_spanned})
+
+    header_rows, inconsistencies = [], 0
+    for row in range(1, min(dims["max_row"], 10) + 1):
+        coords = [f"{get_column_letter(col)}{row}" for col in range(min_col, max_col + 1)]
+        values = [str(cells[c]["value"]) for c in coords if c in cells and cells[c]["value"] is not None]
+        gaps = sum(1 for c in coords if c not in cells)
+        if values:
+            text_ratio = sum(isinstance(v, str) for v in values) / len(values)
+            header_rows.append({"row": row, "cell_count": len(values), "gaps": gaps,
+                                "text_ratio": text_ratio, "is_header_like": text_ratio > 0.7})
+            if gaps > 0:
+                inconsistencies += gaps / (max_col - min_col + 1)
+
+    total = (dims["max_row"] - dims["min_row"] + 1) * (max_col - min_col + 1)
+    data_cells = len([c for c in cells.values() if c["value"] is not None and str(c["value"]).strip()])
+    valued = [coord for coord, c in cells.items() if c["value"] is not None]
+    row_gaps = processor._find_gaps(sorted({int(re.search(r"\d+", c).group()) for c in valued}))
+    col_gaps = processor._find_gaps(sorted({column_index_from_string(re.search(r"[A-Z]+", c).group()) for c in valued}))
+    distribution = {"sparsity": 0.0, "clusters": []} if not cells else {
+        "sparsity": 1.0 - data_cells / total, "total_addressable": total, "data_cells": data_cells,
+        "row_gaps": row_gaps[:5], "col_gaps": col_gaps[:5],
+        "clustered": len(row_gaps) > 3 or len(col_gaps) > 3,
+    }
+
+    formulas = [c["formula"] for c in cells.values() if c["formula"]]
+    formula_types = {}
+    for formula in formulas:
+        category = processor._categorize_formula(formula)
+        formula_types[category] = formula_types.get(category, 0) + 1
+    complex_count = sum(processor._is_complex_formula(f) for f in formulas)
+
+    columns = {}
+    for col in range(min_col, min(max_col + 1, min_col + 20)):
+        letter = get_column_letter(col)
+        values = [cells[f"{letter}{row}"]["value"] for row in range(dims["min_row"], dims["max_row"] + 1)
+                  if f"{letter}{row}" in cells and cells[f"{letter}{row}"]["value"] is not None]
+        if len(values) > 1:
+            types = {}
+            for value in values:
+                types[type(value).__name__] = types.get(type(value).__name__, 0) + 1
+            columns[letter] = 0.0 if len(types) == 1 else min((len(types) - 1) / len(values), 1.0)
+    scores = list(columns.values())
+
+    return {
+        "dimensions": dims,
+        "cell_count": len(cells),
+        "merged_cells": {"count": len(patterns), "complex_merges": complex_merges, "patterns": patterns},
+        "header_structure": {"detected_levels": sum(hr["is_header_like"] for hr in header_rows),
+                             "inconsistency_score": min(inconsistencies, 1.0),
+                             "header_rows": header_rows[:5]},
+        "data_distribution": distribution,
+        "formulas": {"formula_count": len(formulas), "complex_formula_count": complex_count,
+                     "formula_ratio": len(formulas) / len(cells) if cells else 0,
+                     "complex_ratio": complex_count / len(formulas) if formulas else 0,
+                     "formula_types": formula_types},
+        "columns": {"column_count": len(columns),
+                    "average_inconsistency": sum(scores) / len(scores) if scores else 0,
+                    "high_inconsistency_columns": len([s for s in scores if s > 0.3])},
+    }
+
+
+@pytest.mark.parametrize("filename", [
+    "pDD10b - Exos_2023_financials.xlsx",
+    "ai_failover_complex_merges.xlsx",
+    "ai_failover_sparse_clusters.xlsx",
+    "ai_failover_multi_level_headers.xlsx",
+])
+@pytest.mark.parametrize("mode", ["single_pass", "streaming"])
+def test_accumulated_metadata_matches_verbose_analysis(filename, mode):
+    path = os.path.join(FIXTURES_DIR, filename)
+    processor = ComplexityPreservingCompactProcessor(ingestion_mode=mode)
+
+    metadata = processor.process_file(path)["complexity_metadata"]["sheets"]
+
+    verbose = ExcelProcessor().process_file(path)
+    expected = {sheet["name"]: _reference_sheet_metadata(processor, sheet)
+                for sheet in verbose["workbook"]["sheets"]}
+    assert metadata == expected
+
+
+def test_complexity_metadata_does_not_run_verbose_processor(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("verbose ExcelProcessor pass should not run")
+
+    monkeypatch.setattr(ExcelProcessor, "process_file", fail)
+    path = os.path.join(FIXTURES_DIR, "Test_SpreadSheet_100_numbers.xlsx")
+
+    result = ComplexityPreservingCompactProcessor().process_file(path)
+
+    assert result["complexity_metadata"]["sheets"]
+
+
+def test_metadata_omitted_when_not_requested():
+    path = os.path.join(FIXTURES_DIR, "Test_SpreadSheet_100_numbers.xlsx")
+
+    result = ComplexityPreservingCompactProcessor().process_file(path, include_complexity_metadata=False)
+
+    assert "complexity_metadata" not in result
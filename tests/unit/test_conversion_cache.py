@@ -0,0 +1,163 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from converter import conversion_cache as conversion_cache_module
+from converter.conversion_cache import ConversionCache, pipeline_fingerprint, pipeline_modules
+from converter.storage_service import LocalStorageService
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ConversionCache(storage=LocalStorageService(str(tmp_path / "storage")))
+
+
+@pytest.fixture
+def upload(tmp_path):
+    path = tmp_path / "book.xlsx"
+    path.write_bytes(b"workbook bytes")
+    return str(path)
+
+
+def _counting_compute(calls):
+    def compute():
+        calls.append(1)
+        return {"processed_json": {"sheets": len(calls)}, "table_data": {"tables": []}}
+    return compute
+
+
+def test_identical_upload_is_served_from_cache(cache, upload):
+    calls = []
+    first, first_hit = cache.get_or_compute("excel_compact", upload, {"enable_comparison": False}, _counting_compute(calls))
+    second, second_hit = cache.get_or_compute("excel_compact", upload, {"enable_comparison": False}, _counting_compute(calls))
+
+    assert (first_hit, second_hit) == (False, True)
+    assert second == first
+    assert len(calls) == 1
+
+
+def test_options_and_content_are_part_of_the_key(cache, upload, tmp_path):
+    calls = []
+    cache.get_or_compute("excel_compact", upload, {"enable_comparison": False}, _counting_compute(calls))
+    _, hit = cache.get_or_compute("excel_compact", upload, {"enable_comparison": True}, _counting_compute(calls))
+    assert hit is False
+
+    other = tmp_path / "other.xlsx"
+    other.write_bytes(b"different bytes")
+    _, hit = cache.get_or_compute("excel_compact", str(other), {"enable_comparison": False}, _counting_compute(calls))
+    assert hit is False
+    assert len(calls) == 3
+
+
+def test_pipeline_change_invalidates_entries(cache, upload, monkeypatch):
+    calls = []
+    cache.get_or_compute("pdf_table_removal", upload, None, _counting_compute(calls))
+
+    monkeypatch.setattr(conversion_cache_module, "pipeline_fingerprint", lambda pipeline: "f" * 64)
+    _, hit = cache.get_or_compute("pdf_table_removal", upload, None, _counting_compute(calls))
+
+    assert hit is False
+    assert len(calls) == 2
+
+
+def test_incomplete_entry_is_a_miss(cache, upload):
+    key = cache.entry_key("excel_compact", "abc", {})
+    cache.storage.put_json(f"{key}/processed_json.json", {"partial": True})
+
+    assert cache.get(key) is None
+
+
+def test_disabled_cache_always_computes(tmp_path, upload):
+    cache = ConversionCache(storage=LocalStorageService(str(tmp_path / "s")), enabled=False)
+    calls = []
+    cache.get_or_compute("excel_compact", upload, None, _counting_compute(calls))
+    _, hit = cache.get_or_compute("excel_compact", upload, None, _counting_compute(calls))
+    assert hit is False and len(calls) == 2
+
+
+def _pdf_result(filename, timestamp):
+    metadata = {"filename": filename, "processing_timestamp": timestamp, "processing_duration": 12.5, "total_pages": 3}
+    return {"processed_json": {"pdf_processing_result": {"document_metadata": metadata}}}
+
+
+def test_run_fields_are_not_stored_and_describe_the_serving_run(cache, upload, tmp_path):
+    first, _ = cache.get_or_compute("pdf_table_removal", upload, None,
+                                    lambda: _pdf_result("book.xlsx", "2020-01-01T00:00:00"))
+    assert first["processed_json"]["pdf_processing_result"]["document_metadata"]["filename"] == "book.xlsx"
+
+    stored = cache.get(cache.entry_key("pdf_table_removal", conversion_cache_module.hash_file(upload)))
+    assert stored["processed_json"]["pdf_processing_result"]["document_metadata"] == {"total_pages": 3}
+
+    again = tmp_path / "again.pdf"
+    again.write_bytes(b"workbook bytes")
+    second, hit = cache.get_or_compute("pdf_table_removal", str(again), None, lambda: pytest.fail("recomputed"))
+    metadata = second["processed_json"]["pdf_processing_result"]["document_metadata"]
+
+    assert hit is True
+    assert metadata["filename"] == "again.pdf"
+    assert metadata["processing_timestamp"] > "2020-01-01T00:00:00"
+    assert metadata["processing_duration"] < 12.5
+    assert metadata["total_pages"] == 3
+
+
+def test_run_fields_match_wildcard_keys():
+    artifacts = {"table_data": {"complexity_analysis": {
+        "Sheet1": {"processing_metadata": {"analysis_timestamp": "t1"}},
+        "Sheet2": {"processing_metadata": {"analysis_timestamp": "t2"}},
+    }}}
+    path = ("table_data", "complexity_analysis", "*", "processing_metadata", "analysis_timestamp")
+
+    slots = list(conversion_cache_module._run_field_slots(artifacts, path))
+
+    assert sorted(container[key] for container, key in slots) == ["t1", "t2"]
+
+
+def test_fingerprint_is_stable_and_rejects_unknown_pipelines():
+    assert pipeline_fingerprint("excel_compact") == pipeline_fingerprint("excel_compact")
+    assert pipeline_fingerprint("excel_compact") != pipeline_fingerprint("pdf_table_removal")
+    with pytest.raises(ValueError):
+        pipeline_fingerprint("nope")
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+FIXTURES_DIR = os.path.join(REPO_ROOT, "tests", "fixtures")
+
+# Runs one pipeline in a fresh interpreter and prints the converter modules it loaded
+_PIPELINE_RUNS = {
+    "excel_compact": """
+from converter.complexity_preserving_compact_processor import ComplexityPreservingCompactProcessor
+from converter.excel_complexity_analyzer import ExcelComplexityAnalyzer
+from converter.compact_table_processor import CompactTableProcessor
+data = ComplexityPreservingCompactProcessor(enable_rle=True).process_file(
+    PATH, filter_empty_trailing=True, include_complexity_metadata=True)
+analyzer = ExcelComplexityAnalyzer()
+results = {s["name"]: analyzer.analyze_sheet_complexity(s) for s in data["workbook"]["sheets"]}
+CompactTableProcessor().transform_to_compact_table_format(data, {"complexity_results": results})
+""",
+    "pdf_table_removal": """
+from converter.pdf.table_removal import PDFTableRemovalProcessor
+PDFTableRemovalProcessor().process(PATH)
+""",
+}
+
+_PIPELINE_INPUTS = {
+    "excel_compact": os.path.join(FIXTURES_DIR, "excel", "Test_SpreadSheet_100_numbers.xlsx"),
+    "pdf_table_removal": os.path.join(FIXTURES_DIR, "pdfs", "Test_PDF_Table_9_numbers.pdf"),
+}
+
+
+@pytest.mark.parametrize("pipeline", sorted(_PIPELINE_RUNS))
+def test_fingerprint_covers_every_module_the_pipeline_loads(pipeline):
+    script = (f"import json, sys\nPATH = {_PIPELINE_INPUTS[pipeline]!r}\n" + _PIPELINE_RUNS[pipeline] +
+              "print(json.dumps(sorted(m for m in sys.modules if m == 'converter' or m.startswith('converter.'))))")
+    # The numpy engine is imported lazily; selecting it checks that lazy imports are followed
+    env = {**os.environ, "TABLE_DETECTION_ENGINE": "numpy", "PDF_PAGE_WORKERS": "1"}
+    completed = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, env=env,
+                               capture_output=True, text=True, check=True)
+    loaded = set(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    assert loaded
+    assert loaded <= set(pipeline_modules(pipeline))
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import pytest
+
+from fastapi_service.conversion_executor import ConversionExecutor, ExecutorSaturatedError
+
+
+def test_run_returns_result_off_the_calling_thread():
+    executor = ConversionExecutor(max_workers=2, max_queue=1)
+    try:
+        caller = threading.get_ident()
+        worker = asyncio.run(executor.run(threading.get_ident))
+        assert worker != caller
+        assert executor.metrics()["completed"] == 1
+    finally:
+        executor.shutdown()
+
+
+def test_rejects_with_retry_after_when_queue_is_full():
+    executor = ConversionExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = executor.submit(release.wait)
+        waiting = executor.submit(release.wait)
+
+        with pytest.raises(ExecutorSaturatedError) as excinfo:
+            executor.submit(release.wait)
+
+        assert excinfo.value.status_code == 429
+        assert int(excinfo.value.headers["Retry-After"]) >= 1
+        metrics = executor.metrics()
+        assert metrics["active"] + metrics["queued"] == 2
+        assert metrics["rejected"] == 1
+
+        release.set()
+        running.result(timeout=5)
+        waiting.result(timeout=5)
+        assert executor.metrics()["utilization"] == 0
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_failed_tasks_are_counted_and_reraised():
+    executor = ConversionExecutor(max_workers=1, max_queue=0)
+    try:
+        with pytest.raises(ZeroDivisionError):
+            asyncio.run(executor.run(lambda: 1 / 0))
+        assert executor.metrics()["failed"] == 1
+    finally:
+        executor.shutdown()
+
+
+def test_rejects_with_503_after_shutdown():
+    executor = ConversionExecutor(max_workers=1, max_queue=0)
+    executor.shutdown()
+
+    with pytest.raises(ExecutorSaturatedError) as excinfo:
+        executor.submit(lambda: None)
+
+    assert excinfo.value.status_code == 503
+    assert "Retry-After" in excinfo.value.headers
+
+
+def test_submit_when_free_waits_for_an_idle_worker_instead_of_rejecting():
+    executor = ConversionExecutor(max_workers=1, max_queue=0)
+    release = threading.Event()
+    try:
+        running = executor.submit(release.wait)
+        background = []
+        waiter = threading.Thread(target=lambda: background.append(executor.submit_when_free(lambda: "done")))
+        waiter.start()
+        waiter.join(timeout=0.2)
+        assert waiter.is_alive() and not background
+
+        release.set()
+        waiter.join(timeout=5)
+        running.result(timeout=5)
+        assert background[0].result(timeout=5) == "done"
+        assert executor.metrics()["completed"] == 2
+    finally:
+        release.set()
+        executor.shutdown()
@@ -0,0 +1,174 @@
+import threading
+import time
+
+import pytest
+
+from converter import job_queue as job_queue_module
+from converter.job_queue import RedisJobQueue, SQLiteJobQueue
+from converter.processing_registry import processing_registry
+from fastapi_service import worker as worker_module
+from fastapi_service.worker import JobWorker
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    import redis
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis.Redis, "from_url",
+                        classmethod(lambda cls, url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs)))
+    return server
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def queue(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteJobQueue(str(tmp_path / "jobs.sqlite3"))
+    request.getfixturevalue("fake_redis")
+    return RedisJobQueue("redis://fake")
+
+
+@pytest.fixture
+def local_storage(tmp_path, monkeypatch):
+    monkeypatch.setenv("STORAGE_BACKEND", "local")
+    monkeypatch.setenv("LOCAL_STORAGE_PATH", str(tmp_path / "storage"))
+    from converter.storage_service import get_storage_service
+    return get_storage_service()
+
+
+def test_jobs_are_claimed_in_fifo_order(queue):
+    queue.enqueue("a", "excel_upload", {"n": 1})
+    time.sleep(0.01)
+    queue.enqueue("b", "excel_upload", {"n": 2})
+
+    first = queue.claim("w1", lease_seconds=60)
+    second = queue.claim("w2", lease_seconds=60)
+
+    assert (first.id, second.id) == ("a", "b")
+    assert first.status == "processing" and first.attempts == 1 and first.payload == {"n": 1}
+    assert queue.claim("w3", lease_seconds=60) is None
+    assert queue.counts()["processing"] == 2
+
+
+def test_expired_lease_is_reclaimed_until_attempts_run_out(queue):
+    queue.enqueue("a", "excel_upload", {}, max_attempts=2)
+
+    assert queue.claim("w1", lease_seconds=0).attempts == 1
+    reclaimed = queue.claim("w2", lease_seconds=0)
+    assert reclaimed.worker_id == "w2" and reclaimed.attempts == 2
+
+    assert queue.claim("w3", lease_seconds=60) is None
+    job = queue.get("a")
+    assert job.status == "failed"
+    assert job.error == "worker lease expired"
+
+
+def test_finished_jobs_are_purged_after_retention(queue, monkeypatch):
+    queue.enqueue("done", "excel_upload", {})
+    queue.enqueue("waiting", "excel_upload", {})
+    queue.complete(queue.claim("w1", lease_seconds=60).id)
+    assert queue.counts() == {"queued": 1, "processing": 0, "completed": 1, "failed": 0}
+
+    now = time.time()
+    monkeypatch.setattr(job_queue_module.time, "time", lambda: now + queue.retention_seconds + 1)
+
+    assert queue.purge_finished() == 1
+    assert queue.counts() == {"queued": 1, "processing": 0, "completed": 0, "failed": 0}
+
+
+def test_redis_claim_recovers_ids_from_dead_workers(fake_redis):
+    queue = RedisJobQueue("redis://fake")
+    queue.enqueue("a", "excel_upload", {})
+    # A worker popped the id and died before leasing it: no heartbeat key remains
+    queue.client.lmove(queue._pending, queue._claiming("dead"), "RIGHT", "LEFT")
+    queue.client.sadd(queue._workers, "dead")
+
+    job = queue.claim("w1", lease_seconds=60)
+
+    assert job.id == "a" and job.status == "processing" and job.attempts == 1
+    assert queue.client.llen(queue._claiming("dead")) == 0
+    assert queue.counts()["processing"] == 1
+
+
+def test_redis_lease_is_abandoned_when_the_claim_was_recovered(fake_redis):
+    queue = RedisJobQueue("redis://fake")
+    queue.enqueue("a", "excel_upload", {})
+    queue.client.lmove(queue._pending, queue._claiming("slow"), "RIGHT", "LEFT")
+    queue.client.lmove(queue._claiming("slow"), queue._pending, "RIGHT", "RIGHT")
+
+    assert queue._lease("a", "slow", lease_seconds=60) is False
+    assert queue.get("a").status == "queued"
+    assert queue.claim("w1", lease_seconds=60).id == "a"
+
+
+def test_queue_survives_reopening(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    SQLiteJobQueue(path).enqueue("a", "pdf_upload", {"input_key": "k"}, record={"type": "pdf"})
+
+    job = SQLiteJobQueue(path).claim("w1", lease_seconds=60)
+
+    assert job.id == "a" and job.record == {"type": "pdf"}
+
+
+def test_worker_drives_registry_status_transitions(queue, local_storage, monkeypatch):
+    seen = {}
+
+    def handler(processing_id, input_path, payload):
+        with open(input_path, "rb") as f:
+            seen["input"] = f.read()
+        seen["status"] = processing_registry.get(processing_id)["status"]
+        processing_registry.register(processing_id, {"type": "test", "status": "completed", "result": 42})
+
+    monkeypatch.setattr(worker_module, "_resolve_handler", lambda job_type: handler)
+    local_storage.put_bytes("jobs/j1/input.bin", b"payload")
+    worker_module.enqueue_conversion_job("j1", "test_job", {"input_key": "jobs/j1/input.bin", "delete_input": True},
+                                         record={"type": "test"}, queue=queue)
+    assert processing_registry.get("j1")["status"] == "queued"
+
+    assert JobWorker(queue=queue).run_once()
+
+    assert seen == {"input": b"payload", "status": "processing"}
+    job = queue.get("j1")
+    assert job.status == "completed"
+    assert job.record["result"] == 42
+    assert processing_registry.get("j1")["status"] == "completed"
+    assert not local_storage.exists("jobs/j1/input.bin")
+
+
+def test_worker_runs_handlers_on_its_executor(queue, local_storage, monkeypatch):
+    from fastapi_service.conversion_executor import ConversionExecutor
+
+    seen = {}
+
+    def handler(processing_id, input_path, payload):
+        seen["thread"] = threading.current_thread().name
+
+    monkeypatch.setattr(worker_module, "_resolve_handler", lambda job_type: handler)
+    local_storage.put_bytes("jobs/j3/input.bin", b"x")
+    queue.enqueue("j3", "excel_upload", {"input_key": "jobs/j3/input.bin"}, record={"type": "excel"})
+    executor = ConversionExecutor(max_workers=1, max_queue=0)
+    try:
+        assert JobWorker(queue=queue, executor=executor).run_once()
+        assert executor.metrics()["completed"] == 1
+    finally:
+        executor.shutdown()
+
+    assert seen["thread"].startswith("conversion")
+    assert queue.get("j3").status == "completed"
+
+
+def test_worker_marks_failed_jobs(queue, local_storage, monkeypatch):
+    def handler(processing_id, input_path, payload):
+        raise ValueError("corrupt workbook")
+
+    monkeypatch.setattr(worker_module, "_resolve_handler", lambda job_type: handler)
+    local_storage.put_bytes("jobs/j2/input.bin", b"x")
+    queue.enqueue("j2", "excel_upload", {"input_key": "jobs/j2/input.bin"}, record={"type": "excel"})
+
+    assert JobWorker(queue=queue).run_once()
+
+    job = queue.get("j2")
+    assert job.status == "failed"
+    assert job.error == "corrupt workbook"
+    assert processing_registry.get("j2")["status"] == "failed"
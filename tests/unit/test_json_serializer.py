@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from converter import json_serializer
+from converter.json_serializer import RawJSON, dumps, dumps_object, encode, loads
+from converter.storage_service import LocalStorageService, StorageType
+from fastapi_service.responses import EncodedJSONResponse
+
+
+PAYLOAD = {'workbook': {'sheets': [{'name': 'Ünïcode', 'rows': [{'r': 1, 'cells': [[1, 2.5, None, '=A1']]}]}]},
+           'flags': [True, False, None], 1: 'int key'}
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, monkeypatch):
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(json_serializer, 'orjson', None)
+    return request.param
+
+
+def test_dumps_is_compact_utf8_json_on_both_backends(backend):
+    encoded = dumps(PAYLOAD)
+
+    assert json_serializer.backend() == backend
+    assert isinstance(encoded, bytes) and b', ' not in encoded and b': ' not in encoded
+    assert json.loads(encoded) == json.loads(json.dumps(PAYLOAD))
+    assert loads(encoded) == loads(encoded.decode('utf-8')) == json.loads(json.dumps(PAYLOAD))
+    assert json.loads(dumps(PAYLOAD, indent=True)) == json.loads(encoded)
+    assert b'\n  "workbook"' in dumps(PAYLOAD, indent=True)
+
+
+def test_values_orjson_rejects_fall_back_to_stdlib(backend):
+    assert loads(dumps({'big': 2 ** 70})) == {'big': 2 ** 70}
+    assert loads(dumps({'when': object()}, default=lambda value: 'obj')) == {'when': 'obj'}
+    with pytest.raises(TypeError):
+        dumps({'set': {1, 2}})
+    assert loads(b'{"nan": NaN}')['nan'] != 0
+
+
+def test_dumps_object_splices_raw_json_without_reencoding(backend):
+    raw = encode({'rows': [1, 2, 3]})
+    body = dumps_object({'processing_id': 'p1', 'data': raw, 'storage': None})
+
+    assert isinstance(raw, RawJSON) and encode(raw) is raw
+    assert json.loads(body) == {'processing_id': 'p1', 'data': {'rows': [1, 2, 3]}, 'storage': None}
+    # Raw bytes are passed through untouched, not re-encoded
+    assert dumps_object({'data': RawJSON(b'[1,  2]')}) == b'{"data":[1,  2]}'
+    assert EncodedJSONResponse({'data': RawJSON(b'[1,  2]')}).body == b'{"data":[1,  2]}'
+    assert EncodedJSONResponse(b'{"a":1}').body == b'{"a":1}'
+
+
+def test_put_json_stores_pre_encoded_bytes_as_is(tmp_path):
+    storage = LocalStorageService(base_dir=str(tmp_path))
+    body = dumps({'a': 1})
+
+    ref = storage.store_json(data={'a': 1}, storage_type=StorageType.PROCESSED_JSON, key_prefix='p1', encoded=body)
+
+    assert ref.size_bytes == len(body)
+    assert storage.get_bytes(ref.key) == body
+    assert storage.get_json(ref.key) == {'a': 1}
+    assert storage.get_json(storage.put_json('processed/x.json', PAYLOAD).key) == json.loads(json.dumps(PAYLOAD))
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+from openpyxl import Workbook
+from openpyxl.styles import Font, PatternFill
+
+from converter import compact_excel_processor
+from converter.compact_excel_processor import CompactExcelProcessor, max_sheet_workers
+from converter.complexity_preserving_compact_processor import ComplexityPreservingCompactProcessor
+
+
+FIXTURES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "fixtures", "excel"))
+EXOS = os.path.join(FIXTURES_DIR, "pDD10b - Exos_2023_financials.xlsx")
+
+
+@pytest.fixture(autouse=True)
+def _sheet_worker_cap(monkeypatch):
+    # Fan out even on single-CPU hosts, where the default cap is one worker
+    monkeypatch.setenv("EXCEL_MAX_SHEET_WORKERS", "3")
+
+
+def _without_meta(result):
+    result["workbook"].pop("meta", None)
+    result.pop("complexity_metadata", {}).pop("extraction_timestamp", None)
+    return result
+
+
+def _build_multi_style_workbook(path):
+    """Three sheets whose styles first appear in different orders"""
+    workbook = Workbook()
+    palettes = [["FFFF0000", "FF00FF00"], ["FF0000FF", "FFFF0000"], ["FF00FF00", "FFFFFF00", "FF0000FF"]]
+    for index, palette in enumerate(palettes):
+        sheet = workbook.active if index == 0 else workbook.create_sheet(f"Sheet{index + 1}")
+        for row in range(1, 6):
+            for col, color in enumerate(palette, start=1):
+                cell = sheet.cell(row=row, column=col, value=row * col)
+                cell.fill = PatternFill("solid", fgColor=color)
+                cell.font = Font(bold=row == 1)
+            # A uniformly styled row exercises the shared row-level style reference
+            for col in range(10, 40):
+                sheet.cell(row=row, column=col, value="x").fill = PatternFill("solid", fgColor=palette[0])
+    workbook.save(path)
+
+
+def test_parallel_matches_sequential_conversion():
+    sequential = CompactExcelProcessor(ingestion_mode="single_pass").process_file(EXOS)
+    parallel = CompactExcelProcessor(ingestion_mode="parallel", max_workers=2).process_file(EXOS)
+
+    assert _without_meta(parallel) == _without_meta(sequential)
+
+
+def test_parallel_merges_worker_style_registries_deterministically(tmp_path):
+    path = str(tmp_path / "styles.xlsx")
+    _build_multi_style_workbook(path)
+
+    sequential = CompactExcelProcessor(ingestion_mode="streaming").process_file(path)
+    parallel = CompactExcelProcessor(ingestion_mode="parallel", max_workers=3).process_file(path)
+
+    assert list(parallel["workbook"]["styles"]) == list(sequential["workbook"]["styles"])
+    assert [sheet["name"] for sheet in parallel["workbook"]["sheets"]] == ["Sheet", "Sheet2", "Sheet3"]
+    assert _without_meta(parallel) == _without_meta(sequential)
+
+
+def test_parallel_complexity_metadata_matches_sequential():
+    processors = [ComplexityPreservingCompactProcessor(ingestion_mode="single_pass"),
+                  ComplexityPreservingCompactProcessor(ingestion_mode="parallel", max_workers=2)]
+    sequential, parallel = (processor.process_file(EXOS) for processor in processors)
+
+    assert list(parallel["complexity_metadata"]["sheets"]) == list(sequential["complexity_metadata"]["sheets"])
+    assert _without_meta(parallel) == _without_meta(sequential)
+
+
+@pytest.mark.parametrize("max_workers", [0, -2])
+def test_invalid_worker_count_rejected(max_workers):
+    with pytest.raises(ValueError):
+        CompactExcelProcessor(ingestion_mode="parallel", max_workers=max_workers)
+
+
+def test_worker_count_is_capped_by_server_config(monkeypatch):
+    monkeypatch.setenv("EXCEL_MAX_SHEET_WORKERS", "2")
+    processor = CompactExcelProcessor(ingestion_mode="parallel", max_workers=10000)
+
+    assert max_sheet_workers() == 2
+    assert processor._parallel_worker_count(50) == 2
+    assert processor._parallel_worker_count(1) == 1
+
+
+@pytest.mark.parametrize("value", ["-1", "many"])
+def test_invalid_server_worker_cap_rejected(monkeypatch, value):
+    monkeypatch.setenv("EXCEL_MAX_SHEET_WORKERS", value)
+    with pytest.raises(ValueError):
+        max_sheet_workers()
+
+
+def test_parallel_conversions_share_one_pool(tmp_path):
+    path = str(tmp_path / "styles.xlsx")
+    _build_multi_style_workbook(path)
+
+    CompactExcelProcessor(ingestion_mode="parallel", max_workers=2).process_file(path)
+    pool = compact_excel_processor._sheet_pool
+    CompactExcelProcessor(ingestion_mode="parallel", max_workers=3).process_file(path)
+
+    assert pool is not None
+    assert compact_excel_processor._sheet_pool is pool
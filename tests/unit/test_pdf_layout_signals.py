@@ -0,0 +1,69 @@
+import pytest
+
+from converter.pdf_layout_signals import LayoutSignalExtractor
+from converter.pdf_page_complexity_analyzer import PDFPageComplexityAnalyzer
+
+fitz = pytest.importorskip("fitz")
+
+
+def _prose_page(doc):
+    page = doc.new_page()
+    for i in range(30):
+        page.insert_text((72, 72 + 14 * i), f"In {2001 + i % 20} revenue grew {i + 3}% and margins held at {40 + i}.5 overall.",
+                         fontsize=10)
+
+
+def _text_table_page(doc):
+    """Borderless four-column table with no figures in it"""
+    page = doc.new_page()
+    for r in range(12):
+        cells = ["Region", "Owner", "Status", "Notes"] if r == 0 else \
+            [["North", "South", "East", "West"][r % 4], "Team", ["Open", "Closed"][r % 2], "Pending review"]
+        for x, text in zip((72, 200, 330, 450), cells):
+            page.insert_text((x, 72 + 16 * r), text, fontsize=10)
+
+
+def _ruled_numeric_page(doc):
+    page = doc.new_page()
+    for r in range(10):
+        y = 72 + 16 * r
+        for c, x in enumerate((72, 220, 330, 440)):
+            page.insert_text((x, y), f"Item {r}" if c == 0 else f"{(r + 1) * (c + 3) * 137:,}", fontsize=10)
+        page.draw_line((70, y + 4), (520, y + 4))
+
+
+def _two_column_prose_page(doc):
+    page = doc.new_page()
+    for i in range(35):
+        page.insert_text((72, 72 + 14 * i), "lorem ipsum dolor sit amet consect", fontsize=10)
+        page.insert_text((320, 72 + 14 * i), "adipiscing elit sed do eiusmod tem", fontsize=10)
+
+
+@pytest.fixture
+def doc():
+    doc = fitz.open()
+    for build in (_prose_page, _text_table_page, _ruled_numeric_page, _two_column_prose_page):
+        build(doc)
+    yield doc
+    doc.close()
+
+
+def test_layout_signals_separate_tables_from_prose(doc):
+    extractor = LayoutSignalExtractor()
+    prose, text_table, ruled, two_column = (extractor.page_signals(page) for page in doc)
+
+    assert prose["table_likeness"] == 0.0
+    assert text_table["column_alignment"] == 1.0 and text_table["numeric_grid"] == 0.0
+    assert ruled == {"table_likeness": 1.0, "column_alignment": 1.0, "numeric_grid": 1.0,
+                     "ruling_lines": 1.0, "multi_cell_rows": 10.0}
+    assert two_column["table_likeness"] < 0.35 < text_table["table_likeness"]
+    assert extractor.page_signals(object()) is None
+
+
+def test_analyzer_routes_tables_not_numeric_prose(doc):
+    analyzer = PDFPageComplexityAnalyzer()
+    metrics = analyzer.analyze_pages(doc)
+
+    assert [m["category"] for m in metrics] == ["numeric_prose", "probable_table", "probable_table", "none_or_low_numbers"]
+    assert metrics[1]["number_count"] == 0
+    assert analyzer.group_numeric_pages(metrics) == [(1, 2)]
@@ -0,0 +1,74 @@
+import random
+import re
+
+from converter.pdf.plumber_clean_processor import NumberExtractor
+from converter.pdf_ai_router import FAILOVER_NUMBER_PATTERNS
+from converter.pdf_number_scanner import NumberScanner, get_number_scanner
+from converter.pdfplumber_number_extractor import PDFPlumberNumberExtractor
+
+
+TOKENS = ['$', '$ ', '1,234', '12', '2024', 'FY2023', 'Q3 2021', '%', '3.5', '1.80x', '1e5', '1/2', '3/0',
+          '1st', '22nd', '12,34', '1,234,567.89', '0.5%', 'revenue', 'page', 'million', 'k', '\n', ' ', '.', ',']
+
+
+def _texts(count, seed=0):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(TOKENS) + rng.choice(['', ' ']) for _ in range(rng.randint(1, 60)))
+            for _ in range(count)]
+
+
+def _per_pattern(patterns, text, flags=0):
+    return [(name, m.start(), m.end(), m.group(0))
+            for name, pattern in patterns.items() for m in re.finditer(pattern, text, flags)]
+
+
+def _legacy_select(patterns, priority, text, accept):
+    """The overlap resolution the scanner replaced: a linear scan of accepted spans per candidate"""
+    candidates = sorted(_per_pattern(patterns, text, re.IGNORECASE),
+                        key=lambda m: (m[1], priority.get(m[0], 9), m[1] - m[2]))
+    used, accepted = [], []
+    for match in candidates:
+        if any(not (match[2] <= start or match[1] >= end) for start, end in used):
+            continue
+        if accept(match):
+            accepted.append(match)
+            used.append((match[1], match[2]))
+    return accepted
+
+
+def test_scan_matches_per_pattern_finditer():
+    for patterns in (FAILOVER_NUMBER_PATTERNS, NumberExtractor().patterns):
+        scanner = NumberScanner(patterns)
+        for text in _texts(300):
+            expected = _per_pattern(patterns, text)
+            assert [tuple(m) for m in scanner.scan_by_format(text)] == expected
+            assert [tuple(m) for m in scanner.scan(text)] == sorted(expected, key=lambda m: m[1])
+
+
+def test_select_matches_linear_overlap_resolution():
+    extractor = PDFPlumberNumberExtractor()
+    scanner = extractor.scanner
+    # Rejecting some candidates leaves their spans free for lower-priority matches
+    accept = lambda match: not match[3].endswith('4')  # noqa: E731
+    for text in _texts(300, seed=1):
+        expected = _legacy_select(extractor.patterns, extractor.PATTERN_PRIORITY, text, accept)
+        selected = scanner.select(text, extractor.PATTERN_PRIORITY, lambda m: tuple(m) if accept(m) else None)
+        assert selected == expected
+
+
+def test_extractor_prefers_specific_formats():
+    numbers = PDFPlumberNumberExtractor().extract_numbers_from_text(
+        'Revenue grew 12.5% to $1,234.50 million in FY2024, a 1.80x margin of 3,500.', {'bbox': [0, 0, 0, 0]}, {}
+    )
+
+    assert [(n['original_text'], n['format']) for n in numbers] == [
+        ('12.5%', 'percentage'), ('$1,234.50', 'currency'), ('FY2024', 'date_number'),
+        ('1.80x', 'ratio'), ('3,500', 'integer'),
+    ]
+    assert numbers[1]['unit'] == 'million' and numbers[0]['unit'] == 'percent'
+
+
+def test_scanners_are_shared_per_pattern_set():
+    patterns = dict(FAILOVER_NUMBER_PATTERNS)
+    assert get_number_scanner(patterns) is get_number_scanner(FAILOVER_NUMBER_PATTERNS)
+    assert get_number_scanner(patterns, re.IGNORECASE) is not get_number_scanner(patterns)
@@ -0,0 +1,53 @@
+import math
+import random
+
+import pytest
+
+from converter.pdf_spatial_index import ZoneIndex, bboxes_overlap, pad_bbox
+from converter.pdfplumber_text_extractor import PDFPlumberTextExtractor
+
+
+def _random_bboxes(rng, count, max_width, max_height):
+    bboxes = []
+    for _ in range(count):
+        x0, top = rng.uniform(-20, 600), rng.uniform(-20, 800)
+        bboxes.append((x0, top, x0 + rng.uniform(0, max_width), top + rng.uniform(0, max_height)))
+    return bboxes
+
+
+@pytest.mark.parametrize('zone_count', [0, 3, 40, 200])
+def test_index_matches_linear_scan(zone_count):
+    rng = random.Random(zone_count)
+    zones = _random_bboxes(rng, zone_count, 150, 80)
+    words = _random_bboxes(rng, 2000, 40, 12)
+    # Words sharing a zone's edge or corner count as overlapping
+    words += [(zone[2], zone[3], zone[2] + 5, zone[3] + 5) for zone in zones]
+    index = ZoneIndex(zones)
+
+    for word in words:
+        assert index.overlaps(word) == any(bboxes_overlap(word, zone) for zone in zones)
+
+
+def test_degenerate_zones_are_exact():
+    zones = [(0, 0, math.inf, 10), (5, float('nan'), 6, 7), (200, 200, 100, 100), (0, 0, 1e9, 1e9)]
+    zones += [(x, 500, x + 4, 504) for x in range(0, 400, 20)]
+    index = ZoneIndex(zones)
+    words = [(1, 1, 2, 2), (120, 120, 130, 130), (150, 90, 260, 250), (-5, -5, -1, -1), (0, 0, math.inf, 1)]
+
+    for word in words:
+        assert index.overlaps(word) == any(bboxes_overlap(word, zone) for zone in zones)
+    with pytest.raises(ValueError):
+        ZoneIndex(zones, cell_size=0)
+
+
+def test_text_extractor_filters_words_in_padded_zones():
+    extractor = PDFPlumberTextExtractor()
+    zones = extractor._prepare_exclusion_zones([{'region': {'page_number': '1-2', 'bbox': [5, 100, 200, 300]}}], 3)
+    words = [
+        {'text': 'inside', 'x0': 50, 'top': 150, 'x1': 80, 'bottom': 160},
+        {'text': 'padding', 'x0': 205, 'top': 150, 'x1': 230, 'bottom': 160},
+        {'text': 'outside', 'x0': 250, 'top': 150, 'x1': 280, 'bottom': 160},
+    ]
+
+    assert zones == {0: [pad_bbox([5, 100, 200, 300], 10)], 1: [(0, 90, 210, 310)]}
+    assert [w['text'] for w in extractor._filter_excluded_words(words, zones[0])] == ['outside']
@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from converter.pdfplumber_document_context import PDFDocumentContext
+from converter.pdfplumber_processor import PDFPlumberProcessor
+from converter.pdfplumber_table_extractor import PDFPlumberTableExtractor
+from converter.pdfplumber_text_extractor import PDFPlumberTextExtractor
+
+
+PDF_PATH = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'pdfs',
+                        'Test_PDF_Table_9_numbers_with_before_and_after_paragraphs.pdf')
+
+
+def _without_timestamps(data):
+    if isinstance(data, dict):
+        return {k: _without_timestamps(v) for k, v in data.items() if not k.endswith('timestamp')}
+    if isinstance(data, list):
+        return [_without_timestamps(v) for v in data]
+    return data
+
+
+def test_words_are_extracted_once_per_page_and_settings():
+    with PDFDocumentContext(PDF_PATH) as document:
+        page = document.pages[0]
+        calls = []
+        extract_words = page.page.extract_words
+        page.page.extract_words = lambda **kw: calls.append(kw) or extract_words(**kw)
+
+        words = page.words()
+        assert page.words(x_tolerance=3, y_tolerance=3) is words
+        assert page.words(x_tolerance=1) is not words
+        assert len(calls) == 2 and words
+        assert document.pages[0] is page and document.page_count >= 1
+
+    with pytest.raises(FileNotFoundError):
+        PDFDocumentContext('missing.pdf')
+
+
+def test_extractors_read_a_shared_document_like_their_own():
+    tables = PDFPlumberTableExtractor()
+    text = PDFPlumberTextExtractor()
+    own_tables = tables.extract_tables(PDF_PATH)
+    own_text = text.extract_text_content(PDF_PATH, own_tables['tables'])
+
+    with PDFDocumentContext(PDF_PATH) as document:
+        shared_tables = tables.extract_tables(PDF_PATH, document)
+        shared_text = text.extract_text_content(PDF_PATH, shared_tables['tables'], document)
+
+    assert _without_timestamps(shared_tables) == _without_timestamps(own_tables)
+    assert _without_timestamps(shared_text) == _without_timestamps(own_text)
+
+
+def test_process_file_opens_the_pdf_once(monkeypatch):
+    import converter.pdfplumber_document_context as context_module
+
+    opened = []
+    real_open = context_module.pdfplumber.open
+    monkeypatch.setattr(context_module.pdfplumber, 'open', lambda path: opened.append(path) or real_open(path))
+
+    result = PDFPlumberProcessor().process_file(PDF_PATH)['pdf_processing_result']
+
+    assert opened == [PDF_PATH]
+    assert result['processing_summary']['processing_errors'] == []
+    assert result['processing_summary']['text_sections'] > 0
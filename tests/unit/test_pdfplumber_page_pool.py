@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from converter import pdfplumber_page_pool
+from converter.pdfplumber_page_pool import max_page_workers, page_ranges, page_worker_count, resolve_page_workers
+from converter.pdfplumber_table_extractor import PDFPlumberTableExtractor
+from converter.pdfplumber_text_extractor import PDFPlumberTextExtractor
+
+
+PDF_PATH = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'pdfs', 'synthetic_financial_report.pdf')
+
+
+@pytest.fixture(autouse=True)
+def _page_worker_cap(monkeypatch):
+    # Shard even on single-CPU hosts, where the default cap is one worker
+    monkeypatch.setenv('PDF_MAX_PAGE_WORKERS', '4')
+
+
+def _without_timestamps(data):
+    if isinstance(data, dict):
+        return {k: _without_timestamps(v) for k, v in data.items() if not k.endswith('timestamp')}
+    if isinstance(data, list):
+        return [_without_timestamps(v) for v in data]
+    return data
+
+
+def _sharded(extractor_class):
+    return extractor_class({**extractor_class()._get_default_config(), 'page_workers': 2, 'min_pages_per_worker': 1})
+
+
+def test_page_ranges_cover_the_document_in_order():
+    ranges = page_ranges(10, 2)
+    assert len(ranges) == 8
+    assert ranges[0][0] == 0 and ranges[-1][1] == 10
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert page_ranges(3, 4) == [(0, 1), (1, 2), (2, 3)]
+    assert page_ranges(0, 4) == []
+
+
+def test_page_worker_count():
+    assert page_worker_count(1, 8, 500) == 1
+    assert page_worker_count(4, 8, 500) == 4
+    assert page_worker_count(4, 8, 20) == 2
+    assert page_worker_count(4, 8, 3) == 1
+
+
+def test_page_worker_count_is_capped_by_server_config(monkeypatch):
+    monkeypatch.setenv('PDF_MAX_PAGE_WORKERS', '2')
+    assert max_page_workers() == 2
+    assert page_worker_count(64, 1, 500) == 2
+    for bad in ('many', '-1'):
+        monkeypatch.setenv('PDF_MAX_PAGE_WORKERS', bad)
+        with pytest.raises(ValueError):
+            max_page_workers()
+
+
+def test_resolve_page_workers(monkeypatch):
+    monkeypatch.delenv('PDF_PAGE_WORKERS', raising=False)
+    assert resolve_page_workers() == 1
+    monkeypatch.setenv('PDF_PAGE_WORKERS', '3')
+    assert resolve_page_workers() == 3
+    assert resolve_page_workers(2) == 2
+    assert resolve_page_workers(0) == (os.cpu_count() or 1)
+    for bad in ('many', '-1'):
+        monkeypatch.setenv('PDF_PAGE_WORKERS', bad)
+        with pytest.raises(ValueError):
+            resolve_page_workers()
+
+
+def test_sharded_extraction_matches_in_process_extraction():
+    tables = PDFPlumberTableExtractor().extract_tables(PDF_PATH)
+    text = PDFPlumberTextExtractor().extract_text_content(PDF_PATH, tables['tables'])
+
+    sharded_tables = _sharded(PDFPlumberTableExtractor).extract_tables(PDF_PATH)
+    sharded_text = _sharded(PDFPlumberTextExtractor).extract_text_content(PDF_PATH, sharded_tables['tables'])
+
+    assert _without_timestamps(sharded_tables) == _without_timestamps(tables)
+    assert _without_timestamps(sharded_text) == _without_timestamps(text)
+    assert len(sharded_text['text_content']['pages']) == 3
+
+
+def test_extractors_share_one_page_pool():
+    sharded_tables = _sharded(PDFPlumberTableExtractor).extract_tables(PDF_PATH)
+    pool = pdfplumber_page_pool._page_pool
+    _sharded(PDFPlumberTextExtractor).extract_text_content(PDF_PATH, sharded_tables['tables'])
+
+    assert pool is not None
+    assert pdfplumber_page_pool._page_pool is pool
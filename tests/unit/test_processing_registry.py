@@ -0,0 +1,122 @@
+import time
+
+import pytest
+
+from converter import processing_registry as registry_module
+from converter.processing_registry import (
+    InMemoryRegistryBackend,
+    ProcessingRegistry,
+    RedisRegistryBackend,
+    SQLiteRegistryBackend,
+)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    import redis
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis.Redis, "from_url",
+                        classmethod(lambda cls, url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs)))
+    return server
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def make_registry(request, tmp_path):
+    if request.param == "redis":
+        request.getfixturevalue("fake_redis")
+
+    def make(ttl_seconds=3600):
+        if request.param == "memory":
+            return ProcessingRegistry(InMemoryRegistryBackend(ttl_seconds))
+        if request.param == "redis":
+            return ProcessingRegistry(RedisRegistryBackend("redis://fake", ttl_seconds=ttl_seconds))
+        return ProcessingRegistry(SQLiteRegistryBackend(str(tmp_path / "registry.sqlite3"), ttl_seconds))
+    return make
+
+
+def test_register_get_delete(make_registry):
+    registry = make_registry()
+    registry.register("a", {"type": "excel"})
+
+    record = registry.get("a")
+    assert record["type"] == "excel"
+    assert record["status"] == "completed"
+    assert "created_at" in record
+
+    assert registry.delete("a") is True
+    assert registry.get("a") is None
+    assert registry.delete("a") is False
+
+
+def test_list_pages_newest_first_and_filters_by_status(make_registry):
+    registry = make_registry()
+    for i in range(5):
+        registry.register(f"r{i}", {"status": "failed" if i % 2 else "completed"})
+        time.sleep(0.002)
+    # Status updates keep a record's position in creation order
+    registry.register("r0", {"status": "failed"})
+
+    assert [r["processing_id"] for r in registry.list(limit=2)] == ["r4", "r3"]
+    assert [r["processing_id"] for r in registry.list(limit=2, offset=2)] == ["r2", "r1"]
+    assert [r["processing_id"] for r in registry.list(status="failed")] == ["r3", "r1", "r0"]
+    assert registry.count() == 5
+    assert registry.count(status="completed") == 2
+
+    with pytest.raises(ValueError):
+        registry.list(limit=0)
+
+
+def test_records_expire_after_ttl(make_registry, monkeypatch):
+    registry = make_registry(ttl_seconds=10)
+    registry.register("old", {"type": "pdf"})
+
+    now = time.time()
+    monkeypatch.setattr(registry_module.time, "time", lambda: now + 11)
+
+    assert registry.get("old") is None
+    assert registry.count() == 0
+    assert registry.backend.purge_expired() == 1
+
+
+def test_expired_records_are_not_counted_before_a_purge(make_registry, monkeypatch):
+    registry = make_registry(ttl_seconds=10)
+    registry.register("old", {"status": "completed"})
+    registry.register("kept", {"status": "completed"})
+    registry.backend._last_purge = time.time() + 3600  # no purge during this test
+
+    now = time.time()
+    monkeypatch.setattr(registry_module.time, "time", lambda: now + 11)
+    registry.register("kept", {"status": "failed"})
+
+    assert registry.count() == 1
+    assert registry.count(status="completed") == 0
+    assert registry.count(status="failed") == 1
+
+
+def test_records_without_ttl_are_always_counted(make_registry):
+    registry = make_registry(ttl_seconds=0)
+    registry.register("a", {"status": "completed"})
+
+    assert registry.count(status="completed") == 1
+    assert registry.backend.purge_expired() == 0
+
+
+def test_sqlite_records_are_shared_between_instances(tmp_path):
+    path = str(tmp_path / "registry.sqlite3")
+    ProcessingRegistry(SQLiteRegistryBackend(path)).register("a", {"type": "excel", "storage": {"key": "k"}})
+
+    other = ProcessingRegistry(SQLiteRegistryBackend(path))
+
+    assert other.get("a")["storage"] == {"key": "k"}
+
+
+def test_backend_is_selected_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROCESSING_REGISTRY_BACKEND", "sqlite")
+    monkeypatch.setenv("PROCESSING_REGISTRY_PATH", str(tmp_path / "env.sqlite3"))
+    assert isinstance(ProcessingRegistry().backend, SQLiteRegistryBackend)
+
+    monkeypatch.setenv("PROCESSING_REGISTRY_BACKEND", "bogus")
+    with pytest.raises(RuntimeError):
+        ProcessingRegistry().backend
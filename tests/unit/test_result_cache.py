@@ -0,0 +1,105 @@
+import os
+import time
+
+import pytest
+
+from converter import result_cache as result_cache_module
+from converter.result_cache import ResultCache, estimate_size
+
+
+def _payload(n):
+    return {"full_data": {"cells": ["x" * 10] * n}}
+
+
+def test_get_and_set_behave_like_the_old_dict():
+    cache = ResultCache(max_bytes=10_000)
+    cache["a"] = {"filename": "a.xlsx"}
+
+    assert "a" in cache
+    assert cache["a"]["filename"] == "a.xlsx"
+    assert cache.get("missing") is None
+    with pytest.raises(KeyError):
+        cache["missing"]
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert stats["bytes"] == estimate_size({"filename": "a.xlsx"})
+
+
+def test_least_recently_used_entries_are_evicted_first():
+    size = estimate_size(_payload(10))
+    cache = ResultCache(max_bytes=size * 2)
+    cache["a"] = _payload(10)
+    cache["b"] = _payload(10)
+    cache.get("a")
+    cache["c"] = _payload(10)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= size * 2
+
+
+def test_max_entries_and_oversize_entries():
+    cache = ResultCache(max_bytes=estimate_size(_payload(10)) * 10, max_entries=1)
+    cache["a"] = _payload(1)
+    cache["b"] = _payload(1)
+    assert list(cache) == ["b"]
+
+    cache["huge"] = _payload(1000)
+    assert "huge" not in cache
+    assert cache.stats()["oversize"] == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache = ResultCache(max_bytes=10_000, ttl_seconds=10)
+    cache["a"] = {"v": 1}
+
+    now = time.time()
+    monkeypatch.setattr(result_cache_module.time, "time", lambda: now + 11)
+
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_evicted_entries_spill_to_disk_and_come_back(tmp_path):
+    spill_dir = str(tmp_path / "spill")
+    size = estimate_size(_payload(10))
+    cache = ResultCache(max_bytes=size, spill_dir=spill_dir)
+    cache["a"] = _payload(10)
+    cache["b"] = _payload(10)
+
+    assert len(cache) == 1
+    assert len([n for n in os.listdir(spill_dir) if n.endswith(".json.gz")]) == 1
+    assert "a" in cache
+
+    assert cache.get("a") == _payload(10)
+    stats = cache.stats()
+    assert stats["spills"] == 2  # 'a' spilled, then 'b' displaced by its promotion
+    assert stats["spill_hits"] == 1
+
+    assert cache.pop("b") is True
+    assert os.listdir(spill_dir) == []
+
+
+def test_size_hint_skips_encoding(tmp_path, monkeypatch):
+    def fail(value):
+        raise AssertionError("value was re-encoded")
+
+    monkeypatch.setattr(result_cache_module, "estimate_size", fail)
+    size = len(result_cache_module.json_dumps(_payload(10)))
+    cache = ResultCache(max_bytes=size, spill_dir=str(tmp_path / "spill"))
+    cache.put("a", _payload(10), size_bytes=size)
+    cache.put("b", _payload(10), size_bytes=size)
+
+    # Promotion from the spill directory measures the bytes it decompressed
+    assert cache.get("a") == _payload(10)
+    assert cache.stats()["bytes"] == size
+
+
+def test_invalid_bounds_are_rejected():
+    with pytest.raises(ValueError):
+        ResultCache(max_bytes=0)
+    with pytest.raises(ValueError):
+        ResultCache(max_entries=0)
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('boto3')
+moto = pytest.importorskip('moto')
+
+from converter.storage_service import (
+    AsyncStorageService,
+    S3StorageService,
+    StorageWrite,
+    clear_s3_clients,
+)
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    for name in ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY'):
+        monkeypatch.setenv(name, 'testing')
+    monkeypatch.delenv('STORAGE_COMPRESSION', raising=False)
+    monkeypatch.delenv('STORAGE_ROOT_PREFIX', raising=False)
+    monkeypatch.setenv('S3_MULTIPART_THRESHOLD_MB', '5')
+    monkeypatch.setenv('S3_MULTIPART_CHUNK_MB', '5')
+    clear_s3_clients()
+    with moto.mock_aws():
+        yield S3StorageService(bucket_name='artifacts', region='us-east-1')
+    clear_s3_clients()
+
+
+def test_instances_share_one_pooled_client(s3, monkeypatch):
+    calls = []
+    monkeypatch.setattr(s3.s3, 'head_bucket', lambda **kwargs: calls.append(kwargs))
+
+    other = S3StorageService(bucket_name='artifacts', region='us-east-1')
+
+    assert other.s3 is s3.s3
+    assert s3.s3.meta.config.max_pool_connections == 32
+    # The bucket was checked when the first instance was built
+    assert calls == []
+
+
+def test_large_objects_use_multipart_upload(s3):
+    data = bytes(range(256)) * (24 * 1024)  # 6 MiB, above the 5 MiB threshold
+
+    ref = s3.put_bytes('original/big.bin', data, metadata={'run': 1})
+    head = s3.s3.head_object(Bucket='artifacts', Key='original/big.bin')
+
+    assert ref.size_bytes == len(data) and s3.get_bytes('original/big.bin') == data
+    # Multipart ETags carry the part count
+    assert head['ETag'].strip('"').endswith('-2')
+    assert head['Metadata'] == {'run': '1'}
+
+
+def test_batches_round_trip_in_order(s3):
+    writes = [StorageWrite(f'processed/p1/{i}.bin', bytes([i]) * 10) for i in range(6)]
+    writes.append(s3.json_write('processed/p1/data.json', {'a': 1}))
+
+    refs = s3.put_many(writes)
+
+    assert [ref.key for ref in refs] == [w.key for w in writes]
+    assert s3.get_many([w.key for w in writes[:6]]) == [w.data for w in writes[:6]]
+    assert s3.get_json('processed/p1/data.json') == {'a': 1}
+
+
+def test_async_facade_runs_storage_calls_off_the_event_loop(s3):
+    storage = AsyncStorageService(s3)
+
+    async def scenario():
+        await asyncio.gather(*(storage.put_json(f'processed/p{i}/data.json', {'i': i}) for i in range(4)))
+        return await storage.get_json('processed/p3/data.json'), await storage.exists('processed/p0/data.json')
+
+    assert asyncio.run(scenario()) == ({'i': 3}, True)
+
+
+def test_invalid_tuning_is_rejected(s3, monkeypatch):
+    monkeypatch.setenv('S3_MAX_CONCURRENCY', 'many')
+    with pytest.raises(ValueError):
+        S3StorageService(bucket_name='artifacts', region='us-east-1')
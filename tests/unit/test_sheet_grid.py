@@ -0,0 +1,82 @@
+from converter.sheet_grid import SheetGrid, is_numeric_string
+from converter.table_detector import TableDetector
+
+
+def _grid():
+    return SheetGrid.from_cell_data([
+        {'r': 1, 'cells': [[1, 'Revenue'], [2, '2024-01-31'], [3, 'Month 2']]},
+        {'r': 2, 'cells': [[1, 'Cash'], [2, 100], [3, '1,234'], [4, '   '], [5, None]]},
+        {'r': 5, 'cells': [[3, 7.5]]},
+    ])
+
+
+def test_blank_cells_are_not_indexed():
+    grid = _grid()
+
+    assert len(grid) == 7
+    assert not grid.has(2, 4) and not grid.has(2, 5)
+    assert grid.rows == [1, 2, 5]
+    assert not SheetGrid.from_cell_data({})
+
+
+def test_dict_and_compact_formats_build_the_same_grid():
+    grid = SheetGrid.from_cell_data({
+        'A1': {'value': 'Revenue'}, 'B1': {'value': '2024-01-31'}, 'C1': {'value': 'Month 2'},
+        'A2': {'value': 'Cash'}, 'B2': {'value': 100}, 'C2': {'value': '1,234'}, 'D2': {'value': ''},
+        'C5': {'value': 7.5, 'row': 5, 'column': 3},
+    })
+
+    assert grid.rows == _grid().rows
+    assert all(grid.row_bits(r, 1, 10) == _grid().row_bits(r, 1, 10) for r in (1, 2, 5))
+
+
+def test_row_counts_and_type_masks_respect_column_range():
+    grid = _grid()
+
+    assert grid.count(2, 1, 10) == 3
+    assert grid.count(2, 2, 3) == 2
+    assert grid.count(2, 1, 10, 'numeric') == 2
+    assert grid.count(2, 1, 10, 'text') == 1
+    assert grid.count(1, 1, 10, 'iso_date') == 1
+    assert grid.count(1, 1, 10, 'month_label') == 1
+    assert grid.is_kind(2, 3, 'numeric') and not grid.is_kind(2, 1, 'numeric')
+
+
+def test_row_scans_skip_empty_rows():
+    grid = _grid()
+
+    assert grid.data_rows(1, 10, 1, 10) == [1, 2, 5]
+    assert grid.data_rows(1, 10, 4, 10) == []
+    assert grid.next_data_row(3, 10, 1, 10) == 5
+    assert grid.next_data_row(3, 4, 1, 10) is None
+    assert grid.col_has_data(3, 3, 5) and not grid.col_has_data(1, 3, 5)
+    assert grid.column_span(grid.rows_between(1, 2), 1, 10) == (1, 3)
+    assert grid.column_span([5], 1, 2) is None
+
+
+def test_added_cells_invalidate_cached_row_masks():
+    grid = _grid()
+    assert grid.count(5, 1, 10, 'text') == 0
+
+    grid.add(5, 1, 'Total')
+    grid.add(3, 2, 1)
+
+    assert grid.count(5, 1, 10, 'text') == 1
+    assert grid.rows == [1, 2, 3, 5]
+
+
+def test_numeric_string_ignores_formatting():
+    assert is_numeric_string('$1,234.50')
+    assert is_numeric_string('12 %')
+    assert not is_numeric_string('12a')
+    assert not is_numeric_string(12)
+
+
+def test_detector_only_visits_occupied_rows_of_sparse_sheets():
+    # Two blocks 50k rows apart; scanning the bounding box cell by cell would be slow
+    data = [{'r': r, 'cells': [[1, f'Item {r}'], [2, r], [3, r * 2]]} for r in range(1, 6)]
+    data += [{'r': r, 'cells': [[1, f'Item {r}'], [2, r], [3, r * 2]]} for r in range(50001, 50006)]
+
+    tables = TableDetector().detect_tables(data, [1, 1, 50005, 3], {'table_detection': {'use_gaps': True}})
+
+    assert [(t['start_row'], t['end_row']) for t in tables] == [(1, 5), (50001, 50005)]
@@ -0,0 +1,126 @@
+import os
+
+import pytest
+from openpyxl import load_workbook
+
+from converter.compact_excel_processor import CompactExcelProcessor
+from converter.complexity_preserving_compact_processor import ComplexityPreservingCompactProcessor
+from converter import excel_single_pass_loader
+from converter.excel_single_pass_loader import SinglePassWorkbook, load_workbook_single_pass
+
+
+FIXTURES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "fixtures", "excel"))
+
+# Fixtures containing formula cells with cached values
+FORMULA_FIXTURES = [
+    "pDD10b - Exos_2023_financials.xlsx",
+    "single_unit_economics_4_tables.xlsx",
+]
+
+
+def _without_load_time_meta(result):
+    # openpyxl stamps created/modified with the load time when a file lacks them
+    result["workbook"].pop("meta", None)
+    return result
+
+
+@pytest.mark.parametrize("filename", FORMULA_FIXTURES + ["Test_SpreadSheet_100_numbers.xlsx"])
+def test_single_pass_matches_dual_load(filename):
+    path = os.path.join(FIXTURES_DIR, filename)
+
+    dual = CompactExcelProcessor(ingestion_mode="dual_load").process_file(path)
+    single = CompactExcelProcessor(ingestion_mode="single_pass").process_file(path)
+
+    assert _without_load_time_meta(single) == _without_load_time_meta(dual)
+
+
+@pytest.mark.parametrize("filename", FORMULA_FIXTURES)
+def test_cached_values_match_data_only_workbook(filename):
+    path = os.path.join(FIXTURES_DIR, filename)
+
+    workbook_with_formulas, workbook_with_values = load_workbook_single_pass(path)
+    data_only_workbook = load_workbook(path, data_only=True)
+
+    formula_cells = 0
+    for sheet_name in workbook_with_formulas.sheetnames:
+        values_sheet = workbook_with_values[sheet_name]
+        for row in workbook_with_formulas[sheet_name].iter_rows():
+            for cell in row:
+                if cell.data_type != "f":
+                    continue
+                formula_cells += 1
+                expected = data_only_workbook[sheet_name][cell.coordinate]
+                actual = values_sheet.value_cell(cell)
+                assert actual.value == expected.value
+                assert actual.is_date == expected.is_date
+
+    assert formula_cells > 0
+
+
+def test_single_pass_leaves_openpyxl_reader_untouched():
+    from openpyxl.reader import excel as openpyxl_excel_reader
+    from openpyxl.worksheet._reader import WorksheetReader
+
+    path = os.path.join(FIXTURES_DIR, FORMULA_FIXTURES[0])
+    _, workbook_with_values = load_workbook_single_pass(path)
+
+    assert isinstance(workbook_with_values, SinglePassWorkbook)
+    assert openpyxl_excel_reader.WorksheetReader is WorksheetReader
+
+
+def test_unsupported_openpyxl_falls_back_to_dual_load(monkeypatch):
+    monkeypatch.setattr(excel_single_pass_loader, "SINGLE_PASS_SUPPORTED", False)
+    path = os.path.join(FIXTURES_DIR, FORMULA_FIXTURES[0])
+
+    workbook_with_formulas, workbook_with_values = load_workbook_single_pass(path)
+
+    assert not isinstance(workbook_with_values, SinglePassWorkbook)
+    assert workbook_with_values.sheetnames == workbook_with_formulas.sheetnames
+
+
+@pytest.mark.parametrize("filename", FORMULA_FIXTURES + [
+    "ai_failover_complex_merges.xlsx",
+    "pDD10abc_Lendflow_12.31_2024_Balance_Sheet_(1_19_25).xlsx",
+])
+def test_streaming_matches_dual_load(filename):
+    path = os.path.join(FIXTURES_DIR, filename)
+
+    dual = CompactExcelProcessor(ingestion_mode="dual_load").process_file(path)
+    streaming = CompactExcelProcessor(ingestion_mode="streaming").process_file(path)
+
+    assert _without_load_time_meta(streaming) == _without_load_time_meta(dual)
+
+
+def test_streaming_replays_merged_borders_and_comments(tmp_path):
+    from openpyxl import Workbook
+    from openpyxl.comments import Comment
+    from openpyxl.styles import Border, Side
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet["A1"] = "Header"
+    sheet["A1"].border = Border(top=Side(style="thin"), left=Side(style="thin"))
+    sheet["C3"].border = Border(right=Side(style="thick"), bottom=Side(style="thick"))
+    sheet.merge_cells("A1:C3")
+    sheet["E5"].comment = Comment("note", "author")
+    sheet["E6"].hyperlink = "https://example.com"
+    path = tmp_path / "merged.xlsx"
+    workbook.save(path)
+
+    processors = [CompactExcelProcessor(ingestion_mode=mode, enable_rle=False) for mode in ("dual_load", "streaming")]
+    dual, streaming = (p.process_file(str(path), filter_empty_trailing=False) for p in processors)
+
+    assert _without_load_time_meta(streaming) == _without_load_time_meta(dual)
+
+
+def test_complexity_processor_accepts_ingestion_mode():
+    path = os.path.join(FIXTURES_DIR, "Test_SpreadSheet_100_numbers.xlsx")
+
+    processor = ComplexityPreservingCompactProcessor(ingestion_mode="dual_load")
+    assert processor.ingestion_mode == "dual_load"
+    assert processor.process_file(path)["workbook"]["sheets"]
+
+
+def test_unknown_ingestion_mode_rejected():
+    with pytest.raises(ValueError):
+        CompactExcelProcessor(ingestion_mode="bogus")
@@ -0,0 +1,124 @@
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from converter.content_encoding import compress, decompress, get_storage_compression, iter_compress, iter_decompress
+from converter.storage_service import LocalStorageService, StorageType
+from fastapi_service.streaming import json_envelope, stored_object, streamed_response
+
+
+PAYLOAD = {'rows': [{'r': r, 'cells': [[1, f'value {r}']]} for r in range(200)]}
+
+
+def _storage(tmp_path, monkeypatch, encoding, level=None):
+    monkeypatch.setenv('STORAGE_COMPRESSION', encoding)
+    if level is not None:
+        monkeypatch.setenv('STORAGE_COMPRESSION_LEVEL', str(level))
+    return LocalStorageService(base_dir=str(tmp_path))
+
+
+@pytest.fixture(params=['gzip', 'zstd'])
+def encoding(request):
+    if request.param == 'zstd':
+        pytest.importorskip('zstandard')
+    return request.param
+
+
+def test_codec_round_trips_across_chunks_and_frames(encoding):
+    data = json.dumps(PAYLOAD).encode()
+    packed = compress(data, encoding, 1)
+
+    assert decompress(packed, encoding) == data
+    streamed = b''.join(iter_compress([data[:100], data[100:]], encoding))
+    chunks = [streamed[i:i + 7] for i in range(0, len(streamed), 7)]
+    assert b''.join(iter_decompress(chunks, encoding)) == data
+    assert decompress(compress(b'a', encoding) + compress(b'b', encoding), encoding) == b'ab'
+    with pytest.raises(ValueError):
+        compress(data, 'br')
+
+
+def test_storage_compression_config(monkeypatch):
+    monkeypatch.delenv('STORAGE_COMPRESSION', raising=False)
+    assert get_storage_compression() == (None, None)
+    monkeypatch.setenv('STORAGE_COMPRESSION', 'GZIP')
+    monkeypatch.setenv('STORAGE_COMPRESSION_LEVEL', '9')
+    assert get_storage_compression() == ('gzip', 9)
+    monkeypatch.setenv('STORAGE_COMPRESSION_LEVEL', 'high')
+    with pytest.raises(ValueError):
+        get_storage_compression()
+    monkeypatch.setenv('STORAGE_COMPRESSION', 'lz4')
+    with pytest.raises(ValueError):
+        get_storage_compression()
+
+
+def test_json_artifacts_are_stored_compressed_and_read_transparently(tmp_path, monkeypatch, encoding):
+    storage = _storage(tmp_path, monkeypatch, encoding, level=1)
+
+    ref = storage.store_json(data=PAYLOAD, storage_type=StorageType.PROCESSED_JSON, key_prefix='p1')
+    stored = b''.join(storage.iter_bytes(ref.key))
+
+    assert ref.content_encoding == encoding and ref.size_bytes == len(stored)
+    assert decompress(stored, encoding) == storage.get_bytes(ref.key)
+    assert storage.get_json(ref.key) == PAYLOAD and storage.exists(ref.key)
+    assert storage.head(ref.key).content_encoding == encoding
+    assert [(r.key, r.content_encoding) for r in storage.list(ref.key.rsplit('/', 1)[0])] == [(ref.key, encoding)]
+
+    storage.move(ref.key, 'processed/p2/data.json')
+    assert storage.get_json('processed/p2/data.json') == PAYLOAD and not storage.exists(ref.key)
+    # Overwriting with plain bytes replaces the compressed copy
+    storage.put_bytes('processed/p2/data.json', b'{}')
+    assert storage.head('processed/p2/data.json').content_encoding is None
+    assert storage.get_json('processed/p2/data.json') == {}
+    assert storage.delete('processed/p2/data.json') and not storage.exists('processed/p2/data.json')
+
+
+def test_stored_compressed_bytes_are_forwarded_or_decoded(tmp_path, monkeypatch):
+    storage = _storage(tmp_path, monkeypatch, 'gzip')
+    storage.put_json('processed/p1/data.json', PAYLOAD)
+    stored = b''.join(storage.iter_bytes('processed/p1/data.json'))
+    app = FastAPI()
+
+    @app.get('/raw')
+    def raw(request: Request):
+        return streamed_response(request, [stored_object(storage, 'processed/p1/data.json')], 'application/json')
+
+    @app.get('/full')
+    def full(request: Request):
+        segments = json_envelope('data', stored_object(storage, 'processed/p1/data.json'), processing_id='p1')
+        return streamed_response(request, segments, 'application/json')
+
+    client = TestClient(app)
+    with client.stream('GET', '/raw', headers={'Accept-Encoding': 'gzip'}) as response:
+        assert response.headers['content-encoding'] == 'gzip'
+        assert response.headers['content-length'] == str(len(stored))
+        assert b''.join(response.iter_raw()) == stored
+    ranged = client.get('/raw', headers={'Accept-Encoding': 'gzip', 'Range': 'bytes=0-9'})
+    assert ranged.status_code == 206 and ranged.headers['content-encoding'] == 'gzip'
+
+    assert client.get('/raw', headers={'Accept-Encoding': 'identity'}).json() == PAYLOAD
+    with client.stream('GET', '/full', headers={'Accept-Encoding': 'gzip'}) as response:
+        assert response.headers['content-encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(b''.join(response.iter_raw()))) == {'processing_id': 'p1', 'data': PAYLOAD}
+    assert client.get('/full', headers={'Accept-Encoding': 'identity'}).json() == {'processing_id': 'p1', 'data': PAYLOAD}
+
+
+def test_zstd_payload_is_spliced_into_the_envelope(tmp_path, monkeypatch):
+    pytest.importorskip('zstandard')
+    storage = _storage(tmp_path, monkeypatch, 'zstd')
+    storage.put_json('processed/p1/data.json', PAYLOAD)
+    stored = b''.join(storage.iter_bytes('processed/p1/data.json'))
+    app = FastAPI()
+
+    @app.get('/full')
+    def full(request: Request):
+        segments = json_envelope('data', stored_object(storage, 'processed/p1/data.json'), processing_id='p1')
+        return streamed_response(request, segments, 'application/json')
+
+    with TestClient(app).stream('GET', '/full', headers={'Accept-Encoding': 'zstd'}) as response:
+        body = b''.join(response.iter_raw())
+    assert response.headers['content-encoding'] == 'zstd'
+    assert response.headers['content-length'] == str(len(body)) and stored in body
+    assert json.loads(decompress(body, 'zstd')) == {'processing_id': 'p1', 'data': PAYLOAD}
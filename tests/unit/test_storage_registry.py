@@ -0,0 +1,43 @@
+import pytest
+
+from converter.storage_service import LocalStorageService, StorageService, StorageServiceRegistry
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setenv('STORAGE_BACKEND', 'local')
+    monkeypatch.setenv('LOCAL_STORAGE_PATH', str(tmp_path / 'a'))
+    return StorageServiceRegistry()
+
+
+def test_service_is_built_once_per_configuration(registry, tmp_path, monkeypatch):
+    first = registry.get()
+
+    assert registry.get() is first
+    assert isinstance(first, StorageService) and isinstance(first.storage, LocalStorageService)
+
+    monkeypatch.setenv('LOCAL_STORAGE_PATH', str(tmp_path / 'b'))
+    second = registry.get()
+    assert second is not first and registry.get() is second
+    registry.reload()
+    assert registry.get() is not second
+
+
+def test_calls_are_counted_per_backend_and_operation(registry):
+    storage = registry.get()
+    storage.put_json('processed/p1/data.json', {'a': 1})
+    assert storage.get_json('processed/p1/data.json') == {'a': 1}
+    assert b''.join(storage.iter_bytes('processed/p1/data.json')) == b'{"a":1}'
+    with pytest.raises(FileNotFoundError):
+        storage.get_bytes('processed/missing.json')
+
+    local = registry.metrics.snapshot()['local']
+    ops = local['operations']
+    assert local['calls'] == 4 and local['errors'] == 1
+    assert ops['get_bytes'] == {**ops['get_bytes'], 'calls': 1, 'errors': 1}
+    assert ops['put_json']['calls'] == ops['iter_bytes']['calls'] == 1
+    assert ops['put_json']['max_ms'] >= ops['put_json']['avg_ms'] >= 0
+    # Internal calls (put_json -> put_bytes) and unmetered helpers are not counted
+    assert 'put_bytes' not in ops
+    registry.metrics.reset()
+    assert registry.metrics.snapshot() == {}
@@ -0,0 +1,103 @@
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from converter.storage_service import LocalStorageService
+from fastapi_service.streaming import (
+    RangeNotSatisfiable,
+    iter_segments,
+    json_envelope,
+    negotiate_encoding,
+    parse_range,
+    stored_object,
+    streamed_response,
+)
+
+
+PAYLOAD = {'rows': [{'r': r, 'cells': [[1, f'value {r}']]} for r in range(200)]}
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = LocalStorageService(base_dir=str(tmp_path))
+    storage.put_json('processed/p1/data.json', PAYLOAD)
+    return storage
+
+
+@pytest.fixture
+def client(storage):
+    app = FastAPI()
+
+    @app.get('/full')
+    def full(request: Request):
+        segments = json_envelope('data', stored_object(storage, 'processed/p1/data.json'), processing_id='p1')
+        return streamed_response(request, segments, 'application/json')
+
+    return TestClient(app)
+
+
+def test_iter_bytes_reads_ranges_in_chunks(storage):
+    raw = storage.get_bytes('processed/p1/data.json')
+
+    assert storage.head('processed/p1/data.json').size_bytes == len(raw)
+    assert b''.join(storage.iter_bytes('processed/p1/data.json', chunk_size=7)) == raw
+    assert b''.join(storage.iter_bytes('processed/p1/data.json', 5, 40, chunk_size=7)) == raw[5:40]
+    with pytest.raises(FileNotFoundError):
+        storage.head('processed')
+
+
+def test_envelope_splices_the_stored_payload(storage):
+    segments = json_envelope('data', stored_object(storage, 'processed/p1/data.json'), processing_id='p1', n=1)
+    body = b''.join(iter_segments(segments, 0, 10 ** 9))
+
+    assert json.loads(body) == {'processing_id': 'p1', 'n': 1, 'data': PAYLOAD}
+    assert b''.join(iter_segments(segments, 3, 50)) == body[3:50]
+    assert json.loads(b''.join(iter_segments(json_envelope('data', b'[1]'), 0, 100))) == {'data': [1]}
+
+
+def test_parse_range():
+    assert parse_range(None, 100) is None
+    assert parse_range('bytes=0-9', 100) == (0, 10)
+    assert parse_range('bytes=90-', 100) == (90, 100)
+    assert parse_range('bytes=95-200', 100) == (95, 100)
+    assert parse_range('bytes=-10', 100) == (90, 100)
+    assert parse_range('bytes=0-1,5-6', 100) is None
+    assert parse_range('bytes=9-2', 100) is None
+    assert parse_range('items=0-9', 100) is None
+    for header in ('bytes=100-', 'bytes=-0'):
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range(header, 100)
+
+
+def test_negotiate_encoding(monkeypatch):
+    assert negotiate_encoding('gzip, deflate') == 'gzip'
+    assert negotiate_encoding('gzip;q=0, identity') is None
+    assert negotiate_encoding('') is None
+    assert negotiate_encoding('br') is None
+    pytest.importorskip('zstandard')
+    assert negotiate_encoding('gzip, zstd') == 'zstd'
+    assert negotiate_encoding('zstd;q=0.5, gzip') == 'gzip'
+    assert negotiate_encoding('*') == 'zstd'
+
+
+def test_streamed_json_is_compressed_or_ranged(client):
+    identity = client.get('/full', headers={'Accept-Encoding': 'identity'})
+    raw = identity.content
+    assert identity.headers['content-length'] == str(len(raw))
+    assert json.loads(raw) == {'processing_id': 'p1', 'data': PAYLOAD}
+
+    with client.stream('GET', '/full', headers={'Accept-Encoding': 'gzip'}) as response:
+        assert response.headers['content-encoding'] == 'gzip'
+        assert gzip.decompress(b''.join(response.iter_raw())) == raw
+
+    ranged = client.get('/full', headers={'Range': 'bytes=10-19', 'Accept-Encoding': 'gzip'})
+    assert ranged.status_code == 206
+    assert ranged.headers['content-range'] == f'bytes 10-19/{len(raw)}'
+    assert 'content-encoding' not in ranged.headers and ranged.content == raw[10:20]
+
+    unsatisfiable = client.get('/full', headers={'Range': f'bytes={len(raw)}-'})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers['content-range'] == f'bytes */{len(raw)}'
@@ -0,0 +1,64 @@
+from openpyxl import Workbook
+from openpyxl.styles import Border, Font, PatternFill, Side
+
+from converter.compact_excel_processor import CompactExcelProcessor
+
+
+def _styled_sheet():
+    sheet = Workbook().active
+    for row in range(1, 41):
+        cell = sheet.cell(row=row, column=1, value=row)
+        cell.font = Font(bold=row % 2 == 0, size=8 + row % 5)
+        cell.fill = PatternFill("solid", fgColor=f"FF00{row % 7:02X}00")
+        cell.border = Border(top=Side(style="thin")) if row % 3 == 0 else Border()
+    sheet.cell(row=41, column=1, value="plain")
+    return sheet
+
+
+def _linear_scan_reference(processor, cell):
+    style_dict = processor._extract_cell_style_dict(cell)
+    if not style_dict:
+        return None
+    key = processor._create_style_key(style_dict)
+    for style_id, existing in processor.style_registry.items():
+        if processor._create_style_key(existing) == key:
+            return style_id
+    style_id = f"s{processor.next_style_id}"
+    processor.next_style_id += 1
+    processor.style_registry[style_id] = style_dict
+    return style_id
+
+
+def test_interned_references_match_linear_scan():
+    cells = [row[0] for row in _styled_sheet().iter_rows()]
+    interned, reference = CompactExcelProcessor(), CompactExcelProcessor()
+
+    refs = [interned._get_style_reference(cell) for cell in cells]
+    expected = [_linear_scan_reference(reference, cell) for cell in cells]
+
+    assert refs == expected
+    assert list(interned.style_registry.items()) == list(reference.style_registry.items())
+
+
+def test_style_dict_built_once_per_shared_style(monkeypatch):
+    cells = [row[0] for row in _styled_sheet().iter_rows()] * 3
+    processor = CompactExcelProcessor()
+    calls = []
+    original = processor._extract_cell_style_dict
+    monkeypatch.setattr(processor, "_extract_cell_style_dict", lambda cell: calls.append(cell) or original(cell))
+
+    for cell in cells:
+        processor._get_style_reference(cell)
+
+    assert len(calls) == len({processor._style_cache_key(cell) for cell in cells}) == 41
+
+
+def test_registry_reset_clears_indexes():
+    processor = CompactExcelProcessor()
+    cell = _styled_sheet()["A2"]
+    assert processor._get_style_reference(cell) == "s1"
+
+    processor._reset_style_registry()
+
+    assert processor.style_registry == {} and processor._style_index == {} and processor._style_ref_cache == {}
+    assert processor._get_style_reference(cell) == "s1"
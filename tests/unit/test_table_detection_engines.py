@@ -0,0 +1,115 @@
+"""
+Parity suite for the table detection engines.
+
+The 'numpy' engine (VectorizedTableDetector) must return exactly the regions
+the 'python' engine (TableDetector) returns, on the Excel fixtures and on
+seeded random sheets mixing labels, numbers, dates, blanks and gaps.
+"""
+
+import glob
+import os
+import random
+
+import pytest
+
+from converter.compact_excel_processor import CompactExcelProcessor
+from converter.table_detector import TableDetector, get_table_detector
+from converter.vectorized_table_detector import VectorizedTableDetector
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fixtures', 'excel')
+# The two large workbooks take ~20s to load; the integration suite covers them
+MAX_FIXTURE_BYTES = 500_000
+
+OPTION_SETS = [
+    {},
+    {'table_detection': {'use_gaps': True}},
+    {'table_detection': {'use_gaps': True, 'gap_threshold': 1}},
+    {'sheet_data': {'frozen': [1, 0]}},
+]
+
+WORDS = ['Assets', 'Revenue', 'Total', 'Cash', 'abc', 'Month 1', 'Month 2', '2024-01-31', 'Q1 2024',
+         'Jan 1, 2024', '1,234', '$5', '12%', '-3.5', '10-20', 'x', 'Label text', 'Section', '3/4/2023']
+
+
+def _random_sheet(seed):
+    rnd = random.Random(seed)
+    nrows, ncols = rnd.randint(1, 80), rnd.randint(1, 15)
+    rows, r = [], 1
+    while r <= nrows:
+        if rnd.random() < 0.2:
+            r += rnd.randint(1, 5)
+            continue
+        sparse = rnd.random() < 0.3
+        cells = []
+        for c in range(1, ncols + 1):
+            if rnd.random() < (0.3 if sparse else 0.8):
+                kind = rnd.random()
+                value = (rnd.choice(WORDS) if kind < 0.4 else rnd.randint(-100, 1000) if kind < 0.7
+                         else rnd.random() * 100 if kind < 0.8 else True if kind < 0.85 else '  ' if kind < 0.9 else None)
+                cells.append([c, value])
+        if rnd.random() < 0.15 and cells:
+            cells = [[1, rnd.choice(WORDS)]]  # section-header style row
+        rows.append({'r': r, 'cells': cells})
+        r += 1
+    return rows, [1, 1, max(r - 1, 1), ncols]
+
+
+def _assert_same_regions(rows, dimensions, options):
+    expected = TableDetector().detect_tables(rows, dimensions, options)
+    assert VectorizedTableDetector().detect_tables(rows, dimensions, options) == expected
+
+
+@pytest.mark.parametrize('path', [
+    p for p in sorted(glob.glob(os.path.join(FIXTURES, '*.xlsx'))) if os.path.getsize(p) <= MAX_FIXTURE_BYTES
+], ids=os.path.basename)
+def test_engines_agree_on_excel_fixtures(path):
+    workbook = CompactExcelProcessor().process_file(path)
+    for sheet in workbook['workbook']['sheets']:
+        for options in OPTION_SETS:
+            _assert_same_regions(sheet.get('rows', []), sheet.get('dimensions', [1, 1, 1, 1]),
+                                 {**options, 'sheet_data': {**options.get('sheet_data', {}), **sheet}})
+
+
+@pytest.mark.parametrize('seed_block', range(4))
+def test_engines_agree_on_random_sheets(seed_block):
+    for seed in range(seed_block * 100, (seed_block + 1) * 100):
+        rows, dimensions = _random_sheet(seed)
+        for options in OPTION_SETS:
+            _assert_same_regions(rows, dimensions, options)
+
+
+def test_engines_agree_on_row_walk_helpers():
+    python, numpy = TableDetector(), VectorizedTableDetector()
+    for seed in range(200):
+        rows, _ = _random_sheet(seed)
+        python_grid = python.grid_class.from_cell_data(rows)
+        numpy_grid = numpy.grid_class.from_cell_data(rows)
+        rnd = random.Random(seed)
+        for _ in range(5):
+            start, end = rnd.randint(0, 60), rnd.randint(0, 90)
+            min_col, max_col = rnd.randint(0, 4), rnd.randint(0, 16)
+            for name in ('_find_table_end_by_gap', '_find_multirow_table_end', '_find_multirow_header_blocks'):
+                args = (start, end, min_col, max_col)
+                assert getattr(numpy, name)(numpy_grid, *args) == getattr(python, name)(python_grid, *args), (name, seed, args)
+
+
+def test_engine_is_selectable_per_call_and_by_environment(monkeypatch):
+    rows, dimensions = _random_sheet(7)
+    options = {'table_detection': {'engine': 'numpy', 'use_gaps': True}}
+
+    assert TableDetector().detect_tables(rows, dimensions, options) == \
+        TableDetector().detect_tables(rows, dimensions, {'table_detection': {'use_gaps': True}})
+
+    monkeypatch.setenv('TABLE_DETECTION_ENGINE', 'numpy')
+    assert isinstance(get_table_detector(), VectorizedTableDetector)
+    with pytest.raises(ValueError):
+        get_table_detector('fortran')
+
+
+def test_dense_matrix_limit_falls_back_to_grid_methods(monkeypatch):
+    from converter import vectorized_table_detector
+
+    monkeypatch.setattr(vectorized_table_detector, 'MAX_DENSE_CELLS', 0)
+    for seed in range(20):
+        rows, dimensions = _random_sheet(seed)
+        _assert_same_regions(rows, dimensions, {'table_detection': {'use_gaps': True}})